@@ -66,6 +66,10 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+if DEBUG:
+    # Report per-request query counts against each view's declared budget.
+    MIDDLEWARE.append("dunbud.middleware.QueryBudgetMiddleware")
+
 if not DEBUG:
     # The whitenoise documentation recommends inserting it right after SecurityMiddleware.
     MIDDLEWARE.insert(
@@ -151,6 +155,10 @@ STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
 
+# User uploads such as character portraits
+MEDIA_URL = "/media/"
+MEDIA_ROOT = Path(os.getenv("MEDIA_ROOT", BASE_DIR / "media"))
+
 # Configure Whitenoise to compress and hash files
 STORAGES = {
     "default": {
@@ -260,6 +268,12 @@ DEFAULT_FROM_EMAIL = os.getenv(
     "DEFAULT_FROM_EMAIL",
     "noreply@dunbud-staging.up.railway.app",
 )
+# Render portrait thumbnails on the request thread instead of a process pool
+DUNBUD_THUMBNAILS_INLINE = os.getenv("DUNBUD_THUMBNAILS_INLINE", "False") == "True"
+# Let check_links probe private and loopback addresses (local development only)
+DUNBUD_LINK_CHECK_ALLOW_PRIVATE = (
+    os.getenv("DUNBUD_LINK_CHECK_ALLOW_PRIVATE", "False") == "True"
+)
 ANYMAIL = {
     "RESEND_API_KEY": os.getenv("RESEND_API_KEY"),
 }
@@ -3,7 +3,9 @@ from django.contrib import admin
 from dunbud.models import (
     Campaign,
     CampaignInvitation,
+    CampaignSnapshot,
     HelpfulLink,
+    LinkCheck,
     PlayerCharacter,
     TabletopSystem,
 )
@@ -13,7 +15,8 @@ from dunbud.models.session import Session
 class CampaignInvitationInline(admin.TabularInline):
     model = CampaignInvitation
     extra = 0
-    readonly_fields = ("token", "created_at")
+    readonly_fields = ("token_prefix", "created_at", "use_count")
+    raw_id_fields = ("invitee",)
 
 
 class HelpfulLinkInline(admin.TabularInline):
@@ -50,10 +53,25 @@ class TabletopSystemAdmin(admin.ModelAdmin):
 
 @admin.register(CampaignInvitation)
 class CampaignInvitationAdmin(admin.ModelAdmin):
-    list_display = ("campaign", "created_at", "is_active")
-    list_filter = ("is_active", "created_at")
+    list_display = ("campaign", "created_at", "expires_at", "use_count", "is_active")
+    list_filter = ("is_active", "created_at", "expires_at")
+    search_fields = ("campaign__name", "token_prefix")
+    readonly_fields = ("token_prefix", "token_hash", "use_count")
+
+
+@admin.register(CampaignSnapshot)
+class CampaignSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("campaign", "version", "generated_at")
     search_fields = ("campaign__name",)
-    readonly_fields = ("token",)
+    readonly_fields = ("campaign", "version", "document", "generated_at")
+
+
+@admin.register(LinkCheck)
+class LinkCheckAdmin(admin.ModelAdmin):
+    list_display = ("url", "status_code", "is_healthy", "checked_at")
+    search_fields = ("url",)
+    list_filter = ("is_healthy", "checked_at")
+    readonly_fields = ("url", "status_code", "is_healthy", "error", "checked_at")
 
 
 @admin.register(HelpfulLink)
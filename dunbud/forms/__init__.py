@@ -1,15 +1,25 @@
 from .chat_message import ChatMessageForm
-from .helpful_link import HelpfulLinkForm
-from .journal import JournalEntryForm
+from .handout import HandoutForm
+from .helpful_link import HelpfulLinkForm, HelpfulLinkImportForm
+from .invitation_email import InvitationEmailForm
+from .journal import JournalDraftForm, JournalEntryForm
 from .party_feed import PartyFeedItemForm
+from .player_character import PlayerCharacterForm
 from .session_create import SessionCreateForm
+from .session_recording import SessionRecordingForm
 from .session_update import SessionUpdateForm
 
 __all__ = [
     "ChatMessageForm",
+    "HandoutForm",
     "HelpfulLinkForm",
+    "HelpfulLinkImportForm",
+    "InvitationEmailForm",
+    "JournalDraftForm",
     "JournalEntryForm",
     "PartyFeedItemForm",
+    "PlayerCharacterForm",
     "SessionCreateForm",
+    "SessionRecordingForm",
     "SessionUpdateForm",
 ]
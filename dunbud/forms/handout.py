@@ -0,0 +1,45 @@
+import hashlib
+import mimetypes
+from typing import Any
+
+from django import forms
+from django.core.files.uploadedfile import UploadedFile
+
+from dunbud.models import Handout
+from dunbud.models.handout import MAX_HANDOUT_SIZE
+
+
+class HandoutForm(forms.ModelForm):
+    """
+    A form for uploading a campaign handout.
+    The file's digest, size and type are recorded as it is saved.
+    """
+
+    class Meta:
+        model = Handout
+        fields = ["title", "file"]
+
+    def clean_file(self) -> UploadedFile:
+        upload: UploadedFile = self.cleaned_data["file"]
+        if (upload.size or 0) > MAX_HANDOUT_SIZE:
+            raise forms.ValidationError(
+                f"Handouts can be at most {MAX_HANDOUT_SIZE // (1024 * 1024)} MB.",
+            )
+        return upload
+
+    def save(self, commit: bool = True) -> Any:
+        handout: Handout = super().save(commit=False)
+        upload: UploadedFile = self.cleaned_data["file"]
+
+        digest = hashlib.sha256()
+        for chunk in upload.chunks():
+            digest.update(chunk)
+        upload.seek(0)
+        handout.digest = digest.hexdigest()
+        handout.size = upload.size or 0
+        handout.content_type = (
+            mimetypes.guess_type(upload.name or "")[0] or "application/octet-stream"
+        )
+        if commit:
+            handout.save()
+        return handout
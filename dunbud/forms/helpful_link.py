@@ -1,6 +1,7 @@
 from django import forms
 
 from dunbud.models import HelpfulLink
+from dunbud.models.links import LINK_LIMIT_MESSAGE, MAX_LINKS_PER_CAMPAIGN
 
 
 class HelpfulLinkForm(forms.ModelForm):
@@ -20,3 +21,45 @@ class HelpfulLinkForm(forms.ModelForm):
         if not url.startswith(("http://", "https://")):
             url = f"https://{url}"
         return str(url)
+
+
+LINE_FORMAT_MESSAGE = "expected a name and URL as 'Name | URL'."
+
+
+class HelpfulLinkImportForm(forms.Form):
+    """
+    A form for pasting several helpful links at once, one "Name | URL" per line.
+    """
+
+    links = forms.CharField(
+        widget=forms.Textarea(
+            attrs={
+                "class": "form-control",
+                "rows": 5,
+                "placeholder": "Roll20 | https://roll20.net",
+            },
+        ),
+    )
+
+    def clean_links(self) -> list[tuple[str, str]]:
+        """
+        Parse each non-empty line and validate it like a single link.
+        """
+        links = []
+        errors = []
+        lines = self.cleaned_data["links"].splitlines()
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            name, separator, url = line.partition("|")
+            form = HelpfulLinkForm({"name": name.strip(), "url": url.strip()})
+            if not separator or not form.is_valid():
+                errors.append(f"Line {number}: {LINE_FORMAT_MESSAGE}")
+                continue
+            links.append((form.cleaned_data["name"], form.cleaned_data["url"]))
+
+        if errors:
+            raise forms.ValidationError(errors)
+        if len(links) > MAX_LINKS_PER_CAMPAIGN:
+            raise forms.ValidationError(LINK_LIMIT_MESSAGE)
+        return links
@@ -0,0 +1,95 @@
+import re
+from typing import Any
+
+from django import forms
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db.models import Q
+
+from dunbud.services.invitation_emails import MAX_EMAIL_INVITES
+
+User = get_user_model()
+
+
+class InvitationEmailForm(forms.Form):
+    """
+    Form for emailing invitations to a pasted list of recipients.
+    Recipients are email addresses or ``@username`` for existing users, and
+    may be separated by commas, semicolons or new lines.
+    """
+
+    emails = forms.CharField(
+        widget=forms.Textarea(
+            attrs={
+                "class": "form-control",
+                "rows": 4,
+                "placeholder": "rogue@example.com, @bard",
+            },
+        ),
+    )
+
+    def clean_emails(self) -> list[str]:
+        """
+        Split, normalize and de-duplicate the recipients. Usernames are kept
+        with their leading ``@`` and resolved in ``clean``.
+        """
+        recipients: list[str] = []
+        invalid: list[str] = []
+        for value in re.split(r"[\s,;]+", self.cleaned_data["emails"]):
+            if not value:
+                continue
+            recipient = value.strip().lower()
+            if not recipient.startswith("@"):
+                try:
+                    validate_email(recipient)
+                except ValidationError:
+                    invalid.append(value)
+                    continue
+            if recipient not in recipients:
+                recipients.append(recipient)
+
+        if invalid:
+            raise forms.ValidationError(
+                f"These are not valid email addresses: {', '.join(invalid)}",
+            )
+        if not recipients:
+            raise forms.ValidationError("Enter at least one email address.")
+        if len(recipients) > MAX_EMAIL_INVITES:
+            raise forms.ValidationError(
+                f"You can invite up to {MAX_EMAIL_INVITES} addresses at once.",
+            )
+        return recipients
+
+    def clean(self) -> dict[str, Any]:
+        """
+        Resolve ``@username`` recipients to users with one query. Their
+        addresses are never shown to the inviter.
+        """
+        super().clean()
+        cleaned_data = self.cleaned_data
+        recipients: list[str] = cleaned_data.get("emails") or []
+        names = [r.removeprefix("@") for r in recipients if r.startswith("@")]
+        if not names:
+            cleaned_data["invitees"] = []
+            return cleaned_data
+
+        lookup = Q()
+        for name in names:
+            lookup |= Q(username__iexact=name)
+        found = {
+            user.username.lower(): user
+            for user in User.objects.filter(lookup, is_active=True).exclude(email="")
+        }
+        missing = [name for name in names if name not in found]
+        if missing:
+            self.add_error(
+                "emails",
+                "These users do not exist or cannot receive email: "
+                f"{', '.join(f'@{name}' for name in missing)}",
+            )
+            return cleaned_data
+
+        cleaned_data["emails"] = [r for r in recipients if not r.startswith("@")]
+        cleaned_data["invitees"] = [found[name] for name in names]
+        return cleaned_data
@@ -5,6 +5,7 @@ from django import forms
 from dunbud.models.journal import JournalEntry
 from dunbud.models.player_character import PlayerCharacter
 from dunbud.models.session import Session
+from dunbud.services.journal_drafts import DRAFT_FIELDS
 
 
 class JournalEntryForm(forms.ModelForm):
@@ -15,7 +16,7 @@ class JournalEntryForm(forms.ModelForm):
 
     class Meta:
         model = JournalEntry
-        fields = ["title", "session", "content"]
+        fields = ["title", "session", "visibility", "content"]
         widgets = {
             "content": forms.Textarea(attrs={"rows": 10}),
         }
@@ -28,9 +29,11 @@ class JournalEntryForm(forms.ModelForm):
 
         # Filter sessions to the character's campaign
         if self.character.campaign:
-            session_field.queryset = Session.objects.filter(
-                campaign=self.character.campaign,
-            ).order_by("-session_number")
+            session_field.queryset = (
+                Session.objects.filter(campaign=self.character.campaign)
+                .select_related("campaign")
+                .order_by("-session_number")
+            )
         else:
             # If character has no campaign, they cannot link to a session
             session_field.queryset = Session.objects.none()
@@ -42,3 +45,22 @@ class JournalEntryForm(forms.ModelForm):
         if commit:
             entry.save()
         return entry
+
+
+class JournalDraftForm(forms.Form):
+    """
+    Validates an autosave patch. Only the fields present in the request are
+    part of the patch.
+    """
+
+    entry = forms.UUIDField(required=False)
+    title = forms.CharField(max_length=255, required=False)
+    content = forms.CharField(required=False, strip=False)
+
+    def get_changes(self) -> dict[str, str]:
+        """
+        Return the cleaned values of the draft fields that were submitted.
+        """
+        return {
+            name: self.cleaned_data[name] for name in DRAFT_FIELDS if name in self.data
+        }
@@ -0,0 +1,60 @@
+from typing import Any
+
+from django import forms
+from django.core.files.uploadedfile import UploadedFile
+from django.utils.translation import gettext_lazy as _
+
+from dunbud.models import PlayerCharacter
+from dunbud.services.portraits import (
+    MAX_PORTRAIT_SIZE,
+    sniff_image_type,
+    store_portrait,
+)
+
+
+class PlayerCharacterForm(forms.ModelForm):
+    """
+    Form for creating and updating characters, with an optional portrait.
+    The portrait is only checked by its size and leading bytes here; it is
+    decoded later, off the request thread.
+    """
+
+    portrait_image = forms.FileField(
+        required=False,
+        label=_("Portrait"),
+        help_text=_("A PNG, JPEG, GIF or WebP image of up to 5 MB."),
+        widget=forms.FileInput(attrs={"accept": "image/*"}),
+    )
+
+    class Meta:
+        model = PlayerCharacter
+        fields = [
+            "name",
+            "race",
+            "character_class",
+            "level",
+            "bio",
+            "campaign",
+            "character_sheet_link",
+        ]
+
+    def clean_portrait_image(self) -> UploadedFile | None:
+        upload: UploadedFile | None = self.cleaned_data.get("portrait_image")
+        if upload is None:
+            return None
+        if (upload.size or 0) > MAX_PORTRAIT_SIZE:
+            raise forms.ValidationError(_("Portraits can be at most 5 MB."))
+
+        header = upload.read(12)
+        upload.seek(0)
+        if sniff_image_type(header) is None:
+            raise forms.ValidationError(
+                _("Upload a PNG, JPEG, GIF or WebP image."),
+            )
+        return upload
+
+    def save(self, commit: bool = True) -> Any:
+        upload = self.cleaned_data.get("portrait_image")
+        if upload is not None:
+            self.instance.portrait = store_portrait(upload)
+        return super().save(commit=commit)
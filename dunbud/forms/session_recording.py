@@ -0,0 +1,28 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+from dunbud.models.session_recording import MAX_RECORDING_SIZE
+
+
+class SessionRecordingForm(forms.Form):
+    """
+    Describes a recording before its upload starts.
+    """
+
+    filename = forms.CharField(max_length=255)
+    content_type = forms.CharField(max_length=100)
+    size = forms.IntegerField(min_value=1)
+
+    def clean_content_type(self) -> str:
+        content_type: str = self.cleaned_data["content_type"].lower()
+        if not content_type.startswith(("audio/", "video/")):
+            raise ValidationError("Recordings must be audio or video files.")
+        return content_type
+
+    def clean_size(self) -> int:
+        size: int = self.cleaned_data["size"]
+        if size > MAX_RECORDING_SIZE:
+            raise ValidationError(
+                f"Recordings can be at most {MAX_RECORDING_SIZE // 1024**3} GB.",
+            )
+        return size
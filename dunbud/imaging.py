@@ -0,0 +1,49 @@
+"""
+Portrait thumbnail rendering.
+
+This module runs inside process-pool workers, so it must not import Django
+models or anything that needs the app registry.
+"""
+
+import tempfile
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+# Name of each thumbnail size and its edge length in pixels.
+THUMBNAIL_SIZES = {"small": 64, "medium": 256}
+# File extension of each thumbnail format and its Pillow encoder.
+THUMBNAIL_FORMATS = {"webp": "WEBP", "jpg": "JPEG"}
+# Reject images that would decode to more pixels than this.
+MAX_PIXELS = 40_000_000
+
+
+def thumbnail_filename(digest: str, size: str, extension: str) -> str:
+    return f"{digest}_{size}.{extension}"
+
+
+def render_thumbnails(source: str, target_dir: str, digest: str) -> tuple[int, int]:
+    """
+    Render every thumbnail size and format of the image at ``source`` into
+    ``target_dir``, cropped to a square. Files are written atomically.
+    Returns the original width and height.
+    """
+    with Image.open(source) as image:
+        width, height = image.size
+        if width * height > MAX_PIXELS:
+            raise ValueError(f"Image is too large: {width}x{height}")
+        image.draft("RGB", (max(THUMBNAIL_SIZES.values()),) * 2)
+        picture = ImageOps.exif_transpose(image).convert("RGB")
+
+    for size, edge in THUMBNAIL_SIZES.items():
+        thumbnail = ImageOps.fit(picture, (edge, edge), Image.Resampling.LANCZOS)
+        for extension, encoder in THUMBNAIL_FORMATS.items():
+            target = Path(target_dir) / thumbnail_filename(digest, size, extension)
+            with tempfile.NamedTemporaryFile(
+                dir=target_dir,
+                suffix=f".{extension}",
+                delete=False,
+            ) as tmp:
+                thumbnail.save(tmp, encoder, quality=85)
+            Path(tmp.name).replace(target)
+    return width, height
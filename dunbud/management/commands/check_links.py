@@ -0,0 +1,73 @@
+import logging
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from dunbud.services import run_link_checks
+from dunbud.services.link_health import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_AGE,
+    DEFAULT_PER_HOST,
+    DEFAULT_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Checks the health of every stored external link concurrently and caches
+    the results for the campaign pages. Links checked within --max-age hours
+    are skipped.
+    """
+
+    help = "Checks helpful, VTT and character sheet links for dead URLs."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=DEFAULT_CONCURRENCY,
+            help="Maximum number of requests in flight.",
+        )
+        parser.add_argument(
+            "--per-host",
+            type=int,
+            default=DEFAULT_PER_HOST,
+            help="Maximum number of requests to a single host at once.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=DEFAULT_TIMEOUT,
+            help="Seconds to wait for each URL.",
+        )
+        parser.add_argument(
+            "--max-age",
+            type=float,
+            default=DEFAULT_MAX_AGE.total_seconds() / 3600,
+            help="Skip URLs checked within this many hours. Use 0 to recheck all.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logger.info("Starting check_links")
+        results = run_link_checks(
+            max_age=timedelta(hours=options["max_age"]),
+            concurrency=options["concurrency"],
+            per_host=options["per_host"],
+            timeout=options["timeout"],
+        )
+
+        broken = [result for result in results if not result.is_healthy]
+        for result in broken:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{result.url}: {result.status_code or result.error}",
+                ),
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {len(results)} links, {len(broken)} unhealthy.",
+            ),
+        )
@@ -0,0 +1,24 @@
+import logging
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from dunbud.services import deactivate_expired_invitations
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Periodic job that deactivates expired and used-up invitations in one
+    batch UPDATE. Meant to be run from cron.
+    """
+
+    help = "Deactivates expired and used-up campaign invitations."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logger.info("Starting deactivate_expired_invites")
+        count = deactivate_expired_invitations()
+        self.stdout.write(
+            self.style.SUCCESS(f"Deactivated {count} expired invitations."),
+        )
@@ -6,7 +6,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from dunbud.models import Campaign, HelpfulLink
-from dunbud.models.links import MAX_LINKS_PER_CAMPAIGN
+from dunbud.models.links import MAX_LINKS_PER_CAMPAIGN, sync_helpful_link_counts
 
 logger = logging.getLogger(__name__)
 
@@ -106,5 +106,6 @@ class Command(BaseCommand):
 
         if links_to_create:
             HelpfulLink.objects.bulk_create(links_to_create)
+            sync_helpful_link_counts(*{link.campaign_id for link in links_to_create})
 
         logger.info("Created %d helpful links.", len(links_to_create))
@@ -0,0 +1,22 @@
+import logging
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from dunbud.services import purge_expired_drafts
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Periodic job that deletes abandoned journal autosave drafts in one batch
+    DELETE. Meant to be run from cron.
+    """
+
+    help = "Deletes journal drafts that have not been saved for a week."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logger.info("Starting purge_journal_drafts")
+        count = purge_expired_drafts()
+        self.stdout.write(self.style.SUCCESS(f"Purged {count} expired drafts."))
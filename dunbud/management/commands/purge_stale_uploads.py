@@ -0,0 +1,23 @@
+import logging
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from dunbud.services import purge_stale_uploads
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Periodic job that deletes abandoned recording uploads and their partial
+    files. Meant to be run periodically on the machine that holds the
+    uploaded media.
+    """
+
+    help = "Deletes recording uploads that have not received a part in two days."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logger.info("Starting purge_stale_uploads")
+        count = purge_stale_uploads()
+        self.stdout.write(self.style.SUCCESS(f"Purged {count} stale uploads."))
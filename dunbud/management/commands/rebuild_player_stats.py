@@ -0,0 +1,23 @@
+import logging
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from dunbud.services import rebuild_player_stats
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Periodic job that recomputes every user's profile statistics from the
+    source tables, repairing drift from writes that bypass signals. Meant to
+    be run from cron.
+    """
+
+    help = "Recomputes the profile statistics of every user."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logger.info("Starting rebuild_player_stats")
+        count = rebuild_player_stats()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {count} users."))
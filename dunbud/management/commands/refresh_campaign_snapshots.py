@@ -0,0 +1,69 @@
+import logging
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from dunbud.services import refresh_campaign_snapshot, stale_campaign_ids
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_INTERVAL = 5.0
+
+
+class Command(BaseCommand):
+    """
+    Worker that rebuilds campaign snapshots whose campaign version has moved
+    on. Readers rebuild stale snapshots themselves; this keeps them warm so
+    requests rarely pay for it. Runs once by default; pass --loop to keep
+    polling.
+    """
+
+    help = "Regenerates stale campaign snapshots."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for stale snapshots instead of exiting.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=DEFAULT_INTERVAL,
+            help="Seconds to sleep between polls when looping.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Maximum number of snapshots to rebuild per poll.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logger.info("Starting refresh_campaign_snapshots")
+        while True:
+            refreshed = self._refresh_batch(options["batch_size"])
+            if not options["loop"]:
+                break
+            if not refreshed:
+                time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("Successfully refreshed snapshots."))
+
+    def _refresh_batch(self, batch_size: int) -> int:
+        """
+        Rebuild up to ``batch_size`` stale snapshots and return how many ran.
+        """
+        campaign_ids = stale_campaign_ids(limit=batch_size)
+        for campaign_id in campaign_ids:
+            try:
+                refresh_campaign_snapshot(campaign_id)
+            except Exception:
+                logger.exception("Failed to refresh snapshot for %s", campaign_id)
+
+        if campaign_ids:
+            logger.info("Refreshed %d campaign snapshots.", len(campaign_ids))
+            self.stdout.write(f"Refreshed {len(campaign_ids)} snapshots.")
+        return len(campaign_ids)
@@ -0,0 +1,23 @@
+import logging
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from dunbud.services import render_stuck_portraits
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Periodic job that renders the thumbnails of portraits left pending, for
+    example when a restart killed the thumbnail pool. Meant to be run
+    periodically on the machine that holds the uploaded media.
+    """
+
+    help = "Renders thumbnails of portraits stuck pending for 15 minutes."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logger.info("Starting render_stuck_portraits")
+        count = render_stuck_portraits()
+        self.stdout.write(self.style.SUCCESS(f"Rendered {count} stuck portraits."))
@@ -0,0 +1,58 @@
+import logging
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+from dunbud.services import send_outbox
+from dunbud.services.outbox import BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Worker that delivers queued emails from the outbox. Meant to be run from
+    cron, or as a long-running process with ``--interval``.
+    """
+
+    help = "Sends pending emails from the outbox."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Emails sent per mail connection.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Keep running, polling the outbox every this many seconds.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        logger.info("Starting send_outbox")
+        if options["interval"] is None:
+            self._send(options["batch_size"])
+            return
+        while True:
+            # A long-running worker outlives database restarts: drop broken
+            # connections and keep polling after a failed run.
+            close_old_connections()
+            try:
+                self._send(options["batch_size"])
+            except Exception:
+                logger.exception("send_outbox run failed")
+            time.sleep(options["interval"])
+
+    def _send(self, batch_size: int) -> None:
+        result = send_outbox(batch_size=batch_size)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sent {result.sent} emails, {result.retried} to retry, "
+                f"{result.failed} failed, {result.deferred} deferred.",
+            ),
+        )
@@ -0,0 +1,73 @@
+"""
+Middleware for the Dungeon Buddy application.
+"""
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+
+def get_query_budget(request: HttpRequest) -> int | None:
+    """
+    Return the ``query_budget`` declared on the view that served the request.
+    """
+    match = request.resolver_match
+    if match is None:
+        return None
+    view_class = getattr(match.func, "view_class", None)
+    return getattr(view_class, "query_budget", None)
+
+
+class QueryCounter:
+    """
+    Database execute wrapper that counts the queries it sees.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueryBudgetMiddleware:
+    """
+    Counts the queries issued while handling a request and compares the total
+    with the ``query_budget`` declared on the view.
+
+    The count is exposed in the ``X-Query-Count`` response header, and a
+    warning is logged whenever a view exceeds its budget. Enabled in DEBUG.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+
+        response.headers["X-Query-Count"] = str(counter.count)
+
+        budget = get_query_budget(request)
+        if budget is not None and counter.count > budget:
+            logger.warning(
+                "Query budget exceeded for %s: %s queries (budget %s)",
+                request.path,
+                counter.count,
+                budget,
+            )
+        return response
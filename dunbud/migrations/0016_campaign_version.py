@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0015_partyfeeditem_session_session_recap_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False, help_text='Incremented whenever cached read models of the campaign go stale.'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:08
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0016_campaign_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignSnapshot',
+            fields=[
+                ('campaign', models.OneToOneField(help_text='The campaign this snapshot describes.', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='dunbud.campaign')),
+                ('version', models.PositiveIntegerField(help_text='The campaign version the document was built from.')),
+                ('document', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='The materialized campaign document.')),
+                ('generated_at', models.DateTimeField(auto_now=True, help_text='When the document was last regenerated.')),
+            ],
+            options={
+                'verbose_name': 'Campaign Snapshot',
+                'verbose_name_plural': 'Campaign Snapshots',
+            },
+        ),
+    ]
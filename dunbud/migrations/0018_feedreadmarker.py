@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0017_campaignsnapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedReadMarker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_read_at', models.DateTimeField(help_text='When the user last viewed the campaign feed.')),
+                ('campaign', models.ForeignKey(help_text='The campaign whose feed was read.', on_delete=django.db.models.deletion.CASCADE, related_name='feed_read_markers', to='dunbud.campaign')),
+                ('user', models.ForeignKey(help_text='The user who read the feed.', on_delete=django.db.models.deletion.CASCADE, related_name='feed_read_markers', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Feed Read Marker',
+                'verbose_name_plural': 'Feed Read Markers',
+                'constraints': [models.UniqueConstraint(fields=('user', 'campaign'), name='unique_feed_read_marker')],
+            },
+        ),
+    ]
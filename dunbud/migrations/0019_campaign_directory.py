@@ -0,0 +1,58 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_open_seats(apps, schema_editor):
+    Campaign = apps.get_model('dunbud', 'Campaign')
+
+    campaigns = Campaign.objects.annotate(player_count=Count('players'))
+    for campaign in campaigns.iterator():
+        open_seats = max(campaign.max_players - campaign.player_count, 0)
+        Campaign.objects.filter(pk=campaign.pk).update(open_seats=open_seats)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0018_feedreadmarker'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirectoryFacet',
+            fields=[
+                ('system', models.OneToOneField(help_text='The tabletop system counted by this facet.', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='directory_facet', serialize=False, to='dunbud.tabletopsystem')),
+                ('listed_campaigns', models.PositiveIntegerField(default=0, help_text='Number of public campaigns using the system.')),
+                ('open_campaigns', models.PositiveIntegerField(default=0, help_text='Number of public campaigns with at least one open seat.')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='When the counts were last refreshed.')),
+            ],
+            options={
+                'verbose_name': 'Directory Facet',
+                'verbose_name_plural': 'Directory Facets',
+            },
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='is_public',
+            field=models.BooleanField(default=False, help_text='Show this campaign in the public directory of open tables.', verbose_name='List in public directory'),
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='open_seats',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Denormalized number of free player slots.'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['is_public', '-created_at', '-id'], name='campaign_directory_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['is_public', 'system', '-created_at', '-id'], name='campaign_directory_system_idx'),
+        ),
+        migrations.RunPython(populate_open_seats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:17
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_helpful_link_count(apps, schema_editor):
+    Campaign = apps.get_model('dunbud', 'Campaign')
+
+    campaigns = Campaign.objects.annotate(link_count=Count('helpful_links'))
+    for campaign in campaigns.iterator():
+        Campaign.objects.filter(pk=campaign.pk).update(
+            helpful_link_count=campaign.link_count,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0019_campaign_directory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='helpful_link_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Denormalized number of helpful links, used for the limit.'),
+        ),
+        migrations.RunPython(populate_helpful_link_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0020_campaign_helpful_link_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LinkCheck',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(help_text='The checked URL.', unique=True)),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, help_text='HTTP status of the last check, empty if it failed.', null=True)),
+                ('is_healthy', models.BooleanField(default=False, help_text='Whether the URL answered with a non-error status.')),
+                ('error', models.CharField(blank=True, help_text='Why the last check failed, if it did not get a response.', max_length=255)),
+                ('checked_at', models.DateTimeField(db_index=True, help_text='When the URL was last checked.')),
+            ],
+            options={
+                'verbose_name': 'Link Check',
+                'verbose_name_plural': 'Link Checks',
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:05
+
+import hashlib
+from datetime import timedelta
+
+import dunbud.models.campaign_invite
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def hash_existing_tokens(apps, schema_editor):
+    CampaignInvitation = apps.get_model('dunbud', 'CampaignInvitation')
+
+    # Existing links keep working for one more invite lifetime.
+    expires_at = timezone.now() + timedelta(days=7)
+    for invite in CampaignInvitation.objects.iterator():
+        invite.token_hash = hashlib.sha256(invite.token.encode()).hexdigest()
+        invite.token_prefix = invite.token[:8]
+        invite.expires_at = expires_at
+        invite.save(update_fields=['token_hash', 'token_prefix', 'expires_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0021_linkcheck'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='token_hash',
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='token_prefix',
+            field=models.CharField(default='', editable=False, max_length=8),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='expires_at',
+            field=models.DateTimeField(default=dunbud.models.campaign_invite.default_invite_expiry),
+        ),
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='max_uses',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='use_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(hash_existing_tokens, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='campaigninvitation',
+            name='token',
+        ),
+        migrations.AlterField(
+            model_name='campaigninvitation',
+            name='token_hash',
+            field=models.CharField(editable=False, max_length=64, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='campaigninvitation',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['expires_at'], name='invite_active_expiry_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0022_hash_invitation_tokens'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='batch_id',
+            field=models.UUIDField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='delivery_error',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='delivery_status',
+            field=models.CharField(blank=True, choices=[('', 'Not emailed'), ('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='email',
+            field=models.EmailField(blank=True, max_length=254),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0023_invitation_email_delivery'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='invitee',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='campaign_invitations', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
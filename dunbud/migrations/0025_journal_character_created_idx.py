@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0024_campaigninvitation_invitee'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='journalentry',
+            index=models.Index(fields=['character', '-created_at', '-id'], name='journal_character_created_idx'),
+        ),
+    ]
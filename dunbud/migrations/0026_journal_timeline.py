@@ -0,0 +1,54 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+from blog.templatetags.markdown_extras import markdown_format
+
+
+def populate_journal_timeline(apps, schema_editor):
+    JournalEntry = apps.get_model('dunbud', 'JournalEntry')
+    PlayerCharacter = apps.get_model('dunbud', 'PlayerCharacter')
+
+    JournalEntry.objects.update(
+        campaign_id=Subquery(
+            PlayerCharacter.objects.filter(pk=OuterRef('character_id')).values(
+                'campaign_id',
+            ),
+        ),
+    )
+    entries = list(JournalEntry.objects.only('pk', 'content'))
+    for entry in entries:
+        entry.content_html = str(markdown_format(entry.content))
+    JournalEntry.objects.bulk_update(entries, ['content_html'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0025_journal_character_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='journalentry',
+            name='campaign',
+            field=models.ForeignKey(blank=True, editable=False, help_text='The campaign the character was in when writing the entry.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='journal_entries', to='dunbud.campaign'),
+        ),
+        migrations.AddField(
+            model_name='journalentry',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, help_text='The rendered and sanitized body.'),
+        ),
+        migrations.AddField(
+            model_name='journalentry',
+            name='visibility',
+            field=models.CharField(choices=[('party', 'Party'), ('dm', 'Dungeon Master only')], default='party', help_text='Who in the campaign can read this entry.', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='journalentry',
+            index=models.Index(fields=['campaign', '-created_at', '-id'], name='journal_campaign_created_idx'),
+        ),
+        migrations.RunPython(populate_journal_timeline, migrations.RunPython.noop),
+    ]
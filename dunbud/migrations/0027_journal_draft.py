@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0026_journal_timeline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JournalDraft',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='The character and entry the draft belongs to.', max_length=80, unique=True)),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('content', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('character', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='journal_drafts', to='dunbud.playercharacter')),
+                ('entry', models.ForeignKey(blank=True, help_text='The entry being edited; empty for a new entry.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='drafts', to='dunbud.journalentry')),
+            ],
+            options={
+                'verbose_name': 'Journal Draft',
+                'verbose_name_plural': 'Journal Drafts',
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0027_journal_draft'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TextRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field', models.CharField(choices=[('content', 'Content'), ('notes', 'Notes'), ('recap', 'Recap')], max_length=20)),
+                ('number', models.PositiveIntegerField(help_text="Position of the revision in the field's history.")),
+                ('is_snapshot', models.BooleanField(default=False, help_text='Whether data holds the full text rather than a delta.')),
+                ('data', models.BinaryField(help_text='The zlib-compressed full text or delta.')),
+                ('checksum', models.CharField(help_text='Digest of the full text after this revision.', max_length=16)),
+                ('length', models.PositiveIntegerField(help_text='Length of the full text after this revision.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('entry', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='dunbud.journalentry')),
+                ('session', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='dunbud.session')),
+            ],
+            options={
+                'verbose_name': 'Text Revision',
+                'verbose_name_plural': 'Text Revisions',
+                'constraints': [models.UniqueConstraint(condition=models.Q(('entry__isnull', False)), fields=('entry', 'field', 'number'), name='unique_entry_revision'), models.UniqueConstraint(condition=models.Q(('session__isnull', False)), fields=('session', 'field', 'number'), name='unique_session_revision'), models.CheckConstraint(condition=models.Q(models.Q(('entry__isnull', False), ('session__isnull', True)), models.Q(('entry__isnull', True), ('session__isnull', False)), _connector='OR'), name='revision_has_one_target')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0028_text_revision'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Portrait',
+            fields=[
+                ('digest', models.CharField(help_text='SHA-256 hex digest of the original image.', max_length=64, primary_key=True, serialize=False)),
+                ('content_type', models.CharField(help_text='MIME type sniffed from the uploaded bytes.', max_length=20)),
+                ('size', models.PositiveIntegerField(help_text='Size of the original in bytes.')),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], default='pending', help_text='Whether the thumbnails have been rendered.', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Portrait',
+                'verbose_name_plural': 'Portraits',
+            },
+        ),
+        migrations.AddField(
+            model_name='playercharacter',
+            name='portrait',
+            field=models.ForeignKey(blank=True, editable=False, help_text="The character's portrait image.", null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='characters', to='dunbud.portrait'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:55
+
+import django.db.models.deletion
+import dunbud.models.handout
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0029_portraits'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Handout',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('file', models.FileField(max_length=255, upload_to=dunbud.models.handout.handout_upload_to)),
+                ('content_type', models.CharField(max_length=100)),
+                ('size', models.PositiveBigIntegerField(help_text='Size of the file in bytes.')),
+                ('digest', models.CharField(help_text='SHA-256 hex digest of the file.', max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='handouts', to='dunbud.campaign')),
+                ('uploaded_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='handouts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Handout',
+                'verbose_name_plural': 'Handouts',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
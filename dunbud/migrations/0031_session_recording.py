@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:00
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0030_handouts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionRecording',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=200)),
+                ('content_type', models.CharField(max_length=100)),
+                ('size', models.PositiveBigIntegerField(help_text='Total size in bytes.')),
+                ('chunk_size', models.PositiveIntegerField(default=8388608)),
+                ('received', models.PositiveBigIntegerField(default=0, help_text='Bytes acknowledged so far.')),
+                ('status', models.CharField(choices=[('uploading', 'Uploading'), ('ready', 'Ready')], default='uploading', max_length=10)),
+                ('file', models.FileField(blank=True, max_length=255, upload_to='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recordings', to='dunbud.session')),
+                ('uploaded_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='session_recordings', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Session Recording',
+                'verbose_name_plural': 'Session Recordings',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'uploading')), fields=['updated_at'], name='recording_uploading_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, user_field):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{user_field: OuterRef('pk')})
+            .order_by()
+            .values(user_field)
+            .annotate(count=Count('*'))
+            .values('count'),
+        ),
+        0,
+    )
+
+
+def populate_player_stats(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Campaign = apps.get_model('dunbud', 'Campaign')
+    Session = apps.get_model('dunbud', 'Session')
+    JournalEntry = apps.get_model('dunbud', 'JournalEntry')
+    PlayerCharacter = apps.get_model('dunbud', 'PlayerCharacter')
+    PlayerStats = apps.get_model('dunbud', 'PlayerStats')
+
+    levels = {}
+    characters = (
+        PlayerCharacter.objects.order_by()
+        .values_list('user_id', 'level')
+        .annotate(count=Count('pk'))
+    )
+    for user_id, level, count in characters:
+        levels.setdefault(user_id, {})[str(level)] = count
+
+    rows = User.objects.annotate(
+        campaigns_run=_count(Campaign.objects.all(), 'dungeon_master'),
+        campaigns_joined=_count(Campaign.players.through.objects.all(), 'customuser'),
+        sessions_attended=_count(Session.attendees.through.objects.all(), 'customuser'),
+        journal_entries=_count(JournalEntry.objects.all(), 'character__user'),
+    ).values_list(
+        'pk',
+        'campaigns_run',
+        'campaigns_joined',
+        'sessions_attended',
+        'journal_entries',
+    )
+    PlayerStats.objects.bulk_create(
+        [
+            PlayerStats(
+                user_id=user_id,
+                campaigns_run=run,
+                campaigns_joined=joined,
+                sessions_attended=attended,
+                journal_entries=entries,
+                characters_by_level=levels.get(user_id, {}),
+            )
+            for user_id, run, joined, attended, entries in rows.iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0032_outgoing_email'),
+        ('users', '0002_username_prefix_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='player_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('campaigns_run', models.PositiveIntegerField(default=0)),
+                ('campaigns_joined', models.PositiveIntegerField(default=0)),
+                ('sessions_attended', models.PositiveIntegerField(default=0)),
+                ('journal_entries', models.PositiveIntegerField(default=0)),
+                ('characters_by_level', models.JSONField(default=dict, help_text='Number of characters per level, keyed by level.')),
+            ],
+            options={
+                'verbose_name': 'Player Stats',
+                'verbose_name_plural': 'Player Stats',
+            },
+        ),
+        migrations.RunPython(populate_player_stats, migrations.RunPython.noop),
+    ]
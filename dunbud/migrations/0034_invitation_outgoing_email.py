@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dunbud', '0033_player_stats'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='campaigninvitation',
+            name='delivery_error',
+        ),
+        migrations.RemoveField(
+            model_name='campaigninvitation',
+            name='delivery_status',
+        ),
+        migrations.AddField(
+            model_name='campaigninvitation',
+            name='outgoing_email',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='invitations', to='dunbud.outgoingemail'),
+        ),
+    ]
@@ -1,21 +1,42 @@
 from .campaign import Campaign
 from .campaign_invite import CampaignInvitation
+from .campaign_snapshot import CampaignSnapshot
 from .chat_message import ChatMessage
-from .feed import PartyFeedItem
+from .directory import DirectoryFacet
+from .feed import FeedReadMarker, PartyFeedItem
+from .handout import Handout
 from .journal import JournalEntry
+from .journal_draft import JournalDraft
+from .link_check import LinkCheck
 from .links import HelpfulLink
+from .outgoing_email import OutgoingEmail
 from .player_character import PlayerCharacter
+from .player_stats import PlayerStats
+from .portrait import Portrait
 from .session import Session
+from .session_recording import SessionRecording
 from .tabletop_system import TabletopSystem
+from .text_revision import TextRevision
 
 __all__ = [
     "Campaign",
     "CampaignInvitation",
+    "CampaignSnapshot",
     "ChatMessage",
+    "DirectoryFacet",
+    "FeedReadMarker",
+    "Handout",
+    "JournalDraft",
     "JournalEntry",
+    "LinkCheck",
     "TabletopSystem",
+    "TextRevision",
+    "OutgoingEmail",
     "PartyFeedItem",
     "PlayerCharacter",
+    "PlayerStats",
+    "Portrait",
     "HelpfulLink",
     "Session",
+    "SessionRecording",
 ]
@@ -14,6 +14,9 @@ from dunbud.models.tabletop_system import TabletopSystem
 
 logger = logging.getLogger(__name__)
 
+# Columns maintained by conditional UPDATEs rather than by saving the instance.
+DENORMALIZED_FIELDS = frozenset({"open_seats", "helpful_link_count", "version"})
+
 
 class Campaign(models.Model):
     """
@@ -74,6 +77,28 @@ class Campaign(models.Model):
         blank=True,
         help_text=_("Link to the video conference (e.g., Zoom, Discord)."),
     )
+    is_public = models.BooleanField(
+        default=False,
+        verbose_name=_("List in public directory"),
+        help_text=_("Show this campaign in the public directory of open tables."),
+    )
+    open_seats = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text=_("Denormalized number of free player slots."),
+    )
+    helpful_link_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text=_("Denormalized number of helpful links, used for the limit."),
+    )
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        help_text=_(
+            "Incremented whenever cached read models of the campaign go stale.",
+        ),
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text=_("The date and time when the campaign was created."),
@@ -91,6 +116,17 @@ class Campaign(models.Model):
         verbose_name = _("Campaign")
         verbose_name_plural = _("Campaigns")
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset pagination for the public directory.
+            models.Index(
+                fields=["is_public", "-created_at", "-id"],
+                name="campaign_directory_idx",
+            ),
+            models.Index(
+                fields=["is_public", "system", "-created_at", "-id"],
+                name="campaign_directory_system_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -109,6 +145,19 @@ class Campaign(models.Model):
         if not self.slug:
             self._generate_unique_slug()
 
+        if is_new:
+            self.open_seats = self.max_players
+
+        # The counters and version are only ever changed with conditional
+        # UPDATEs; leave them out of full saves so a stale instance cannot
+        # write its old values back over them.
+        if not is_new and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in DENORMALIZED_FIELDS
+            ]
+
         super().save(*args, **kwargs)
 
         if is_new:
@@ -1,24 +1,55 @@
+import hashlib
 import logging
 import secrets
 import uuid
+from datetime import datetime, timedelta
 from typing import Any
 
+from django.conf import settings
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+INVITE_LIFETIME = timedelta(days=7)
+
+
+def hash_invite_token(token: str) -> str:
+    """
+    Return the SHA-256 hex digest stored in place of a raw invitation token.
+    Tokens carry 256 random bits, so a fast unsalted hash is sufficient.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def default_invite_expiry() -> datetime:
+    return timezone.now() + INVITE_LIFETIME
+
 
 class CampaignInvitation(models.Model):
     """
     Model representing a secure invitation link to join a Campaign.
 
+    Only a hash of the token is stored. The raw token is available on the
+    instance as ``token`` right after it is created and is never persisted,
+    so the join link can only be shown once.
+
     Attributes:
         id (UUID): Primary key.
         campaign (Campaign): The campaign this invite belongs to.
-        token (str): The unique secure token for the link.
+        token_hash (str): SHA-256 digest of the secret token.
+        token_prefix (str): The first characters of the token, for display.
         created_at (datetime): When the invite was generated.
+        expires_at (datetime): When the invite stops working.
+        max_uses (int | None): How many players may join with it; None is unlimited.
+        use_count (int): How many players have joined with it.
         is_active (bool): Whether the invite is currently valid.
+        email (str): Recipient of an emailed invite; blank for shareable links.
+        invitee (CustomUser | None): The existing user an invite was sent to.
+        batch_id (UUID | None): The email batch the invite was sent in.
+        outgoing_email (OutgoingEmail | None): The outbox row delivering the
+            invite email; its status is the delivery status of the invite.
     """
 
     id: models.UUIDField = models.UUIDField(
@@ -31,28 +62,96 @@ class CampaignInvitation(models.Model):
         on_delete=models.CASCADE,
         related_name="invitations",
     )
-    token: models.CharField = models.CharField(
+    token_hash: models.CharField = models.CharField(
         max_length=64,
         unique=True,
         editable=False,
     )
+    token_prefix: models.CharField = models.CharField(
+        max_length=8,
+        editable=False,
+    )
     created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    expires_at: models.DateTimeField = models.DateTimeField(
+        default=default_invite_expiry,
+    )
+    max_uses: models.PositiveIntegerField = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+    )
+    use_count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
     is_active: models.BooleanField = models.BooleanField(default=True)
+    email: models.EmailField = models.EmailField(blank=True)
+    invitee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="campaign_invitations",
+    )
+    batch_id: models.UUIDField = models.UUIDField(
+        null=True,
+        blank=True,
+        db_index=True,
+        editable=False,
+    )
+    outgoing_email = models.ForeignKey(
+        "OutgoingEmail",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="invitations",
+        editable=False,
+    )
+
+    token: str | None = None
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["expires_at"],
+                condition=models.Q(is_active=True),
+                name="invite_active_expiry_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
-        return f"Invite for {self.campaign.name} ({self.token[:8]}...)"
+        return f"Invite for {self.campaign.name} ({self.token_prefix}...)"
 
     def save(self, *args: Any, **kwargs: Any) -> None:
         """
         Overridden save method to generate a secure token if one does not exist.
         """
-        if not self.token:
-            # Generate a url-safe secure token
-            self.token = secrets.token_urlsafe(32)
+        if not self.token_hash:
+            self.set_new_token()
         super().save(*args, **kwargs)
 
     def get_absolute_url(self) -> str:
         """
         Returns the absolute URL path to join this campaign.
+        Only available on the instance that generated the token.
         """
+        if not self.token:
+            raise ValueError("The raw token is only available when it is created.")
         return reverse("campaign_join", kwargs={"token": self.token})
+
+    def set_new_token(self) -> str:
+        """
+        Generate a url-safe secure token and keep only its hash.
+        Used directly for invites created with ``bulk_create``.
+        """
+        self.token = secrets.token_urlsafe(32)
+        self.token_hash = hash_invite_token(self.token)
+        self.token_prefix = self.token[:8]
+        return self.token
+
+    @property
+    def is_usable(self) -> bool:
+        """
+        Whether the invite is active, unexpired and has uses left.
+        """
+        return (
+            self.is_active
+            and self.expires_at > timezone.now()
+            and (self.max_uses is None or self.use_count < self.max_uses)
+        )
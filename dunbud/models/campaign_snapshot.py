@@ -0,0 +1,43 @@
+import logging
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .campaign import Campaign
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignSnapshot(models.Model):
+    """
+    Denormalized JSON document describing a campaign and everything shown on
+    its page. Shares its primary key with the campaign, so serving it costs a
+    single primary-key lookup.
+    """
+
+    campaign = models.OneToOneField(
+        Campaign,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="snapshot",
+        help_text=_("The campaign this snapshot describes."),
+    )
+    version = models.PositiveIntegerField(
+        help_text=_("The campaign version the document was built from."),
+    )
+    document = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        help_text=_("The materialized campaign document."),
+    )
+    generated_at = models.DateTimeField(
+        auto_now=True,
+        help_text=_("When the document was last regenerated."),
+    )
+
+    class Meta:
+        verbose_name = _("Campaign Snapshot")
+        verbose_name_plural = _("Campaign Snapshots")
+
+    def __str__(self) -> str:
+        return f"Snapshot of {self.campaign_id} (v{self.version})"
@@ -0,0 +1,42 @@
+import logging
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .tabletop_system import TabletopSystem
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryFacet(models.Model):
+    """
+    Precomputed facet counts for the public campaign directory, one row per
+    tabletop system. Refreshed whenever listed campaigns change.
+    """
+
+    system = models.OneToOneField(
+        TabletopSystem,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="directory_facet",
+        help_text=_("The tabletop system counted by this facet."),
+    )
+    listed_campaigns = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of public campaigns using the system."),
+    )
+    open_campaigns = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of public campaigns with at least one open seat."),
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text=_("When the counts were last refreshed."),
+    )
+
+    class Meta:
+        verbose_name = _("Directory Facet")
+        verbose_name_plural = _("Directory Facets")
+
+    def __str__(self) -> str:
+        return f"{self.system}: {self.open_campaigns} open"
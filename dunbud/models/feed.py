@@ -1,5 +1,6 @@
 import uuid
 
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -58,3 +59,39 @@ class PartyFeedItem(models.Model):
 
     def __str__(self) -> str:
         return f"{self.campaign.name}: [{self.category}] {self.message}"
+
+
+class FeedReadMarker(models.Model):
+    """
+    Records when a user last read a campaign's party feed.
+    Feed items created after ``last_read_at`` count as unread.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="feed_read_markers",
+        help_text=_("The user who read the feed."),
+    )
+    campaign = models.ForeignKey(
+        Campaign,
+        on_delete=models.CASCADE,
+        related_name="feed_read_markers",
+        help_text=_("The campaign whose feed was read."),
+    )
+    last_read_at = models.DateTimeField(
+        help_text=_("When the user last viewed the campaign feed."),
+    )
+
+    class Meta:
+        verbose_name = _("Feed Read Marker")
+        verbose_name_plural = _("Feed Read Markers")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "campaign"],
+                name="unique_feed_read_marker",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user_id} read {self.campaign_id} at {self.last_read_at}"
@@ -0,0 +1,71 @@
+import logging
+import uuid
+from typing import Any
+
+from django.conf import settings
+from django.db import models
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+
+logger = logging.getLogger(__name__)
+
+MAX_HANDOUT_SIZE = 200 * 1024 * 1024
+# Types a browser may display inline; everything else is downloaded.
+INLINE_CONTENT_TYPES = frozenset(
+    {"application/pdf", "image/gif", "image/jpeg", "image/png", "image/webp"},
+)
+
+
+def handout_upload_to(instance: Any, filename: str) -> str:
+    return f"handouts/{instance.campaign_id}/{instance.pk}/{filename}"
+
+
+class Handout(models.Model):
+    """
+    A file the Dungeon Master shares with a campaign, such as a map or a PDF.
+
+    The digest of the file is taken while it is uploaded and serves as its
+    strong ETag, so downloads never hash the file again.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    campaign = models.ForeignKey(
+        "Campaign",
+        on_delete=models.CASCADE,
+        related_name="handouts",
+    )
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="handouts",
+    )
+    title = models.CharField(max_length=255)
+    file = models.FileField(upload_to=handout_upload_to, max_length=255)
+    content_type = models.CharField(max_length=100)
+    size = models.PositiveBigIntegerField(help_text=_("Size of the file in bytes."))
+    digest = models.CharField(
+        max_length=64,
+        help_text=_("SHA-256 hex digest of the file."),
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Handout")
+        verbose_name_plural = _("Handouts")
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return self.title
+
+    def get_absolute_url(self) -> str:
+        return reverse("handout_download", kwargs={"pk": self.pk})
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+    @property
+    def is_inline(self) -> bool:
+        return self.content_type in INLINE_CONTENT_TYPES
@@ -5,6 +5,7 @@ from typing import Any
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from blog.templatetags.markdown_extras import markdown_format
 from dunbud.models.player_character import PlayerCharacter
 from dunbud.models.session import Session
 
@@ -15,8 +16,16 @@ class JournalEntry(models.Model):
     """
     Model representing a journal entry written by a player for their character.
     Can optionally be linked to a specific session.
+
+    The campaign is copied from the character when the entry is written, so
+    the campaign timeline reads a single indexed table, and the markdown body
+    is rendered once on save into ``content_html``.
     """
 
+    class Visibility(models.TextChoices):
+        PARTY = "party", _("Party")
+        DUNGEON_MASTER = "dm", _("Dungeon Master only")
+
     id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
@@ -29,6 +38,15 @@ class JournalEntry(models.Model):
         related_name="journal_entries",
         help_text=_("The character who wrote this entry."),
     )
+    campaign = models.ForeignKey(
+        "Campaign",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="journal_entries",
+        help_text=_("The campaign the character was in when writing the entry."),
+    )
     session = models.ForeignKey(
         Session,
         on_delete=models.SET_NULL,
@@ -44,6 +62,17 @@ class JournalEntry(models.Model):
     content = models.TextField(
         help_text=_("The main body of the journal entry."),
     )
+    content_html = models.TextField(
+        blank=True,
+        editable=False,
+        help_text=_("The rendered and sanitized body."),
+    )
+    visibility = models.CharField(
+        max_length=10,
+        choices=Visibility.choices,
+        default=Visibility.PARTY,
+        help_text=_("Who in the campaign can read this entry."),
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text=_("When the entry was created."),
@@ -57,6 +86,16 @@ class JournalEntry(models.Model):
         verbose_name = _("Journal Entry")
         verbose_name_plural = _("Journal Entries")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["character", "-created_at", "-id"],
+                name="journal_character_created_idx",
+            ),
+            models.Index(
+                fields=["campaign", "-created_at", "-id"],
+                name="journal_campaign_created_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.character.name})"
@@ -64,8 +103,12 @@ class JournalEntry(models.Model):
     def save(self, *args: Any, **kwargs: Any) -> None:
         """
         Saves the journal entry and logs the creation.
+        Records the character's campaign on new entries and renders the body.
         """
         is_new = self._state.adding
+        if is_new and self.campaign_id is None:
+            self.campaign_id = self.character.campaign_id
+        self.content_html = str(markdown_format(self.content))
         super().save(*args, **kwargs)
         if is_new:
             logger.info(
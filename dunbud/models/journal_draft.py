@@ -0,0 +1,44 @@
+import logging
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+logger = logging.getLogger(__name__)
+
+
+class JournalDraft(models.Model):
+    """
+    Unsaved changes to a journal entry, written by autosave.
+
+    One row per character and entry (or per character for a new entry),
+    addressed by ``key``. The draft is deleted once the entry is saved.
+    """
+
+    key = models.CharField(
+        max_length=80,
+        unique=True,
+        help_text=_("The character and entry the draft belongs to."),
+    )
+    character = models.ForeignKey(
+        "PlayerCharacter",
+        on_delete=models.CASCADE,
+        related_name="journal_drafts",
+    )
+    entry = models.ForeignKey(
+        "JournalEntry",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="drafts",
+        help_text=_("The entry being edited; empty for a new entry."),
+    )
+    title = models.CharField(max_length=255, blank=True)
+    content = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        verbose_name = _("Journal Draft")
+        verbose_name_plural = _("Journal Drafts")
+
+    def __str__(self) -> str:
+        return f"Draft {self.key}"
@@ -0,0 +1,43 @@
+import logging
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+logger = logging.getLogger(__name__)
+
+
+class LinkCheck(models.Model):
+    """
+    The latest health check of an external URL. Keyed by URL so a link shared
+    by several campaigns or characters is only checked once.
+    """
+
+    url = models.URLField(
+        unique=True,
+        help_text=_("The checked URL."),
+    )
+    status_code = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text=_("HTTP status of the last check, empty if it failed."),
+    )
+    is_healthy = models.BooleanField(
+        default=False,
+        help_text=_("Whether the URL answered with a non-error status."),
+    )
+    error = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text=_("Why the last check failed, if it did not get a response."),
+    )
+    checked_at = models.DateTimeField(
+        db_index=True,
+        help_text=_("When the URL was last checked."),
+    )
+
+    class Meta:
+        verbose_name = _("Link Check")
+        verbose_name_plural = _("Link Checks")
+
+    def __str__(self) -> str:
+        return f"{self.url}: {self.status_code or self.error}"
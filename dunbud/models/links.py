@@ -1,9 +1,50 @@
+from typing import Any
+
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 from dunbud.models.campaign import Campaign
 
 MAX_LINKS_PER_CAMPAIGN = 20
+LINK_LIMIT_MESSAGE = (
+    f"You can only add up to {MAX_LINKS_PER_CAMPAIGN} helpful links per campaign."
+)
+
+
+def reserve_link_slots(campaign_id: Any, count: int = 1) -> None:
+    """
+    Claim ``count`` link slots on the campaign's ``helpful_link_count``.
+
+    The check and the increment are a single conditional UPDATE, so
+    concurrent writers can never overshoot the limit and no row is locked
+    with SELECT ... FOR UPDATE. Raises ValidationError if the slots are
+    not available.
+    """
+    claimed = Campaign.objects.filter(
+        pk=campaign_id,
+        helpful_link_count__lte=MAX_LINKS_PER_CAMPAIGN - count,
+    ).update(helpful_link_count=F("helpful_link_count") + count)
+    if not claimed:
+        raise ValidationError(LINK_LIMIT_MESSAGE)
+
+
+def sync_helpful_link_counts(*campaign_ids: Any) -> None:
+    """
+    Recompute ``helpful_link_count`` from the link rows, for writes that
+    bypass ``HelpfulLink.save()`` such as ``bulk_create``.
+    """
+    link_count = (
+        HelpfulLink.objects.filter(campaign=OuterRef("pk"))
+        .order_by()
+        .values("campaign")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    Campaign.objects.filter(pk__in=campaign_ids).update(
+        helpful_link_count=Coalesce(Subquery(link_count), 0),
+    )
 
 
 class HelpfulLink(models.Model):
@@ -20,18 +61,26 @@ class HelpfulLink(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Claim a link slot on the campaign before inserting a new link.
+        """
+        if not self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
+        with transaction.atomic():
+            reserve_link_slots(self.campaign_id)
+            super().save(*args, **kwargs)
+
     def clean(self) -> None:
         """
-        Validate that the campaign does not have more than 20 helpful links.
+        Reject new links for campaigns that are already full.
+        This reads the counter without locking; save() makes the final call.
         """
-        if self.pk is None and self.campaign:
-            with transaction.atomic():
-                campaign = (
-                    Campaign.objects.select_for_update()
-                    .filter(slug=self.campaign.slug)
-                    .get()
-                )
-                if campaign.helpful_links.count() >= MAX_LINKS_PER_CAMPAIGN:
-                    raise ValidationError(
-                        "You can only add up to 20 helpful links per campaign.",
-                    )
+        if (
+            self.pk is None
+            and self.campaign_id is not None
+            and self.campaign.helpful_link_count >= MAX_LINKS_PER_CAMPAIGN
+        ):
+            raise ValidationError(LINK_LIMIT_MESSAGE)
@@ -59,6 +59,15 @@ class PlayerCharacter(models.Model):
         default=1,
         help_text=_("The level of the character."),
     )
+    portrait = models.ForeignKey(
+        "Portrait",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="characters",
+        help_text=_("The character's portrait image."),
+    )
     bio = models.TextField(
         blank=True,
         help_text=_("Character biography and description."),
@@ -0,0 +1,53 @@
+import logging
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+logger = logging.getLogger(__name__)
+
+
+class PlayerStats(models.Model):
+    """
+    Public counters shown on a user's profile.
+
+    The counters are kept up to date incrementally by signals as campaigns,
+    memberships, attendance, journal entries and characters change, so the
+    profile reads one row instead of counting. ``rebuild_player_stats``
+    recomputes them from scratch.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="player_stats",
+    )
+    campaigns_run = models.PositiveIntegerField(default=0)
+    campaigns_joined = models.PositiveIntegerField(default=0)
+    sessions_attended = models.PositiveIntegerField(default=0)
+    journal_entries = models.PositiveIntegerField(default=0)
+    characters_by_level = models.JSONField(
+        default=dict,
+        help_text=_("Number of characters per level, keyed by level."),
+    )
+
+    class Meta:
+        verbose_name = _("Player Stats")
+        verbose_name_plural = _("Player Stats")
+
+    def __str__(self) -> str:
+        return f"Stats for user {self.user_id}"
+
+    @property
+    def character_levels(self) -> list[tuple[int, int]]:
+        """
+        (level, number of characters) pairs, lowest level first.
+        """
+        return sorted(
+            (int(level), count) for level, count in self.characters_by_level.items()
+        )
+
+    @property
+    def character_count(self) -> int:
+        return sum(self.characters_by_level.values())
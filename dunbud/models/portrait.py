@@ -0,0 +1,64 @@
+import logging
+
+from django.db import models
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+
+logger = logging.getLogger(__name__)
+
+
+class Portrait(models.Model):
+    """
+    An uploaded character portrait, keyed by the SHA-256 digest of its bytes.
+
+    Identical uploads share one row and one file. The original is stored under
+    ``portraits/<first two digest characters>/<digest>`` and its thumbnails
+    next to it; all of these names are derived from the digest, so the files
+    never change once written.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        READY = "ready", _("Ready")
+        FAILED = "failed", _("Failed")
+
+    digest = models.CharField(
+        max_length=64,
+        primary_key=True,
+        help_text=_("SHA-256 hex digest of the original image."),
+    )
+    content_type = models.CharField(
+        max_length=20,
+        help_text=_("MIME type sniffed from the uploaded bytes."),
+    )
+    size = models.PositiveIntegerField(help_text=_("Size of the original in bytes."))
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        help_text=_("Whether the thumbnails have been rendered."),
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Portrait")
+        verbose_name_plural = _("Portraits")
+
+    def __str__(self) -> str:
+        return f"Portrait {self.digest[:12]} ({self.status})"
+
+    @property
+    def directory(self) -> str:
+        return f"portraits/{self.digest[:2]}"
+
+    @property
+    def original_name(self) -> str:
+        return f"{self.directory}/{self.digest}"
+
+    def get_thumbnail_url(self, size: str = "small", extension: str = "webp") -> str:
+        return reverse(
+            "portrait_thumbnail",
+            kwargs={"digest": self.digest, "size": size, "extension": extension},
+        )
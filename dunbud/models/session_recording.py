@@ -0,0 +1,91 @@
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+
+logger = logging.getLogger(__name__)
+
+MAX_RECORDING_SIZE = 8 * 1024 * 1024 * 1024
+RECORDING_CHUNK_SIZE = 8 * 1024 * 1024
+# Unfinished uploads untouched for this long are purged.
+UPLOAD_LIFETIME = timedelta(days=2)
+PARTIAL_DIRECTORY = "uploads/partial"
+
+
+class SessionRecording(models.Model):
+    """
+    An audio or video recording of a session.
+
+    Recordings are uploaded in ``chunk_size`` parts that are appended to a
+    partial file; ``received`` is the number of bytes acknowledged so far, so
+    an interrupted upload resumes from there. Committing moves the complete
+    file into place. A committed file never changes, so its id and size make
+    a strong ETag.
+    """
+
+    class Status(models.TextChoices):
+        UPLOADING = "uploading", _("Uploading")
+        READY = "ready", _("Ready")
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    session = models.ForeignKey(
+        "Session",
+        on_delete=models.CASCADE,
+        related_name="recordings",
+    )
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="session_recordings",
+    )
+    filename = models.CharField(max_length=200)
+    content_type = models.CharField(max_length=100)
+    size = models.PositiveBigIntegerField(help_text=_("Total size in bytes."))
+    chunk_size = models.PositiveIntegerField(default=RECORDING_CHUNK_SIZE)
+    received = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Bytes acknowledged so far."),
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.UPLOADING,
+    )
+    file = models.FileField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Session Recording")
+        verbose_name_plural = _("Session Recordings")
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(status="uploading"),
+                name="recording_uploading_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.filename} ({self.status})"
+
+    def get_absolute_url(self) -> str:
+        return reverse("session_recording_download", kwargs={"pk": self.pk})
+
+    @property
+    def partial_name(self) -> str:
+        return f"{PARTIAL_DIRECTORY}/{self.pk}.part"
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.pk.hex}-{self.size}"'
+
+    @property
+    def is_video(self) -> bool:
+        return self.content_type.startswith("video/")
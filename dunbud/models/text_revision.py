@@ -0,0 +1,85 @@
+import logging
+
+from django.db import models
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+logger = logging.getLogger(__name__)
+
+
+class TextRevision(models.Model):
+    """
+    One stored version of a long text field: a journal entry's content or a
+    session's notes or recap.
+
+    Revisions are numbered from 0 per object and field. Most hold a compressed
+    delta against the previous revision; every ``SNAPSHOT_INTERVAL``-th one
+    (and the first) holds the full compressed text, so any revision can be
+    rebuilt from a bounded number of rows.
+    """
+
+    class Field(models.TextChoices):
+        CONTENT = "content", _("Content")
+        NOTES = "notes", _("Notes")
+        RECAP = "recap", _("Recap")
+
+    entry = models.ForeignKey(
+        "JournalEntry",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="revisions",
+    )
+    session = models.ForeignKey(
+        "Session",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="revisions",
+    )
+    field = models.CharField(max_length=20, choices=Field.choices)
+    number = models.PositiveIntegerField(
+        help_text=_("Position of the revision in the field's history."),
+    )
+    is_snapshot = models.BooleanField(
+        default=False,
+        help_text=_("Whether data holds the full text rather than a delta."),
+    )
+    data = models.BinaryField(
+        help_text=_("The zlib-compressed full text or delta."),
+    )
+    checksum = models.CharField(
+        max_length=16,
+        help_text=_("Digest of the full text after this revision."),
+    )
+    length = models.PositiveIntegerField(
+        help_text=_("Length of the full text after this revision."),
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Text Revision")
+        verbose_name_plural = _("Text Revisions")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["entry", "field", "number"],
+                condition=Q(entry__isnull=False),
+                name="unique_entry_revision",
+            ),
+            models.UniqueConstraint(
+                fields=["session", "field", "number"],
+                condition=Q(session__isnull=False),
+                name="unique_session_revision",
+            ),
+            models.CheckConstraint(
+                condition=Q(entry__isnull=False, session__isnull=True)
+                | Q(entry__isnull=True, session__isnull=False),
+                name="revision_has_one_target",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        target = (
+            f"entry {self.entry_id}" if self.entry_id else f"session {self.session_id}"
+        )
+        return f"Revision {self.number} of {target} {self.field}"
@@ -0,0 +1,181 @@
+from .dashboard import TableEntry, build_my_table, mark_feed_read
+from .directory import (
+    DirectoryPage,
+    get_directory_facets,
+    get_directory_page,
+    rebuild_directory_facets,
+    refresh_campaign_facets,
+    refresh_directory_facets,
+    refresh_open_seats,
+)
+from .downloads import serve_file
+from .invitation_emails import (
+    InvitationEmail,
+    create_email_invitations,
+    get_invitation_batch,
+)
+from .invitations import (
+    create_invitation,
+    deactivate_expired_invitations,
+    find_invitation,
+    record_invitation_use,
+)
+from .journal_drafts import (
+    discard_journal_draft,
+    get_journal_draft,
+    purge_expired_drafts,
+    save_journal_draft,
+)
+from .journal_export import stream_journal_export
+from .journals import (
+    JournalPage,
+    TimelinePage,
+    get_campaign_timeline,
+    get_journal_count,
+    get_journal_page,
+    visible_journal_entries,
+)
+from .link_health import (
+    LinkChecker,
+    LinkResult,
+    get_link_health,
+    run_link_checks,
+    store_link_results,
+    urls_due_for_check,
+)
+from .links import import_helpful_links
+from .membership import (
+    CampaignRole,
+    JoinOutcome,
+    get_campaign_role,
+    get_role_map,
+    invalidate_role_map,
+    is_campaign_member,
+    is_dungeon_master,
+    join_campaign,
+)
+from .outbox import (
+    CircuitBreaker,
+    OutboxResult,
+    purge_sent_emails,
+    queue_email,
+    queue_emails,
+    send_outbox,
+    send_outbox_batch,
+)
+from .player_stats import (
+    adjust_player_stats,
+    get_player_stats,
+    rebuild_player_stats,
+    refresh_character_levels,
+)
+from .portraits import generate_thumbnails, render_stuck_portraits, store_portrait
+from .recordings import (
+    RecordingOffsetError,
+    RecordingUploadError,
+    abort_recording_upload,
+    append_recording_chunk,
+    commit_recording_upload,
+    purge_stale_uploads,
+    start_recording_upload,
+)
+from .revisions import (
+    RevisionSummary,
+    get_revision_diff,
+    get_revision_text,
+    list_revisions,
+    record_revision,
+)
+from .roster import RosterCharacter, RosterMember, build_party_roster, get_party_roster
+from .snapshot import (
+    build_campaign_document,
+    get_campaign_snapshot,
+    mark_snapshots_stale,
+    refresh_campaign_snapshot,
+    stale_campaign_ids,
+)
+from .versioning import bump_campaign_version, campaign_cache_key
+
+__all__ = [
+    "CampaignRole",
+    "CircuitBreaker",
+    "DirectoryPage",
+    "InvitationEmail",
+    "JoinOutcome",
+    "JournalPage",
+    "LinkChecker",
+    "LinkResult",
+    "OutboxResult",
+    "RecordingOffsetError",
+    "RecordingUploadError",
+    "RevisionSummary",
+    "RosterCharacter",
+    "RosterMember",
+    "TableEntry",
+    "TimelinePage",
+    "abort_recording_upload",
+    "adjust_player_stats",
+    "append_recording_chunk",
+    "build_campaign_document",
+    "build_my_table",
+    "build_party_roster",
+    "bump_campaign_version",
+    "campaign_cache_key",
+    "commit_recording_upload",
+    "create_email_invitations",
+    "create_invitation",
+    "deactivate_expired_invitations",
+    "discard_journal_draft",
+    "find_invitation",
+    "generate_thumbnails",
+    "get_campaign_role",
+    "get_campaign_snapshot",
+    "get_campaign_timeline",
+    "get_directory_facets",
+    "get_directory_page",
+    "get_invitation_batch",
+    "get_journal_count",
+    "get_journal_draft",
+    "get_journal_page",
+    "get_link_health",
+    "get_party_roster",
+    "get_player_stats",
+    "get_revision_diff",
+    "get_revision_text",
+    "get_role_map",
+    "import_helpful_links",
+    "invalidate_role_map",
+    "is_campaign_member",
+    "is_dungeon_master",
+    "join_campaign",
+    "list_revisions",
+    "mark_feed_read",
+    "mark_snapshots_stale",
+    "purge_expired_drafts",
+    "purge_sent_emails",
+    "purge_stale_uploads",
+    "queue_email",
+    "queue_emails",
+    "rebuild_directory_facets",
+    "rebuild_player_stats",
+    "record_invitation_use",
+    "record_revision",
+    "refresh_campaign_facets",
+    "refresh_campaign_snapshot",
+    "refresh_character_levels",
+    "refresh_directory_facets",
+    "refresh_open_seats",
+    "render_stuck_portraits",
+    "run_link_checks",
+    "save_journal_draft",
+    "send_outbox",
+    "send_outbox_batch",
+    "serve_file",
+    "stale_campaign_ids",
+    "start_recording_upload",
+    "store_link_results",
+    "store_portrait",
+    "stream_journal_export",
+    "urls_due_for_check",
+    "visible_journal_entries",
+]
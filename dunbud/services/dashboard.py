@@ -0,0 +1,159 @@
+"""
+"My Table" dashboard read model.
+
+Lists every campaign a user belongs to, in any role, with the next upcoming
+session, the number of unread feed items and the user's character. The next
+session and unread count are correlated subqueries, so the whole dashboard is
+built from two queries no matter how many campaigns the user is in.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from django.db.models import (
+    Count,
+    DateTimeField,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from dunbud.models import (
+    Campaign,
+    FeedReadMarker,
+    PartyFeedItem,
+    PlayerCharacter,
+    Session,
+)
+from dunbud.services.membership import CampaignRole
+
+logger = logging.getLogger(__name__)
+
+# Feeds that were never opened count every item as unread.
+NEVER_READ = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class TableEntry:
+    """
+    A single campaign on the user's dashboard.
+    """
+
+    campaign: Campaign
+    role: CampaignRole
+    character: PlayerCharacter | None
+    unread_count: int
+    next_session_date: datetime | None
+    next_session_number: int | None
+
+
+def build_my_table(user: Any) -> list[TableEntry]:
+    """
+    Build the dashboard for a user, ordered by their next session.
+    """
+    if not user.is_authenticated:
+        return []
+
+    upcoming = Session.objects.filter(
+        campaign=OuterRef("pk"),
+        proposed_date__gte=timezone.now(),
+    ).order_by("proposed_date")
+    last_read = FeedReadMarker.objects.filter(
+        user=user,
+        campaign=OuterRef("pk"),
+    ).values("last_read_at")[:1]
+    unread = (
+        PartyFeedItem.objects.filter(
+            campaign=OuterRef("pk"),
+            created_at__gt=OuterRef("last_read_at"),
+        )
+        .order_by()
+        .values("campaign")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+
+    campaigns = list(
+        Campaign.objects.filter(
+            Q(dungeon_master=user)
+            | Q(pk__in=Campaign.objects.filter(players=user).values("pk")),
+        )
+        .select_related("system")
+        .annotate(
+            next_session_date=Subquery(upcoming.values("proposed_date")[:1]),
+            next_session_number=Subquery(upcoming.values("session_number")[:1]),
+            last_read_at=Coalesce(
+                Subquery(last_read),
+                Value(NEVER_READ),
+                output_field=DateTimeField(),
+            ),
+            unread_count=Coalesce(
+                Subquery(unread, output_field=IntegerField()),
+                0,
+            ),
+        )
+        .order_by(F("next_session_date").asc(nulls_last=True), "name"),
+    )
+
+    characters: dict[Any, PlayerCharacter] = {}
+    if campaigns:
+        for character in PlayerCharacter.objects.filter(
+            user=user,
+            campaign__in=campaigns,
+        ).order_by("name"):
+            characters.setdefault(character.campaign_id, character)
+
+    return [
+        TableEntry(
+            campaign=campaign,
+            role=(
+                CampaignRole.DUNGEON_MASTER
+                if campaign.dungeon_master_id == user.pk
+                else CampaignRole.PLAYER
+            ),
+            character=characters.get(campaign.pk),
+            unread_count=campaign.unread_count,  # type: ignore[attr-defined]
+            next_session_date=campaign.next_session_date,  # type: ignore[attr-defined]
+            next_session_number=campaign.next_session_number,  # type: ignore[attr-defined]
+        )
+        for campaign in campaigns
+    ]
+
+
+def mark_feed_read(user: Any, campaign: Campaign) -> None:
+    """
+    Record that the user has read the campaign feed, with a single upsert.
+    The upsert is skipped unless the feed has items newer than the marker, so
+    repeat visits to a quiet campaign cost one read instead of a write.
+    """
+    if not user.is_authenticated:
+        return
+
+    last_read = FeedReadMarker.objects.filter(
+        user=user,
+        campaign=campaign,
+    ).values("last_read_at")[:1]
+    has_unread = PartyFeedItem.objects.filter(
+        campaign=campaign,
+        created_at__gt=Coalesce(
+            Subquery(last_read),
+            Value(NEVER_READ),
+            output_field=DateTimeField(),
+        ),
+    ).exists()
+    if not has_unread:
+        return
+
+    FeedReadMarker.objects.bulk_create(
+        [FeedReadMarker(user=user, campaign=campaign, last_read_at=timezone.now())],
+        update_conflicts=True,
+        unique_fields=["user", "campaign"],
+        update_fields=["last_read_at"],
+    )
@@ -0,0 +1,158 @@
+"""
+Public campaign directory.
+
+Campaigns opt in with ``Campaign.is_public``. Each campaign stores its number
+of free seats in ``open_seats`` and per-system facet counts live in
+``DirectoryFacet``; both are refreshed by signals when membership or listing
+settings change, so browsing never counts players. Results are paginated
+with an opaque (created_at, id) keyset cursor.
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from django.db.models import Count, F, OuterRef, Q, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from dunbud.models import Campaign, DirectoryFacet
+from dunbud.services.pagination import keyset_page
+
+logger = logging.getLogger(__name__)
+
+DIRECTORY_PAGE_SIZE = 20
+
+
+@dataclass(frozen=True, slots=True)
+class DirectoryPage:
+    """
+    One page of directory results and the cursor for the next page.
+    """
+
+    campaigns: list[Campaign]
+    next_cursor: str | None
+
+
+def refresh_open_seats(*campaign_ids: Any) -> None:
+    """
+    Recompute ``open_seats`` for the given campaigns with a single UPDATE.
+    """
+    ids = {campaign_id for campaign_id in campaign_ids if campaign_id is not None}
+    if not ids:
+        return
+
+    player_count = (
+        Campaign.objects.filter(pk=OuterRef("pk"))
+        .order_by()
+        .annotate(player_count=Count("players"))
+        .values("player_count")
+    )
+    Campaign.objects.filter(pk__in=ids).update(
+        open_seats=Greatest(
+            F("max_players") - Coalesce(Subquery(player_count), 0),
+            Value(0),
+        ),
+    )
+
+
+def _facet_counts(campaigns: QuerySet[Campaign]) -> list[DirectoryFacet]:
+    """
+    Aggregate listed and open campaign counts per system.
+    """
+    return [
+        DirectoryFacet(
+            system_id=row["system_id"],
+            listed_campaigns=row["listed"],
+            open_campaigns=row["open"],
+        )
+        for row in campaigns.filter(is_public=True, system__isnull=False)
+        .order_by()
+        .values("system_id")
+        .annotate(
+            listed=Count("pk"),
+            open=Count("pk", filter=Q(open_seats__gt=0)),
+        )
+    ]
+
+
+def _store_facets(facets: list[DirectoryFacet]) -> None:
+    """
+    Upsert facet rows with a single statement.
+    """
+    if facets:
+        DirectoryFacet.objects.bulk_create(
+            facets,
+            update_conflicts=True,
+            unique_fields=["system"],
+            update_fields=["listed_campaigns", "open_campaigns", "updated_at"],
+        )
+
+
+def refresh_directory_facets(system_ids: Iterable[Any]) -> None:
+    """
+    Recompute the facet rows of the given systems.
+    """
+    wanted = {pk for pk in system_ids if pk is not None}
+    if not wanted:
+        return
+
+    facets = _facet_counts(Campaign.objects.filter(system_id__in=wanted))
+    emptied = wanted - {facet.system_id for facet in facets}
+    facets += [DirectoryFacet(system_id=pk) for pk in emptied]
+    _store_facets(facets)
+    logger.debug("Refreshed directory facets for systems %s", wanted)
+
+
+def refresh_campaign_facets(*campaign_ids: Any) -> None:
+    """
+    Recompute the facets of the systems used by the given public campaigns.
+    Builds the counts with one aggregate query and stores them with one upsert.
+    """
+    systems = Campaign.objects.filter(
+        pk__in=campaign_ids,
+        is_public=True,
+    ).values("system_id")
+    _store_facets(_facet_counts(Campaign.objects.filter(system_id__in=systems)))
+
+
+def rebuild_directory_facets() -> None:
+    """
+    Recompute every facet row from scratch.
+    """
+    facets = _facet_counts(Campaign.objects.all())
+    DirectoryFacet.objects.exclude(
+        system_id__in=[facet.system_id for facet in facets],
+    ).delete()
+    _store_facets(facets)
+
+
+def get_directory_facets() -> QuerySet[DirectoryFacet]:
+    """
+    Return the non-empty facets, ordered by system name.
+    """
+    return (
+        DirectoryFacet.objects.filter(listed_campaigns__gt=0)
+        .select_related("system")
+        .order_by("system__name")
+    )
+
+
+def get_directory_page(
+    system_id: Any = None,
+    min_open_seats: int = 1,
+    cursor: str | None = None,
+    page_size: int = DIRECTORY_PAGE_SIZE,
+) -> DirectoryPage:
+    """
+    Return one page of public campaigns, newest first.
+    """
+    queryset = Campaign.objects.filter(
+        is_public=True,
+        open_seats__gte=min_open_seats,
+    ).select_related("dungeon_master", "system")
+    if system_id is not None:
+        queryset = queryset.filter(system_id=system_id)
+
+    campaigns, next_cursor = keyset_page(queryset, cursor, page_size)
+    return DirectoryPage(campaigns=campaigns, next_cursor=next_cursor)
@@ -0,0 +1,141 @@
+"""
+File downloads with HTTP range support.
+
+Responses are ``FileResponse`` objects around the open file, so under a WSGI
+server with ``wsgi.file_wrapper`` (gunicorn) the body is sent with
+``sendfile`` and never passes through Python. A partial response wraps the
+file in ``FileRange``, which starts at the range offset and stops after the
+range; servers that use ``sendfile`` start at the file's current position
+and stop at ``Content-Length``, so ranges stay zero-copy too.
+
+Only single ranges are honoured. Multi-range requests get the whole file,
+which RFC 9110 allows.
+"""
+
+import logging
+import re
+from datetime import datetime
+from typing import IO
+
+from django.http import FileResponse, HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+logger = logging.getLogger(__name__)
+
+RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+class FileRange:
+    """
+    A read-only view of ``length`` bytes of a file, starting at ``start``.
+    """
+
+    def __init__(self, file: IO[bytes], start: int, length: int) -> None:
+        self.file = file
+        self.remaining = length
+        self.name = getattr(file, "name", "")
+        file.seek(start)
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range ``Range`` header into an inclusive (first, last)
+    byte pair clamped to the file. Returns None when the header should be
+    ignored, and ``(size, size)`` when the range cannot be satisfied.
+    """
+    match = RANGE_RE.fullmatch(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # A suffix range: the final ``last`` bytes.
+        if int(last) == 0:
+            return size, size
+        return max(size - int(last), 0), size - 1
+    if last and int(last) < int(first):
+        return None
+    if int(first) >= size:
+        return size, size
+    return int(first), min(int(last), size - 1) if last else size - 1
+
+
+def serve_file(
+    request: HttpRequest,
+    file: IO[bytes],
+    *,
+    size: int,
+    etag: str,
+    last_modified: datetime,
+    content_type: str,
+    filename: str,
+    as_attachment: bool = True,
+) -> HttpResponseBase:
+    """
+    Serve an open file with conditional request, ``Range`` and ``If-Range``
+    handling. ``etag`` must be a strong, quoted entity tag.
+    """
+    timestamp = int(last_modified.timestamp())
+    conditional = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=timestamp,
+    )
+    if conditional is not None:
+        file.close()
+        return conditional
+
+    byte_range = None
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    # A range only applies to the representation the client already has.
+    if range_header and (if_range is None or if_range in (etag, http_date(timestamp))):
+        byte_range = parse_range(range_header, size)
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(timestamp),
+        "Accept-Ranges": "bytes",
+    }
+    if byte_range is not None and byte_range[0] >= size:
+        file.close()
+        unsatisfiable = HttpResponse(status=416, headers=headers)
+        unsatisfiable["Content-Range"] = f"bytes */{size}"
+        return unsatisfiable
+
+    if byte_range is None:
+        response = FileResponse(
+            file,
+            content_type=content_type,
+            as_attachment=as_attachment,
+            filename=filename,
+        )
+    else:
+        first, last = byte_range
+        response = FileResponse(
+            FileRange(file, first, last - first + 1),
+            status=206,
+            content_type=content_type,
+            as_attachment=as_attachment,
+            filename=filename,
+        )
+        response["Content-Range"] = f"bytes {first}-{last}/{size}"
+        response["Content-Length"] = str(last - first + 1)
+    for name, value in headers.items():
+        response[name] = value
+    return response
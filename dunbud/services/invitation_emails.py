@@ -0,0 +1,131 @@
+"""
+Batch email invitations.
+
+A Dungeon Master pastes a list of addresses, or picks existing users by name;
+each recipient gets their own single-use invitation. Users invited by name
+are listed by username so their addresses are never revealed.
+
+The invitations and their emails are created with one ``bulk_create`` each,
+in the caller's transaction. The emails go through the outbox like every
+other email, so a restart or deploy cannot lose them, and each invitation
+points at its outbox row. The delivery status of a batch is read straight
+from those rows, so the page can poll a batch for per-recipient results.
+"""
+
+import logging
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from django.template.loader import render_to_string
+
+from dunbud.models import Campaign, CampaignInvitation, OutgoingEmail
+from dunbud.services.outbox import queue_emails
+
+logger = logging.getLogger(__name__)
+
+MAX_EMAIL_INVITES = 200
+
+
+@dataclass(frozen=True, slots=True)
+class InvitationEmail:
+    """
+    An invitation email queued in the outbox.
+    """
+
+    invitation_id: UUID
+    email: str
+    # What the inviter sees: the address, or ``@username`` for existing users.
+    recipient: str
+
+
+def create_email_invitations(
+    campaign: Campaign,
+    emails: list[str],
+    build_url: Callable[[str], str],
+    invitees: Sequence[Any] = (),
+) -> tuple[UUID, list[InvitationEmail]]:
+    """
+    Create one single-use invitation per address and invited user and queue
+    its email, with one INSERT for the emails and one for the invitations.
+
+    ``build_url`` turns a join path into an absolute URL. Returns the batch id
+    and the queued emails. The raw tokens only leave memory inside the email
+    bodies, which the outbox deletes once they have been sent for a while.
+    """
+    batch_id = uuid.uuid4()
+    recipients = [(email, None) for email in emails]
+    recipients += [(invitee.email, invitee) for invitee in invitees]
+    invitations = [
+        CampaignInvitation(
+            campaign=campaign,
+            email=email,
+            invitee=invitee,
+            batch_id=batch_id,
+            max_uses=1,
+        )
+        for email, invitee in recipients
+    ]
+    for invitation in invitations:
+        invitation.set_new_token()
+
+    subject = f"You're invited to join {campaign.name} on Dungeon Buddy"
+    outgoing = queue_emails(
+        (
+            subject,
+            render_to_string(
+                "campaign/emails/invitation.txt",
+                {
+                    "campaign_name": campaign.name,
+                    "join_url": build_url(invitation.get_absolute_url()),
+                },
+            ),
+            [invitation.email],
+        )
+        for invitation in invitations
+    )
+    for invitation, email in zip(invitations, outgoing, strict=True):
+        invitation.outgoing_email = email
+    CampaignInvitation.objects.bulk_create(invitations)
+
+    logger.info("Queued %d invitation emails for %s", len(invitations), campaign)
+    return batch_id, [
+        InvitationEmail(
+            invitation_id=invitation.pk,
+            email=invitation.email,
+            recipient=(
+                f"@{invitation.invitee.username}"
+                if invitation.invitee
+                else invitation.email
+            ),
+        )
+        for invitation in invitations
+    ]
+
+
+def get_invitation_batch(campaign: Campaign, batch_id: UUID) -> list[dict[str, str]]:
+    """
+    Return the per-recipient delivery status of an email batch, taken from
+    the outbox rows of its emails.
+    """
+    rows = (
+        CampaignInvitation.objects.filter(campaign=campaign, batch_id=batch_id)
+        .order_by("email")
+        .values_list(
+            "email",
+            "invitee__username",
+            "outgoing_email__status",
+            "outgoing_email__last_error",
+        )
+    )
+    return [
+        {
+            "recipient": f"@{username}" if username else email,
+            # Sent emails are purged from the outbox after a while.
+            "delivery_status": status or OutgoingEmail.Status.SENT,
+            "delivery_error": error or "",
+        }
+        for email, username, status, error in rows
+    ]
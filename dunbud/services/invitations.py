@@ -0,0 +1,142 @@
+"""
+Campaign invitation lookups.
+
+Invitation tokens are stored hashed and expire after ``INVITE_LIFETIME`` or
+once ``max_uses`` players have joined with them. Tokens that recently failed
+to resolve are remembered in an in-process cache, so repeated guesses (for
+example a bot scanning ``/invites/<token>/``) are answered without touching
+the database. Tokens are random, so a missed token never becomes valid later.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from dunbud.models import Campaign, CampaignInvitation
+from dunbud.models.campaign_invite import hash_invite_token
+
+logger = logging.getLogger(__name__)
+
+MISSED_TOKEN_CACHE_SIZE = 10_000
+MISSED_TOKEN_TTL = 10 * 60
+# Session key holding a freshly generated join link until the DM sees it.
+NEW_INVITE_SESSION_KEY = "dunbud:new_invite:{campaign_id}"
+
+
+class MissedTokenCache:
+    """
+    A bounded, thread-safe set of token hashes that expire after ``ttl``
+    seconds. The oldest entries are evicted first once ``maxsize`` is reached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = MISSED_TOKEN_CACHE_SIZE,
+        ttl: float = MISSED_TOKEN_TTL,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, token_hash: object) -> bool:
+        with self._lock:
+            expires = self._entries.get(str(token_hash))
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                del self._entries[str(token_hash)]
+                return False
+            return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, token_hash: str) -> None:
+        with self._lock:
+            self._entries[token_hash] = time.monotonic() + self.ttl
+            self._entries.move_to_end(token_hash)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+missed_tokens = MissedTokenCache()
+
+
+def _usable() -> Q:
+    return Q(is_active=True, expires_at__gt=timezone.now()) & (
+        Q(max_uses__isnull=True) | Q(use_count__lt=F("max_uses"))
+    )
+
+
+def find_invitation(token: str) -> CampaignInvitation | None:
+    """
+    Resolve a raw token to a usable invitation, with its campaign loaded.
+    Returns None for unknown, inactive, expired or used-up tokens.
+    """
+    token_hash = hash_invite_token(token)
+    if token_hash in missed_tokens:
+        return None
+
+    invite = (
+        CampaignInvitation.objects.select_related("campaign")
+        .filter(_usable(), token_hash=token_hash)
+        .first()
+    )
+    if invite is None:
+        missed_tokens.add(token_hash)
+    return invite
+
+
+def record_invitation_use(invite: CampaignInvitation) -> bool:
+    """
+    Count one use of the invitation, unless it has run out in the meantime.
+    """
+    used = bool(
+        CampaignInvitation.objects.filter(_usable(), pk=invite.pk).update(
+            use_count=F("use_count") + 1,
+        ),
+    )
+    if used:
+        invite.use_count += 1
+    return used
+
+
+def create_invitation(campaign: Campaign) -> CampaignInvitation:
+    """
+    Replace the campaign's active shareable link with a fresh one.
+    Emailed invitations are left alone. The returned instance carries the raw
+    token in ``token``.
+    """
+    CampaignInvitation.objects.filter(
+        campaign=campaign,
+        email="",
+        is_active=True,
+    ).update(is_active=False)
+    return CampaignInvitation.objects.create(
+        campaign=campaign,
+        max_uses=campaign.max_players,
+    )
+
+
+def deactivate_expired_invitations() -> int:
+    """
+    Deactivate every expired or used-up invitation with a single UPDATE.
+    """
+    deactivated = (
+        CampaignInvitation.objects.filter(is_active=True)
+        .filter(
+            Q(expires_at__lte=timezone.now()) | Q(use_count__gte=F("max_uses")),
+        )
+        .update(is_active=False)
+    )
+    logger.info("Deactivated %d expired invitations", deactivated)
+    return deactivated
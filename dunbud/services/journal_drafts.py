@@ -0,0 +1,84 @@
+"""
+Journal autosave drafts.
+
+While a journal entry is being written, the page sends debounced patches
+holding only the fields that changed. Each patch is a single upsert into the
+small ``JournalDraft`` table: the row is inserted from the saved entry plus
+the patch, and later patches only overwrite the fields they carry. The entry
+itself is not touched, so its ``updated_at`` only moves on the final save,
+which also discards the draft. Drafts older than ``DRAFT_LIFETIME`` are
+ignored and purged by the ``purge_journal_drafts`` command.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Any
+
+from django.utils import timezone
+
+from dunbud.models import JournalDraft, JournalEntry, PlayerCharacter
+
+logger = logging.getLogger(__name__)
+
+DRAFT_LIFETIME = timedelta(days=7)
+DRAFT_FIELDS = ("title", "content")
+
+
+def draft_key(character_id: Any, entry_id: Any = None) -> str:
+    return f"{character_id}:{entry_id or 'new'}"
+
+
+def save_journal_draft(
+    character: PlayerCharacter,
+    entry: JournalEntry | None,
+    changes: dict[str, str],
+) -> bool:
+    """
+    Store the changed draft fields with one upsert.
+    Returns False when the patch holds no draft fields.
+    """
+    fields = [field for field in DRAFT_FIELDS if field in changes]
+    if not fields:
+        return False
+
+    values = {field: getattr(entry, field, "") for field in DRAFT_FIELDS}
+    values.update({field: changes[field] for field in fields})
+    JournalDraft.objects.bulk_create(
+        [
+            JournalDraft(
+                key=draft_key(character.pk, entry.pk if entry else None),
+                character=character,
+                entry=entry,
+                **values,
+            ),
+        ],
+        update_conflicts=True,
+        unique_fields=["key"],
+        update_fields=[*fields, "updated_at"],
+    )
+    return True
+
+
+def get_journal_draft(character_id: Any, entry_id: Any = None) -> JournalDraft | None:
+    """
+    Return the unexpired draft for a new entry or an entry being edited.
+    """
+    return JournalDraft.objects.filter(
+        key=draft_key(character_id, entry_id),
+        updated_at__gte=timezone.now() - DRAFT_LIFETIME,
+    ).first()
+
+
+def discard_journal_draft(character_id: Any, entry_id: Any = None) -> None:
+    JournalDraft.objects.filter(key=draft_key(character_id, entry_id)).delete()
+
+
+def purge_expired_drafts() -> int:
+    """
+    Delete every draft older than ``DRAFT_LIFETIME``.
+    """
+    deleted, _ = JournalDraft.objects.filter(
+        updated_at__lt=timezone.now() - DRAFT_LIFETIME,
+    ).delete()
+    logger.info("Purged %d expired journal drafts", deleted)
+    return deleted
@@ -0,0 +1,104 @@
+"""
+Streaming journal export.
+
+A character's journal is exported as a ZIP holding one Markdown file per entry
+and an ``index.md`` listing them. Entries are read with ``.iterator()`` and
+each one is compressed straight into the response: the archive is written to
+a buffer that is drained after every file, so memory use does not grow with
+the size of the journal. The index is written last from a second, narrow
+query rather than being collected along the way.
+"""
+
+import io
+import logging
+import zipfile
+from collections.abc import Iterator
+from datetime import datetime
+
+from django.utils.text import slugify
+
+from dunbud.models import JournalEntry, PlayerCharacter
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_SIZE = 100
+INDEX_NAME = "index.md"
+
+
+class _StreamBuffer(io.RawIOBase):
+    """
+    Unseekable sink for ``ZipFile`` whose contents are handed out and
+    discarded with ``drain``. ``ZipFile`` writes data descriptors instead of
+    seeking back when the file is not seekable.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def export_filename(created_at: datetime, title: str, pk: object) -> str:
+    """
+    Return a stable, unique file name for an entry inside the archive.
+    """
+    slug = slugify(title)[:50] or "entry"
+    return f"entries/{created_at:%Y-%m-%d}-{slug}-{str(pk)[:8]}.md"
+
+
+def render_entry_markdown(entry: JournalEntry) -> str:
+    """
+    Render an entry as a standalone Markdown document.
+    """
+    details = entry.created_at.strftime("%B %d, %Y")
+    if entry.session:
+        details += f" · Session {entry.session.session_number}"
+    return f"# {entry.title}\n\n*{details}*\n\n{entry.content.strip()}\n"
+
+
+def stream_journal_export(character: PlayerCharacter) -> Iterator[bytes]:
+    """
+    Yield the bytes of a ZIP archive of the character's journal, oldest
+    entry first.
+    """
+    entries = JournalEntry.objects.filter(character=character).order_by(
+        "created_at",
+        "pk",
+    )
+    buffer = _StreamBuffer()
+    count = 0
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for entry in (
+            entries.select_related("session")
+            .defer("content_html")
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        ):
+            zf.writestr(
+                export_filename(entry.created_at, entry.title, entry.pk),
+                render_entry_markdown(entry),
+            )
+            count += 1
+            yield buffer.drain()
+
+        with zf.open(INDEX_NAME, mode="w") as index:
+            index.write(f"# {character.name}'s Journal\n\n".encode())
+            for created_at, title, pk in entries.values_list(
+                "created_at",
+                "title",
+                "pk",
+            ).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                path = export_filename(created_at, title, pk)
+                index.write(f"- {created_at:%Y-%m-%d} [{title}]({path})\n".encode())
+    yield buffer.drain()
+    logger.info("Exported %d journal entries for character %s", count, character.pk)
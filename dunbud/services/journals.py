@@ -0,0 +1,165 @@
+"""
+Character journals and the campaign journal timeline.
+
+Journals are paginated with a (created_at, id) keyset cursor over the
+``journal_character_created_idx`` index, so a deep page costs the same as the
+first one. The entry total shown on the page counts only the entries the
+reader may see. Its parts are cached per character and dropped whenever an
+entry is created, deleted or changes visibility, instead of being counted on
+every request.
+
+The campaign timeline merges every character's entries with one query over
+``journal_campaign_created_idx``. Entries only the Dungeon Master may read are
+filtered out in SQL, and bodies come pre-rendered from ``content_html``.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from dunbud.models import Campaign, JournalEntry, PlayerCharacter
+from dunbud.services.pagination import keyset_page
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_PAGE_SIZE = 10
+TIMELINE_PAGE_SIZE = 20
+JOURNAL_COUNT_TIMEOUT = 60 * 60 * 24
+
+
+@dataclass(frozen=True, slots=True)
+class JournalPage:
+    """
+    One page of journal entries and the cursor for the next page.
+    """
+
+    entries: list[JournalEntry]
+    next_cursor: str | None
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class TimelinePage:
+    """
+    One page of a campaign's journal timeline, newest first.
+    """
+
+    entries: list[JournalEntry]
+    next_cursor: str | None
+
+
+def visible_journal_entries(user: Any) -> Q:
+    """
+    Entries the user may read: party entries, their own entries, and every
+    entry in the campaigns they run.
+    """
+    return (
+        Q(visibility=JournalEntry.Visibility.PARTY)
+        | Q(character__user_id=user.pk)
+        | Q(campaign__dungeon_master_id=user.pk)
+    )
+
+
+def journal_count_key(character_id: Any) -> str:
+    return f"dunbud:journal_counts:{character_id}"
+
+
+def _count_journal(character: PlayerCharacter) -> tuple[int, dict[Any, int]]:
+    """
+    Count the character's party entries, and their Dungeon Master only
+    entries per campaign they were written in.
+    """
+    party = 0
+    private: dict[Any, int] = {}
+    rows = (
+        JournalEntry.objects.filter(character=character)
+        .values("visibility", "campaign_id")
+        .annotate(total=Count("pk"))
+        .order_by()
+    )
+    for row in rows:
+        if row["visibility"] == JournalEntry.Visibility.PARTY:
+            party += row["total"]
+        else:
+            private[row["campaign_id"]] = row["total"]
+    return party, private
+
+
+def get_journal_count(character: PlayerCharacter, user: Any) -> int:
+    """
+    Return how many of the character's entries the user may read, by the
+    same rules as ``visible_journal_entries``.
+
+    The party total and the per-campaign private totals are cached together,
+    so every reader's total comes from one cached value. Only readers other
+    than the author, looking at a journal with private entries, pay one
+    query to see which of those campaigns they run.
+    """
+    key = journal_count_key(character.pk)
+    counts: tuple[int, dict[Any, int]] | None = cache.get(key)
+    if counts is None:
+        counts = _count_journal(character)
+        cache.set(key, counts, JOURNAL_COUNT_TIMEOUT)
+
+    party, private = counts
+    if character.user_id == user.pk:
+        return party + sum(private.values())
+    campaign_ids = [pk for pk in private if pk is not None]
+    if not campaign_ids:
+        return party
+    run = Campaign.objects.filter(
+        pk__in=campaign_ids,
+        dungeon_master_id=user.pk,
+    ).values_list("pk", flat=True)
+    return party + sum(private[pk] for pk in run)
+
+
+def invalidate_journal_count(character_id: Any) -> None:
+    cache.delete(journal_count_key(character_id))
+
+
+def get_journal_page(
+    character: PlayerCharacter,
+    user: Any,
+    cursor: str | None = None,
+    page_size: int = JOURNAL_PAGE_SIZE,
+) -> JournalPage:
+    """
+    Return one page of the character's journal that the user may read,
+    newest first.
+    """
+    entries, next_cursor = keyset_page(
+        JournalEntry.objects.filter(visible_journal_entries(user), character=character)
+        .select_related("session")
+        .defer("content_html"),
+        cursor,
+        page_size,
+    )
+    return JournalPage(
+        entries=entries,
+        next_cursor=next_cursor,
+        total=get_journal_count(character, user),
+    )
+
+
+def get_campaign_timeline(
+    campaign: Campaign,
+    user: Any,
+    cursor: str | None = None,
+    page_size: int = TIMELINE_PAGE_SIZE,
+) -> TimelinePage:
+    """
+    Return one page of the journal entries written in the campaign that the
+    user may read, with their characters and sessions, in a single query.
+    """
+    entries, next_cursor = keyset_page(
+        JournalEntry.objects.filter(visible_journal_entries(user), campaign=campaign)
+        .select_related("character", "session")
+        .defer("content"),
+        cursor,
+        page_size,
+    )
+    return TimelinePage(entries=entries, next_cursor=next_cursor)
@@ -0,0 +1,422 @@
+"""
+Health checks for external links.
+
+URLs from helpful links, campaign VTT links and character sheets are checked
+by the ``check_links`` command. Each check is a blocking ``http.client``
+request run in a thread pool, while asyncio semaphores bound the number of
+requests in flight overall and per host and every check has a timeout.
+Results are stored in ``LinkCheck`` so pages only read the cached health and
+never touch the network.
+
+The checker sends ``HEAD`` requests (falling back to ``GET`` for servers that
+reject ``HEAD``) and follows up to ``MAX_REDIRECTS`` redirects; a final status
+below 400 counts as healthy. The URLs are user supplied, so every host,
+including redirect targets, is resolved first and refused if any of its
+addresses is private, loopback, link-local, multicast or reserved. The request
+then goes to the vetted address, so DNS cannot change the answer in between.
+
+Connections are kept alive and reused for later checks of the same host.
+They are pooled per scheme, host, port and vetted address, so a reused
+connection never reaches an address that was not vetted for it.
+"""
+
+import asyncio
+import http.client
+import ipaddress
+import logging
+import socket
+import ssl
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from urllib.parse import quote, urljoin, urlsplit
+
+from django.conf import settings
+from django.utils import timezone
+
+from dunbud.models import Campaign, HelpfulLink, LinkCheck, PlayerCharacter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 50
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_AGE = timedelta(hours=24)
+
+USER_AGENT = "DungeonBuddy-LinkChecker/1.0"
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# GET bodies up to this size are read so the connection can be reused; the
+# connection behind a longer body is closed instead.
+MAX_DRAIN_BYTES = 64 * 1024
+
+_PoolKey = tuple[str, str, int, str]
+
+
+@dataclass(frozen=True, slots=True)
+class LinkResult:
+    """
+    The outcome of checking one URL.
+    """
+
+    url: str
+    status_code: int | None = None
+    error: str = ""
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.status_code is not None and self.status_code < 400
+
+
+class _RefusedURLError(Exception):
+    """
+    The URL cannot be checked or points at an address that is off limits.
+    """
+
+
+def _is_public_address(address: str) -> bool:
+    """
+    Return whether an IP address may be contacted by the checker.
+    """
+    ip = ipaddress.ip_address(address)
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return not (
+        ip.is_private
+        or ip.is_loopback
+        or ip.is_link_local
+        or ip.is_multicast
+        or ip.is_reserved
+        or ip.is_unspecified
+    )
+
+
+def _resolve(host: str, port: int, allow_private: bool) -> str:
+    """
+    Resolve a host and return the address to connect to.
+    Raises _RefusedURLError if any of its addresses is not public.
+    """
+    addresses = [
+        str(info[4][0])
+        for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    ]
+    if not allow_private:
+        for address in addresses:
+            if not _is_public_address(address):
+                raise _RefusedURLError(f"Refused non-public address {address}")
+    return addresses[0]
+
+
+class _PinnedHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTP connection to an address resolved in advance.
+    """
+
+    def __init__(self, host: str, port: int, address: str, timeout: float) -> None:
+        super().__init__(host, port, timeout=timeout)
+        self.address = address
+
+    def connect(self) -> None:
+        self.sock = socket.create_connection((self.address, self.port), self.timeout)
+
+
+class _PinnedHTTPSConnection(http.client.HTTPSConnection):
+    """
+    HTTPS connection to an address resolved in advance. The certificate is
+    still verified against the host name.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        address: str,
+        timeout: float,
+        ssl_context: ssl.SSLContext,
+    ) -> None:
+        super().__init__(host, port, timeout=timeout, context=ssl_context)
+        self.address = address
+        self.ssl_context = ssl_context
+
+    def connect(self) -> None:
+        sock = socket.create_connection((self.address, self.port), self.timeout)
+        self.sock = self.ssl_context.wrap_socket(sock, server_hostname=self.host)
+
+
+class LinkChecker:
+    """
+    Checks many URLs concurrently, at most ``per_host`` at a time per host.
+    Hosts that resolve to non-public addresses are refused unless
+    ``allow_private`` is set.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_host: int = DEFAULT_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        allow_private: bool = False,
+    ) -> None:
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.allow_private = allow_private
+        self._ssl_context = ssl.create_default_context()
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        # Idle keep-alive connections. Probes run in worker threads, so the
+        # pool has its own lock.
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._idle_lock = threading.Lock()
+        self._pooling = False
+
+    def _connect(self, key: _PoolKey) -> http.client.HTTPConnection:
+        scheme, host, port, address = key
+        if scheme == "https":
+            return _PinnedHTTPSConnection(
+                host,
+                port,
+                address,
+                self.timeout,
+                self._ssl_context,
+            )
+        return _PinnedHTTPConnection(host, port, address, self.timeout)
+
+    def _checkout(self, key: _PoolKey) -> http.client.HTTPConnection | None:
+        with self._idle_lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def _checkin(self, key: _PoolKey, connection: http.client.HTTPConnection) -> None:
+        with self._idle_lock:
+            idle = self._idle.setdefault(key, []) if self._pooling else []
+            # Requests per host are bounded, so more connections than that
+            # would never be used again.
+            if self._pooling and len(idle) < self.per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _close_idle(self) -> None:
+        with self._idle_lock:
+            self._pooling = False
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _send(
+        self,
+        key: _PoolKey,
+        connection: http.client.HTTPConnection,
+        method: str,
+        target: str,
+    ) -> tuple[int, str | None]:
+        """
+        Send a request and return the connection to the pool once its
+        response has been read to the end.
+        """
+        try:
+            connection.request(
+                method,
+                target,
+                headers={"User-Agent": USER_AGENT, "Accept": "*/*"},
+            )
+            response = connection.getresponse()
+            response.read(MAX_DRAIN_BYTES)
+        except BaseException:
+            connection.close()
+            raise
+        if response.isclosed() and not response.will_close:
+            self._checkin(key, connection)
+        else:
+            connection.close()
+        return response.status, response.getheader("Location")
+
+    def _request(self, method: str, url: str) -> tuple[int, str | None]:
+        """
+        Send one request and return the status code and redirect location.
+        """
+        try:
+            parts = urlsplit(url)
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+        except ValueError as e:
+            raise _RefusedURLError("Invalid URL") from e
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise _RefusedURLError("Unsupported URL")
+
+        address = _resolve(parts.hostname, port, self.allow_private)
+        key = (parts.scheme, parts.hostname, port, address)
+        target = quote(parts.path or "/", safe="/%:@!$&'()*+,;=~")
+        if parts.query:
+            target += "?" + quote(parts.query, safe="/%:@!$&'()*+,;=?~")
+
+        connection = self._checkout(key)
+        if connection is not None:
+            try:
+                return self._send(key, connection, method, target)
+            except ConnectionError:
+                # The server dropped the idle connection; use a new one.
+                pass
+        return self._send(key, self._connect(key), method, target)
+
+    def _probe(self, url: str) -> LinkResult:
+        """
+        Check a URL, following redirects. Runs in a worker thread.
+        """
+        target = url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                status_code, location = self._request("HEAD", target)
+                if status_code in (405, 501):
+                    status_code, location = self._request("GET", target)
+                if status_code not in REDIRECT_STATUSES or not location:
+                    return LinkResult(url, status_code=status_code)
+                target = urljoin(target, location)
+        except TimeoutError:
+            return LinkResult(url, error="Timed out")
+        except Exception as e:
+            return LinkResult(url, error=(str(e) or type(e).__name__)[:255])
+        return LinkResult(url, error="Too many redirects")
+
+    async def check(self, url: str, slots: asyncio.Semaphore) -> LinkResult:
+        """
+        Check a single URL, waiting for one of the global ``slots``.
+        """
+        try:
+            host = urlsplit(url).hostname or ""
+        except ValueError:
+            return LinkResult(url, error="Invalid URL")
+        host_slots = self._host_slots.setdefault(
+            host,
+            asyncio.Semaphore(self.per_host),
+        )
+
+        # Take the host slot first so URLs queued behind a busy host do not
+        # hold global slots, and start the timeout only once both are held.
+        async with host_slots, slots:
+            try:
+                async with asyncio.timeout(self.timeout):
+                    return await asyncio.get_running_loop().run_in_executor(
+                        self._executor,
+                        self._probe,
+                        url,
+                    )
+            except TimeoutError:
+                return LinkResult(url, error="Timed out")
+
+    async def check_all(self, urls: Iterable[str]) -> list[LinkResult]:
+        """
+        Check every URL, at most ``concurrency`` at a time.
+        """
+        slots = asyncio.Semaphore(self.concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix="link-check",
+        )
+        self._pooling = True
+        try:
+            return list(
+                await asyncio.gather(*(self.check(url, slots) for url in urls)),
+            )
+        finally:
+            # Requests that outlived their timeout end at the socket timeout
+            # and close their connections instead of pooling them.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._host_slots.clear()
+            self._close_idle()
+
+
+def collect_link_urls() -> set[str]:
+    """
+    Return every distinct external URL stored on links, campaigns and sheets.
+    """
+    sources = (
+        HelpfulLink.objects.values_list("url", flat=True),
+        Campaign.objects.exclude(vtt_link="").values_list("vtt_link", flat=True),
+        PlayerCharacter.objects.exclude(character_sheet_link="").values_list(
+            "character_sheet_link",
+            flat=True,
+        ),
+    )
+    return {url for source in sources for url in source.order_by().distinct()}
+
+
+def urls_due_for_check(max_age: timedelta = DEFAULT_MAX_AGE) -> list[str]:
+    """
+    Return the stored URLs that were not checked within ``max_age``.
+    """
+    recently_checked = set(
+        LinkCheck.objects.filter(
+            checked_at__gte=timezone.now() - max_age,
+        ).values_list("url", flat=True),
+    )
+    return sorted(collect_link_urls() - recently_checked)
+
+
+def store_link_results(
+    results: Iterable[LinkResult],
+    checked_at: datetime | None = None,
+) -> None:
+    """
+    Upsert the results into ``LinkCheck`` in batches.
+    """
+    checked_at = checked_at or timezone.now()
+    LinkCheck.objects.bulk_create(
+        [
+            LinkCheck(
+                url=result.url,
+                status_code=result.status_code,
+                is_healthy=result.is_healthy,
+                error=result.error,
+                checked_at=checked_at,
+            )
+            for result in results
+        ],
+        update_conflicts=True,
+        unique_fields=["url"],
+        update_fields=["status_code", "is_healthy", "error", "checked_at"],
+        batch_size=500,
+    )
+
+
+def run_link_checks(
+    max_age: timedelta = DEFAULT_MAX_AGE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> list[LinkResult]:
+    """
+    Check every URL that is due and store the results.
+    """
+    urls = urls_due_for_check(max_age)
+    if not urls:
+        return []
+
+    checker = LinkChecker(
+        concurrency=concurrency,
+        per_host=per_host,
+        timeout=timeout,
+        allow_private=getattr(settings, "DUNBUD_LINK_CHECK_ALLOW_PRIVATE", False),
+    )
+    results = asyncio.run(checker.check_all(urls))
+    store_link_results(results)
+    logger.info(
+        "Checked %d links, %d unhealthy",
+        len(results),
+        sum(not result.is_healthy for result in results),
+    )
+    return results
+
+
+def get_link_health(urls: Iterable[str]) -> dict[str, LinkCheck]:
+    """
+    Return the cached checks for the given URLs, keyed by URL.
+    """
+    wanted = {url for url in urls if url}
+    if not wanted:
+        return {}
+    return {check.url: check for check in LinkCheck.objects.filter(url__in=wanted)}
@@ -0,0 +1,40 @@
+"""
+Bulk import of helpful links.
+
+Slots for the whole batch are claimed on the campaign's link counter with one
+conditional UPDATE, then every link is written with a single INSERT, all in
+one transaction. Either every link is imported or none is.
+"""
+
+import logging
+
+from django.db import transaction
+
+from dunbud.models import Campaign, HelpfulLink
+from dunbud.models.links import reserve_link_slots
+from dunbud.services.snapshot import mark_snapshots_stale
+
+logger = logging.getLogger(__name__)
+
+
+def import_helpful_links(
+    campaign: Campaign,
+    links: list[tuple[str, str]],
+) -> list[HelpfulLink]:
+    """
+    Add ``(name, url)`` pairs to a campaign in one transaction.
+    Raises ValidationError if the batch would exceed the link limit.
+    """
+    if not links:
+        return []
+
+    with transaction.atomic():
+        reserve_link_slots(campaign.pk, len(links))
+        created = HelpfulLink.objects.bulk_create(
+            [HelpfulLink(campaign=campaign, name=name, url=url) for name, url in links],
+        )
+        # bulk_create skips the save signals that normally flag the snapshot.
+        mark_snapshots_stale(campaign.pk)
+
+    logger.info("Imported %d helpful links into %s", len(created), campaign)
+    return created
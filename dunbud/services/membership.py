@@ -0,0 +1,206 @@
+"""
+Campaign membership lookups backed by a per-user cached role map.
+
+The role map is a ``{campaign_id: role}`` dictionary covering every campaign a
+user manages or has joined. It is built with two narrow queries, stored in the
+default cache and memoized on the user instance for the rest of the request,
+so repeated permission checks do not touch the database.
+
+Signals drop a user's map whenever their memberships change, but a cached map
+is only trusted for ``ROLE_MAP_TIMEOUT`` seconds. That bounds how long access
+can outlive a revocation when a request re-caches pre-commit state, or when a
+write bypasses the signals (``QuerySet.update`` or raw m2m writes).
+"""
+
+import logging
+from enum import StrEnum
+from typing import Any
+from uuid import UUID
+
+from django.core.cache import cache
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed
+
+from dunbud.models import Campaign
+
+logger = logging.getLogger(__name__)
+
+ROLE_MAP_CACHE_KEY = "dunbud:campaign_roles:{user_id}"
+ROLE_MAP_TIMEOUT = 30
+# Attribute used to memoize the role map on a user instance for one request.
+_INSTANCE_ATTR = "_campaign_role_cache"
+
+
+class CampaignRole(StrEnum):
+    """
+    The role a user holds in a campaign.
+    """
+
+    DUNGEON_MASTER = "dungeon_master"
+    PLAYER = "player"
+    NONE = "none"
+
+
+class JoinOutcome(StrEnum):
+    """
+    The result of trying to join a campaign as a player.
+    """
+
+    JOINED = "joined"
+    ALREADY_PLAYER = "already_player"
+    FULL = "full"
+
+
+def _cache_key(user_id: Any) -> str:
+    return ROLE_MAP_CACHE_KEY.format(user_id=user_id)
+
+
+def _build_role_map(user_id: Any) -> dict[str, CampaignRole]:
+    """
+    Query the campaigns a user belongs to. DM roles take precedence.
+    """
+    joined = Campaign.objects.filter(players=user_id).order_by()
+    managed = Campaign.objects.filter(dungeon_master_id=user_id).order_by()
+
+    role_map = {
+        str(pk): CampaignRole.PLAYER for pk in joined.values_list("pk", flat=True)
+    }
+    role_map.update(
+        {
+            str(pk): CampaignRole.DUNGEON_MASTER
+            for pk in managed.values_list("pk", flat=True)
+        },
+    )
+    return role_map
+
+
+def get_role_map(user: Any) -> dict[str, CampaignRole]:
+    """
+    Return the ``{campaign_id: role}`` map for a user.
+
+    Anonymous users always receive an empty map.
+    """
+    if not user.is_authenticated:
+        return {}
+
+    role_map: dict[str, CampaignRole] | None = getattr(user, _INSTANCE_ATTR, None)
+    if role_map is not None:
+        return role_map
+
+    key = _cache_key(user.pk)
+    cached = cache.get(key)
+    if cached is None:
+        role_map = _build_role_map(user.pk)
+        cache.set(
+            key,
+            {pk: str(role) for pk, role in role_map.items()},
+            ROLE_MAP_TIMEOUT,
+        )
+    else:
+        role_map = {pk: CampaignRole(role) for pk, role in cached.items()}
+
+    setattr(user, _INSTANCE_ATTR, role_map)
+    return role_map
+
+
+def get_campaign_role(user: Any, campaign: Campaign | UUID | str) -> CampaignRole:
+    """
+    Return the role the user holds in the given campaign.
+    """
+    campaign_id = campaign.pk if isinstance(campaign, Campaign) else campaign
+    return get_role_map(user).get(str(campaign_id), CampaignRole.NONE)
+
+
+def is_campaign_member(user: Any, campaign: Campaign | UUID | str) -> bool:
+    """
+    Return True if the user is the Dungeon Master or a player of the campaign.
+    """
+    return get_campaign_role(user, campaign) is not CampaignRole.NONE
+
+
+def is_dungeon_master(user: Any, campaign: Campaign | UUID | str) -> bool:
+    """
+    Return True if the user is the Dungeon Master of the campaign.
+    """
+    return get_campaign_role(user, campaign) is CampaignRole.DUNGEON_MASTER
+
+
+def invalidate_role_map(*user_ids: Any) -> None:
+    """
+    Drop the cached role maps for the given users.
+
+    The keys are deleted immediately and again once the surrounding
+    transaction commits, so a concurrent request cannot re-cache the
+    pre-commit membership.
+    """
+    keys = [_cache_key(user_id) for user_id in user_ids if user_id is not None]
+    if not keys:
+        return
+
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+    logger.debug("Invalidated campaign role maps for users %s", user_ids)
+
+
+def _insert_player(campaign: Campaign, user_id: Any) -> int:
+    """
+    Insert the membership row unless it exists; return the affected row count.
+    """
+    field = Campaign.players.field
+    through = Campaign.players.through
+    table = connection.ops.quote_name(through._meta.db_table)
+    campaign_column = connection.ops.quote_name(field.m2m_column_name())
+    user_column = connection.ops.quote_name(field.m2m_reverse_name())
+    campaign_field = through._meta.get_field(field.m2m_field_name())
+    assert isinstance(campaign_field, models.Field)
+    campaign_id = campaign_field.get_db_prep_value(campaign.pk, connection)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({campaign_column}, {user_column}) "  # nosec B608
+            f"SELECT %s, %s WHERE NOT EXISTS ("
+            f"SELECT 1 FROM {table} "
+            f"WHERE {campaign_column} = %s AND {user_column} = %s)",
+            [campaign_id, user_id, campaign_id, user_id],
+        )
+        return int(cursor.rowcount)
+
+
+def join_campaign(campaign: Campaign, user: Any) -> JoinOutcome:
+    """
+    Add the user to the campaign's players if a seat is free.
+
+    The membership row is inserted only if it does not exist, with the
+    through table's unique constraint as a backstop. A seat is then claimed
+    with a conditional UPDATE of ``open_seats``, which locks the campaign row
+    so concurrent joins cannot overfill the table; without a seat the insert
+    is rolled back. The outcome is read from the affected row counts, and the
+    usual ``m2m_changed`` signal is sent so feed, cache and directory updates
+    still happen.
+    """
+    try:
+        with transaction.atomic():
+            if not _insert_player(campaign, user.pk):
+                return JoinOutcome.ALREADY_PLAYER
+
+            claimed = Campaign.objects.filter(
+                pk=campaign.pk,
+                open_seats__gt=0,
+            ).update(open_seats=F("open_seats") - 1)
+            if not claimed:
+                transaction.set_rollback(True)
+                return JoinOutcome.FULL
+
+            m2m_changed.send(
+                sender=Campaign.players.through,
+                instance=campaign,
+                action="post_add",
+                reverse=False,
+                model=type(user),
+                pk_set={user.pk},
+                using=connection.alias,
+            )
+    except IntegrityError:
+        return JoinOutcome.ALREADY_PLAYER
+    return JoinOutcome.JOINED
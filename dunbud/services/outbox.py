@@ -0,0 +1,293 @@
+"""
+Outbox-backed email delivery.
+
+Requests never talk to the mail provider. ``queue_email`` inserts the email
+into the ``OutgoingEmail`` table, in the same transaction as the change that
+caused it, and the ``send_outbox`` worker delivers pending emails in batches
+over one mail connection per batch.
+
+A failed email is retried with exponential backoff until ``MAX_ATTEMPTS``,
+after which it is marked failed. When no mail connection can be opened at
+all, the batch is deferred instead, without using up any attempts. The worker claims a batch by pushing its
+``next_attempt_at`` past ``CLAIM_TIMEOUT``, so several workers never send
+the same email, and a worker that dies mid-batch only delays its emails.
+
+A circuit breaker sits in front of the backend. After a run of consecutive
+failures it opens and the worker stops sending for a cooldown, leaving the
+remaining emails pending without using up their attempts. After the
+cooldown one email is let through to test the backend.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Self
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from dunbud.models import OutgoingEmail
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 8
+RETRY_BASE_DELAY = timedelta(minutes=1)
+MAX_RETRY_DELAY = timedelta(hours=6)
+# A claimed email is not picked up by another worker for this long.
+CLAIM_TIMEOUT = timedelta(minutes=5)
+SENT_RETENTION = timedelta(days=7)
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing dependency.
+
+    The breaker opens after ``threshold`` consecutive failures and rejects
+    calls for ``cooldown`` seconds. Once the cooldown is over calls are let
+    through again; the next failure reopens it straight away and a success
+    closes it.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.retry_after > 0
+
+    @property
+    def retry_after(self) -> float:
+        """
+        Seconds until calls are let through again.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                if self._opened_at is None:
+                    logger.warning("Circuit opened after %d failures", self._failures)
+                self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+mail_breaker = CircuitBreaker()
+
+
+@dataclass(slots=True)
+class OutboxResult:
+    """
+    What a run of the outbox worker did.
+    """
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    deferred: int = 0
+
+    def __iadd__(self, other: Self) -> Self:
+        self.sent += other.sent
+        self.retried += other.retried
+        self.failed += other.failed
+        self.deferred += other.deferred
+        return self
+
+
+def queue_email(
+    subject: str,
+    body: str,
+    recipients: list[str],
+    from_email: str | None = None,
+) -> OutgoingEmail:
+    """
+    Add an email to the outbox. It is only sent if the current transaction
+    commits.
+    """
+    return queue_emails([(subject, body, recipients)], from_email)[0]
+
+
+def queue_emails(
+    messages: Iterable[tuple[str, str, list[str]]],
+    from_email: str | None = None,
+) -> list[OutgoingEmail]:
+    """
+    Add several ``(subject, body, recipients)`` emails to the outbox with a
+    single INSERT.
+    """
+    return OutgoingEmail.objects.bulk_create(
+        [
+            OutgoingEmail(
+                subject=subject,
+                body=body,
+                recipients=recipients,
+                from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            )
+            for subject, body, recipients in messages
+        ],
+    )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    How long to wait before the next try after ``attempts`` failed ones.
+    """
+    return min(RETRY_BASE_DELAY * (1 << (attempts - 1)), MAX_RETRY_DELAY)
+
+
+def _claim_batch(batch_size: int) -> list[OutgoingEmail]:
+    """
+    Take up to ``batch_size`` due emails, hiding them from other workers for
+    ``CLAIM_TIMEOUT``.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutgoingEmail.Status.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at")[:batch_size],
+        )
+        OutgoingEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            next_attempt_at=now + CLAIM_TIMEOUT,
+        )
+    return emails
+
+
+def _record_failure(email: OutgoingEmail, error: str, now: datetime) -> None:
+    email.attempts += 1
+    email.last_error = error[:255]
+    if email.attempts >= MAX_ATTEMPTS:
+        email.status = OutgoingEmail.Status.FAILED
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+
+
+def send_outbox_batch(
+    batch_size: int = BATCH_SIZE,
+    breaker: CircuitBreaker = mail_breaker,
+) -> OutboxResult:
+    """
+    Send one batch of due emails over a single mail connection and record
+    each outcome with one bulk UPDATE.
+    """
+    result = OutboxResult()
+    if breaker.is_open:
+        return result
+    emails = _claim_batch(batch_size)
+    if not emails:
+        return result
+
+    connection = get_connection()
+    open_error = ""
+    try:
+        connection.open()
+    except Exception as e:
+        logger.warning("Could not open a mail connection: %s", e)
+        breaker.record_failure()
+        open_error = str(e) or type(e).__name__
+
+    now = timezone.now()
+    for email in emails:
+        if open_error:
+            # The backend is down, not this email: retry the whole batch later
+            # without using up its attempts.
+            email.last_error = open_error[:255]
+            email.next_attempt_at = now + max(
+                RETRY_BASE_DELAY,
+                timedelta(seconds=breaker.retry_after),
+            )
+            result.deferred += 1
+            continue
+        if breaker.is_open:
+            # Leave the rest for after the cooldown without using up attempts.
+            email.next_attempt_at = now + timedelta(seconds=breaker.retry_after)
+            result.deferred += 1
+            continue
+        message = EmailMessage(
+            subject=email.subject,
+            body=email.body,
+            from_email=email.from_email,
+            to=email.recipients,
+            connection=connection,
+        )
+        try:
+            message.send()
+        except Exception as e:
+            logger.warning("Failed to send outgoing email %s: %s", email.pk, e)
+            breaker.record_failure()
+            _record_failure(email, str(e) or type(e).__name__, now)
+        else:
+            breaker.record_success()
+            email.status = OutgoingEmail.Status.SENT
+            email.sent_at = now
+            result.sent += 1
+            continue
+
+        if email.status == OutgoingEmail.Status.FAILED:
+            result.failed += 1
+        else:
+            result.retried += 1
+
+    connection.close()
+
+    OutgoingEmail.objects.bulk_update(
+        emails,
+        ["status", "attempts", "next_attempt_at", "last_error", "sent_at"],
+    )
+    return result
+
+
+def purge_sent_emails() -> int:
+    """
+    Delete sent emails older than ``SENT_RETENTION``.
+    """
+    deleted, _ = OutgoingEmail.objects.filter(
+        status=OutgoingEmail.Status.SENT,
+        sent_at__lt=timezone.now() - SENT_RETENTION,
+    ).delete()
+    return deleted
+
+
+def send_outbox(
+    batch_size: int = BATCH_SIZE,
+    breaker: CircuitBreaker = mail_breaker,
+) -> OutboxResult:
+    """
+    Send batches until no email is due or the circuit breaker opens.
+    """
+    result = OutboxResult()
+    while True:
+        batch = send_outbox_batch(batch_size, breaker)
+        result += batch
+        if batch.sent + batch.retried + batch.failed < batch_size or breaker.is_open:
+            break
+
+    purge_sent_emails()
+    logger.info(
+        "Sent %d outgoing emails, %d to retry, %d failed, %d deferred",
+        result.sent,
+        result.retried,
+        result.failed,
+        result.deferred,
+    )
+    return result
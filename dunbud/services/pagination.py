@@ -0,0 +1,59 @@
+"""
+Keyset pagination helpers.
+
+Lists ordered newest first are paginated on ``(created_at, pk)`` rather than
+with OFFSET, so every page is a bounded index range scan no matter how deep
+it is. The position of the last row on a page is handed to the client as an
+opaque cursor.
+"""
+
+import base64
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from django.db.models import Model, Q, QuerySet
+
+
+def encode_cursor(instance: Any) -> str:
+    """
+    Encode the keyset position of a row as an opaque URL-safe token.
+    """
+    raw = f"{instance.created_at.isoformat()}|{instance.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID] | None:
+    """
+    Decode a cursor produced by ``encode_cursor``; invalid cursors give None.
+    """
+    try:
+        created_at, pk = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(pk)
+    except ValueError:
+        return None
+
+
+def keyset_page[M: Model](
+    queryset: QuerySet[M],
+    cursor: str | None,
+    page_size: int,
+) -> tuple[list[M], str | None]:
+    """
+    Return the rows after ``cursor``, newest first, and the cursor for the
+    next page, which is None on the last page. Fetches one extra row to tell
+    whether another page exists, so no COUNT is needed.
+    """
+    position = decode_cursor(cursor) if cursor else None
+    if position is not None:
+        created_at, pk = position
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk),
+        )
+
+    rows = list(queryset.order_by("-created_at", "-pk")[: page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(rows[-1])
+    return rows, next_cursor
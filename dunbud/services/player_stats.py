@@ -0,0 +1,137 @@
+"""
+Precomputed profile statistics.
+
+Every user has a ``PlayerStats`` row, created with the user. Signals adjust
+its counters with single conditional UPDATEs as things change, so viewing a
+profile costs one primary key lookup however much the player has done. The
+per-level character histogram is a JSON object; it is recomputed for the
+owner whenever one of their characters is saved or deleted, which is one
+small aggregate over that user's characters.
+
+``rebuild_player_stats`` recomputes every counter from the source tables,
+for backfills and to repair drift from writes that bypass signals such as
+``bulk_create`` or ``QuerySet.update``.
+"""
+
+import logging
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from dunbud.models import (
+    Campaign,
+    JournalEntry,
+    PlayerCharacter,
+    PlayerStats,
+    Session,
+)
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = ("campaigns_run", "campaigns_joined", "sessions_attended", "journal_entries")
+
+
+def adjust_player_stats(field: str, delta: int, **lookup: Any) -> None:
+    """
+    Add ``delta`` to one counter of the stats rows matching ``lookup``,
+    never going below zero.
+    """
+    if field not in COUNTERS:
+        raise ValueError(f"Unknown player stat: {field}")
+    if delta:
+        PlayerStats.objects.filter(**lookup).update(
+            **{field: Greatest(F(field) + delta, 0)},
+        )
+
+
+def adjust_player_stats_by_user(field: str, deltas: dict[Any, int]) -> None:
+    """
+    Apply a different delta per user, with one UPDATE per distinct delta.
+    """
+    by_delta: dict[int, list[Any]] = {}
+    for user_id, delta in deltas.items():
+        by_delta.setdefault(delta, []).append(user_id)
+    for delta, user_ids in by_delta.items():
+        adjust_player_stats(field, delta, user_id__in=user_ids)
+
+
+def refresh_character_levels(user_id: Any) -> None:
+    """
+    Recompute the character histogram of one user.
+    """
+    levels = (
+        PlayerCharacter.objects.filter(user_id=user_id)
+        .order_by()
+        .values_list("level")
+        .annotate(count=Count("pk"))
+    )
+    PlayerStats.objects.filter(user_id=user_id).update(
+        characters_by_level={str(level): count for level, count in levels},
+    )
+
+
+def _count(queryset: QuerySet[Any], user_field: str) -> Coalesce:
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{user_field: OuterRef("pk")})
+            .order_by()
+            .values(user_field)
+            .annotate(count=Count("*"))
+            .values("count"),
+        ),
+        0,
+    )
+
+
+def rebuild_player_stats(*user_ids: Any) -> int:
+    """
+    Recompute the stats of the given users, or of every user, and upsert
+    them. Returns the number of rows written.
+    """
+    users = get_user_model().objects.order_by("pk")
+    if user_ids:
+        users = users.filter(pk__in=user_ids)
+    rows = users.annotate(
+        campaigns_run=_count(Campaign.objects.all(), "dungeon_master"),
+        campaigns_joined=_count(Campaign.players.through.objects.all(), "customuser"),
+        sessions_attended=_count(Session.attendees.through.objects.all(), "customuser"),
+        journal_entries=_count(JournalEntry.objects.all(), "character__user"),
+    ).values_list("pk", *COUNTERS)
+
+    levels: dict[Any, dict[str, int]] = {}
+    characters = PlayerCharacter.objects.order_by().values_list("user_id", "level")
+    if user_ids:
+        characters = characters.filter(user_id__in=user_ids)
+    for user_id, level, count in characters.annotate(count=Count("pk")):
+        levels.setdefault(user_id, {})[str(level)] = count
+
+    stats = [
+        PlayerStats(
+            user_id=user_id,
+            **dict(zip(COUNTERS, counts, strict=True)),
+            characters_by_level=levels.get(user_id, {}),
+        )
+        for user_id, *counts in rows
+    ]
+    PlayerStats.objects.bulk_create(
+        stats,
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=[*COUNTERS, "characters_by_level"],
+        batch_size=500,
+    )
+    logger.info("Rebuilt stats for %d users", len(stats))
+    return len(stats)
+
+
+def get_player_stats(user: Any) -> PlayerStats:
+    """
+    Return the user's stats, building them if the row is missing.
+    """
+    stats = PlayerStats.objects.filter(user=user).first()
+    if stats is None:
+        rebuild_player_stats(user.pk)
+        stats = PlayerStats.objects.get(user=user)
+    return stats
@@ -0,0 +1,193 @@
+"""
+Character portraits.
+
+An upload is handled in two steps. On the request thread it is only hashed
+and moved into storage under its SHA-256 digest, so uploading an image that
+is already stored writes nothing. Thumbnails are rendered by a process-pool
+worker once the transaction commits, keeping image decoding off the web
+workers; until they are ready, pages show the character's initial instead.
+A portrait whose render failed is queued again when the same image is
+uploaded again, and the ``render_stuck_portraits`` job renders any that were
+lost, for example when a restart killed the pool.
+
+Thumbnail names are derived from the digest and never change, so they are
+served with immutable cache headers. Rendering writes to local paths, so the
+default storage must be a ``FileSystemStorage``.
+"""
+
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import UploadedFile
+from django.db import connections, transaction
+from django.utils import timezone
+
+from dunbud.imaging import render_thumbnails
+from dunbud.models import PlayerCharacter, Portrait
+from dunbud.services.versioning import bump_campaign_version
+
+logger = logging.getLogger(__name__)
+
+MAX_PORTRAIT_SIZE = 5 * 1024 * 1024
+THUMBNAIL_WORKERS = 2
+# Portraits pending for longer than this were lost by the pool.
+STUCK_AFTER = timedelta(minutes=15)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def sniff_image_type(header: bytes) -> str | None:
+    """
+    Return the MIME type of a PNG, JPEG, GIF or WebP image from its first
+    bytes, or None for anything else.
+    """
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def store_portrait(upload: UploadedFile) -> Portrait:
+    """
+    Store an upload under its digest and queue its thumbnails. An image that
+    is already stored is reused as is.
+    """
+    digest = hashlib.sha256()
+    header = b""
+    for chunk in upload.chunks():
+        header = header or chunk[:12]
+        digest.update(chunk)
+
+    portrait, created = Portrait.objects.get_or_create(
+        digest=digest.hexdigest(),
+        defaults={
+            "content_type": sniff_image_type(header) or "",
+            "size": upload.size or 0,
+        },
+    )
+    if not default_storage.exists(portrait.original_name):
+        upload.seek(0)
+        # Uploads spooled to a temporary file are moved, not copied.
+        default_storage.save(portrait.original_name, upload)
+    if portrait.status != Portrait.Status.READY:
+        if portrait.status == Portrait.Status.FAILED:
+            portrait.status = Portrait.Status.PENDING
+            portrait.save(update_fields=["status"])
+        queue_thumbnails(portrait)
+    return portrait
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=THUMBNAIL_WORKERS)
+        return _pool
+
+
+def _record_thumbnails(digest: str, dimensions: tuple[int, int] | None) -> None:
+    """
+    Mark the portrait ready or failed and refresh the rosters that show it.
+    """
+    if dimensions is None:
+        Portrait.objects.filter(pk=digest).update(status=Portrait.Status.FAILED)
+        return
+
+    width, height = dimensions
+    Portrait.objects.filter(pk=digest).update(
+        status=Portrait.Status.READY,
+        width=width,
+        height=height,
+    )
+    bump_campaign_version(
+        *PlayerCharacter.objects.filter(portrait_id=digest).values_list(
+            "campaign_id",
+            flat=True,
+        ),
+    )
+
+
+def _thumbnails_done(digest: str, future: Future[tuple[int, int]]) -> None:
+    try:
+        dimensions: tuple[int, int] | None = future.result()
+    except Exception:
+        logger.exception("Could not render thumbnails for portrait %s", digest)
+        dimensions = None
+    try:
+        _record_thumbnails(digest, dimensions)
+    finally:
+        # Pool callbacks run on the executor's own thread.
+        connections.close_all()
+
+
+def generate_thumbnails(portrait: Portrait) -> None:
+    """
+    Render the portrait's thumbnails on the calling thread.
+    """
+    try:
+        dimensions: tuple[int, int] | None = render_thumbnails(
+            default_storage.path(portrait.original_name),
+            default_storage.path(portrait.directory),
+            portrait.digest,
+        )
+    except Exception:
+        logger.exception("Could not render thumbnails for portrait %s", portrait.pk)
+        dimensions = None
+    _record_thumbnails(portrait.digest, dimensions)
+
+
+def render_stuck_portraits(max_age: timedelta = STUCK_AFTER) -> int:
+    """
+    Render, on the calling thread, the thumbnails of portraits that have been
+    pending for longer than ``max_age``. Returns how many were rendered.
+
+    The job must run where the media lives. A portrait whose original is
+    missing from this machine's storage is left pending rather than failed.
+    """
+    stuck = Portrait.objects.filter(
+        status=Portrait.Status.PENDING,
+        created_at__lt=timezone.now() - max_age,
+    ).order_by("created_at")
+    rendered = 0
+    for portrait in stuck:
+        if not default_storage.exists(portrait.original_name):
+            logger.warning("Original of portrait %s is not in storage", portrait.pk)
+            continue
+        generate_thumbnails(portrait)
+        rendered += 1
+    return rendered
+
+
+def _submit_thumbnails(portrait: Portrait) -> None:
+    future = _get_pool().submit(
+        render_thumbnails,
+        default_storage.path(portrait.original_name),
+        default_storage.path(portrait.directory),
+        portrait.digest,
+    )
+    future.add_done_callback(partial(_thumbnails_done, portrait.digest))
+
+
+def queue_thumbnails(portrait: Portrait) -> None:
+    """
+    Render the thumbnails once the current transaction commits.
+
+    They are rendered in a process pool unless ``DUNBUD_THUMBNAILS_INLINE``
+    is set, in which case they are rendered on the calling thread.
+    """
+    if getattr(settings, "DUNBUD_THUMBNAILS_INLINE", False):
+        transaction.on_commit(partial(generate_thumbnails, portrait))
+    else:
+        transaction.on_commit(partial(_submit_thumbnails, portrait))
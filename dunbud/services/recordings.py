@@ -0,0 +1,243 @@
+"""
+Resumable chunked uploads of session recordings.
+
+A recording is uploaded in three steps:
+
+1. ``start_recording_upload`` records the file's name, type and total size.
+2. The client sends consecutive parts of exactly ``chunk_size`` bytes (the
+   last may be shorter), each with the offset it starts at and its SHA-256.
+   ``append_recording_chunk`` streams the part from the request onto the end
+   of a partial file and acknowledges the new offset once the checksum
+   matches and the data is synced to disk. A rejected part is truncated
+   away, so the partial file always ends at the acknowledged offset. A client
+   that was interrupted asks for the offset and carries on from there. No
+   database transaction stays open while a part streams in.
+3. ``commit_recording_upload`` moves the complete file into place with an
+   atomic rename.
+
+Parts are read from the request in small blocks, so no process ever holds
+more than one block in memory. With a reverse proxy in front, request
+buffering should be turned off for the chunk URL (for nginx,
+``proxy_request_buffering off``); a proxy that buffers anyway only holds one
+part at a time.
+
+The partial and final files live in the default storage, which must be a
+``FileSystemStorage`` so the rename stays on one filesystem and ``flock``
+works on the partial file.
+"""
+
+import fcntl
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any, Protocol
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from dunbud.models import Session, SessionRecording
+from dunbud.models.session_recording import PARTIAL_DIRECTORY, UPLOAD_LIFETIME
+
+logger = logging.getLogger(__name__)
+
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class _Readable(Protocol):
+    """
+    A binary stream, such as the request itself.
+    """
+
+    def read(self, n: int | None = ..., /) -> bytes: ...
+
+
+class RecordingUploadError(Exception):
+    """
+    A request that does not fit the state of the upload.
+    """
+
+
+class RecordingOffsetError(RecordingUploadError):
+    """
+    A part was sent for an offset other than the acknowledged one.
+    """
+
+    def __init__(self, offset: int) -> None:
+        super().__init__(f"Expected a part at offset {offset}.")
+        self.offset = offset
+
+
+def _partial_path(recording: SessionRecording) -> Path:
+    return Path(default_storage.path(recording.partial_name))
+
+
+def start_recording_upload(
+    session: Session,
+    user: Any,
+    filename: str,
+    content_type: str,
+    size: int,
+) -> SessionRecording:
+    """
+    Register a new upload of ``size`` bytes. The values are validated by
+    ``SessionRecordingForm``.
+    """
+    return SessionRecording.objects.create(
+        session=session,
+        uploaded_by=user,
+        filename=get_valid_filename(Path(filename).name)[:200] or "recording",
+        content_type=content_type,
+        size=size,
+    )
+
+
+def append_recording_chunk(
+    recording_id: Any,
+    offset: int,
+    stream: _Readable,
+    length: int,
+    checksum: str,
+) -> int:
+    """
+    Append one part read from ``stream`` and return the new acknowledged
+    offset.
+
+    No transaction is held while the part streams in from the client. Writers
+    of one upload take turns through an advisory lock on the partial file; a
+    part sent while another is being written is refused like an out-of-order
+    one. The acknowledged offset is re-read once the file is locked and only
+    advanced if it has not moved since.
+    """
+    recording = SessionRecording.objects.get(
+        pk=recording_id,
+        status=SessionRecording.Status.UPLOADING,
+    )
+    if offset != recording.received:
+        raise RecordingOffsetError(recording.received)
+    expected = min(recording.chunk_size, recording.size - offset)
+    if length != expected:
+        raise RecordingUploadError(f"Expected a part of {expected} bytes.")
+
+    path = _partial_path(recording)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    with os.fdopen(fd, "r+b") as partial:
+        try:
+            fcntl.flock(partial.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise RecordingOffsetError(recording.received) from None
+
+        # Another writer may have advanced the upload before the lock was ours.
+        received = SessionRecording.objects.values_list("received", flat=True).get(
+            pk=recording.pk,
+        )
+        if received != offset:
+            raise RecordingOffsetError(received)
+
+        # Drop anything a failed earlier attempt left past the offset.
+        partial.truncate(offset)
+        partial.seek(offset)
+        digest = hashlib.sha256()
+        written = 0
+        while written < length:
+            block = stream.read(min(READ_BLOCK_SIZE, length - written))
+            if not block:
+                break
+            digest.update(block)
+            partial.write(block)
+            written += len(block)
+
+        if written != length or digest.hexdigest() != checksum.lower():
+            partial.truncate(offset)
+            raise RecordingUploadError(
+                "The part was incomplete."
+                if written != length
+                else "The part does not match its checksum.",
+            )
+        partial.flush()
+        os.fsync(partial.fileno())
+
+        advanced = SessionRecording.objects.filter(
+            pk=recording.pk,
+            status=SessionRecording.Status.UPLOADING,
+            received=offset,
+        ).update(received=offset + length, updated_at=timezone.now())
+        if not advanced:
+            # Aborted, purged or committed while the part streamed in.
+            partial.truncate(offset)
+            raise RecordingOffsetError(offset)
+    return offset + length
+
+
+def commit_recording_upload(recording_id: Any) -> SessionRecording:
+    """
+    Move a fully received upload into place and mark it ready.
+    """
+    with transaction.atomic():
+        recording = SessionRecording.objects.select_for_update().get(
+            pk=recording_id,
+        )
+        if recording.status == SessionRecording.Status.READY:
+            return recording
+        if recording.received != recording.size:
+            raise RecordingOffsetError(recording.received)
+
+        name = f"recordings/{recording.session_id}/{recording.pk}/{recording.filename}"
+        target = Path(default_storage.path(name))
+        partial = _partial_path(recording)
+        # A commit that renamed the file but failed before saving can be
+        # retried.
+        if partial.exists() or not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            partial.replace(target)
+
+        recording.file.name = name
+        recording.status = SessionRecording.Status.READY
+        recording.save(update_fields=["file", "status", "updated_at"])
+    logger.info("Committed recording %s (%d bytes)", recording.pk, recording.size)
+    return recording
+
+
+def abort_recording_upload(recording: SessionRecording) -> None:
+    """
+    Delete an unfinished upload and its partial file.
+    """
+    _partial_path(recording).unlink(missing_ok=True)
+    recording.delete()
+
+
+def purge_stale_uploads() -> int:
+    """
+    Delete every unfinished upload untouched for ``UPLOAD_LIFETIME``, along
+    with partial files of that age that no upload points at any more.
+
+    The job must run where the partial files live.
+    """
+    cutoff = timezone.now() - UPLOAD_LIFETIME
+    stale = list(
+        SessionRecording.objects.filter(
+            status=SessionRecording.Status.UPLOADING,
+            updated_at__lt=cutoff,
+        ),
+    )
+    for recording in stale:
+        _partial_path(recording).unlink(missing_ok=True)
+    SessionRecording.objects.filter(pk__in=[r.pk for r in stale]).delete()
+    logger.info("Purged %d stale recording uploads", len(stale))
+
+    directory = Path(default_storage.path(PARTIAL_DIRECTORY))
+    if directory.is_dir():
+        live = {
+            f"{pk}.part"
+            for pk in SessionRecording.objects.filter(
+                status=SessionRecording.Status.UPLOADING,
+            ).values_list("pk", flat=True)
+        }
+        for path in directory.iterdir():
+            if path.name not in live and path.stat().st_mtime < cutoff.timestamp():
+                logger.info("Removing orphaned partial file %s", path.name)
+                path.unlink(missing_ok=True)
+    return len(stale)
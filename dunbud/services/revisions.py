@@ -0,0 +1,256 @@
+"""
+Revision history for long text fields.
+
+Every change to a journal entry's content or a session's notes or recap is
+stored as a ``TextRevision``. A revision holds a zlib-compressed line delta
+against the previous version: runs of unchanged lines are stored as a
+reference to the previous text and only inserted lines are stored verbatim,
+so storage grows with the size of the edit rather than of the document.
+Every ``SNAPSHOT_INTERVAL``-th revision holds the full text instead, so
+rebuilding any revision reads at most ``SNAPSHOT_INTERVAL`` rows.
+
+Each revision also stores a checksum of the text it produces. If the text
+was changed without going through ``save()`` (for example by a queryset
+``update``), the next change starts a new snapshot rather than building a
+delta on the wrong base.
+"""
+
+import difflib
+import hashlib
+import json
+import logging
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.db import transaction
+from django.db.models import QuerySet
+
+from dunbud.models import JournalEntry, Session, TextRevision
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_INTERVAL = 10
+# The text fields that keep a history, per model.
+REVISIONED_FIELDS: dict[type[Any], tuple[str, ...]] = {
+    JournalEntry: ("content",),
+    Session: ("notes", "recap"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionSummary:
+    """
+    A revision as listed in the history, without its data.
+    """
+
+    number: int
+    created_at: datetime
+    length: int
+
+
+def text_checksum(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def encode_delta(old: str, new: str) -> bytes:
+    """
+    Encode ``new`` as compressed line operations against ``old``: ``[i, j]``
+    copies lines ``i:j`` of the old text and a string inserts new text.
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops: list[list[int] | str] = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(new_lines[j1:j2]))
+    return zlib.compress(json.dumps(ops, separators=(",", ":")).encode())
+
+
+def apply_delta(old: str, delta: bytes | memoryview) -> str:
+    """
+    Rebuild the text a delta produced from the text it was taken against.
+    """
+    old_lines = old.splitlines(keepends=True)
+    parts: list[str] = []
+    for op in json.loads(zlib.decompress(delta)):
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.extend(old_lines[op[0] : op[1]])
+    return "".join(parts)
+
+
+def _revisions(instance: JournalEntry | Session, field: str) -> QuerySet[TextRevision]:
+    target = "entry" if isinstance(instance, JournalEntry) else "session"
+    return TextRevision.objects.filter(field=field, **{target: instance.pk})
+
+
+def _revision(
+    instance: JournalEntry | Session,
+    field: str,
+    number: int,
+    text: str,
+    previous: str | None = None,
+) -> TextRevision:
+    is_snapshot = previous is None or number % SNAPSHOT_INTERVAL == 0
+    target = "entry" if isinstance(instance, JournalEntry) else "session"
+    return TextRevision(
+        field=field,
+        number=number,
+        is_snapshot=is_snapshot,
+        data=(
+            zlib.compress(text.encode())
+            if previous is None or is_snapshot
+            else encode_delta(previous, text)
+        ),
+        checksum=text_checksum(text),
+        length=len(text),
+        **{target: instance},
+    )
+
+
+def record_revision(
+    instance: JournalEntry | Session,
+    field: str,
+    old: str,
+    new: str,
+) -> TextRevision | None:
+    """
+    Store the change of ``field`` from ``old`` to ``new``.
+
+    The first change also stores ``old`` as revision 0, so the history starts
+    from the text as it was before any tracked edit. The parent row is locked
+    while the next number is picked, so concurrent saves of the same entry or
+    session take turns instead of colliding on the unique revision number.
+    """
+    if old == new:
+        return None
+
+    with transaction.atomic():
+        _lock_parent(instance)
+        return _append_revisions(instance, field, old, new)
+
+
+def _lock_parent(instance: JournalEntry | Session) -> None:
+    parents: QuerySet[Any] = (
+        JournalEntry.objects.filter(pk=instance.pk)
+        if isinstance(instance, JournalEntry)
+        else Session.objects.filter(pk=instance.pk)
+    )
+    # Evaluated for the row lock alone.
+    list(parents.select_for_update().values_list("pk", flat=True))
+
+
+def _append_revisions(
+    instance: JournalEntry | Session,
+    field: str,
+    old: str,
+    new: str,
+) -> TextRevision:
+    revisions: list[TextRevision] = []
+    latest = (
+        _revisions(instance, field)
+        .order_by("-number")
+        .values_list("number", "checksum")
+        .first()
+    )
+    if latest is None:
+        number = 0
+        revisions.append(_revision(instance, field, number, old))
+    else:
+        number, checksum = latest
+        if checksum != text_checksum(old):
+            logger.warning(
+                "Revision history of %s %s drifted; starting a new snapshot",
+                instance,
+                field,
+            )
+            number += 1
+            revisions.append(_revision(instance, field, number, old))
+
+    revisions.append(_revision(instance, field, number + 1, new, previous=old))
+    TextRevision.objects.bulk_create(revisions)
+    return revisions[-1]
+
+
+def list_revisions(
+    instance: JournalEntry | Session,
+    field: str,
+) -> list[RevisionSummary]:
+    """
+    Return the field's revisions, newest first.
+    """
+    return [
+        RevisionSummary(number=number, created_at=created_at, length=length)
+        for number, created_at, length in _revisions(instance, field)
+        .order_by("-number")
+        .values_list("number", "created_at", "length")
+    ]
+
+
+def _rebuild(
+    instance: JournalEntry | Session,
+    field: str,
+    start: int,
+    end: int,
+) -> dict[int, str]:
+    """
+    Rebuild revisions ``start`` to ``end`` from the snapshot at or before
+    ``start`` with one query.
+    """
+    first = start - start % SNAPSHOT_INTERVAL
+    texts: dict[int, str] = {}
+    text = ""
+    for number, is_snapshot, data in (
+        _revisions(instance, field)
+        .filter(number__gte=first, number__lte=end)
+        .order_by("number")
+        .values_list("number", "is_snapshot", "data")
+    ):
+        text = (
+            zlib.decompress(data).decode() if is_snapshot else apply_delta(text, data)
+        )
+        if number >= start:
+            texts[number] = text
+    return texts
+
+
+def get_revision_text(
+    instance: JournalEntry | Session,
+    field: str,
+    number: int,
+) -> str | None:
+    """
+    Return the field's text as of the given revision, or None if there is no
+    such revision.
+    """
+    return _rebuild(instance, field, number, number).get(number)
+
+
+def get_revision_diff(
+    instance: JournalEntry | Session,
+    field: str,
+    number: int,
+) -> list[str] | None:
+    """
+    Return a unified diff of what the given revision changed, or None if
+    there is no such revision.
+    """
+    texts = _rebuild(instance, field, max(number - 1, 0), number)
+    if number not in texts:
+        return None
+    before = texts.get(number - 1, "") if number else ""
+    return list(
+        difflib.unified_diff(
+            before.splitlines(),
+            texts[number].splitlines(),
+            fromfile=f"revision {number - 1}" if number else "empty",
+            tofile=f"revision {number}",
+            lineterm="",
+        ),
+    )
@@ -0,0 +1,111 @@
+"""
+Party roster read model.
+
+The roster lists every player of a campaign together with the character they
+play in it. It is built with one joined query and cached under the campaign
+version, so rendering the party list costs a single cache get.
+"""
+
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import FilteredRelation, Q
+from django.urls import reverse
+
+from dunbud.models import Campaign, Portrait
+from dunbud.services.versioning import campaign_cache_key
+
+logger = logging.getLogger(__name__)
+
+ROSTER_TIMEOUT = 60 * 60 * 24
+
+
+@dataclass(frozen=True, slots=True)
+class RosterCharacter:
+    """
+    The character a player uses in a campaign.
+    """
+
+    pk: UUID
+    name: str
+    character_sheet_link: str
+    # Digest of the portrait, once its thumbnails are ready.
+    portrait: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RosterMember:
+    """
+    A single player in a campaign roster.
+    """
+
+    user_id: int
+    username: str
+    campaign_character: RosterCharacter | None
+
+    def get_absolute_url(self) -> str:
+        return reverse("user_detail", kwargs={"username": self.username})
+
+
+def build_party_roster(campaign: Campaign) -> list[RosterMember]:
+    """
+    Build the roster with a single query joining players to their characters.
+    If a player has several characters in the campaign the first by name wins.
+    """
+    rows = (
+        get_user_model()
+        .objects.filter(joined_campaigns=campaign)
+        .annotate(
+            campaign_character=FilteredRelation(
+                "characters",
+                condition=Q(characters__campaign=campaign),
+            ),
+        )
+        .order_by("username", "campaign_character__name")
+        .values_list(
+            "pk",
+            "username",
+            "campaign_character__pk",
+            "campaign_character__name",
+            "campaign_character__character_sheet_link",
+            "campaign_character__portrait_id",
+            "campaign_character__portrait__status",
+        )
+    )
+
+    roster: dict[int, RosterMember] = {}
+    for user_id, username, char_id, char_name, sheet_link, portrait, status in rows:
+        if user_id in roster:
+            continue
+        character = (
+            RosterCharacter(
+                pk=char_id,
+                name=char_name,
+                character_sheet_link=sheet_link,
+                portrait=portrait if status == Portrait.Status.READY else None,
+            )
+            if char_id is not None
+            else None
+        )
+        roster[user_id] = RosterMember(
+            user_id=user_id,
+            username=username,
+            campaign_character=character,
+        )
+    return list(roster.values())
+
+
+def get_party_roster(campaign: Campaign) -> list[RosterMember]:
+    """
+    Return the cached roster for the campaign, building it on a miss.
+    """
+    key = campaign_cache_key("roster", campaign)
+    roster: list[RosterMember] | None = cache.get(key)
+    if roster is None:
+        roster = build_party_roster(campaign)
+        cache.set(key, roster, ROSTER_TIMEOUT)
+        logger.debug("Built party roster for campaign %s", campaign.pk)
+    return roster
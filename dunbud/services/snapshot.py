@@ -0,0 +1,226 @@
+"""
+Materialized campaign documents.
+
+A campaign snapshot is a denormalized JSON document holding everything shown
+on the campaign page. It is stored in ``CampaignSnapshot`` together with the
+campaign version it was built from; any change that bumps the version marks
+the snapshot stale, and the ``refresh_campaign_snapshots`` worker rebuilds it
+outside the request cycle. Changes the roster does not show (links, sessions,
+the feed) leave the version alone and mark only the snapshot stale. Readers
+compare the stored version with the campaign's in the same lookup and rebuild
+a stale document on the spot, so a missed worker run never serves old data.
+A rebuild only stores its document if the snapshot was not touched while it
+was being built, so a change that lands mid-build is never papered over.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any
+
+from django.db.models import F, Q
+from django.urls import reverse
+from django.utils import timezone
+
+from dunbud.models import (
+    Campaign,
+    CampaignSnapshot,
+    HelpfulLink,
+    PartyFeedItem,
+    Session,
+)
+from dunbud.services.roster import build_party_roster
+
+logger = logging.getLogger(__name__)
+
+# Only the most recent feed items are embedded in the document.
+SNAPSHOT_FEED_LIMIT = 50
+
+
+def build_campaign_document(campaign_id: Any) -> tuple[int, dict[str, Any]] | None:
+    """
+    Assemble the document for a campaign.
+    Returns the campaign version it reflects and the document, or None if the
+    campaign does not exist.
+    """
+    campaign = (
+        Campaign.objects.select_related("dungeon_master", "system")
+        .filter(pk=campaign_id)
+        .first()
+    )
+    if campaign is None:
+        return None
+
+    links = HelpfulLink.objects.filter(campaign=campaign).order_by("pk")
+    sessions = (
+        Session.objects.filter(campaign=campaign)
+        .order_by("session_number")
+        .prefetch_related("attendees", "busy_users")
+    )
+    feed = PartyFeedItem.objects.filter(campaign=campaign).select_related("session")
+
+    system = campaign.system
+    document = {
+        "id": campaign.pk,
+        "slug": campaign.slug,
+        "url": reverse("campaign_detail", kwargs={"slug": campaign.slug}),
+        "name": campaign.name,
+        "description": campaign.description,
+        "max_players": campaign.max_players,
+        "vtt_link": campaign.vtt_link,
+        "video_link": campaign.video_link,
+        "version": campaign.version,
+        "created_at": campaign.created_at,
+        "updated_at": campaign.updated_at,
+        "dungeon_master": {
+            "id": campaign.dungeon_master.pk,
+            "username": campaign.dungeon_master.username,
+        },
+        "system": (
+            {"name": system.name, "short_name": system.short_name} if system else None
+        ),
+        "players": [
+            {
+                "id": member.user_id,
+                "username": member.username,
+                "character": (
+                    {
+                        "id": member.campaign_character.pk,
+                        "name": member.campaign_character.name,
+                        "character_sheet_link": (
+                            member.campaign_character.character_sheet_link
+                        ),
+                    }
+                    if member.campaign_character
+                    else None
+                ),
+            }
+            for member in build_party_roster(campaign)
+        ],
+        "helpful_links": [
+            {"id": link.pk, "name": link.name, "url": link.url} for link in links
+        ],
+        "sessions": [
+            {
+                "session_number": session.session_number,
+                "proposed_date": session.proposed_date,
+                "duration": session.duration,
+                "attendees": [user.username for user in session.attendees.all()],
+                "busy": [user.username for user in session.busy_users.all()],
+            }
+            for session in sessions
+        ],
+        "feed": [
+            {
+                "category": item.category,
+                "message": item.message,
+                "created_at": item.created_at,
+                "session_number": item.session.session_number if item.session else None,
+            }
+            for item in feed[:SNAPSHOT_FEED_LIMIT]
+        ],
+    }
+    return campaign.version, document
+
+
+def _snapshot_marker(campaign_id: Any) -> datetime | None:
+    """
+    Return when the snapshot was last written or marked stale, creating an
+    empty stale one first if the campaign has none. Returns None if the
+    campaign does not exist.
+    """
+    marker: datetime | None = (
+        CampaignSnapshot.objects.filter(pk=campaign_id)
+        .values_list("generated_at", flat=True)
+        .first()
+    )
+    if marker is not None or not Campaign.objects.filter(pk=campaign_id).exists():
+        return marker
+    CampaignSnapshot.objects.bulk_create(
+        [CampaignSnapshot(campaign_id=campaign_id, version=0, document={})],
+        ignore_conflicts=True,
+    )
+    return (
+        CampaignSnapshot.objects.filter(pk=campaign_id)
+        .values_list("generated_at", flat=True)
+        .first()
+    )
+
+
+def refresh_campaign_snapshot(campaign_id: Any) -> dict[str, Any] | None:
+    """
+    Rebuild and store the snapshot of a campaign.
+    Returns the new document, or None if the campaign no longer exists.
+
+    The document is only stored if the snapshot was neither rewritten nor
+    marked stale while it was being built. Otherwise a change landed during
+    the build, so the snapshot stays stale and the next read rebuilds it.
+    """
+    marker = _snapshot_marker(campaign_id)
+    if marker is None:
+        return None
+    built = build_campaign_document(campaign_id)
+    if built is None:
+        return None
+
+    version, document = built
+    stored = CampaignSnapshot.objects.filter(
+        pk=campaign_id,
+        generated_at=marker,
+    ).update(version=version, document=document, generated_at=timezone.now())
+    if stored:
+        logger.debug("Refreshed snapshot for campaign %s (v%s)", campaign_id, version)
+    else:
+        logger.debug("Snapshot for campaign %s changed during rebuild", campaign_id)
+    return document
+
+
+def mark_snapshots_stale(*campaign_ids: Any) -> None:
+    """
+    Flag the stored snapshots of the given campaigns for a rebuild without
+    bumping the campaign version. Versions start at 1, so a snapshot version
+    of 0 is always behind. ``generated_at`` moves too, so a rebuild already
+    running does not store its document over the mark.
+    """
+    ids = {campaign_id for campaign_id in campaign_ids if campaign_id is not None}
+    if not ids:
+        return
+
+    CampaignSnapshot.objects.filter(pk__in=ids).update(
+        version=0,
+        generated_at=timezone.now(),
+    )
+    logger.debug("Marked snapshots stale for %s", ids)
+
+
+def stale_campaign_ids(limit: int | None = None) -> list[Any]:
+    """
+    Return the ids of campaigns whose snapshot is missing or out of date.
+    """
+    ids = Campaign.objects.filter(
+        Q(snapshot__isnull=True) | Q(snapshot__version__lt=F("version")),
+    ).values_list("pk", flat=True)
+    if limit is not None:
+        ids = ids[:limit]
+    return list(ids)
+
+
+def get_campaign_snapshot(campaign_id: Any) -> dict[str, Any] | None:
+    """
+    Return the stored document for a campaign with one primary-key lookup.
+    A campaign that has never been materialized, or whose snapshot has fallen
+    behind the campaign version, is rebuilt on read.
+    """
+    row = (
+        CampaignSnapshot.objects.filter(pk=campaign_id)
+        .values_list("document", "version", "campaign__version")
+        .first()
+    )
+    if row is None:
+        return refresh_campaign_snapshot(campaign_id)
+
+    document: dict[str, Any]
+    document, version, campaign_version = row
+    if version < campaign_version:
+        logger.debug("Rebuilding stale snapshot for campaign %s", campaign_id)
+        return refresh_campaign_snapshot(campaign_id)
+    return document
@@ -0,0 +1,35 @@
+"""
+Helpers for the ``Campaign.version`` counter.
+
+Cached read models of a campaign (such as the party roster) are stored under
+keys that include the campaign version, so bumping the version is all that is
+needed to invalidate them. Stale entries simply expire.
+"""
+
+import logging
+from typing import Any
+
+from django.db.models import F
+
+from dunbud.models import Campaign
+
+logger = logging.getLogger(__name__)
+
+
+def campaign_cache_key(name: str, campaign: Campaign) -> str:
+    """
+    Build a cache key for a campaign read model at its current version.
+    """
+    return f"dunbud:{name}:{campaign.pk}:v{campaign.version}"
+
+
+def bump_campaign_version(*campaign_ids: Any) -> None:
+    """
+    Increment the version of the given campaigns with a single UPDATE.
+    """
+    ids = {campaign_id for campaign_id in campaign_ids if campaign_id is not None}
+    if not ids:
+        return
+
+    Campaign.objects.filter(pk__in=ids).update(version=F("version") + 1)
+    logger.debug("Bumped campaign versions for %s", ids)
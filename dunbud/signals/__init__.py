@@ -1,3 +1,79 @@
+from .directory_signals import (
+    refresh_directory_on_campaign_delete,
+    refresh_directory_on_campaign_save,
+    refresh_directory_on_player_change,
+    remember_directory_listing,
+)
+from .journal_signals import (
+    invalidate_journal_count_on_delete,
+    invalidate_journal_count_on_save,
+)
+from .link_signals import release_link_slot_on_delete
+from .membership_signals import (
+    invalidate_roles_on_campaign_create,
+    invalidate_roles_on_campaign_delete,
+    invalidate_roles_on_dm_change,
+    invalidate_roles_on_player_change,
+)
 from .party_feed_signals import track_campaign_changes, track_player_changes
+from .player_stats_signals import (
+    count_attended_sessions,
+    count_campaign_run,
+    count_joined_campaigns,
+    count_journal_entry,
+    create_player_stats,
+    move_campaign_run_on_dm_change,
+    refresh_levels_on_character_change,
+    uncount_attendance_on_delete,
+    uncount_campaign_on_delete,
+    uncount_character_journal,
+    uncount_journal_entry,
+)
+from .read_model_signals import (
+    bump_version_on_character_change,
+    bump_version_on_character_move,
+    bump_version_on_player_change,
+    bump_version_on_username_change,
+    mark_snapshot_stale_on_attendance_change,
+    mark_snapshot_stale_on_campaign_change,
+    mark_snapshot_stale_on_component_change,
+    mark_snapshot_stale_on_system_change,
+)
+from .revision_signals import record_text_revisions, remember_revisioned_text
 
-__all__ = ["track_campaign_changes", "track_player_changes"]
+__all__ = [
+    "bump_version_on_character_change",
+    "bump_version_on_character_move",
+    "bump_version_on_player_change",
+    "bump_version_on_username_change",
+    "count_attended_sessions",
+    "count_campaign_run",
+    "count_joined_campaigns",
+    "count_journal_entry",
+    "create_player_stats",
+    "invalidate_journal_count_on_delete",
+    "invalidate_journal_count_on_save",
+    "invalidate_roles_on_campaign_create",
+    "invalidate_roles_on_campaign_delete",
+    "invalidate_roles_on_dm_change",
+    "invalidate_roles_on_player_change",
+    "mark_snapshot_stale_on_attendance_change",
+    "mark_snapshot_stale_on_campaign_change",
+    "mark_snapshot_stale_on_component_change",
+    "mark_snapshot_stale_on_system_change",
+    "move_campaign_run_on_dm_change",
+    "record_text_revisions",
+    "refresh_directory_on_campaign_delete",
+    "refresh_directory_on_campaign_save",
+    "refresh_directory_on_player_change",
+    "refresh_levels_on_character_change",
+    "release_link_slot_on_delete",
+    "remember_directory_listing",
+    "remember_revisioned_text",
+    "track_campaign_changes",
+    "track_player_changes",
+    "uncount_attendance_on_delete",
+    "uncount_campaign_on_delete",
+    "uncount_character_journal",
+    "uncount_journal_entry",
+]
@@ -0,0 +1,119 @@
+import logging
+from typing import Any
+
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from dunbud.models import Campaign
+from dunbud.services.directory import (
+    refresh_campaign_facets,
+    refresh_directory_facets,
+    refresh_open_seats,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _refresh_listing(campaign_ids: set[Any]) -> None:
+    """
+    Refresh open seats for the campaigns and the facets of the public ones.
+    """
+    if not campaign_ids:
+        return
+
+    refresh_open_seats(*campaign_ids)
+    refresh_campaign_facets(*campaign_ids)
+
+
+@receiver(m2m_changed, sender=Campaign.players.through)
+def refresh_directory_on_player_change(
+    sender: Any,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    model: type[Model],
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    Keep open seat counts and facets in step with campaign membership.
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            _refresh_listing({instance.pk})
+        return
+
+    # instance is a user; pk_set holds campaign ids.
+    if action in ("post_add", "post_remove") and pk_set:
+        _refresh_listing(set(pk_set))
+    elif action == "pre_clear":
+        instance._directory_cleared_campaigns = set(  # type: ignore[attr-defined]
+            Campaign.objects.filter(players=instance.pk).values_list("pk", flat=True),
+        )
+    elif action == "post_clear":
+        _refresh_listing(getattr(instance, "_directory_cleared_campaigns", set()))
+
+
+@receiver(pre_save, sender=Campaign)
+def remember_directory_listing(
+    sender: type[Campaign],
+    instance: Campaign,
+    **kwargs: Any,
+) -> None:
+    """
+    Remember the stored listing settings so post_save can tell what changed.
+    """
+    if instance._state.adding:
+        return
+
+    instance._directory_previous = (  # type: ignore[attr-defined]
+        Campaign.objects.filter(pk=instance.pk)
+        .values_list("system_id", "is_public", "max_players")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Campaign)
+def refresh_directory_on_campaign_save(
+    sender: type[Campaign],
+    instance: Campaign,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Refresh open seats and facets when listing settings change.
+    """
+    if created:
+        if instance.is_public:
+            refresh_directory_facets([instance.system_id])
+        return
+
+    previous = getattr(instance, "_directory_previous", None)
+    if previous is None:
+        return
+    old_system_id, was_public, old_max_players = previous
+
+    if instance.max_players != old_max_players:
+        refresh_open_seats(instance.pk)
+
+    changed = previous != (
+        instance.system_id,
+        instance.is_public,
+        instance.max_players,
+    )
+    if changed and (was_public or instance.is_public):
+        refresh_directory_facets({old_system_id, instance.system_id})
+
+
+@receiver(post_delete, sender=Campaign)
+def refresh_directory_on_campaign_delete(
+    sender: type[Campaign],
+    instance: Campaign,
+    **kwargs: Any,
+) -> None:
+    """
+    Drop a deleted public campaign from its facet.
+    """
+    if instance.is_public:
+        refresh_directory_facets([instance.system_id])
@@ -0,0 +1,38 @@
+import logging
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from dunbud.models import JournalEntry
+from dunbud.services.journals import invalidate_journal_count
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=JournalEntry)
+def invalidate_journal_count_on_save(
+    sender: type[JournalEntry],
+    instance: JournalEntry,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Drop the cached entry counts when an entry is written or may have
+    changed visibility.
+    """
+    if created or update_fields is None or "visibility" in update_fields:
+        invalidate_journal_count(instance.character_id)
+
+
+@receiver(post_delete, sender=JournalEntry)
+def invalidate_journal_count_on_delete(
+    sender: type[JournalEntry],
+    instance: JournalEntry,
+    **kwargs: Any,
+) -> None:
+    """
+    Drop the cached entry count when an entry is removed.
+    """
+    invalidate_journal_count(instance.character_id)
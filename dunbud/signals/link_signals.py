@@ -0,0 +1,29 @@
+import logging
+from typing import Any
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from dunbud.models import Campaign, HelpfulLink
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_delete, sender=HelpfulLink)
+def release_link_slot_on_delete(
+    sender: type[HelpfulLink],
+    instance: HelpfulLink,
+    **kwargs: Any,
+) -> None:
+    """
+    Give the slot back to the campaign's link counter.
+    Cascades from deleting the campaign itself are ignored.
+    """
+    if isinstance(kwargs.get("origin"), Campaign):
+        return
+
+    Campaign.objects.filter(pk=instance.campaign_id).update(
+        helpful_link_count=Greatest(F("helpful_link_count") - 1, 0),
+    )
@@ -0,0 +1,86 @@
+import logging
+from typing import Any
+
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from dunbud.models import Campaign
+from dunbud.services.membership import invalidate_role_map
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(m2m_changed, sender=Campaign.players.through)
+def invalidate_roles_on_player_change(
+    sender: Any,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    model: type[Model],
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    Invalidate cached role maps when players join or leave a campaign.
+    """
+    if reverse:
+        # instance is the user whose joined campaigns changed.
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_role_map(instance.pk)
+        return
+
+    if action in ("post_add", "post_remove") and pk_set:
+        invalidate_role_map(*pk_set)
+    elif action == "pre_clear" and isinstance(instance, Campaign):
+        invalidate_role_map(*instance.players.values_list("pk", flat=True))
+
+
+@receiver(pre_save, sender=Campaign)
+def invalidate_roles_on_dm_change(
+    sender: type[Campaign],
+    instance: Campaign,
+    **kwargs: Any,
+) -> None:
+    """
+    Invalidate the old and new Dungeon Master when a campaign changes hands.
+    """
+    if instance._state.adding:
+        return
+
+    old_dm_id = (
+        Campaign.objects.filter(pk=instance.pk)
+        .values_list("dungeon_master_id", flat=True)
+        .first()
+    )
+    if old_dm_id is not None and old_dm_id != instance.dungeon_master_id:
+        invalidate_role_map(old_dm_id, instance.dungeon_master_id)
+
+
+@receiver(post_save, sender=Campaign)
+def invalidate_roles_on_campaign_create(
+    sender: type[Campaign],
+    instance: Campaign,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Invalidate the Dungeon Master's role map when a campaign is created.
+    """
+    if created:
+        invalidate_role_map(instance.dungeon_master_id)
+
+
+@receiver(pre_delete, sender=Campaign)
+def invalidate_roles_on_campaign_delete(
+    sender: type[Campaign],
+    instance: Campaign,
+    **kwargs: Any,
+) -> None:
+    """
+    Invalidate every member's role map before a campaign is deleted.
+    """
+    invalidate_role_map(
+        instance.dungeon_master_id,
+        *instance.players.values_list("pk", flat=True),
+    )
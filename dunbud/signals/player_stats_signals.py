@@ -0,0 +1,280 @@
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Model
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from dunbud.models import Campaign, JournalEntry, PlayerCharacter, PlayerStats, Session
+from dunbud.services.player_stats import (
+    adjust_player_stats,
+    adjust_player_stats_by_user,
+    refresh_character_levels,
+)
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+
+def _count_membership_change(
+    field: str,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: set[Any] | None,
+    members: Iterable[Any],
+) -> None:
+    """
+    Apply an m2m change between users and campaigns or sessions to the
+    users' ``field`` counter. ``members`` lists the users of a forward
+    relation that is about to be cleared.
+    """
+    sign = {"post_add": 1, "post_remove": -1}.get(action)
+    if reverse:
+        # instance is the user; pk_set holds campaign or session ids.
+        if sign and pk_set:
+            adjust_player_stats(field, sign * len(pk_set), user_id=instance.pk)
+        elif action == "post_clear":
+            PlayerStats.objects.filter(user_id=instance.pk).update(**{field: 0})
+        return
+
+    if sign and pk_set:
+        adjust_player_stats(field, sign, user_id__in=pk_set)
+    elif action == "pre_clear":
+        adjust_player_stats(field, -1, user_id__in=list(members))
+
+
+@receiver(post_save, sender=User)
+def create_player_stats(
+    sender: type[Model],
+    instance: Model,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Give every new user an empty stats row.
+    """
+    if created:
+        PlayerStats.objects.bulk_create(
+            [PlayerStats(user_id=instance.pk)],
+            ignore_conflicts=True,
+        )
+
+
+@receiver(m2m_changed, sender=Campaign.players.through)
+def count_joined_campaigns(
+    sender: Any,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    model: type[Model],
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    Count campaigns joined as players join or leave.
+    """
+    _count_membership_change(
+        "campaigns_joined",
+        instance,
+        action,
+        reverse,
+        pk_set,
+        members=(
+            instance.players.values_list("pk", flat=True)
+            if isinstance(instance, Campaign)
+            else ()
+        ),
+    )
+
+
+@receiver(m2m_changed, sender=Session.attendees.through)
+def count_attended_sessions(
+    sender: Any,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    model: type[Model],
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    Count sessions attended as attendance is marked or withdrawn.
+    """
+    _count_membership_change(
+        "sessions_attended",
+        instance,
+        action,
+        reverse,
+        pk_set,
+        members=(
+            instance.attendees.values_list("pk", flat=True)
+            if isinstance(instance, Session)
+            else ()
+        ),
+    )
+
+
+@receiver(post_save, sender=Campaign)
+def count_campaign_run(
+    sender: type[Campaign],
+    instance: Campaign,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Count a new campaign for its Dungeon Master.
+    """
+    if created:
+        adjust_player_stats("campaigns_run", 1, user_id=instance.dungeon_master_id)
+
+
+@receiver(pre_save, sender=Campaign)
+def move_campaign_run_on_dm_change(
+    sender: type[Campaign],
+    instance: Campaign,
+    **kwargs: Any,
+) -> None:
+    """
+    Move the campaign between Dungeon Masters when it changes hands.
+    """
+    if instance._state.adding:
+        return
+
+    old_dm_id = (
+        Campaign.objects.filter(pk=instance.pk)
+        .values_list("dungeon_master_id", flat=True)
+        .first()
+    )
+    if old_dm_id is not None and old_dm_id != instance.dungeon_master_id:
+        adjust_player_stats("campaigns_run", -1, user_id=old_dm_id)
+        adjust_player_stats("campaigns_run", 1, user_id=instance.dungeon_master_id)
+
+
+@receiver(pre_delete, sender=Campaign)
+def uncount_campaign_on_delete(
+    sender: type[Campaign],
+    instance: Campaign,
+    **kwargs: Any,
+) -> None:
+    """
+    Take a deleted campaign, its memberships and the attendance of its
+    sessions off everyone's counters, with one aggregate for the sessions.
+    """
+    adjust_player_stats("campaigns_run", -1, user_id=instance.dungeon_master_id)
+    adjust_player_stats(
+        "campaigns_joined",
+        -1,
+        user_id__in=list(instance.players.values_list("pk", flat=True)),
+    )
+    attendance = (
+        Session.attendees.through.objects.filter(session__campaign=instance)
+        .order_by()
+        .values_list("customuser")
+        .annotate(count=Count("pk"))
+    )
+    adjust_player_stats_by_user(
+        "sessions_attended",
+        {user_id: -count for user_id, count in attendance},
+    )
+
+
+@receiver(pre_delete, sender=Session)
+def uncount_attendance_on_delete(
+    sender: type[Session],
+    instance: Session,
+    **kwargs: Any,
+) -> None:
+    """
+    Take a deleted session off its attendees' counters.
+    Cascades from deleting the campaign are counted there in one go.
+    """
+    if isinstance(kwargs.get("origin"), Campaign):
+        return
+
+    adjust_player_stats(
+        "sessions_attended",
+        -1,
+        user_id__in=list(instance.attendees.values_list("pk", flat=True)),
+    )
+
+
+@receiver(post_save, sender=JournalEntry)
+def count_journal_entry(
+    sender: type[JournalEntry],
+    instance: JournalEntry,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Count a new journal entry for the character's owner.
+    """
+    if created:
+        adjust_player_stats(
+            "journal_entries",
+            1,
+            user__characters=instance.character_id,
+        )
+
+
+@receiver(post_delete, sender=JournalEntry)
+def uncount_journal_entry(
+    sender: type[JournalEntry],
+    instance: JournalEntry,
+    **kwargs: Any,
+) -> None:
+    """
+    Take a deleted journal entry off its author's counter.
+    Cascades from deleting the character are counted there in one go.
+    """
+    if isinstance(kwargs.get("origin"), PlayerCharacter | User):
+        return
+
+    adjust_player_stats(
+        "journal_entries",
+        -1,
+        user__characters=instance.character_id,
+    )
+
+
+@receiver(pre_delete, sender=PlayerCharacter)
+def uncount_character_journal(
+    sender: type[PlayerCharacter],
+    instance: PlayerCharacter,
+    **kwargs: Any,
+) -> None:
+    """
+    Take a deleted character's journal entries off its owner's counter.
+    """
+    if isinstance(kwargs.get("origin"), User):
+        return
+
+    adjust_player_stats(
+        "journal_entries",
+        -instance.journal_entries.count(),
+        user_id=instance.user_id,
+    )
+
+
+@receiver(post_save, sender=PlayerCharacter)
+@receiver(post_delete, sender=PlayerCharacter)
+def refresh_levels_on_character_change(
+    sender: type[PlayerCharacter],
+    instance: PlayerCharacter,
+    **kwargs: Any,
+) -> None:
+    """
+    Recompute the owner's character histogram.
+    """
+    if isinstance(kwargs.get("origin"), User):
+        return
+
+    refresh_character_levels(instance.user_id)
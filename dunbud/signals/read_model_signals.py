@@ -0,0 +1,197 @@
+import logging
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db.models import Model, Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from dunbud.models import (
+    Campaign,
+    HelpfulLink,
+    PartyFeedItem,
+    PlayerCharacter,
+    Session,
+    TabletopSystem,
+)
+from dunbud.services.snapshot import mark_snapshots_stale
+from dunbud.services.versioning import bump_campaign_version
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+
+@receiver(m2m_changed, sender=Campaign.players.through)
+def bump_version_on_player_change(
+    sender: Any,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    model: type[Model],
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    Bump the campaign version when its roster changes.
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            bump_campaign_version(instance.pk)
+        return
+
+    # instance is a user; pk_set holds campaign ids.
+    if action in ("post_add", "post_remove") and pk_set:
+        bump_campaign_version(*pk_set)
+    elif action == "pre_clear":
+        bump_campaign_version(
+            *Campaign.objects.filter(players=instance.pk).values_list("pk", flat=True),
+        )
+
+
+@receiver(pre_save, sender=PlayerCharacter)
+def bump_version_on_character_move(
+    sender: type[PlayerCharacter],
+    instance: PlayerCharacter,
+    **kwargs: Any,
+) -> None:
+    """
+    Bump the previous campaign when a character moves to another campaign.
+    """
+    if instance._state.adding:
+        return
+
+    old_campaign_id = (
+        PlayerCharacter.objects.filter(pk=instance.pk)
+        .values_list("campaign_id", flat=True)
+        .first()
+    )
+    if old_campaign_id != instance.campaign_id:
+        bump_campaign_version(old_campaign_id)
+
+
+@receiver(post_save, sender=PlayerCharacter)
+@receiver(post_delete, sender=PlayerCharacter)
+def bump_version_on_character_change(
+    sender: type[PlayerCharacter],
+    instance: PlayerCharacter,
+    **kwargs: Any,
+) -> None:
+    """
+    Bump the character's campaign when the character changes.
+    """
+    bump_campaign_version(instance.campaign_id)
+
+
+@receiver(post_save, sender=User)
+def bump_version_on_username_change(
+    sender: Any,
+    instance: Any,
+    created: bool,
+    update_fields: frozenset[str] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    Bump the campaigns a user plays in when their profile may have changed,
+    and flag the snapshots of campaigns they run. Saves limited to other
+    fields (such as ``last_login``) are ignored.
+    """
+    if created or (update_fields is not None and "username" not in update_fields):
+        return
+
+    bump_campaign_version(
+        *Campaign.objects.filter(players=instance.pk).values_list("pk", flat=True),
+    )
+    mark_snapshots_stale(
+        *Campaign.objects.filter(dungeon_master=instance.pk).values_list(
+            "pk",
+            flat=True,
+        ),
+    )
+
+
+@receiver(post_save, sender=Campaign)
+def mark_snapshot_stale_on_campaign_change(
+    sender: type[Campaign],
+    instance: Campaign,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Flag the campaign snapshot when the campaign itself is edited.
+    """
+    if created:
+        return
+
+    mark_snapshots_stale(instance.pk)
+
+
+@receiver(post_save, sender=HelpfulLink)
+@receiver(post_delete, sender=HelpfulLink)
+@receiver(post_save, sender=PartyFeedItem)
+@receiver(post_delete, sender=PartyFeedItem)
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def mark_snapshot_stale_on_component_change(
+    sender: type[Model],
+    instance: HelpfulLink | PartyFeedItem | Session,
+    **kwargs: Any,
+) -> None:
+    """
+    Flag the campaign snapshot when one of the components on its page changes.
+    The roster does not show these, so the version is left alone.
+    Cascades from deleting the campaign itself are ignored.
+    """
+    if isinstance(kwargs.get("origin"), Campaign):
+        return
+
+    mark_snapshots_stale(instance.campaign_id)
+
+
+@receiver(m2m_changed, sender=Session.attendees.through)
+@receiver(m2m_changed, sender=Session.busy_users.through)
+def mark_snapshot_stale_on_attendance_change(
+    sender: Any,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    model: type[Model],
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    Flag the campaign snapshot when a session's attendance changes.
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            mark_snapshots_stale(getattr(instance, "campaign_id", None))
+        return
+
+    # instance is a user; pk_set holds session ids.
+    if action in ("post_add", "post_remove") and pk_set:
+        sessions = Session.objects.filter(pk__in=pk_set)
+    elif action == "pre_clear":
+        sessions = Session.objects.filter(
+            Q(attendees=instance.pk) | Q(busy_users=instance.pk),
+        )
+    else:
+        return
+    mark_snapshots_stale(*sessions.values_list("campaign_id", flat=True))
+
+
+@receiver(post_save, sender=TabletopSystem)
+def mark_snapshot_stale_on_system_change(
+    sender: type[TabletopSystem],
+    instance: TabletopSystem,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Flag the snapshot of every campaign using a tabletop system when the
+    system is edited.
+    """
+    if created:
+        return
+
+    mark_snapshots_stale(
+        *Campaign.objects.filter(system=instance).values_list("pk", flat=True),
+    )
@@ -0,0 +1,61 @@
+import logging
+from typing import Any
+
+from django.db.models import Model
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from dunbud.models import JournalEntry, Session
+from dunbud.services.revisions import REVISIONED_FIELDS, record_revision
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(pre_save, sender=JournalEntry)
+@receiver(pre_save, sender=Session)
+def remember_revisioned_text(
+    sender: type[Model],
+    instance: JournalEntry | Session,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Remember the stored text of the revisioned fields so post_save can
+    record what changed.
+    """
+    if instance._state.adding:
+        return
+
+    fields = [
+        field
+        for field in REVISIONED_FIELDS[sender]
+        if update_fields is None or field in update_fields
+    ]
+    if not fields:
+        return
+    previous = (
+        sender._default_manager.filter(pk=instance.pk).values_list(*fields).first()
+    )
+    if previous is not None:
+        instance._revision_previous = dict(  # type: ignore[union-attr]
+            zip(fields, previous, strict=True),
+        )
+
+
+@receiver(post_save, sender=JournalEntry)
+@receiver(post_save, sender=Session)
+def record_text_revisions(
+    sender: type[JournalEntry] | type[Session],
+    instance: JournalEntry | Session,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Store a revision for every revisioned field the save changed.
+    """
+    previous = instance.__dict__.pop("_revision_previous", None)
+    if created or previous is None:
+        return
+
+    for field, old in previous.items():
+        record_revision(instance, field, old, getattr(instance, field))
@@ -0,0 +1,28 @@
+from django import template
+from django.utils.html import format_html
+
+from dunbud.models import LinkCheck
+
+register = template.Library()
+
+
+@register.simple_tag
+def link_health_badge(health: dict[str, LinkCheck] | None, url: str) -> str:
+    """
+    Render a warning badge for a URL whose last cached check failed.
+
+    Args:
+        health (dict): Cached checks keyed by URL, from ``get_link_health``.
+        url (str): The URL to look up.
+
+    Returns:
+        str: The badge HTML, or an empty string for healthy or unchecked URLs.
+    """
+    check = (health or {}).get(url)
+    if check is None or check.is_healthy:
+        return ""
+    return format_html(
+        '<span class="badge bg-warning-subtle text-warning-emphasis" title="{}">'
+        "Link may be broken</span>",
+        f"Checked {check.checked_at:%Y-%m-%d}: {check.status_code or check.error}",
+    )
@@ -11,7 +11,9 @@ from config.tests.factories import (
     TabletopSystemFactory,
     UserFactory,
 )
-from dunbud.models import Campaign, CampaignInvitation
+from dunbud.models import Campaign, CampaignInvitation, PartyFeedItem
+from dunbud.services import CampaignRole, JoinOutcome, get_campaign_role, join_campaign
+from dunbud.views.mixins import CAMPAIGNS_PER_PAGE
 
 User = get_user_model()
 
@@ -325,6 +327,36 @@ class CampaignListViewTests(TestCase):
         response = self.client.get(self.joined_url)
         self.assertRedirects(response, f"/users/login/?next={self.joined_url}")
 
+    def test_managed_list_is_paginated(self) -> None:
+        """
+        Test that the managed list shows one page of campaigns at a time.
+        """
+        for i in range(CAMPAIGNS_PER_PAGE):
+            Campaign.objects.create(name=f"Extra {i}", dungeon_master=self.user_dm)
+        self.client.force_login(self.user_dm)
+
+        first = self.client.get(self.managed_url)
+        second = self.client.get(self.managed_url, {"page": 2})
+
+        self.assertTrue(first.context["is_paginated"])
+        self.assertEqual(len(first.context["campaigns"]), CAMPAIGNS_PER_PAGE)
+        self.assertEqual(len(second.context["campaigns"]), 1)
+        self.assertContains(first, "Page 1 of 2")
+
+    def test_list_annotates_latest_activity(self) -> None:
+        """
+        Test that each campaign carries the timestamp of its newest feed item.
+        """
+        PartyFeedItem.objects.create(campaign=self.campaign2, message="Old")
+        newest = PartyFeedItem.objects.create(campaign=self.campaign2, message="New")
+        self.client.force_login(self.user_dm)
+
+        response = self.client.get(self.joined_url)
+
+        campaign = response.context["campaigns"][0]
+        self.assertEqual(campaign.latest_activity, newest.created_at)
+        self.assertContains(response, "Updated")
+
 
 class CampaignDetailViewTests(TestCase):
     def setUp(self) -> None:
@@ -658,6 +690,57 @@ class CampaignJoinViewTests(TestCase):
         # Ensure player was not added
         self.assertNotIn(self.player, self.campaign.players.all())
 
+    def test_join_campaign_outcomes(self) -> None:
+        """
+        The join service reports joined, already-a-player and full outcomes.
+        """
+        latecomer, _ = UserFactory.create(username="latecomer")
+
+        self.assertEqual(join_campaign(self.campaign, self.player), JoinOutcome.JOINED)
+        self.assertEqual(
+            join_campaign(self.campaign, self.player),
+            JoinOutcome.ALREADY_PLAYER,
+        )
+        self.assertEqual(join_campaign(self.campaign, latecomer), JoinOutcome.FULL)
+
+        self.campaign.refresh_from_db(fields=["open_seats"])
+        self.assertEqual(self.campaign.open_seats, 0)
+        self.assertEqual(list(self.campaign.players.all()), [self.player])
+
+    def test_join_campaign_uses_database_capacity(self) -> None:
+        """
+        A stale in-memory campaign cannot be overfilled.
+        """
+        stale = Campaign.objects.get(pk=self.campaign.pk)
+        other, _ = UserFactory.create(username="racer")
+        join_campaign(self.campaign, other)
+
+        self.assertEqual(join_campaign(stale, self.player), JoinOutcome.FULL)
+        self.assertEqual(self.campaign.players.count(), 1)
+
+    def test_join_campaign_runs_membership_side_effects(self) -> None:
+        """
+        Joining still posts to the feed and refreshes the cached roles.
+        """
+        self.assertIs(
+            get_campaign_role(self.player, self.campaign),
+            CampaignRole.NONE,
+        )
+
+        join_campaign(self.campaign, self.player)
+
+        player = User.objects.get(pk=self.player.pk)
+        self.assertIs(
+            get_campaign_role(player, self.campaign),
+            CampaignRole.PLAYER,
+        )
+        self.assertTrue(
+            PartyFeedItem.objects.filter(
+                campaign=self.campaign,
+                message="player_join joined the party.",
+            ).exists(),
+        )
+
     def test_join_full_logging(self) -> None:
         """
         Test that attempting to join a full campaign is logged.
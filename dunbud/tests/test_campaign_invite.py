@@ -1,12 +1,18 @@
 import secrets
+from datetime import timedelta
+from io import StringIO
 
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import Client, TestCase
 from django.urls import reverse
+from django.utils import timezone
 
 from config.tests.factories import TabletopSystemFactory, UserFactory
 from dunbud.models.campaign import Campaign
-from dunbud.models.campaign_invite import CampaignInvitation
+from dunbud.models.campaign_invite import CampaignInvitation, hash_invite_token
+from dunbud.services import find_invitation
+from dunbud.services.invitations import MissedTokenCache, missed_tokens
 
 User = get_user_model()
 
@@ -29,6 +35,7 @@ class CampaignInvitationTests(TestCase):
             system=TabletopSystemFactory.create(),
         )
         self.client = Client()
+        missed_tokens.clear()
 
     def test_dm_can_create_invite(self) -> None:
         """
@@ -128,7 +135,8 @@ class CampaignInvitationTests(TestCase):
         Verify the string representation of a CampaignInvitation.
         """
         invite = CampaignInvitation.objects.create(campaign=self.campaign)
-        expected_str = f"Invite for {self.campaign.name} ({invite.token[:8]}...)"
+        expected_str = f"Invite for {self.campaign.name} ({invite.token_prefix}...)"
+        self.assertEqual(invite.token_prefix, (invite.token or "")[:8])
 
         self.assertEqual(str(invite), expected_str)
 
@@ -152,3 +160,138 @@ class CampaignInvitationTests(TestCase):
         # Ensure the player count hasn't increased/changed unexpectedly
         self.assertEqual(self.campaign.players.filter(pk=self.player.pk).count(), 1)
         self.assertContains(response, "You are already a player in this campaign.")
+
+    def test_only_token_hash_is_stored(self) -> None:
+        """
+        The raw token is never persisted; only its hash is.
+        """
+        invite = CampaignInvitation.objects.create(campaign=self.campaign)
+        stored = CampaignInvitation.objects.get(pk=invite.pk)
+
+        self.assertEqual(stored.token_hash, hash_invite_token(invite.token or ""))
+        self.assertIsNone(stored.token)
+        with self.assertRaises(ValueError):
+            stored.get_absolute_url()
+
+    def test_new_link_is_shown_once(self) -> None:
+        """
+        The generated link is shown on the next page view only.
+        """
+        self.client.login(username=self.dm.username, password=self.dm_pass)
+        url = reverse("campaign_invite_create", kwargs={"slug": self.campaign.slug})
+
+        response = self.client.post(url, follow=True)
+        self.assertContains(response, "/invites/")
+
+        response = self.client.get(
+            reverse("campaign_detail", kwargs={"slug": self.campaign.slug}),
+        )
+        self.assertNotContains(response, "/invites/")
+        self.assertContains(response, "Rotate Invite Link")
+
+    def test_generating_rotates_active_invite(self) -> None:
+        """
+        Generating a link deactivates the previous one and caps its uses.
+        """
+        old = CampaignInvitation.objects.create(campaign=self.campaign)
+        self.client.login(username=self.dm.username, password=self.dm_pass)
+        url = reverse("campaign_invite_create", kwargs={"slug": self.campaign.slug})
+
+        self.client.post(url)
+
+        old.refresh_from_db()
+        self.assertFalse(old.is_active)
+        new = CampaignInvitation.objects.get(campaign=self.campaign, is_active=True)
+        self.assertEqual(new.max_uses, self.campaign.max_players)
+
+    def test_expired_invite_cannot_be_used(self) -> None:
+        """
+        Invitations stop working once they expire.
+        """
+        invite = CampaignInvitation.objects.create(
+            campaign=self.campaign,
+            expires_at=timezone.now() - timedelta(minutes=1),
+        )
+        join_url = reverse("campaign_join", kwargs={"token": invite.token})
+
+        self.client.login(username=self.player.username, password=self.player_pass)
+        response = self.client.get(join_url)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(self.campaign.players.filter(pk=self.player.pk).exists())
+
+    def test_used_up_invite_cannot_be_used(self) -> None:
+        """
+        Each join uses up one seat of the invitation.
+        """
+        invite = CampaignInvitation.objects.create(campaign=self.campaign, max_uses=1)
+        join_url = reverse("campaign_join", kwargs={"token": invite.token})
+        latecomer, latecomer_pass = UserFactory.create()
+
+        self.client.login(username=self.player.username, password=self.player_pass)
+        self.client.get(join_url)
+        self.client.login(username=latecomer.username, password=latecomer_pass)
+        response = self.client.get(join_url)
+
+        invite.refresh_from_db()
+        self.assertEqual(invite.use_count, 1)
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(self.campaign.players.filter(pk=latecomer.pk).exists())
+
+    def test_missed_tokens_skip_the_database(self) -> None:
+        """
+        A token that failed to resolve is rejected from memory next time.
+        """
+        token = secrets.token_urlsafe(32)
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(find_invitation(token))
+        with self.assertNumQueries(0):
+            self.assertIsNone(find_invitation(token))
+
+    def test_missed_token_cache_is_bounded(self) -> None:
+        """
+        The cache evicts the oldest entries and forgets expired ones.
+        """
+        cache = MissedTokenCache(maxsize=2, ttl=60)
+        for token_hash in ("a", "b", "c"):
+            cache.add(token_hash)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("a", cache)
+        self.assertIn("c", cache)
+
+        expired = MissedTokenCache(ttl=-1)
+        expired.add("a")
+        self.assertNotIn("a", expired)
+
+    def test_batch_job_deactivates_expired_invites(self) -> None:
+        """
+        The periodic job deactivates expired and used-up invitations only.
+        """
+        expired = CampaignInvitation.objects.create(
+            campaign=self.campaign,
+            expires_at=timezone.now() - timedelta(days=1),
+        )
+        used_up = CampaignInvitation.objects.create(
+            campaign=self.campaign,
+            max_uses=1,
+            use_count=1,
+        )
+        current = CampaignInvitation.objects.create(campaign=self.campaign)
+        out = StringIO()
+
+        call_command("deactivate_expired_invites", stdout=out)
+
+        self.assertIn("Deactivated 2 expired invitations.", out.getvalue())
+        self.assertEqual(
+            set(
+                CampaignInvitation.objects.filter(is_active=True).values_list(
+                    "pk",
+                    flat=True,
+                ),
+            ),
+            {current.pk},
+        )
+        self.assertFalse(CampaignInvitation.objects.get(pk=expired.pk).is_active)
+        self.assertFalse(CampaignInvitation.objects.get(pk=used_up.pk).is_active)
@@ -0,0 +1,250 @@
+from collections.abc import Callable
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from config.tests.factories import (
+    CampaignFactory,
+    HelpfulLinkFactory,
+    PlayerCharacterFactory,
+    SessionFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.models import CampaignSnapshot, PartyFeedItem
+from dunbud.services import (
+    build_campaign_document,
+    get_campaign_snapshot,
+    mark_snapshots_stale,
+    refresh_campaign_snapshot,
+    stale_campaign_ids,
+)
+from users.models import CustomUser
+
+
+# Cache hits are only query-free with an in-memory cache backend.
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class CampaignSnapshotTests(TestCase):
+    """
+    Tests for the materialized campaign document.
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.dm, _ = UserFactory.create(username="dm")
+        self.player, _ = UserFactory.create(username="player")
+        self.outsider, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(name="Dungeons"),
+            players=[self.player],
+        )
+        PlayerCharacterFactory.create(
+            user=self.player,
+            campaign=self.campaign,
+            name="Aria",
+        )
+        self.session = SessionFactory.create(campaign=self.campaign)
+        self.session.attendees.add(self.player)
+        HelpfulLinkFactory.create(campaign=self.campaign, name="Map")
+        self.url = reverse("campaign_snapshot", kwargs={"pk": self.campaign.pk})
+
+    def _is_stale(self) -> bool:
+        return self.campaign.pk in stale_campaign_ids()
+
+    def test_document_contents(self) -> None:
+        """
+        The document holds every component of the campaign page.
+        """
+        built = build_campaign_document(self.campaign.pk)
+        self.assertIsNotNone(built)
+        assert built is not None
+        version, document = built
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(version, self.campaign.version)
+        self.assertEqual(document["name"], self.campaign.name)
+        self.assertEqual(document["dungeon_master"]["username"], "dm")
+        self.assertEqual(document["system"]["name"], "Dungeons")
+        self.assertEqual(document["players"][0]["username"], "player")
+        self.assertEqual(document["players"][0]["character"]["name"], "Aria")
+        self.assertEqual(document["helpful_links"][0]["name"], "Map")
+        self.assertEqual(document["sessions"][0]["attendees"], ["player"])
+
+    def test_missing_campaign(self) -> None:
+        """
+        Unknown campaigns have no document.
+        """
+        other = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+        )
+        other_id = other.pk
+        other.delete()
+
+        self.assertIsNone(build_campaign_document(other_id))
+        self.assertIsNone(get_campaign_snapshot(other_id))
+
+    def test_stored_snapshot_is_one_lookup(self) -> None:
+        """
+        A stored snapshot is served with a single primary-key lookup.
+        """
+        refresh_campaign_snapshot(self.campaign.pk)
+
+        with self.assertNumQueries(1):
+            document = get_campaign_snapshot(self.campaign.pk)
+        self.assertIsNotNone(document)
+
+    def test_first_read_materializes(self) -> None:
+        """
+        A campaign without a snapshot is materialized on first read.
+        """
+        get_campaign_snapshot(self.campaign.pk)
+
+        self.assertTrue(CampaignSnapshot.objects.filter(pk=self.campaign.pk).exists())
+        self.assertFalse(self._is_stale())
+
+    def test_component_changes_mark_snapshot_stale(self) -> None:
+        """
+        Changing any component of the page marks the snapshot stale.
+        """
+        changes: dict[str, Callable[[], object]] = {
+            "link": lambda: HelpfulLinkFactory.create(campaign=self.campaign),
+            "feed": lambda: PartyFeedItem.objects.create(
+                campaign=self.campaign,
+                message="News",
+            ),
+            "session": lambda: SessionFactory.create(campaign=self.campaign),
+            "attendance": lambda: self.session.busy_users.add(self.dm),
+            "players": lambda: self.campaign.players.add(self.outsider),
+            "dm rename": lambda: self._rename(self.dm, "overlord"),
+            "system": lambda: self._rename_system("Dragons"),
+            "campaign edit": self._edit_campaign,
+        }
+        for name, change in changes.items():
+            with self.subTest(change=name):
+                refresh_campaign_snapshot(self.campaign.pk)
+                self.assertFalse(self._is_stale())
+
+                change()
+
+                self.assertTrue(self._is_stale())
+
+    def _rename(self, user: CustomUser, username: str) -> None:
+        user.username = username
+        user.save()
+
+    def _edit_campaign(self) -> None:
+        self.campaign.description = "A new chapter."
+        self.campaign.save()
+
+    def _rename_system(self, name: str) -> None:
+        system = self.campaign.system
+        assert system is not None
+        system.name = name
+        system.save()
+
+    def test_change_during_rebuild_keeps_snapshot_stale(self) -> None:
+        """
+        A rebuild does not store its document over a change that marked the
+        snapshot stale while it was being built.
+        """
+        for existing in (False, True):
+            with self.subTest(existing=existing):
+                CampaignSnapshot.objects.all().delete()
+                if existing:
+                    refresh_campaign_snapshot(self.campaign.pk)
+                    mark_snapshots_stale(self.campaign.pk)
+
+                def build_during_change(campaign_id: object) -> object:
+                    built = build_campaign_document(campaign_id)
+                    HelpfulLinkFactory.create(campaign=self.campaign, name="Lore")
+                    return built
+
+                with mock.patch(
+                    "dunbud.services.snapshot.build_campaign_document",
+                    side_effect=build_during_change,
+                ):
+                    refresh_campaign_snapshot(self.campaign.pk)
+
+                self.assertTrue(self._is_stale())
+                document = get_campaign_snapshot(self.campaign.pk)
+                assert document is not None
+                names = [link["name"] for link in document["helpful_links"]]
+                self.assertIn("Lore", names)
+
+    def test_worker_refreshes_stale_snapshots(self) -> None:
+        """
+        The refresh command rebuilds stale snapshots.
+        """
+        refresh_campaign_snapshot(self.campaign.pk)
+        HelpfulLinkFactory.create(campaign=self.campaign, name="Lore")
+
+        call_command("refresh_campaign_snapshots", stdout=StringIO())
+
+        self.assertFalse(self._is_stale())
+        document = get_campaign_snapshot(self.campaign.pk)
+        assert document is not None
+        self.assertIn("Lore", [link["name"] for link in document["helpful_links"]])
+
+    def test_api_returns_document_to_members(self) -> None:
+        """
+        Members receive the stored document as JSON.
+        """
+        self.client.force_login(self.player)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["slug"], self.campaign.slug)
+
+    def test_api_rebuilds_stale_document(self) -> None:
+        """
+        A stale document is rebuilt on read instead of waiting for the worker.
+        """
+        refresh_campaign_snapshot(self.campaign.pk)
+        HelpfulLinkFactory.create(campaign=self.campaign, name="Lore")
+        self.client.force_login(self.dm)
+
+        response = self.client.get(self.url)
+
+        names = [link["name"] for link in response.json()["helpful_links"]]
+        self.assertIn("Lore", names)
+        self.assertFalse(self._is_stale())
+
+    def test_roster_change_rebuilds_on_read(self) -> None:
+        """
+        A snapshot behind the campaign version is rebuilt on read.
+        """
+        refresh_campaign_snapshot(self.campaign.pk)
+        self.campaign.players.add(self.outsider)
+
+        document = get_campaign_snapshot(self.campaign.pk)
+
+        assert document is not None
+        usernames = [player["username"] for player in document["players"]]
+        self.assertIn(self.outsider.username, usernames)
+
+    def test_api_denies_non_members(self) -> None:
+        """
+        Users outside the campaign are denied.
+        """
+        self.client.force_login(self.outsider)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_api_requires_login(self) -> None:
+        """
+        Anonymous users are redirected to the login page.
+        """
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
@@ -0,0 +1,186 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from config.tests.factories import CampaignFactory, TabletopSystemFactory, UserFactory
+from dunbud.models import Campaign, DirectoryFacet, TabletopSystem
+from dunbud.services import get_directory_page, rebuild_directory_facets
+from dunbud.services.pagination import decode_cursor, encode_cursor
+
+
+class CampaignDirectoryTests(TestCase):
+    """
+    Tests for the public campaign directory and its precomputed counts.
+    """
+
+    def setUp(self) -> None:
+        self.dm, _ = UserFactory.create()
+        self.player, _ = UserFactory.create()
+        self.system = TabletopSystemFactory.create(name="Dungeons")
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=self.system,
+            max_players=2,
+            is_public=True,
+        )
+
+    def _open_seats(self, campaign: Campaign) -> int:
+        campaign.refresh_from_db(fields=["open_seats"])
+        return campaign.open_seats
+
+    def _facet(self, system: TabletopSystem) -> DirectoryFacet:
+        return DirectoryFacet.objects.get(system=system)
+
+    def test_new_campaign_has_all_seats_open(self) -> None:
+        """
+        A new campaign starts with every seat open and is counted in its facet.
+        """
+        self.assertEqual(self._open_seats(self.campaign), 2)
+        self.assertEqual(self._facet(self.system).listed_campaigns, 1)
+        self.assertEqual(self._facet(self.system).open_campaigns, 1)
+
+    def test_membership_changes_update_open_seats(self) -> None:
+        """
+        Joining and leaving keep the open seat count and facets in step.
+        """
+        other, _ = UserFactory.create()
+        self.campaign.players.add(self.player, other)
+
+        self.assertEqual(self._open_seats(self.campaign), 0)
+        self.assertEqual(self._facet(self.system).open_campaigns, 0)
+
+        other.joined_campaigns.clear()
+
+        self.assertEqual(self._open_seats(self.campaign), 1)
+        self.assertEqual(self._facet(self.system).open_campaigns, 1)
+
+    def test_max_players_change_updates_open_seats(self) -> None:
+        """
+        Raising the table size opens more seats.
+        """
+        self.campaign.players.add(self.player)
+        self.campaign.max_players = 5
+        self.campaign.save()
+
+        self.assertEqual(self._open_seats(self.campaign), 4)
+
+    def test_listing_changes_update_facets(self) -> None:
+        """
+        Unlisting, moving systems and deleting campaigns refresh the facets.
+        """
+        other_system = TabletopSystemFactory.create(name="Dragons")
+
+        self.campaign.system = other_system
+        self.campaign.save()
+        self.assertEqual(self._facet(self.system).listed_campaigns, 0)
+        self.assertEqual(self._facet(other_system).listed_campaigns, 1)
+
+        self.campaign.is_public = False
+        self.campaign.save()
+        self.assertEqual(self._facet(other_system).listed_campaigns, 0)
+
+        self.campaign.is_public = True
+        self.campaign.save()
+        self.campaign.delete()
+        self.assertEqual(self._facet(other_system).listed_campaigns, 0)
+
+    def test_rebuild_matches_incremental_counts(self) -> None:
+        """
+        Rebuilding from scratch produces the same facet rows.
+        """
+        self.campaign.players.add(self.player)
+        before = list(DirectoryFacet.objects.values("system", "open_campaigns"))
+
+        DirectoryFacet.objects.all().delete()
+        rebuild_directory_facets()
+
+        after = list(DirectoryFacet.objects.values("system", "open_campaigns"))
+        self.assertEqual(before, after)
+
+    def test_page_filters(self) -> None:
+        """
+        Private, full and other-system campaigns are filtered out.
+        """
+        CampaignFactory.create(dungeon_master=self.dm, system=self.system)
+        full = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=self.system,
+            max_players=1,
+            is_public=True,
+        )
+        full.players.add(self.player)
+        elsewhere = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            is_public=True,
+        )
+
+        open_here = get_directory_page(system_id=self.system.pk).campaigns
+        any_system = get_directory_page().campaigns
+        with_full = get_directory_page(system_id=self.system.pk, min_open_seats=0)
+
+        self.assertEqual(open_here, [self.campaign])
+        self.assertEqual(set(any_system), {self.campaign, elsewhere})
+        self.assertEqual(set(with_full.campaigns), {self.campaign, full})
+
+    def test_keyset_pagination(self) -> None:
+        """
+        Following cursors visits every listed campaign exactly once.
+        """
+        for _ in range(4):
+            CampaignFactory.create(
+                dungeon_master=self.dm,
+                system=self.system,
+                is_public=True,
+            )
+
+        seen: list[Campaign] = []
+        cursor = None
+        while True:
+            page = get_directory_page(cursor=cursor, page_size=2)
+            seen += page.campaigns
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+    def test_cursor_round_trip(self) -> None:
+        """
+        Cursors decode to the campaign position; garbage decodes to None.
+        """
+        self.assertEqual(
+            decode_cursor(encode_cursor(self.campaign)),
+            (self.campaign.created_at, self.campaign.pk),
+        )
+        self.assertIsNone(decode_cursor("not-a-cursor"))
+
+    def test_directory_page_query_count(self) -> None:
+        """
+        A page of results costs a single query.
+        """
+        with self.assertNumQueries(1):
+            get_directory_page()
+
+    def test_view_is_public(self) -> None:
+        """
+        Anonymous visitors can browse the directory.
+        """
+        response = self.client.get(reverse("campaign_directory"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "campaign/campaign_directory.html")
+        self.assertContains(response, self.campaign.name)
+        self.assertContains(response, "Dungeons")
+
+    def test_view_ignores_invalid_filters(self) -> None:
+        """
+        Malformed filters fall back to the defaults.
+        """
+        response = self.client.get(
+            reverse("campaign_directory"),
+            {"system": "nope", "seats": "many", "cursor": "garbage"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, self.campaign.name)
@@ -0,0 +1,184 @@
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.http import http_date
+
+from config.tests.factories import (
+    CampaignFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.models import Handout
+from dunbud.services.downloads import parse_range
+
+CONTENT = bytes(range(256)) * 40
+
+
+class HandoutTests(TestCase):
+    """
+    Tests for campaign handouts and ranged downloads.
+    """
+
+    def setUp(self) -> None:
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.dm, _ = UserFactory.create()
+        self.player, _ = UserFactory.create()
+        self.outsider, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.player],
+        )
+        self.list_url = reverse(
+            "campaign_handouts",
+            kwargs={"slug": self.campaign.slug},
+        )
+
+    def _upload(self, name: str = "map.pdf", content: bytes = CONTENT) -> Handout:
+        self.client.force_login(self.dm)
+        response = self.client.post(
+            self.list_url,
+            {"title": "Battle map", "file": SimpleUploadedFile(name, content)},
+        )
+        self.assertRedirects(response, self.list_url)
+        return Handout.objects.latest("created_at")
+
+    def _download(self, handout: Handout, **headers: str) -> bytes:
+        response = self.client.get(handout.get_absolute_url(), headers=headers)
+        self.last_response = response
+        return response.getvalue()
+
+    def test_upload_records_metadata(self) -> None:
+        """
+        Uploading stores the file with its size, type and digest.
+        """
+        handout = self._upload()
+
+        self.assertEqual(handout.size, len(CONTENT))
+        self.assertEqual(handout.content_type, "application/pdf")
+        self.assertEqual(len(handout.digest), 64)
+        self.assertEqual(handout.uploaded_by, self.dm)
+
+    def test_only_the_dm_uploads(self) -> None:
+        """
+        Players see the list but cannot upload; outsiders see nothing.
+        """
+        self.client.force_login(self.player)
+        self.assertNotContains(self.client.get(self.list_url), "Share a Handout")
+        response = self.client.post(
+            self.list_url,
+            {"title": "Mine", "file": SimpleUploadedFile("a.txt", b"a")},
+        )
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_login(self.outsider)
+        self.assertEqual(self.client.get(self.list_url).status_code, 403)
+
+    def test_full_download(self) -> None:
+        """
+        Members download the whole file with a strong ETag.
+        """
+        handout = self._upload()
+        self.client.force_login(self.player)
+
+        self.assertEqual(self._download(handout), CONTENT)
+        response = self.last_response
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], f'"{handout.digest}"')
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(response["Content-Length"], str(len(CONTENT)))
+        self.assertIn("inline", response["Content-Disposition"])
+
+    def test_outsiders_cannot_download(self) -> None:
+        """
+        Downloads are restricted to campaign members.
+        """
+        handout = self._upload()
+        self.client.force_login(self.outsider)
+
+        self._download(handout)
+        self.assertEqual(self.last_response.status_code, 403)
+
+    def test_range_requests(self) -> None:
+        """
+        Single ranges return 206 with just the requested bytes.
+        """
+        handout = self._upload()
+        self.client.force_login(self.player)
+
+        self.assertEqual(
+            self._download(handout, Range="bytes=100-199"),
+            CONTENT[100:200],
+        )
+        self.assertEqual(self.last_response.status_code, 206)
+        self.assertEqual(
+            self.last_response["Content-Range"],
+            f"bytes 100-199/{len(CONTENT)}",
+        )
+        self.assertEqual(self.last_response["Content-Length"], "100")
+        self.assertEqual(self._download(handout, Range="bytes=-10"), CONTENT[-10:])
+        self.assertEqual(self._download(handout, Range="bytes=10000-"), CONTENT[10000:])
+
+        self._download(handout, Range=f"bytes={len(CONTENT)}-")
+        self.assertEqual(self.last_response.status_code, 416)
+        self.assertEqual(self.last_response["Content-Range"], f"bytes */{len(CONTENT)}")
+
+        self.assertEqual(self._download(handout, Range="bytes=0-1,5-6"), CONTENT)
+        self.assertEqual(self.last_response.status_code, 200)
+
+    def test_if_range(self) -> None:
+        """
+        A range is honoured only if the client's validator still matches.
+        """
+        handout = self._upload()
+        self.client.force_login(self.player)
+
+        partial = self._download(handout, Range="bytes=0-9", If_Range=handout.etag)
+        self.assertEqual(partial, CONTENT[:10])
+        date = http_date(handout.updated_at.timestamp())
+        self.assertEqual(
+            self._download(handout, Range="bytes=0-9", If_Range=date),
+            CONTENT[:10],
+        )
+        stale = self._download(handout, Range="bytes=0-9", If_Range='"stale"')
+        self.assertEqual(stale, CONTENT)
+        self.assertEqual(self.last_response.status_code, 200)
+
+    def test_if_none_match(self) -> None:
+        """
+        A client holding the current version gets 304 without the body.
+        """
+        handout = self._upload()
+        self.client.force_login(self.player)
+
+        self._download(handout, If_None_Match=handout.etag)
+        self.assertEqual(self.last_response.status_code, 304)
+
+    def test_unsafe_types_download_as_attachments(self) -> None:
+        """
+        Only images and PDFs are displayed inline.
+        """
+        handout = self._upload(name="notes.html", content=b"<script></script>")
+        self.client.force_login(self.player)
+
+        self._download(handout)
+        self.assertIn("attachment", self.last_response["Content-Disposition"])
+
+    def test_parse_range(self) -> None:
+        """
+        Malformed ranges are ignored and ends are clamped to the file.
+        """
+        self.assertEqual(parse_range("bytes=5-1000", 100), (5, 99))
+        self.assertEqual(parse_range("bytes=-1000", 100), (0, 99))
+        self.assertEqual(parse_range("bytes=-0", 100), (100, 100))
+        self.assertIsNone(parse_range("bytes=9-5", 100))
+        self.assertIsNone(parse_range("items=0-5", 100))
+        self.assertIsNone(parse_range("bytes=-", 100))
@@ -0,0 +1,265 @@
+from typing import Any
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from config.tests.factories import CampaignFactory, TabletopSystemFactory, UserFactory
+from dunbud.models import CampaignInvitation, OutgoingEmail
+from dunbud.services import create_invitation, send_outbox
+from dunbud.services.outbox import MAX_ATTEMPTS, mail_breaker
+
+
+class CountingBackend(EmailBackend):
+    """
+    In-memory backend that counts opened connections and rejects one address.
+    """
+
+    opened = 0
+
+    def open(self) -> bool:
+        type(self).opened += 1
+        return True
+
+    def send_messages(self, messages: Any) -> int:
+        if any("bounce@example.com" in message.to for message in messages):
+            raise OSError("Mailbox unavailable")
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND="dunbud.tests.test_invitation_email.CountingBackend",
+)
+class InvitationEmailTests(TestCase):
+    """
+    Tests for emailing invitations to a list of addresses.
+    """
+
+    def setUp(self) -> None:
+        self.dm, _ = UserFactory.create()
+        self.player, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.player],
+        )
+        self.url = reverse("campaign_invite_email", kwargs={"slug": self.campaign.slug})
+        CountingBackend.opened = 0
+        mail_breaker.reset()
+
+    def _post(self, emails: str, deliver: bool = True) -> Any:
+        response = self.client.post(
+            self.url,
+            {"emails": emails},
+            headers={"x-requested-with": "XMLHttpRequest"},
+        )
+        if deliver:
+            send_outbox()
+        return response
+
+    def test_dm_can_email_invitations(self) -> None:
+        """
+        Every address gets its own single-use invite over one mail connection.
+        """
+        self.client.force_login(self.dm)
+
+        response = self._post("Rogue@example.com, bard@example.com\nrogue@example.com")
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(len(response.json()["recipients"]), 2)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual(
+            {message.to[0] for message in mail.outbox},
+            {"rogue@example.com", "bard@example.com"},
+        )
+        self.assertNotEqual(mail.outbox[0].body, mail.outbox[1].body)
+
+        invites = CampaignInvitation.objects.filter(campaign=self.campaign)
+        self.assertEqual(invites.count(), 2)
+        self.assertTrue(all(invite.max_uses == 1 for invite in invites))
+        self.assertTrue(
+            all(
+                invite.outgoing_email.status == OutgoingEmail.Status.SENT
+                for invite in invites
+                if invite.outgoing_email
+            ),
+        )
+
+    def test_invitations_are_inserted_in_one_statement(self) -> None:
+        """
+        The invitations and their emails are each created with one INSERT.
+        """
+        self.client.force_login(self.dm)
+        emails = ", ".join(f"player{i}@example.com" for i in range(10))
+
+        with CaptureQueriesContext(connection) as ctx:
+            self._post(emails, deliver=False)
+
+        for table in ("dunbud_campaigninvitation", "dunbud_outgoingemail"):
+            with self.subTest(table=table):
+                inserts = [
+                    q
+                    for q in ctx.captured_queries
+                    if q["sql"].startswith(f'INSERT INTO "{table}"')
+                ]
+                self.assertEqual(len(inserts), 1)
+
+    def test_failed_deliveries_are_reported(self) -> None:
+        """
+        A rejected address is retried, then marked failed, without stopping
+        the batch.
+        """
+        self.client.force_login(self.dm)
+        response = self._post("bounce@example.com, bard@example.com")
+
+        status = self.client.get(response.json()["status_url"]).json()
+
+        self.assertFalse(status["done"])
+        by_email = {r["recipient"]: r for r in status["recipients"]}
+        self.assertEqual(by_email["bard@example.com"]["delivery_status"], "sent")
+        self.assertEqual(by_email["bounce@example.com"]["delivery_status"], "pending")
+        self.assertEqual(
+            by_email["bounce@example.com"]["delivery_error"],
+            "Mailbox unavailable",
+        )
+
+        OutgoingEmail.objects.filter(status=OutgoingEmail.Status.PENDING).update(
+            attempts=MAX_ATTEMPTS - 1,
+            next_attempt_at=timezone.now(),
+        )
+        send_outbox()
+
+        status = self.client.get(response.json()["status_url"]).json()
+        self.assertTrue(status["done"])
+        by_email = {r["recipient"]: r for r in status["recipients"]}
+        self.assertEqual(by_email["bounce@example.com"]["delivery_status"], "failed")
+
+    def test_emails_wait_in_the_outbox(self) -> None:
+        """
+        The request only queues the emails; the outbox worker sends them.
+        """
+        self.client.force_login(self.dm)
+
+        response = self._post("bard@example.com", deliver=False)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(mail.outbox, [])
+        invite = CampaignInvitation.objects.select_related("outgoing_email").get(
+            campaign=self.campaign,
+        )
+        assert invite.outgoing_email is not None
+        self.assertEqual(invite.outgoing_email.status, OutgoingEmail.Status.PENDING)
+        self.assertEqual(invite.outgoing_email.recipients, ["bard@example.com"])
+
+        send_outbox()
+
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_purged_emails_are_reported_sent(self) -> None:
+        """
+        Invitations whose sent email was purged from the outbox stay sent.
+        """
+        self.client.force_login(self.dm)
+        response = self._post("bard@example.com")
+
+        OutgoingEmail.objects.all().delete()
+        status = self.client.get(response.json()["status_url"]).json()
+
+        self.assertTrue(status["done"])
+        self.assertEqual(status["recipients"][0]["delivery_status"], "sent")
+
+    def test_emailed_invite_can_be_used_once(self) -> None:
+        """
+        The link in the email joins the campaign and cannot be reused.
+        """
+        self.client.force_login(self.dm)
+        self._post("guest@example.com")
+        join_url = mail.outbox[0].body.split("http://testserver")[1].split()[0]
+        guest, _ = UserFactory.create()
+        other, _ = UserFactory.create()
+
+        self.client.force_login(guest)
+        self.client.get(join_url)
+        self.client.force_login(other)
+        response = self.client.get(join_url)
+
+        self.assertTrue(self.campaign.players.filter(pk=guest.pk).exists())
+        self.assertEqual(response.status_code, 404)
+
+    def test_rotating_the_link_keeps_emailed_invites(self) -> None:
+        """
+        Generating a new shareable link does not revoke emailed invitations.
+        """
+        self.client.force_login(self.dm)
+        self._post("guest@example.com")
+
+        create_invitation(self.campaign)
+
+        self.assertTrue(
+            CampaignInvitation.objects.get(email="guest@example.com").is_active,
+        )
+
+    def test_invalid_addresses_are_rejected(self) -> None:
+        """
+        Malformed addresses reject the whole batch.
+        """
+        self.client.force_login(self.dm)
+
+        response = self._post("bard@example.com, not-an-email")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("not-an-email", response.json()["errors"]["emails"][0])
+        self.assertFalse(CampaignInvitation.objects.exists())
+
+    def test_player_cannot_email_invitations(self) -> None:
+        """
+        Only the Dungeon Master can send invitations.
+        """
+        self.client.force_login(self.player)
+
+        response = self._post("bard@example.com")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(mail.outbox, [])
+
+    def test_existing_users_can_be_invited_by_name(self) -> None:
+        """
+        ``@username`` recipients are emailed without revealing their address.
+        """
+        guest, _ = UserFactory.create(username="Gimli", email="gimli@example.com")
+        self.client.force_login(self.dm)
+
+        response = self._post("@gimli, bard@example.com")
+
+        self.assertEqual(response.status_code, 202)
+        self.assertNotIn("gimli@example.com", response.content.decode())
+        self.assertEqual(
+            {message.to[0] for message in mail.outbox},
+            {"gimli@example.com", "bard@example.com"},
+        )
+        invite = CampaignInvitation.objects.get(email="gimli@example.com")
+        self.assertEqual(invite.invitee, guest)
+
+        status = self.client.get(response.json()["status_url"]).json()
+        self.assertEqual(
+            [r["recipient"] for r in status["recipients"]],
+            ["bard@example.com", "@Gimli"],
+        )
+
+    def test_unknown_usernames_are_rejected(self) -> None:
+        """
+        Usernames that do not exist or have no address reject the batch.
+        """
+        UserFactory.create(username="silent", email="")
+        self.client.force_login(self.dm)
+
+        response = self._post("@nobody, @silent")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("@nobody, @silent", response.json()["errors"]["emails"][0])
+        self.assertFalse(CampaignInvitation.objects.exists())
@@ -1,20 +1,38 @@
 import datetime
+import io
+import zipfile
 from typing import cast
 
 from django import forms
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
 from config.tests.factories import (
     CampaignFactory,
     PlayerCharacterFactory,
+    SessionFactory,
     TabletopSystemFactory,
     UserFactory,
 )
 from dunbud.forms.journal import JournalEntryForm
 from dunbud.models.journal import JournalEntry
+from dunbud.models.journal_draft import JournalDraft
 from dunbud.models.session import Session
+from dunbud.services import (
+    get_campaign_timeline,
+    get_journal_count,
+    get_journal_page,
+    stream_journal_export,
+)
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
 
 
 class JournalModelTests(TestCase):
@@ -124,6 +142,7 @@ class JournalFormTests(TestCase):
         """
         data = {
             "title": "Valid Entry",
+            "visibility": "party",
             "content": "Good content.",
             "session": self.session_valid.pk,
         }
@@ -140,6 +159,7 @@ class JournalFormTests(TestCase):
         """
         data = {
             "title": "Hacking Attempt",
+            "visibility": "party",
             "content": "Trying to link wrong session.",
             "session": self.session_invalid.pk,
         }
@@ -232,6 +252,7 @@ class JournalViewTests(TestCase):
         self.client.force_login(self.owner)
         data = {
             "title": "New Chapter",
+            "visibility": "party",
             "content": "Exciting events.",
             "session": "",  # Optional field
         }
@@ -263,6 +284,7 @@ class JournalViewTests(TestCase):
         self.client.force_login(self.owner)
         data = {
             "title": "Revised Title",
+            "visibility": "party",
             "content": "Updated content.",
             "session": "",
         }
@@ -296,3 +318,347 @@ class JournalViewTests(TestCase):
         response = self.client.post(self.delete_url)
         self.assertRedirects(response, self.list_url)
         self.assertFalse(JournalEntry.objects.filter(pk=self.entry.pk).exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class JournalPaginationTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.owner, _ = UserFactory.create()
+        self.character = PlayerCharacterFactory.create(user=self.owner)
+        # Entries share timestamps in pairs so the id tie-breaker matters.
+        base = timezone.now()
+        entries = [
+            JournalEntry(character=self.character, title=f"Entry {i}", content="...")
+            for i in range(25)
+        ]
+        JournalEntry.objects.bulk_create(entries)
+        for i, entry in enumerate(entries):
+            JournalEntry.objects.filter(pk=entry.pk).update(
+                created_at=base - datetime.timedelta(minutes=i // 2),
+            )
+        self.url = reverse("journal_list", kwargs={"character_id": self.character.pk})
+        self.client.force_login(self.owner)
+
+    def test_pages_cover_every_entry_once(self) -> None:
+        """Test that following cursors visits every entry exactly once, in order."""
+        seen: list[JournalEntry] = []
+        cursor = None
+        while True:
+            page = get_journal_page(self.character, self.owner, cursor=cursor)
+            seen += page.entries
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(len({entry.pk for entry in seen}), 25)
+        keys = [(entry.created_at, entry.pk) for entry in seen]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+    def test_deep_pages_cost_the_same_as_the_first(self) -> None:
+        """Test that later pages run the same queries and never use OFFSET or COUNT."""
+        first = self.client.get(self.url)
+        cursor = first.context["page"].next_cursor
+        cursor = get_journal_page(self.character, self.owner, cursor=cursor).next_cursor
+        assert cursor is not None
+
+        with CaptureQueriesContext(connection) as first_page:
+            self.client.get(self.url)
+        with CaptureQueriesContext(connection) as deep_page:
+            response = self.client.get(self.url, {"cursor": cursor})
+
+        self.assertEqual(len(response.context["entries"]), 5)
+        self.assertEqual(len(first_page), len(deep_page))
+        for query in deep_page.captured_queries:
+            self.assertNotIn("OFFSET", query["sql"])
+            self.assertNotIn("COUNT(", query["sql"])
+
+    def test_total_is_cached_until_entries_change(self) -> None:
+        """Test that the entry total is counted once and refreshed on create and delete."""
+        self.assertEqual(get_journal_count(self.character, self.owner), 25)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_journal_count(self.character, self.owner), 25)
+
+        entry = JournalEntry.objects.create(
+            character=self.character,
+            title="Another",
+            content="...",
+        )
+        self.assertEqual(get_journal_count(self.character, self.owner), 26)
+        entry.delete()
+        self.assertEqual(get_journal_count(self.character, self.owner), 25)
+
+    def test_invalid_cursor_shows_first_page(self) -> None:
+        """Test that a malformed cursor falls back to the newest entries."""
+        response = self.client.get(self.url, {"cursor": "garbage"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Entry 0")
+        self.assertContains(response, "25 entries")
+
+
+class CampaignJournalTests(TestCase):
+    def setUp(self) -> None:
+        self.dm, _ = UserFactory.create()
+        self.rogue, _ = UserFactory.create()
+        self.bard, _ = UserFactory.create()
+        self.outsider, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.rogue, self.bard],
+        )
+        self.rogue_pc = PlayerCharacterFactory.create(
+            user=self.rogue,
+            campaign=self.campaign,
+            name="Vex",
+        )
+        self.bard_pc = PlayerCharacterFactory.create(
+            user=self.bard,
+            campaign=self.campaign,
+            name="Lyra",
+        )
+        self.session = SessionFactory.create(campaign=self.campaign)
+        JournalEntry.objects.create(
+            character=self.rogue_pc,
+            session=self.session,
+            title="Heist notes",
+            content="We **stole** the crown.",
+        )
+        JournalEntry.objects.create(
+            character=self.bard_pc,
+            title="A secret verse",
+            content="Only the DM may know.",
+            visibility=JournalEntry.Visibility.DUNGEON_MASTER,
+        )
+        self.url = reverse("campaign_journal", kwargs={"slug": self.campaign.slug})
+
+    def test_entries_record_campaign_and_rendered_body(self) -> None:
+        """Test that new entries copy the character's campaign and render markdown."""
+        entry = JournalEntry.objects.get(title="Heist notes")
+
+        self.assertEqual(entry.campaign, self.campaign)
+        self.assertIn("<strong>stole</strong>", entry.content_html)
+
+    def test_rendered_body_is_sanitized(self) -> None:
+        """Test that scripts in entries are stripped from the stored HTML."""
+        entry = JournalEntry.objects.create(
+            character=self.rogue_pc,
+            title="Sneaky",
+            content="<script>alert(1)</script>Hi",
+        )
+        self.assertNotIn("<script>", entry.content_html)
+
+    def test_timeline_merges_characters_in_one_query(self) -> None:
+        """Test that the DM reads every character's entries with one timeline query."""
+        with self.assertNumQueries(1):
+            page = get_campaign_timeline(self.campaign, self.dm)
+
+        self.assertEqual(
+            [entry.title for entry in page.entries],
+            ["A secret verse", "Heist notes"],
+        )
+        self.assertEqual(page.entries[1].session, self.session)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_journal_total_only_counts_visible_entries(self) -> None:
+        """Test that each reader's total counts the entries they may read."""
+        cache.clear()
+        entry = JournalEntry.objects.create(
+            character=self.bard_pc,
+            title="Public verse",
+            content="For everyone.",
+        )
+
+        for user, total in ((self.bard, 2), (self.dm, 2), (self.rogue, 1)):
+            with self.subTest(user=user.username):
+                page = get_journal_page(self.bard_pc, user)
+                self.assertEqual(page.total, len(page.entries))
+                self.assertEqual(page.total, total)
+
+        entry.visibility = JournalEntry.Visibility.DUNGEON_MASTER
+        entry.save()
+        self.assertEqual(get_journal_count(self.bard_pc, self.rogue), 0)
+
+    def test_dm_only_entries_are_hidden_from_other_players(self) -> None:
+        """Test that DM-only entries are visible to their author and the DM alone."""
+        self.client.force_login(self.rogue)
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "Heist notes")
+        self.assertContains(response, "<strong>stole</strong>", html=True)
+        self.assertNotContains(response, "A secret verse")
+        self.assertEqual(
+            len(get_campaign_timeline(self.campaign, self.bard).entries),
+            2,
+        )
+
+    def test_dm_only_entries_are_hidden_from_character_journal(self) -> None:
+        """Test that the character journal applies the same visibility."""
+        url = reverse("journal_list", kwargs={"character_id": self.bard_pc.pk})
+
+        self.client.force_login(self.rogue)
+        self.assertNotContains(self.client.get(url), "A secret verse")
+        self.client.force_login(self.dm)
+        self.assertContains(self.client.get(url), "A secret verse")
+
+    def test_outsiders_cannot_read_the_timeline(self) -> None:
+        """Test that users outside the campaign are refused."""
+        self.client.force_login(self.outsider)
+
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class JournalExportTests(TestCase):
+    def setUp(self) -> None:
+        self.owner, _ = UserFactory.create()
+        self.character = PlayerCharacterFactory.create(user=self.owner, name="Vex")
+        for i in range(3):
+            JournalEntry.objects.create(
+                character=self.character,
+                title=f"Day {i}",
+                content=f"Things happened on day {i}.",
+            )
+        self.url = reverse("journal_export", kwargs={"character_id": self.character.pk})
+
+    def _download(self) -> zipfile.ZipFile:
+        self.client.force_login(self.owner)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        self.assertIn('filename="vex-journal.zip"', response["Content-Disposition"])
+        return zipfile.ZipFile(io.BytesIO(response.getvalue()))
+
+    def test_export_holds_one_file_per_entry_and_an_index(self) -> None:
+        """Test that every entry is exported as Markdown and listed in the index."""
+        archive = self._download()
+
+        self.assertIsNone(archive.testzip())
+        names = archive.namelist()
+        self.assertEqual(names[-1], "index.md")
+        self.assertEqual(len(names), 4)
+        index = archive.read("index.md").decode()
+        for name in names[:-1]:
+            self.assertIn(f"]({name})", index)
+        self.assertIn("# Day 0", archive.read(names[0]).decode())
+        self.assertIn("Things happened on day 0.", archive.read(names[0]).decode())
+
+    def test_export_streams_a_chunk_per_entry(self) -> None:
+        """Test that the archive is yielded incrementally rather than all at once."""
+        chunks = list(stream_journal_export(self.character))
+
+        self.assertEqual(len(chunks), 4)
+        self.assertTrue(all(chunks))
+
+    def test_only_the_owner_can_export(self) -> None:
+        """Test that other users cannot download someone else's journal."""
+        other, _ = UserFactory.create()
+        self.client.force_login(other)
+
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class JournalDraftTests(TestCase):
+    def setUp(self) -> None:
+        self.owner, _ = UserFactory.create()
+        self.character = PlayerCharacterFactory.create(user=self.owner)
+        self.entry = JournalEntry.objects.create(
+            character=self.character,
+            title="Saved title",
+            content="Saved content.",
+        )
+        self.draft_url = reverse(
+            "journal_draft",
+            kwargs={"character_id": self.character.pk},
+        )
+        self.create_url = reverse(
+            "journal_create",
+            kwargs={"character_id": self.character.pk},
+        )
+        self.update_url = reverse("journal_update", kwargs={"entry_id": self.entry.pk})
+        self.client.force_login(self.owner)
+
+    def test_patches_are_single_upserts_that_leave_the_entry_alone(self) -> None:
+        """Test that each autosave is one write and never updates the entry row."""
+        updated_at = self.entry.updated_at
+
+        for text in ("Draft one", "Draft two"):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(
+                    self.draft_url,
+                    {"entry": str(self.entry.pk), "content": text},
+                )
+            self.assertEqual(response.status_code, 200)
+            writes = [
+                q["sql"]
+                for q in ctx.captured_queries
+                if q["sql"].startswith(("INSERT", "UPDATE"))
+            ]
+            self.assertEqual(len(writes), 1)
+            self.assertIn("dunbud_journaldraft", writes[0])
+
+        self.entry.refresh_from_db()
+        self.assertEqual(self.entry.updated_at, updated_at)
+        draft = JournalDraft.objects.get()
+        self.assertEqual(draft.content, "Draft two")
+        self.assertEqual(draft.title, "Saved title")
+
+    def test_draft_is_restored_and_discarded_on_save(self) -> None:
+        """Test that the edit form shows the draft and a full save clears it."""
+        self.client.post(
+            self.draft_url,
+            {"entry": str(self.entry.pk), "title": "Better title"},
+        )
+
+        response = self.client.get(self.update_url)
+        self.assertContains(response, "Restored your unsaved draft")
+        self.assertContains(response, 'value="Better title"')
+        self.assertContains(response, "Saved content.")
+
+        self.client.post(
+            self.update_url,
+            {"title": "Better title", "visibility": "party", "content": "Done."},
+        )
+        self.assertFalse(JournalDraft.objects.exists())
+
+    def test_new_entry_drafts_are_kept_apart(self) -> None:
+        """Test that a draft for a new entry restores on the create form only."""
+        self.client.post(self.draft_url, {"title": "Fresh", "content": "Once upon"})
+
+        self.assertContains(self.client.get(self.create_url), "Once upon")
+        self.assertNotContains(self.client.get(self.update_url), "Once upon")
+
+    def test_expired_drafts_are_ignored_and_purged(self) -> None:
+        """Test that week-old drafts are not restored and the command deletes them."""
+        self.client.post(self.draft_url, {"title": "Old"})
+        JournalDraft.objects.update(
+            updated_at=timezone.now() - datetime.timedelta(days=8),
+        )
+
+        self.assertNotContains(self.client.get(self.create_url), 'value="Old"')
+        out = io.StringIO()
+        call_command("purge_journal_drafts", stdout=out)
+        self.assertIn("Purged 1 expired drafts.", out.getvalue())
+
+    def test_only_the_owner_can_autosave(self) -> None:
+        """Test that drafts cannot be written for someone else's character or entry."""
+        other, _ = UserFactory.create()
+        other_character = PlayerCharacterFactory.create(user=other)
+        other_entry = JournalEntry.objects.create(
+            character=other_character,
+            title="Theirs",
+            content="...",
+        )
+
+        response = self.client.post(
+            self.draft_url,
+            {"entry": str(other_entry.pk), "content": "Mine now"},
+        )
+        self.assertEqual(response.status_code, 404)
+
+        self.client.force_login(other)
+        response = self.client.post(self.draft_url, {"content": "Hijack"})
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(JournalDraft.objects.exists())
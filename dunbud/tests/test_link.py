@@ -1,10 +1,14 @@
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from config.tests.factories import HelpfulLinkFactory, UserFactory
 from dunbud.models import Campaign, HelpfulLink
-from dunbud.models.links import MAX_LINKS_PER_CAMPAIGN
+from dunbud.models.links import MAX_LINKS_PER_CAMPAIGN, sync_helpful_link_counts
+from dunbud.services import import_helpful_links
 
 User = get_user_model()
 
@@ -20,6 +24,10 @@ class HelpfulLinkTests(TestCase):
         )
         self.campaign.players.add(self.player)
         self.add_url = reverse("helpful_link_add", kwargs={"slug": self.campaign.slug})
+        self.import_url = reverse(
+            "helpful_link_import",
+            kwargs={"slug": self.campaign.slug},
+        )
         self.campaign_url = reverse(
             "campaign_detail",
             kwargs={"slug": self.campaign.slug},
@@ -191,3 +199,125 @@ class HelpfulLinkTests(TestCase):
             campaign=self.campaign,
         )
         self.assertEqual(str(link), "My Link")
+
+    def _link_count(self) -> int:
+        self.campaign.refresh_from_db(fields=["helpful_link_count"])
+        return self.campaign.helpful_link_count
+
+    def test_counter_tracks_adds_and_deletes(self) -> None:
+        """
+        The campaign's link counter follows creates and deletes.
+        """
+        first = HelpfulLinkFactory.create(campaign=self.campaign)
+        HelpfulLinkFactory.create(campaign=self.campaign)
+        self.assertEqual(self._link_count(), 2)
+
+        first.delete()
+        self.assertEqual(self._link_count(), 1)
+
+    def test_limit_is_enforced_on_save(self) -> None:
+        """
+        Saving past the limit fails even when clean() was not called.
+        """
+        for i in range(MAX_LINKS_PER_CAMPAIGN):
+            HelpfulLinkFactory.create(campaign=self.campaign, name=f"Link {i}")
+
+        with self.assertRaises(ValidationError):
+            HelpfulLink.objects.create(
+                campaign=self.campaign,
+                name="Too many",
+                url="https://toomany.com",
+            )
+        self.assertEqual(self._link_count(), MAX_LINKS_PER_CAMPAIGN)
+        self.assertFalse(HelpfulLink.objects.filter(name="Too many").exists())
+
+    def test_sync_counts_repairs_counter(self) -> None:
+        """
+        Syncing recomputes the counter after writes that bypass save().
+        """
+        HelpfulLink.objects.bulk_create(
+            [
+                HelpfulLink(campaign=self.campaign, name="A", url="https://a.com"),
+                HelpfulLink(campaign=self.campaign, name="B", url="https://b.com"),
+            ],
+        )
+        self.assertEqual(self._link_count(), 0)
+
+        sync_helpful_link_counts(self.campaign.pk)
+        self.assertEqual(self._link_count(), 2)
+
+    def test_import_uses_a_single_insert(self) -> None:
+        """
+        A batch of links is written with one INSERT.
+        """
+        links = [(f"Link {i}", f"https://{i}.example.com") for i in range(5)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            import_helpful_links(self.campaign, links)
+
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(self._link_count(), 5)
+        self.assertEqual(HelpfulLink.objects.filter(campaign=self.campaign).count(), 5)
+
+    def test_import_past_limit_adds_nothing(self) -> None:
+        """
+        A batch that does not fit is rejected as a whole.
+        """
+        HelpfulLinkFactory.create(campaign=self.campaign)
+        links = [
+            (f"Link {i}", f"https://{i}.example.com")
+            for i in range(MAX_LINKS_PER_CAMPAIGN)
+        ]
+
+        with self.assertRaises(ValidationError):
+            import_helpful_links(self.campaign, links)
+
+        self.assertEqual(self._link_count(), 1)
+        self.assertEqual(HelpfulLink.objects.filter(campaign=self.campaign).count(), 1)
+
+    def test_dm_can_import_links(self) -> None:
+        """
+        The Dungeon Master can paste several links at once.
+        """
+        self.client.force_login(self.dm)
+        data = {"links": "Roll20 | roll20.net\n\nDiscord | https://discord.com\n"}
+        response = self.client.post(
+            self.import_url,
+            data,
+            headers={"x-requested-with": "XMLHttpRequest"},
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [link["url"] for link in response.json()["links"]],
+            ["https://roll20.net", "https://discord.com"],
+        )
+        self.assertEqual(self._link_count(), 2)
+
+    def test_import_rejects_malformed_lines(self) -> None:
+        """
+        Any malformed line rejects the whole import.
+        """
+        self.client.force_login(self.dm)
+        data = {"links": "Roll20 | roll20.net\nno separator here"}
+        response = self.client.post(
+            self.import_url,
+            data,
+            headers={"x-requested-with": "XMLHttpRequest"},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Line 2", response.json()["errors"]["links"][0])
+        self.assertFalse(HelpfulLink.objects.filter(campaign=self.campaign).exists())
+
+    def test_player_cannot_import_links(self) -> None:
+        """
+        Players cannot import links.
+        """
+        self.client.force_login(self.player)
+        response = self.client.post(
+            self.import_url,
+            {"links": "Roll20 | roll20.net"},
+            headers={"x-requested-with": "XMLHttpRequest"},
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(HelpfulLink.objects.filter(campaign=self.campaign).exists())
@@ -0,0 +1,268 @@
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from typing import Any
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from config.tests.factories import (
+    CampaignFactory,
+    HelpfulLinkFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.models import LinkCheck
+from dunbud.services import (
+    LinkChecker,
+    LinkResult,
+    run_link_checks,
+    store_link_results,
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Minimal server with one behaviour per path.
+    """
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        with self.lock:
+            type(self).connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _respond(self, status: int, body: bytes = b"") -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _redirect(self, location: str) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _handle(self) -> None:
+        with self.lock:
+            type(self).in_flight += 1
+            type(self).max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.path == "/slow":
+                time.sleep(0.5)
+                self._respond(200)
+            elif self.path == "/busy":
+                time.sleep(0.05)
+                self._respond(200)
+            elif self.path == "/missing":
+                self._respond(404)
+            elif self.path == "/no-head" and self.command == "HEAD":
+                self._respond(405)
+            elif self.path == "/moved":
+                self._redirect("/missing")
+            elif self.path == "/loop":
+                self._redirect("/loop")
+            elif self.path == "/metadata":
+                self._redirect("http://169.254.169.254/latest/meta-data/")
+            else:
+                self._respond(200, b"hello")
+        finally:
+            with self.lock:
+                type(self).in_flight -= 1
+
+    do_HEAD = _handle  # noqa: N815
+    do_GET = _handle  # noqa: N815
+
+
+# The stub server listens on loopback, which the checker refuses by default.
+@override_settings(DUNBUD_LINK_CHECK_ALLOW_PRIVATE=True)
+class LinkHealthTests(TestCase):
+    """
+    Tests for the concurrent link checker against a local stub server.
+    """
+
+    def setUp(self) -> None:
+        _StubHandler.connections = 0
+        _StubHandler.max_in_flight = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.dm, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+        )
+
+    def _check(self, *paths: str, **kwargs: Any) -> dict[str, LinkResult]:
+        urls = [f"{self.base}{path}" for path in paths]
+        kwargs.setdefault("allow_private", True)
+        results = asyncio.run(LinkChecker(**kwargs).check_all(urls))
+        return {result.url.removeprefix(self.base): result for result in results}
+
+    def test_statuses_are_reported(self) -> None:
+        """
+        Healthy and broken URLs are told apart by status code.
+        """
+        results = self._check("/ok", "/missing")
+
+        self.assertEqual(results["/ok"].status_code, 200)
+        self.assertTrue(results["/ok"].is_healthy)
+        self.assertEqual(results["/missing"].status_code, 404)
+        self.assertFalse(results["/missing"].is_healthy)
+
+    def test_requests_per_host_are_bounded(self) -> None:
+        """
+        No more than ``per_host`` requests go to one host at once.
+        """
+        self._check(*(["/busy"] * 8), concurrency=8, per_host=2)
+
+        self.assertLessEqual(_StubHandler.max_in_flight, 2)
+
+    def test_connections_are_reused_per_host(self) -> None:
+        """
+        Checks of one host share keep-alive connections, at most ``per_host``
+        of them, and redirects reuse the connection they arrived on.
+        """
+        results = self._check(
+            *(f"/page{i}" for i in range(8)),
+            "/moved",
+            concurrency=8,
+            per_host=2,
+        )
+
+        self.assertTrue(all(r.is_healthy for p, r in results.items() if p != "/moved"))
+        self.assertEqual(results["/moved"].status_code, 404)
+        self.assertLessEqual(_StubHandler.connections, 2)
+
+    def test_redirects_are_followed(self) -> None:
+        """
+        The status of the redirect target decides the health.
+        """
+        results = self._check("/moved", "/loop")
+
+        self.assertEqual(results["/moved"].status_code, 404)
+        self.assertEqual(results["/loop"].error, "Too many redirects")
+
+    def test_private_addresses_are_refused(self) -> None:
+        """
+        Loopback hosts are refused before any connection is made.
+        """
+        results = self._check("/ok", allow_private=False)
+
+        self.assertIsNone(results["/ok"].status_code)
+        self.assertIn("Refused", results["/ok"].error)
+        self.assertEqual(_StubHandler.connections, 0)
+
+    def test_redirects_to_private_addresses_are_refused(self) -> None:
+        """
+        A public page cannot redirect the checker to an internal address.
+        """
+        # Treat the stub server as public so only the redirect is refused.
+        with mock.patch(
+            "dunbud.services.link_health._is_public_address",
+            side_effect=lambda address: address == "127.0.0.1",
+        ):
+            result = self._check("/metadata", allow_private=False)["/metadata"]
+
+        self.assertIsNone(result.status_code)
+        self.assertIn("169.254.169.254", result.error)
+
+    def test_falls_back_to_get_when_head_is_rejected(self) -> None:
+        """
+        Servers that reject HEAD are checked with GET.
+        """
+        self.assertEqual(self._check("/no-head")["/no-head"].status_code, 200)
+
+    def test_concurrency_is_bounded(self) -> None:
+        """
+        No more than ``concurrency`` requests are in flight at once.
+        """
+        self._check(*(["/busy"] * 8), concurrency=2, per_host=8)
+
+        self.assertLessEqual(_StubHandler.max_in_flight, 2)
+
+    def test_timeouts_and_connection_errors_are_recorded(self) -> None:
+        """
+        Slow and unreachable URLs are reported as unhealthy with an error.
+        """
+        slow = self._check("/slow", timeout=0.1)["/slow"]
+        unreachable = asyncio.run(
+            LinkChecker().check_all(["http://127.0.0.1:1/", "ftp://example.com/"]),
+        )
+
+        self.assertEqual(slow.error, "Timed out")
+        self.assertIsNone(slow.status_code)
+        self.assertTrue(all(not result.is_healthy for result in unreachable))
+        self.assertTrue(all(result.error for result in unreachable))
+
+    def test_run_stores_results_and_skips_fresh_urls(self) -> None:
+        """
+        Results are cached and recently checked URLs are not checked again.
+        """
+        HelpfulLinkFactory.create(campaign=self.campaign, url=f"{self.base}/ok")
+        HelpfulLinkFactory.create(campaign=self.campaign, url=f"{self.base}/missing")
+        self.campaign.vtt_link = f"{self.base}/ok"
+        self.campaign.save()
+
+        self.assertEqual(len(run_link_checks()), 2)
+        self.assertEqual(LinkCheck.objects.filter(is_healthy=False).count(), 1)
+        self.assertEqual(run_link_checks(), [])
+        self.assertEqual(len(run_link_checks(max_age=timedelta(0))), 2)
+
+    def test_command_reports_unhealthy_links(self) -> None:
+        """
+        The command prints each unhealthy link and a summary.
+        """
+        HelpfulLinkFactory.create(campaign=self.campaign, url=f"{self.base}/missing")
+        out = StringIO()
+
+        call_command("check_links", stdout=out)
+
+        self.assertIn(f"{self.base}/missing: 404", out.getvalue())
+        self.assertIn("Checked 1 links, 1 unhealthy.", out.getvalue())
+
+    def test_campaign_page_shows_cached_health(self) -> None:
+        """
+        The campaign page flags broken links from the cache alone.
+        """
+        broken = HelpfulLinkFactory.create(
+            campaign=self.campaign,
+            url="https://gone.invalid/",
+        )
+        healthy = HelpfulLinkFactory.create(
+            campaign=self.campaign,
+            url="https://fine.invalid/",
+        )
+        store_link_results(
+            [
+                LinkResult(broken.url, status_code=404),
+                LinkResult(healthy.url, status_code=200),
+            ],
+            checked_at=timezone.now(),
+        )
+        self.client.force_login(self.dm)
+
+        response = self.client.get(
+            reverse("campaign_detail", kwargs={"slug": self.campaign.slug}),
+        )
+
+        self.assertContains(response, "Link may be broken", count=1)
@@ -0,0 +1,163 @@
+import time
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from config.tests.factories import CampaignFactory, TabletopSystemFactory, UserFactory
+from dunbud.models import Campaign
+from dunbud.services import (
+    CampaignRole,
+    get_campaign_role,
+    get_role_map,
+    is_campaign_member,
+    is_dungeon_master,
+)
+from dunbud.services.membership import ROLE_MAP_TIMEOUT
+from users.models import CustomUser
+
+
+# Cache hits are only query-free with an in-memory cache backend.
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class CampaignRoleMapTests(TestCase):
+    """
+    Tests for the cached campaign membership service.
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.dm, _ = UserFactory.create()
+        self.player, _ = UserFactory.create()
+        self.outsider, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.player],
+        )
+
+    def _fresh(self, user: CustomUser) -> CustomUser:
+        """
+        Reload a user so no role map is memoized on the instance.
+        """
+        return CustomUser.objects.get(pk=user.pk)
+
+    def test_roles(self) -> None:
+        """
+        DM, player and outsider receive the expected roles.
+        """
+        self.assertEqual(
+            get_campaign_role(self.dm, self.campaign),
+            CampaignRole.DUNGEON_MASTER,
+        )
+        self.assertEqual(
+            get_campaign_role(self.player, self.campaign),
+            CampaignRole.PLAYER,
+        )
+        self.assertEqual(
+            get_campaign_role(self.outsider, self.campaign),
+            CampaignRole.NONE,
+        )
+        self.assertTrue(is_dungeon_master(self.dm, self.campaign))
+        self.assertFalse(is_dungeon_master(self.player, self.campaign))
+        self.assertTrue(is_campaign_member(self.player, self.campaign.pk))
+        self.assertFalse(is_campaign_member(self.outsider, self.campaign.pk))
+
+    def test_anonymous_user_has_no_roles(self) -> None:
+        """
+        Anonymous users never hit the database and hold no roles.
+        """
+        with self.assertNumQueries(0):
+            self.assertEqual(get_role_map(AnonymousUser()), {})
+
+    def test_role_map_is_cached(self) -> None:
+        """
+        Once built, the role map is served from the cache.
+        """
+        get_role_map(self.player)
+        player = self._fresh(self.player)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(is_campaign_member(player, self.campaign))
+            self.assertFalse(is_dungeon_master(player, self.campaign))
+
+    def test_cached_roles_expire_quickly(self) -> None:
+        """
+        A write that bypasses the signals is picked up within seconds.
+        """
+        self.assertTrue(is_dungeon_master(self.dm, self.campaign))
+        Campaign.objects.filter(pk=self.campaign.pk).update(
+            dungeon_master=self.outsider,
+        )
+        self.assertTrue(is_dungeon_master(self._fresh(self.dm), self.campaign))
+
+        later = time.time() + ROLE_MAP_TIMEOUT + 1
+        with mock.patch("time.time", return_value=later):
+            self.assertFalse(is_dungeon_master(self._fresh(self.dm), self.campaign))
+
+    def test_player_added_invalidates(self) -> None:
+        """
+        Adding a player drops their cached role map.
+        """
+        get_role_map(self.outsider)
+        self.campaign.players.add(self.outsider)
+
+        self.assertEqual(
+            get_campaign_role(self._fresh(self.outsider), self.campaign),
+            CampaignRole.PLAYER,
+        )
+
+    def test_player_removed_invalidates(self) -> None:
+        """
+        Removing a player drops their cached role map.
+        """
+        get_role_map(self.player)
+        self.campaign.players.remove(self.player)
+
+        self.assertFalse(is_campaign_member(self._fresh(self.player), self.campaign))
+
+    def test_players_cleared_invalidates(self) -> None:
+        """
+        Clearing the roster drops the role maps of every former player.
+        """
+        get_role_map(self.player)
+        self.campaign.players.clear()
+
+        self.assertFalse(is_campaign_member(self._fresh(self.player), self.campaign))
+
+    def test_reverse_join_invalidates(self) -> None:
+        """
+        Joining through the user side of the relation also invalidates.
+        """
+        get_role_map(self.outsider)
+        self.outsider.joined_campaigns.add(self.campaign)
+
+        self.assertTrue(is_campaign_member(self._fresh(self.outsider), self.campaign))
+
+    def test_dm_change_invalidates(self) -> None:
+        """
+        Handing a campaign to a new DM invalidates both DMs.
+        """
+        get_role_map(self.dm)
+        get_role_map(self.outsider)
+
+        self.campaign.dungeon_master = self.outsider
+        self.campaign.save()
+
+        self.assertFalse(is_campaign_member(self._fresh(self.dm), self.campaign))
+        self.assertTrue(is_dungeon_master(self._fresh(self.outsider), self.campaign))
+
+    def test_campaign_delete_invalidates(self) -> None:
+        """
+        Deleting a campaign removes it from every member's role map.
+        """
+        campaign_id = self.campaign.pk
+        get_role_map(self.dm)
+        get_role_map(self.player)
+
+        self.campaign.delete()
+
+        self.assertNotIn(str(campaign_id), get_role_map(self._fresh(self.dm)))
+        self.assertNotIn(str(campaign_id), get_role_map(self._fresh(self.player)))
@@ -0,0 +1,183 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from config.tests.factories import (
+    CampaignFactory,
+    PlayerCharacterFactory,
+    SessionFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.models import Campaign, FeedReadMarker, PartyFeedItem
+from dunbud.services import CampaignRole, build_my_table, mark_feed_read
+
+
+class MyTableTests(TestCase):
+    """
+    Tests for the "My Table" dashboard.
+    """
+
+    def setUp(self) -> None:
+        self.user, _ = UserFactory.create()
+        self.other, _ = UserFactory.create()
+        self.system = TabletopSystemFactory.create()
+        self.managed = CampaignFactory.create(
+            dungeon_master=self.user,
+            system=self.system,
+            name="Managed",
+        )
+        self.joined = CampaignFactory.create(
+            dungeon_master=self.other,
+            system=self.system,
+            players=[self.user],
+            name="Joined",
+        )
+        self.character = PlayerCharacterFactory.create(
+            user=self.user,
+            campaign=self.joined,
+        )
+        self.url = reverse("my_table")
+
+    def _add_campaign(self, name: str) -> Campaign:
+        campaign = CampaignFactory.create(
+            dungeon_master=self.other,
+            system=self.system,
+            players=[self.user],
+            name=name,
+        )
+        PartyFeedItem.objects.create(campaign=campaign, message="Welcome")
+        SessionFactory.create(
+            campaign=campaign,
+            proposed_date=timezone.now() + timedelta(days=1),
+        )
+        PlayerCharacterFactory.create(user=self.user, campaign=campaign)
+        return campaign
+
+    def test_lists_campaigns_in_every_role(self) -> None:
+        """
+        Managed and joined campaigns appear with the user's role and character.
+        """
+        CampaignFactory.create(dungeon_master=self.other, system=self.system)
+
+        entries = {e.campaign.pk: e for e in build_my_table(self.user)}
+
+        self.assertEqual(set(entries), {self.managed.pk, self.joined.pk})
+        self.assertEqual(entries[self.managed.pk].role, CampaignRole.DUNGEON_MASTER)
+        self.assertEqual(entries[self.joined.pk].role, CampaignRole.PLAYER)
+        self.assertEqual(entries[self.joined.pk].character, self.character)
+        self.assertIsNone(entries[self.managed.pk].character)
+
+    def test_next_session_ignores_past_sessions(self) -> None:
+        """
+        The next session is the earliest one that has not started yet.
+        """
+        now = timezone.now()
+        SessionFactory.create(
+            campaign=self.joined,
+            proposed_date=now - timedelta(days=1),
+        )
+        SessionFactory.create(
+            campaign=self.joined,
+            proposed_date=now + timedelta(days=7),
+        )
+        sooner = SessionFactory.create(
+            campaign=self.joined,
+            proposed_date=now + timedelta(days=2),
+        )
+
+        entries = build_my_table(self.user)
+
+        self.assertEqual(entries[0].campaign, self.joined)
+        self.assertEqual(entries[0].next_session_number, sooner.session_number)
+        self.assertIsNone(entries[1].next_session_date)
+
+    def test_unread_count(self) -> None:
+        """
+        Feed items posted after the user last read the feed count as unread.
+        """
+        entry = next(e for e in build_my_table(self.user) if e.campaign == self.joined)
+        self.assertEqual(
+            entry.unread_count,
+            PartyFeedItem.objects.filter(campaign=self.joined).count(),
+        )
+
+        mark_feed_read(self.user, self.joined)
+        PartyFeedItem.objects.create(campaign=self.joined, message="One")
+        PartyFeedItem.objects.create(campaign=self.joined, message="Two")
+
+        entry = next(e for e in build_my_table(self.user) if e.campaign == self.joined)
+        self.assertEqual(entry.unread_count, 2)
+
+    def test_visiting_campaign_marks_feed_read(self) -> None:
+        """
+        Opening the campaign page clears its unread count.
+        """
+        PartyFeedItem.objects.create(campaign=self.joined, message="News")
+        self.client.force_login(self.user)
+
+        self.client.get(reverse("campaign_detail", kwargs={"slug": self.joined.slug}))
+
+        entry = next(e for e in build_my_table(self.user) if e.campaign == self.joined)
+        self.assertEqual(entry.unread_count, 0)
+
+    def test_mark_feed_read_skips_write_when_up_to_date(self) -> None:
+        """
+        Marking an already-read feed costs a single read and no write.
+        """
+        PartyFeedItem.objects.create(campaign=self.joined, message="News")
+        mark_feed_read(self.user, self.joined)
+        marker = FeedReadMarker.objects.get(user=self.user, campaign=self.joined)
+        read_at = marker.last_read_at
+
+        with self.assertNumQueries(1):
+            mark_feed_read(self.user, self.joined)
+
+        marker.refresh_from_db()
+        self.assertEqual(marker.last_read_at, read_at)
+
+    def test_query_count_is_fixed(self) -> None:
+        """
+        The dashboard costs two queries however many campaigns it lists.
+        """
+        for i in range(5):
+            self._add_campaign(f"Extra {i}")
+
+        with self.assertNumQueries(2):
+            entries = build_my_table(self.user)
+        self.assertEqual(len(entries), 7)
+
+    def test_view_renders_dashboard(self) -> None:
+        """
+        The dashboard page lists the user's campaigns.
+        """
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "campaign/my_table.html")
+        self.assertContains(response, "Managed")
+        self.assertContains(response, "Joined")
+        self.assertContains(response, self.character.name)
+
+    def test_view_empty_state(self) -> None:
+        """
+        Users without campaigns see an empty state.
+        """
+        loner, _ = UserFactory.create()
+        self.client.force_login(loner)
+
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "You are not part of any campaigns yet.")
+
+    def test_view_requires_login(self) -> None:
+        """
+        Anonymous users are redirected to the login page.
+        """
+        response = self.client.get(self.url)
+
+        self.assertRedirects(response, f"/users/login/?next={self.url}")
@@ -0,0 +1,212 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from typing import Any
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from dunbud.models import OutgoingEmail
+from dunbud.services import CircuitBreaker, queue_email, send_outbox
+from dunbud.services.outbox import MAX_ATTEMPTS, OutboxResult, retry_delay
+
+
+class FlakyBackend(EmailBackend):
+    """
+    In-memory backend that counts opened connections, refuses connections
+    while ``unreachable`` is set and fails while ``down`` is set or for one
+    address.
+    """
+
+    opened = 0
+    down = False
+    unreachable = False
+
+    def open(self) -> bool:
+        if self.unreachable:
+            raise ConnectionRefusedError("Connection refused")
+        type(self).opened += 1
+        return True
+
+    def send_messages(self, messages: Any) -> int:
+        if self.down or any("bounce@example.com" in m.to for m in messages):
+            raise OSError("Service unavailable")
+        return super().send_messages(messages)
+
+
+@override_settings(EMAIL_BACKEND="dunbud.tests.test_outbox.FlakyBackend")
+class OutboxTests(TestCase):
+    """
+    Tests for the email outbox and its worker.
+    """
+
+    def setUp(self) -> None:
+        FlakyBackend.opened = 0
+        FlakyBackend.down = False
+        FlakyBackend.unreachable = False
+        self.breaker = CircuitBreaker(threshold=3, cooldown=60)
+
+    def _queue(self, *recipients: str) -> list[OutgoingEmail]:
+        return [queue_email("Hello", "Body", [to]) for to in recipients]
+
+    def test_batches_share_one_connection(self) -> None:
+        """
+        Queued emails are sent in batches, one mail connection per batch.
+        """
+        self._queue(*(f"player{i}@example.com" for i in range(5)))
+
+        result = send_outbox(batch_size=2, breaker=self.breaker)
+
+        self.assertEqual(result.sent, 5)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(FlakyBackend.opened, 3)
+        self.assertFalse(
+            OutgoingEmail.objects.exclude(status=OutgoingEmail.Status.SENT).exists(),
+        )
+
+    def test_failures_are_retried_with_backoff(self) -> None:
+        """
+        A failed email is rescheduled with a growing delay and eventually
+        given up on.
+        """
+        (email,) = self._queue("bounce@example.com")
+
+        send_outbox(breaker=self.breaker)
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(email.last_error, "Service unavailable")
+        self.assertGreater(
+            email.next_attempt_at,
+            timezone.now() + timedelta(seconds=50),
+        )
+        self.assertGreater(retry_delay(3), retry_delay(2))
+
+        # Not due yet, so the next run leaves it alone.
+        self.assertEqual(send_outbox(breaker=self.breaker).retried, 0)
+
+        OutgoingEmail.objects.update(
+            attempts=MAX_ATTEMPTS - 1,
+            next_attempt_at=timezone.now(),
+        )
+        self.assertEqual(send_outbox(breaker=self.breaker).failed, 1)
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmail.Status.FAILED)
+
+    def test_open_breaker_defers_without_using_attempts(self) -> None:
+        """
+        Once the breaker opens, the rest of the batch waits for the cooldown
+        and later runs do not touch the backend.
+        """
+        FlakyBackend.down = True
+        self._queue(*(f"player{i}@example.com" for i in range(5)))
+
+        result = send_outbox(breaker=self.breaker)
+
+        self.assertEqual(result.retried, 3)
+        self.assertEqual(result.deferred, 2)
+        self.assertTrue(self.breaker.is_open)
+        deferred = OutgoingEmail.objects.filter(attempts=0)
+        self.assertEqual(deferred.count(), 2)
+
+        FlakyBackend.down = False
+        OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(send_outbox(breaker=self.breaker).sent, 0)
+        self.assertEqual(mail.outbox, [])
+
+        self.breaker.reset()
+        self.assertEqual(send_outbox(breaker=self.breaker).sent, 5)
+
+    def test_unreachable_backend_defers_without_using_attempts(self) -> None:
+        """
+        When no connection can be opened the whole batch is put off, with the
+        error recorded but no attempt used up.
+        """
+        FlakyBackend.unreachable = True
+        self._queue(*(f"player{i}@example.com" for i in range(5)))
+
+        result = send_outbox(breaker=self.breaker)
+
+        self.assertEqual(result.deferred, 5)
+        self.assertEqual(result.retried + result.failed, 0)
+        self.assertFalse(OutgoingEmail.objects.exclude(attempts=0).exists())
+        self.assertFalse(
+            OutgoingEmail.objects.filter(
+                next_attempt_at__lte=timezone.now() + timedelta(seconds=50),
+            ).exists(),
+        )
+        self.assertEqual(
+            set(OutgoingEmail.objects.values_list("last_error", flat=True)),
+            {"Connection refused"},
+        )
+
+        FlakyBackend.unreachable = False
+        OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(send_outbox(breaker=self.breaker).sent, 5)
+
+    def test_breaker_closes_after_a_success(self) -> None:
+        """
+        After the cooldown one failure reopens the breaker and one success
+        closes it.
+        """
+        breaker = CircuitBreaker(threshold=2, cooldown=0.05)
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+
+        time.sleep(0.06)
+        self.assertFalse(breaker.is_open)
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+
+        time.sleep(0.06)
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertFalse(breaker.is_open)
+
+    def test_command_sends_and_purges_old_emails(self) -> None:
+        """
+        The worker command sends pending emails and drops old sent ones.
+        """
+        (old,) = self._queue("old@example.com")
+        OutgoingEmail.objects.filter(pk=old.pk).update(
+            status=OutgoingEmail.Status.SENT,
+            sent_at=timezone.now() - timedelta(days=30),
+        )
+        self._queue("bard@example.com")
+        out = StringIO()
+
+        call_command("send_outbox", stdout=out)
+
+        self.assertIn("Sent 1 emails, 0 to retry, 0 failed", out.getvalue())
+        self.assertEqual(mail.outbox[0].to, ["bard@example.com"])
+        self.assertFalse(OutgoingEmail.objects.filter(pk=old.pk).exists())
+
+    def test_worker_keeps_polling_after_a_failed_run(self) -> None:
+        """
+        With ``--interval`` the command logs a failed run and polls again.
+        """
+        command = "dunbud.management.commands.send_outbox"
+        out = StringIO()
+
+        with (
+            mock.patch(f"{command}.close_old_connections"),
+            mock.patch(
+                f"{command}.send_outbox",
+                side_effect=[OSError("database restarting"), OutboxResult(sent=1)],
+            ),
+            mock.patch(
+                f"{command}.time.sleep",
+                side_effect=[None, KeyboardInterrupt],
+            ),
+            self.assertLogs(command, "ERROR"),
+            self.assertRaises(KeyboardInterrupt),
+        ):
+            call_command("send_outbox", "--interval", "30", stdout=out)
+
+        self.assertIn("Sent 1 emails", out.getvalue())
@@ -1,8 +1,17 @@
+from datetime import timedelta
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
-from config.tests.factories import PlayerCharacterFactory, UserFactory
-from dunbud.models import Campaign, PlayerCharacter
+from config.tests.factories import (
+    PlayerCharacterFactory,
+    SessionFactory,
+    UserFactory,
+)
+from dunbud.models import Campaign, JournalEntry, PlayerCharacter
 
 
 class CharacterModelTests(TestCase):
@@ -197,7 +206,7 @@ class CharacterViewTests(TestCase):
         self.assertContains(response, "Frodo")
 
         # Verify the specific campaign line from the template is rendered
-        # Template: Campaign: {{ character.campaign.name }}
+        # Template: Campaign: {{ character.campaign_name }}
         self.assertContains(response, "Campaign: The Fellowship")
 
     def test_character_list_view(self) -> None:
@@ -212,6 +221,54 @@ class CharacterViewTests(TestCase):
         self.assertContains(response, c1.name)
         self.assertNotContains(response, "Other Char")
 
+    def test_character_list_annotations(self) -> None:
+        """
+        Characters carry journal activity, campaign name and next session,
+        and the query count does not grow with the number of characters.
+        """
+        dm_user, _ = UserFactory.create(username="annotations_dm")
+        campaign = Campaign.objects.create(name="The Shire", dungeon_master=dm_user)
+        session = SessionFactory.create(
+            campaign=campaign,
+            proposed_date=timezone.now() + timedelta(days=3),
+        )
+        SessionFactory.create(
+            campaign=campaign,
+            proposed_date=timezone.now() - timedelta(days=3),
+        )
+        writer = PlayerCharacterFactory.create(user=self.user, campaign=campaign)
+        PlayerCharacterFactory.create(user=self.user, name="Quiet")
+        for title in ("One", "Two"):
+            latest = JournalEntry.objects.create(
+                character=writer,
+                title=title,
+                content="...",
+            )
+
+        url = reverse("character_list")
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as few:
+            response = self.client.get(url)
+        characters = {c.pk: c for c in response.context["characters"]}
+
+        self.assertEqual(characters[writer.pk].journal_count, 2)
+        self.assertEqual(characters[writer.pk].last_entry_at, latest.created_at)
+        self.assertEqual(characters[writer.pk].campaign_name, "The Shire")
+        self.assertEqual(
+            characters[writer.pk].next_session_date,
+            session.proposed_date,
+        )
+        quiet = next(c for c in characters.values() if c.name == "Quiet")
+        self.assertEqual(quiet.journal_count, 0)
+        self.assertIsNone(quiet.last_entry_at)
+        self.assertIsNone(quiet.next_session_date)
+
+        for _ in range(10):
+            PlayerCharacterFactory.create(user=self.user, campaign=campaign)
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(url)
+        self.assertEqual(len(many), len(few))
+
     def test_character_create_view(self) -> None:
         """
         Test creating a character via the view.
@@ -0,0 +1,171 @@
+from io import StringIO
+from typing import Any
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from config.tests.factories import (
+    CampaignFactory,
+    PlayerCharacterFactory,
+    SessionFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.models import JournalEntry, PlayerStats
+from dunbud.services import rebuild_player_stats
+from dunbud.services.player_stats import COUNTERS
+
+
+class PlayerStatsTests(TestCase):
+    """
+    Tests for the incrementally maintained profile statistics.
+    """
+
+    def setUp(self) -> None:
+        self.system = TabletopSystemFactory.create()
+        self.dm, _ = UserFactory.create()
+        self.player, self.password = UserFactory.create()
+        self.other, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=self.system,
+            players=[self.player, self.other],
+        )
+        self.session = SessionFactory.create(campaign=self.campaign)
+        self.session.attendees.add(self.player, self.other)
+        self.character = PlayerCharacterFactory.create(
+            self.player,
+            campaign=self.campaign,
+            level=3,
+        )
+        JournalEntry.objects.create(character=self.character, title="Day one")
+
+    def _stats(self, user: Any) -> dict[str, Any]:
+        stats = PlayerStats.objects.get(user=user)
+        return {
+            field: getattr(stats, field) for field in (*COUNTERS, "characters_by_level")
+        }
+
+    def _assert_matches_rebuild(self) -> None:
+        """
+        The incremental counters equal a rebuild from the source tables.
+        """
+        users = (self.dm, self.player, self.other)
+        incremental = [self._stats(user) for user in users]
+        rebuild_player_stats()
+        self.assertEqual(incremental, [self._stats(user) for user in users])
+
+    def test_counters_follow_changes(self) -> None:
+        """
+        Creating campaigns, joining, attending, writing and levelling up are
+        all counted.
+        """
+        self.assertEqual(
+            self._stats(self.player),
+            {
+                "campaigns_run": 0,
+                "campaigns_joined": 1,
+                "sessions_attended": 1,
+                "journal_entries": 1,
+                "characters_by_level": {"3": 1},
+            },
+        )
+        self.assertEqual(self._stats(self.dm)["campaigns_run"], 1)
+
+        self.character.level = 4
+        self.character.save()
+        PlayerCharacterFactory.create(self.player, level=4)
+
+        self.assertEqual(self._stats(self.player)["characters_by_level"], {"4": 2})
+        self._assert_matches_rebuild()
+
+    def test_leaving_and_clearing(self) -> None:
+        """
+        Removals and clears from either side of the relations are counted.
+        """
+        self.campaign.players.remove(self.other)
+        self.player.joined_campaigns.clear()
+        self.session.attendees.clear()
+
+        self.assertEqual(self._stats(self.player)["campaigns_joined"], 0)
+        self.assertEqual(self._stats(self.other)["campaigns_joined"], 0)
+        self.assertEqual(self._stats(self.other)["sessions_attended"], 0)
+        self._assert_matches_rebuild()
+
+    def test_deletes_are_uncounted(self) -> None:
+        """
+        Deleting entries, characters, sessions and campaigns takes them off
+        the counters, including cascades.
+        """
+        second = SessionFactory.create(campaign=self.campaign)
+        second.attendees.add(self.player)
+        JournalEntry.objects.create(character=self.character, title="Day two")
+        JournalEntry.objects.filter(title="Day one").get().delete()
+
+        self.assertEqual(self._stats(self.player)["journal_entries"], 1)
+        self.session.delete()
+        self.assertEqual(self._stats(self.player)["sessions_attended"], 1)
+        self._assert_matches_rebuild()
+
+        self.character.delete()
+        self.campaign.delete()
+
+        self.assertEqual(
+            self._stats(self.player),
+            {
+                "campaigns_run": 0,
+                "campaigns_joined": 0,
+                "sessions_attended": 0,
+                "journal_entries": 0,
+                "characters_by_level": {},
+            },
+        )
+        self.assertEqual(self._stats(self.dm)["campaigns_run"], 0)
+        self._assert_matches_rebuild()
+
+    def test_campaign_changing_hands(self) -> None:
+        """
+        A campaign moves between Dungeon Masters' counters.
+        """
+        self.campaign.dungeon_master = self.other
+        self.campaign.save()
+
+        self.assertEqual(self._stats(self.dm)["campaigns_run"], 0)
+        self.assertEqual(self._stats(self.other)["campaigns_run"], 1)
+        self._assert_matches_rebuild()
+
+    def test_profile_reads_one_row(self) -> None:
+        """
+        The profile shows the stats without counting anything.
+        """
+        self.client.login(username=self.player.username, password=self.password)
+        url = reverse("user_detail", kwargs={"username": self.player.username})
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertContains(response, "Sessions attended")
+        self.assertContains(response, "Level 3 × 1")
+        self.assertFalse(
+            any("COUNT" in query["sql"] for query in context.captured_queries),
+        )
+
+    def test_missing_rows_are_rebuilt(self) -> None:
+        """
+        A user without a stats row gets one built on first view, and the
+        command rebuilds everyone.
+        """
+        PlayerStats.objects.filter(user=self.player).delete()
+        self.client.login(username=self.player.username, password=self.password)
+
+        response = self.client.get(
+            reverse("user_detail", kwargs={"username": self.player.username}),
+        )
+        out = StringIO()
+        call_command("rebuild_player_stats", stdout=out)
+
+        self.assertEqual(response.context["stats"].journal_entries, 1)
+        self.assertIn("Rebuilt stats for 3 users.", out.getvalue())
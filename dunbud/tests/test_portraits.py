@@ -0,0 +1,236 @@
+import io
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from config.tests.factories import (
+    CampaignFactory,
+    PlayerCharacterFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.imaging import render_thumbnails
+from dunbud.models import Portrait
+from dunbud.services import build_party_roster, render_stuck_portraits
+from dunbud.services.portraits import sniff_image_type
+
+
+def make_image(color: str = "red", size: tuple[int, int] = (400, 300)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class PortraitTests(TestCase):
+    """
+    Tests for portrait uploads, thumbnails and serving.
+    """
+
+    def setUp(self) -> None:
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(
+            MEDIA_ROOT=media_root,
+            DUNBUD_THUMBNAILS_INLINE=True,
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.media_root = Path(media_root)
+
+        self.dm, _ = UserFactory.create()
+        self.user, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.user],
+        )
+        self.character = PlayerCharacterFactory.create(
+            user=self.user,
+            campaign=self.campaign,
+            name="Legolas",
+        )
+        self.client.force_login(self.user)
+
+    def _upload(self, content: bytes, name: str = "portrait.png") -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("character_edit", kwargs={"pk": self.character.pk}),
+                {
+                    "name": self.character.name,
+                    "level": 1,
+                    "campaign": self.character.campaign_id or "",
+                    "portrait_image": SimpleUploadedFile(name, content),
+                },
+            )
+        self.assertEqual(response.status_code, 302)
+        self.character.refresh_from_db()
+
+    def test_upload_stores_original_and_thumbnails(self) -> None:
+        """
+        The original is stored under its digest and every thumbnail is
+        rendered once the upload commits.
+        """
+        self._upload(make_image())
+
+        portrait = Portrait.objects.get()
+        self.assertEqual(self.character.portrait, portrait)
+        self.assertEqual(portrait.status, Portrait.Status.READY)
+        self.assertEqual((portrait.width, portrait.height), (400, 300))
+        self.assertEqual(portrait.content_type, "image/png")
+        directory = self.media_root / portrait.directory
+        self.assertEqual(
+            sorted(path.name for path in directory.iterdir()),
+            sorted(
+                [portrait.digest]
+                + [
+                    f"{portrait.digest}_{size}.{extension}"
+                    for size in ("small", "medium")
+                    for extension in ("jpg", "webp")
+                ],
+            ),
+        )
+        with Image.open(directory / f"{portrait.digest}_small.webp") as image:
+            self.assertEqual(image.size, (64, 64))
+
+    def test_duplicate_uploads_are_deduplicated(self) -> None:
+        """
+        Uploading the same bytes twice reuses the stored portrait.
+        """
+        other = PlayerCharacterFactory.create(user=self.user)
+        self._upload(make_image())
+        self.character = other
+        self._upload(make_image(), name="again.png")
+
+        self.assertEqual(Portrait.objects.count(), 1)
+        self.assertEqual(len(list(self.media_root.rglob("*_small.webp"))), 1)
+        self.assertEqual(other.portrait_id, Portrait.objects.get().pk)
+
+    def test_non_images_are_rejected(self) -> None:
+        """
+        Files that do not start like an image never reach storage.
+        """
+        response = self.client.post(
+            reverse("character_edit", kwargs={"pk": self.character.pk}),
+            {
+                "name": "Legolas",
+                "level": 1,
+                "portrait_image": SimpleUploadedFile("x.png", b"<html>"),
+            },
+        )
+
+        self.assertContains(response, "Upload a PNG, JPEG, GIF or WebP image.")
+        self.assertFalse(Portrait.objects.exists())
+        self.assertEqual(sniff_image_type(make_image()), "image/png")
+
+    def test_broken_images_are_marked_failed(self) -> None:
+        """
+        An image that cannot be decoded marks the portrait as failed.
+        """
+        self._upload(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64)
+
+        self.assertEqual(Portrait.objects.get().status, Portrait.Status.FAILED)
+
+    def test_failed_portraits_are_requeued_on_upload(self) -> None:
+        """
+        Uploading an image again retries a portrait whose render failed.
+        """
+        self._upload(make_image())
+        Portrait.objects.update(status=Portrait.Status.FAILED)
+        for thumbnail in self.media_root.rglob("*_small.webp"):
+            thumbnail.unlink()
+
+        self._upload(make_image(), name="again.png")
+
+        self.assertEqual(Portrait.objects.get().status, Portrait.Status.READY)
+        self.assertEqual(len(list(self.media_root.rglob("*_small.webp"))), 1)
+
+    def test_command_renders_stuck_portraits(self) -> None:
+        """
+        The job renders portraits left pending, ignoring recent uploads.
+        """
+        self._upload(make_image())
+        self._upload(make_image("blue"), name="blue.png")
+        stuck, recent = Portrait.objects.order_by("created_at")
+        Portrait.objects.update(status=Portrait.Status.PENDING)
+        Portrait.objects.filter(pk=stuck.pk).update(
+            created_at=timezone.now() - timedelta(hours=1),
+        )
+
+        call_command("render_stuck_portraits", stdout=StringIO())
+
+        stuck.refresh_from_db()
+        recent.refresh_from_db()
+        self.assertEqual(stuck.status, Portrait.Status.READY)
+        self.assertEqual(recent.status, Portrait.Status.PENDING)
+
+    def test_stuck_portraits_without_originals_stay_pending(self) -> None:
+        """
+        A portrait whose original is not on this machine is not marked failed.
+        """
+        self._upload(make_image())
+        portrait = Portrait.objects.get()
+        Portrait.objects.update(
+            status=Portrait.Status.PENDING,
+            created_at=timezone.now() - timedelta(hours=1),
+        )
+        default_storage.delete(portrait.original_name)
+
+        self.assertEqual(render_stuck_portraits(), 0)
+        portrait.refresh_from_db()
+        self.assertEqual(portrait.status, Portrait.Status.PENDING)
+
+    def test_thumbnails_are_served_immutable(self) -> None:
+        """
+        Thumbnails are served without queries and cached forever.
+        """
+        self._upload(make_image())
+        portrait = Portrait.objects.get()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(portrait.get_thumbnail_url("small", "jpg"))
+
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertIn("public", response["Cache-Control"])
+        missing = portrait.get_thumbnail_url().replace(portrait.digest, "0" * 64)
+        self.assertEqual(self.client.get(missing).status_code, 404)
+
+    def test_roster_shows_ready_thumbnails(self) -> None:
+        """
+        The party roster carries the portrait once its thumbnails are ready.
+        """
+        self._upload(make_image())
+        self.campaign.refresh_from_db()
+
+        (member,) = build_party_roster(self.campaign)
+        portrait = Portrait.objects.get()
+        assert member.campaign_character is not None
+        self.assertEqual(member.campaign_character.portrait, portrait.digest)
+        response = self.client.get(
+            reverse("campaign_detail", kwargs={"slug": self.campaign.slug}),
+        )
+        self.assertContains(response, portrait.get_thumbnail_url())
+
+    def test_render_thumbnails_crops_to_squares(self) -> None:
+        """
+        Thumbnails are square whatever the shape of the original.
+        """
+        source = self.media_root / "tall.png"
+        source.write_bytes(make_image(size=(100, 500)))
+
+        self.assertEqual(
+            render_thumbnails(str(source), str(self.media_root), "tall"),
+            (100, 500),
+        )
+        with Image.open(self.media_root / "tall_medium.jpg") as image:
+            self.assertEqual(image.size, (256, 256))
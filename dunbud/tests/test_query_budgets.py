@@ -0,0 +1,530 @@
+import hashlib
+import shutil
+import tempfile
+from collections.abc import Callable
+from io import BytesIO
+from typing import Any
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils.datastructures import MultiValueDict
+
+from config.tests.factories import (
+    CampaignFactory,
+    HelpfulLinkFactory,
+    PlayerCharacterFactory,
+    SessionFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud import urls as dunbud_urls
+from dunbud.forms import HandoutForm
+from dunbud.models import (
+    CampaignInvitation,
+    ChatMessage,
+    HelpfulLink,
+    JournalEntry,
+    PartyFeedItem,
+    SessionRecording,
+)
+from dunbud.services import (
+    append_recording_chunk,
+    commit_recording_upload,
+    create_email_invitations,
+    refresh_campaign_snapshot,
+    start_recording_upload,
+)
+from dunbud.views import PlayerCharacterListView
+from users.models import CustomUser
+
+# A request spec returns (method, url, data, user) for a URL name.
+RequestSpec = tuple[str, str, dict[str, Any], CustomUser]
+
+SMALL_DATASET = 2
+LARGE_DATASET = 12
+
+# Budgets assume an in-memory cache; the database cache would add queries.
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+BUDGET_MIDDLEWARE = "dunbud.middleware.QueryBudgetMiddleware"
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QueryBudgetTests(TestCase):
+    """
+    Renders every URL in dunbud/urls.py against a seeded dataset and checks
+    that each view stays within its declared ``query_budget`` and that the
+    number of queries does not grow with the number of rows.
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.system = TabletopSystemFactory.create()
+        self.dm, _ = UserFactory.create()
+        self.player, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=self.system,
+            players=[self.player],
+            max_players=1000,
+            is_public=True,
+        )
+        self.character = PlayerCharacterFactory.create(
+            user=self.player,
+            campaign=self.campaign,
+        )
+        self.session = SessionFactory.create(campaign=self.campaign)
+        self.entry = JournalEntry.objects.create(
+            character=self.character,
+            session=self.session,
+            title="First entry",
+            content="It begins.",
+        )
+
+    def _grow(self, count: int) -> None:
+        """
+        Add ``count`` rows to every collection the views render.
+        """
+        for _ in range(count):
+            player, _ = UserFactory.create()
+            self.campaign.players.add(player)
+            PlayerCharacterFactory.create(user=player, campaign=self.campaign)
+
+            session = SessionFactory.create(campaign=self.campaign)
+            session.attendees.add(self.dm, player)
+            session.busy_users.add(self.player)
+            ChatMessage.objects.create(
+                session=self.session,
+                user=player,
+                message="Hello",
+            )
+            PartyFeedItem.objects.create(
+                campaign=self.campaign,
+                session=session,
+                message="Something happened.",
+            )
+            JournalEntry.objects.create(
+                character=self.character,
+                session=session,
+                title="Entry",
+                content="More adventures.",
+            )
+
+            managed = CampaignFactory.create(dungeon_master=self.dm, system=self.system)
+            PartyFeedItem.objects.create(campaign=managed, message="News")
+            joined = CampaignFactory.create(
+                dungeon_master=player,
+                system=self.system,
+                players=[self.player],
+                is_public=True,
+            )
+            PartyFeedItem.objects.create(campaign=joined, message="News")
+            PlayerCharacterFactory.create(user=self.player, campaign=joined)
+
+        while self.campaign.helpful_links.count() < min(count * 2, 19):
+            HelpfulLinkFactory.create(campaign=self.campaign)
+
+    def _request_specs(self) -> dict[str, Callable[[], RequestSpec]]:
+        """
+        One request per named URL. POST-only views are exercised via POST.
+        """
+        slug = self.campaign.slug
+        session_kwargs = {
+            "campaign_slug": slug,
+            "session_number": self.session.session_number,
+        }
+
+        def join() -> RequestSpec:
+            newcomer, _ = UserFactory.create()
+            # campaign_invite_create rotates invites, so mint a fresh one.
+            invite = CampaignInvitation.objects.create(campaign=self.campaign)
+            url = reverse("campaign_join", kwargs={"token": invite.token})
+            return "get", url, {}, newcomer
+
+        def delete_link() -> RequestSpec:
+            link = HelpfulLink.objects.filter(campaign=self.campaign).first()
+            url = reverse("helpful_link_delete", kwargs={"pk": link.pk if link else 0})
+            return "post", url, {}, self.dm
+
+        def toggle_attendance() -> RequestSpec:
+            self.session.attendees.remove(self.player)
+            self.session.busy_users.remove(self.player)
+            url = reverse("session_toggle_attendance", kwargs={"pk": self.session.pk})
+            return "post", url, {}, self.player
+
+        def snapshot() -> RequestSpec:
+            # Measure the steady state of an up-to-date snapshot.
+            refresh_campaign_snapshot(self.campaign.pk)
+            url = reverse("campaign_snapshot", kwargs={"pk": self.campaign.pk})
+            return "get", url, {}, self.player
+
+        def add_link() -> RequestSpec:
+            url = reverse("helpful_link_add", kwargs={"slug": slug})
+            return "post", url, {"name": "Map", "url": "https://example.com"}, self.dm
+
+        def email_status() -> RequestSpec:
+            batch_id, _emails = create_email_invitations(
+                self.campaign,
+                ["a@example.com", "b@example.com"],
+                str,
+            )
+            url = reverse(
+                "campaign_invite_email_status",
+                kwargs={"slug": slug, "batch": batch_id},
+            )
+            return "get", url, {}, self.dm
+
+        def portrait_thumbnail() -> RequestSpec:
+            digest = "ab" * 32
+            self._use_temp_media()
+            default_storage.save(
+                f"portraits/ab/{digest}_small.webp",
+                ContentFile(b"RIFF0000WEBP"),
+            )
+            url = reverse(
+                "portrait_thumbnail",
+                kwargs={"digest": digest, "size": "small", "extension": "webp"},
+            )
+            return "get", url, {}, self.player
+
+        def handout_download() -> RequestSpec:
+            self._use_temp_media()
+            form = HandoutForm(
+                {"title": "Map"},
+                MultiValueDict(
+                    {"file": [SimpleUploadedFile("map.png", b"\x89PNG" * 1000)]},
+                ),
+            )
+            form.instance.campaign = self.campaign
+            handout = form.save()
+            url = reverse("handout_download", kwargs={"pk": handout.pk})
+            return "get", url, {}, self.player
+
+        def received_recording() -> SessionRecording:
+            self._use_temp_media()
+            data = b"OggS" * 100
+            recording = start_recording_upload(
+                self.session,
+                self.dm,
+                "session.ogg",
+                "audio/ogg",
+                len(data),
+            )
+            append_recording_chunk(
+                recording.pk,
+                0,
+                BytesIO(data),
+                len(data),
+                hashlib.sha256(data).hexdigest(),
+            )
+            return recording
+
+        def recording_upload() -> RequestSpec:
+            recording = received_recording()
+            url = reverse("session_recording_upload", kwargs={"pk": recording.pk})
+            return "get", url, {}, self.dm
+
+        def recording_commit() -> RequestSpec:
+            recording = received_recording()
+            url = reverse("session_recording_commit", kwargs={"pk": recording.pk})
+            return "post", url, {}, self.dm
+
+        def recording_download() -> RequestSpec:
+            recording = commit_recording_upload(received_recording().pk)
+            return "get", recording.get_absolute_url(), {}, self.player
+
+        def import_links() -> RequestSpec:
+            # The main campaign is kept near the link limit; import elsewhere.
+            campaign = CampaignFactory.create(
+                dungeon_master=self.dm,
+                system=self.system,
+            )
+            url = reverse("helpful_link_import", kwargs={"slug": campaign.slug})
+            return "post", url, {"links": "Map | https://example.com"}, self.dm
+
+        return {
+            "splash": lambda: ("get", reverse("splash"), {}, self.player),
+            "campaign_directory": lambda: (
+                "get",
+                reverse("campaign_directory"),
+                {},
+                self.player,
+            ),
+            "my_table": lambda: ("get", reverse("my_table"), {}, self.player),
+            "campaign_create": lambda: (
+                "get",
+                reverse("campaign_create"),
+                {},
+                self.dm,
+            ),
+            "campaign_managed": lambda: (
+                "get",
+                reverse("campaign_managed"),
+                {},
+                self.dm,
+            ),
+            "campaign_joined": lambda: (
+                "get",
+                reverse("campaign_joined"),
+                {},
+                self.player,
+            ),
+            "campaign_detail": lambda: (
+                "get",
+                reverse("campaign_detail", kwargs={"slug": slug}),
+                {},
+                self.dm,
+            ),
+            "campaign_edit": lambda: (
+                "get",
+                reverse("campaign_edit", kwargs={"slug": slug}),
+                {},
+                self.dm,
+            ),
+            "campaign_invite_create": lambda: (
+                "post",
+                reverse("campaign_invite_create", kwargs={"slug": slug}),
+                {},
+                self.dm,
+            ),
+            "campaign_join": join,
+            "campaign_snapshot": snapshot,
+            "campaign_announcement_create": lambda: (
+                "post",
+                reverse("campaign_announcement_create", kwargs={"slug": slug}),
+                {"message": "Session moved."},
+                self.dm,
+            ),
+            "campaign_invite_email": lambda: (
+                "post",
+                reverse("campaign_invite_email", kwargs={"slug": slug}),
+                {"emails": "a@example.com, b@example.com"},
+                self.dm,
+            ),
+            "campaign_invite_email_status": email_status,
+            "helpful_link_add": add_link,
+            "helpful_link_import": import_links,
+            "helpful_link_delete": delete_link,
+            "character_list": lambda: (
+                "get",
+                reverse("character_list"),
+                {},
+                self.player,
+            ),
+            "character_create": lambda: (
+                "get",
+                reverse("character_create"),
+                {},
+                self.player,
+            ),
+            "character_detail": lambda: (
+                "get",
+                reverse("character_detail", kwargs={"pk": self.character.pk}),
+                {},
+                self.dm,
+            ),
+            "character_edit": lambda: (
+                "get",
+                reverse("character_edit", kwargs={"pk": self.character.pk}),
+                {},
+                self.player,
+            ),
+            "portrait_thumbnail": portrait_thumbnail,
+            "session_propose": lambda: (
+                "get",
+                reverse("session_propose", kwargs={"campaign_slug": slug}),
+                {},
+                self.player,
+            ),
+            "session_toggle_attendance": toggle_attendance,
+            "session_detail": lambda: (
+                "get",
+                reverse("session_detail", kwargs=session_kwargs),
+                {},
+                self.player,
+            ),
+            "session_edit": lambda: (
+                "get",
+                reverse("session_edit", kwargs=session_kwargs),
+                {},
+                self.dm,
+            ),
+            "session_history": lambda: (
+                "get",
+                reverse("session_history", kwargs=session_kwargs),
+                {"field": "recap"},
+                self.player,
+            ),
+            "session_recording_create": lambda: (
+                "post",
+                reverse("session_recording_create", kwargs=session_kwargs),
+                {"filename": "session.ogg", "content_type": "audio/ogg", "size": 400},
+                self.dm,
+            ),
+            "session_recording_upload": recording_upload,
+            "session_recording_commit": recording_commit,
+            "session_recording_download": recording_download,
+            "campaign_handouts": lambda: (
+                "get",
+                reverse("campaign_handouts", kwargs={"slug": slug}),
+                {},
+                self.dm,
+            ),
+            "handout_download": handout_download,
+            "campaign_journal": lambda: (
+                "get",
+                reverse("campaign_journal", kwargs={"slug": slug}),
+                {},
+                self.player,
+            ),
+            "journal_list": lambda: (
+                "get",
+                reverse("journal_list", kwargs={"character_id": self.character.pk}),
+                {},
+                self.player,
+            ),
+            "journal_draft": lambda: (
+                "post",
+                reverse("journal_draft", kwargs={"character_id": self.character.pk}),
+                {"entry": str(self.entry.pk), "content": "Still writing..."},
+                self.player,
+            ),
+            "journal_export": lambda: (
+                "get",
+                reverse("journal_export", kwargs={"character_id": self.character.pk}),
+                {},
+                self.player,
+            ),
+            "journal_create": lambda: (
+                "get",
+                reverse("journal_create", kwargs={"character_id": self.character.pk}),
+                {},
+                self.player,
+            ),
+            "journal_update": lambda: (
+                "get",
+                reverse("journal_update", kwargs={"entry_id": self.entry.pk}),
+                {},
+                self.player,
+            ),
+            "journal_history": lambda: (
+                "get",
+                reverse("journal_history", kwargs={"entry_id": self.entry.pk}),
+                {},
+                self.player,
+            ),
+            "journal_delete": lambda: (
+                "get",
+                reverse("journal_delete", kwargs={"entry_id": self.entry.pk}),
+                {},
+                self.player,
+            ),
+        }
+
+    def _use_temp_media(self) -> None:
+        """
+        Store uploads in a temporary MEDIA_ROOT for the rest of the test.
+        """
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def _measure(self, spec: Callable[[], RequestSpec]) -> tuple[int, int | None]:
+        """
+        Issue the request and return (query count, declared budget).
+        """
+        method, url, data, user = spec()
+        self.client.force_login(user)
+        # Clear per-request caches so each measurement sees a cold cache.
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, data)
+
+        self.assertLess(response.status_code, 400, f"{method.upper()} {url}")
+        view_class = getattr(response.resolver_match.func, "view_class", None)
+        return len(context.captured_queries), getattr(view_class, "query_budget", None)
+
+    def test_every_url_is_covered(self) -> None:
+        """
+        New URLs must be added to the budget suite.
+        """
+        names = {
+            pattern.name
+            for pattern in dunbud_urls.urlpatterns
+            if isinstance(pattern, URLPattern)
+        }
+        self.assertEqual(names, set(self._request_specs()))
+
+    def test_views_stay_within_budget(self) -> None:
+        """
+        Every view declares a budget and stays within it on a large dataset.
+        """
+        self._grow(LARGE_DATASET)
+
+        for name, spec in self._request_specs().items():
+            with self.subTest(view=name):
+                count, budget = self._measure(spec)
+                self.assertIsNotNone(budget, f"{name} does not declare query_budget")
+                self.assertLessEqual(count, budget or 0)
+
+    def test_query_count_does_not_scale_with_rows(self) -> None:
+        """
+        Growing the dataset must not change the number of queries per view.
+        """
+        specs = self._request_specs()
+
+        self._grow(SMALL_DATASET)
+        small = {name: self._measure(spec)[0] for name, spec in specs.items()}
+
+        self._grow(LARGE_DATASET - SMALL_DATASET)
+        large = {name: self._measure(spec)[0] for name, spec in specs.items()}
+
+        self.assertEqual(small, large)
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    MIDDLEWARE=[m for m in settings.MIDDLEWARE if m != BUDGET_MIDDLEWARE]
+    + [BUDGET_MIDDLEWARE],
+)
+class QueryBudgetMiddlewareTests(TestCase):
+    """
+    Tests for the runtime query budget reporting.
+    """
+
+    def setUp(self) -> None:
+        self.user, _ = UserFactory.create()
+        self.client.force_login(self.user)
+
+    def test_query_count_header(self) -> None:
+        """
+        The number of queries is reported in a response header.
+        """
+        response = self.client.get(reverse("character_list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(int(response.headers["X-Query-Count"]), 0)
+
+    def test_budget_exceeded_is_logged(self) -> None:
+        """
+        Exceeding the declared budget logs a warning.
+        """
+        with (
+            self.assertLogs("dunbud.middleware", level="WARNING") as cm,
+            patch.object(PlayerCharacterListView, "query_budget", 0),
+        ):
+            self.client.get(reverse("character_list"))
+
+        self.assertTrue(any("Query budget exceeded" in m for m in cm.output))
@@ -0,0 +1,305 @@
+import fcntl
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import Any
+
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from config.tests.factories import (
+    CampaignFactory,
+    SessionFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.models import SessionRecording
+from dunbud.services import append_recording_chunk
+
+CONTENT = bytes(range(256)) * 10
+CHUNK_SIZE = 1000
+
+
+class SessionRecordingTests(TestCase):
+    """
+    Tests for resumable session recording uploads.
+    """
+
+    def setUp(self) -> None:
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.dm, _ = UserFactory.create()
+        self.player, _ = UserFactory.create()
+        self.outsider, _ = UserFactory.create()
+        campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.player],
+        )
+        self.session = SessionFactory.create(campaign=campaign)
+        self.session_url = reverse(
+            "session_detail",
+            kwargs={
+                "campaign_slug": campaign.slug,
+                "session_number": self.session.session_number,
+            },
+        )
+        self.create_url = reverse(
+            "session_recording_create",
+            kwargs={
+                "campaign_slug": campaign.slug,
+                "session_number": self.session.session_number,
+            },
+        )
+
+    def _start(self, size: int = len(CONTENT), content_type: str = "audio/ogg") -> dict:
+        self.client.force_login(self.dm)
+        response = self.client.post(
+            self.create_url,
+            {
+                "filename": "../Session One.ogg",
+                "content_type": content_type,
+                "size": size,
+            },
+        )
+        self.assertEqual(response.status_code, 201)
+        # Small parts keep the tests fast.
+        SessionRecording.objects.update(chunk_size=CHUNK_SIZE)
+        upload: dict = response.json()
+        return upload
+
+    def _put(
+        self,
+        upload: dict,
+        offset: int,
+        data: bytes | None = None,
+        checksum: str | None = None,
+    ) -> Any:
+        if data is None:
+            data = CONTENT[offset : offset + CHUNK_SIZE]
+        return self.client.put(
+            upload["upload_url"],
+            data,
+            content_type="application/octet-stream",
+            headers={
+                "Upload-Offset": str(offset),
+                "Upload-Checksum": checksum or hashlib.sha256(data).hexdigest(),
+            },
+        )
+
+    def _upload_all(self, upload: dict) -> None:
+        for offset in range(0, len(CONTENT), CHUNK_SIZE):
+            self.assertEqual(self._put(upload, offset).status_code, 200)
+
+    def _partial_size(self, upload: dict) -> int:
+        recording = SessionRecording.objects.get(pk=upload["id"])
+        return Path(default_storage.path(recording.partial_name)).stat().st_size
+
+    def test_upload_commit_and_download(self) -> None:
+        """
+        Parts are appended in order, the commit moves the file into place and
+        members can download ranges of it.
+        """
+        upload = self._start()
+        self._upload_all(upload)
+
+        response = self.client.post(upload["commit_url"])
+
+        self.assertEqual(response.status_code, 200)
+        recording = SessionRecording.objects.get(pk=upload["id"])
+        self.assertEqual(recording.status, SessionRecording.Status.READY)
+        self.assertEqual(recording.filename, "Session_One.ogg")
+        self.assertFalse(default_storage.exists(recording.partial_name))
+        with recording.file.open("rb") as file:
+            self.assertEqual(file.read(), CONTENT)
+
+        self.client.force_login(self.player)
+        response = self.client.get(
+            recording.get_absolute_url(),
+            headers={"Range": "bytes=10-19"},
+        )
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.getvalue(), CONTENT[10:20])
+        self.assertContains(self.client.get(self.session_url), "Session_One.ogg")
+
+    def test_out_of_order_part_reports_the_offset(self) -> None:
+        """
+        A part for the wrong offset is refused with the offset to resume from.
+        """
+        upload = self._start()
+        self._put(upload, 0)
+
+        response = self._put(upload, 2 * CHUNK_SIZE)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["offset"], CHUNK_SIZE)
+        status = self.client.get(upload["upload_url"]).json()
+        self.assertEqual(status["offset"], CHUNK_SIZE)
+        self.assertEqual(self._put(upload, CHUNK_SIZE).status_code, 200)
+
+    def test_bad_parts_are_truncated_away(self) -> None:
+        """
+        Parts with the wrong checksum or length leave the acknowledged data
+        untouched.
+        """
+        upload = self._start()
+        self._put(upload, 0)
+
+        bad_checksum = self._put(upload, CHUNK_SIZE, checksum="0" * 64)
+        short = self._put(upload, CHUNK_SIZE, data=b"short")
+
+        self.assertEqual(bad_checksum.status_code, 400)
+        self.assertEqual(short.status_code, 400)
+        self.assertEqual(self._partial_size(upload), CHUNK_SIZE)
+        self.assertEqual(self._put(upload, CHUNK_SIZE).json()["offset"], 2 * CHUNK_SIZE)
+
+    def test_part_sent_while_another_is_written_is_refused(self) -> None:
+        """
+        Only one part of an upload is written at a time; another sent
+        meanwhile is refused with the offset to resume from.
+        """
+        upload = self._start()
+        self._put(upload, 0)
+        recording = SessionRecording.objects.get(pk=upload["id"])
+
+        with Path(default_storage.path(recording.partial_name)).open("rb") as busy:
+            fcntl.flock(busy.fileno(), fcntl.LOCK_EX)
+            response = self._put(upload, CHUNK_SIZE)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["offset"], CHUNK_SIZE)
+        self.assertEqual(self._partial_size(upload), CHUNK_SIZE)
+        self.assertEqual(self._put(upload, CHUNK_SIZE).status_code, 200)
+
+    def test_parts_stream_outside_a_transaction(self) -> None:
+        """
+        The upload row is not locked while a part is read from the client.
+        """
+        upload = self._start()
+        depth = len(connection.atomic_blocks)
+        depths = []
+
+        class Stream(BytesIO):
+            def read(self, n: int | None = -1, /) -> bytes:
+                depths.append(len(connection.atomic_blocks))
+                return super().read(n)
+
+        data = CONTENT[:CHUNK_SIZE]
+        received = append_recording_chunk(
+            upload["id"],
+            0,
+            Stream(data),
+            len(data),
+            hashlib.sha256(data).hexdigest(),
+        )
+
+        self.assertEqual(received, CHUNK_SIZE)
+        self.assertTrue(depths)
+        self.assertEqual(set(depths), {depth})
+
+    def test_commit_requires_every_part(self) -> None:
+        """
+        An incomplete upload cannot be committed.
+        """
+        upload = self._start()
+        self._put(upload, 0)
+
+        response = self.client.post(upload["commit_url"])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["offset"], CHUNK_SIZE)
+
+    def test_only_audio_and_video_within_the_limit(self) -> None:
+        """
+        Other file types and oversized files are refused up front.
+        """
+        self.client.force_login(self.dm)
+        for content_type, size in (("application/pdf", 10), ("audio/ogg", 2**40)):
+            with self.subTest(content_type=content_type):
+                response = self.client.post(
+                    self.create_url,
+                    {"filename": "a.ogg", "content_type": content_type, "size": size},
+                )
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(SessionRecording.objects.exists())
+
+    def test_only_the_dm_uploads_and_members_download(self) -> None:
+        """
+        Players cannot start or continue uploads; outsiders cannot download.
+        """
+        upload = self._start()
+        self._upload_all(upload)
+        self.client.post(upload["commit_url"])
+        recording = SessionRecording.objects.get(pk=upload["id"])
+
+        self.client.force_login(self.player)
+        self.assertEqual(
+            self.client.post(
+                self.create_url,
+                {"filename": "a.ogg", "content_type": "audio/ogg", "size": 10},
+            ).status_code,
+            403,
+        )
+        self.assertEqual(self.client.post(upload["commit_url"]).status_code, 404)
+        self.client.force_login(self.outsider)
+        self.assertEqual(
+            self.client.get(recording.get_absolute_url()).status_code,
+            403,
+        )
+
+    def test_abort_and_purge_remove_partial_files(self) -> None:
+        """
+        Aborted and stale uploads are deleted along with their partial files.
+        """
+        aborted = self._start()
+        self._put(aborted, 0)
+        self.assertEqual(self.client.delete(aborted["upload_url"]).status_code, 204)
+
+        stale = self._start()
+        self._put(stale, 0)
+        recording = SessionRecording.objects.get(pk=stale["id"])
+        SessionRecording.objects.filter(pk=recording.pk).update(
+            updated_at=timezone.now() - timedelta(days=3),
+        )
+        out = StringIO()
+
+        call_command("purge_stale_uploads", stdout=out)
+
+        self.assertIn("Purged 1 stale uploads.", out.getvalue())
+        self.assertFalse(SessionRecording.objects.exists())
+        self.assertFalse(default_storage.exists(recording.partial_name))
+
+    def test_purge_removes_old_orphaned_partial_files(self) -> None:
+        """
+        Old partial files without an upload are removed; recent ones and
+        those of live uploads are kept.
+        """
+        live = self._start()
+        self._put(live, 0)
+        recording = SessionRecording.objects.get(pk=live["id"])
+        directory = Path(default_storage.path(recording.partial_name)).parent
+        orphan = directory / "orphan.part"
+        recent = directory / "recent.part"
+        orphan.write_bytes(b"x")
+        recent.write_bytes(b"x")
+        old = (timezone.now() - timedelta(days=3)).timestamp()
+        os.utime(orphan, (old, old))
+        os.utime(directory / f"{recording.pk}.part", (old, old))
+
+        call_command("purge_stale_uploads", stdout=StringIO())
+
+        self.assertFalse(orphan.exists())
+        self.assertTrue(recent.exists())
+        self.assertEqual(self._partial_size(live), CHUNK_SIZE)
@@ -0,0 +1,201 @@
+import zlib
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from config.tests.factories import (
+    CampaignFactory,
+    PlayerCharacterFactory,
+    SessionFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.models import JournalEntry, TextRevision
+from dunbud.services import get_revision_diff, get_revision_text, list_revisions
+from dunbud.services.revisions import SNAPSHOT_INTERVAL, apply_delta, encode_delta
+
+
+class RevisionHistoryTests(TestCase):
+    """
+    Tests for delta-compressed revision history of long text fields.
+    """
+
+    def setUp(self) -> None:
+        self.dm, _ = UserFactory.create()
+        self.player, _ = UserFactory.create()
+        self.outsider, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.player],
+        )
+        self.session = SessionFactory.create(campaign=self.campaign, recap="")
+        self.character = PlayerCharacterFactory.create(
+            user=self.player,
+            campaign=self.campaign,
+        )
+        self.entry = JournalEntry.objects.create(
+            character=self.character,
+            title="Into the Mines",
+            content="We entered the mines.\n",
+        )
+
+    def _edit_entry(self, content: str) -> None:
+        self.entry.content = content
+        self.entry.save()
+
+    def test_deltas_round_trip(self) -> None:
+        """
+        A delta rebuilds the new text from the old one.
+        """
+        old = "one\ntwo\nthree\n"
+        new = "zero\none\nthree\nfour"
+
+        self.assertEqual(apply_delta(old, encode_delta(old, new)), new)
+        self.assertEqual(apply_delta("", encode_delta("", new)), new)
+        self.assertEqual(apply_delta(old, encode_delta(old, "")), "")
+
+    def test_delta_size_follows_the_edit(self) -> None:
+        """
+        Editing one line of a long text stores far less than the text.
+        """
+        text = "".join(f"Line {i} of a very long recap.\n" for i in range(2000))
+        self._edit_entry(text)
+        self._edit_entry(text.replace("Line 1000 ", "Line one thousand "))
+
+        latest = TextRevision.objects.filter(entry=self.entry).latest("number")
+        self.assertFalse(latest.is_snapshot)
+        self.assertLess(len(latest.data), 200)
+        self.assertGreater(len(zlib.compress(text.encode())), len(latest.data) * 10)
+
+    def test_first_edit_keeps_the_original(self) -> None:
+        """
+        The first edit stores the original text as revision 0.
+        """
+        self._edit_entry("We fled the mines.\n")
+
+        self.assertEqual(
+            [revision.number for revision in list_revisions(self.entry, "content")],
+            [1, 0],
+        )
+        self.assertEqual(
+            get_revision_text(self.entry, "content", 0),
+            "We entered the mines.\n",
+        )
+        self.assertIn(
+            "+We fled the mines.",
+            get_revision_diff(self.entry, "content", 1) or [],
+        )
+
+    def test_saves_without_changes_are_not_recorded(self) -> None:
+        """
+        Saving unchanged text, or only other fields, adds no revisions.
+        """
+        self.entry.title = "Renamed"
+        self.entry.save()
+        self.entry.save(update_fields=["title"])
+
+        self.assertFalse(TextRevision.objects.exists())
+
+    def test_snapshots_bound_reconstruction(self) -> None:
+        """
+        Every revision rebuilds correctly, reading at most one snapshot
+        interval of rows with a single query.
+        """
+        texts = ["We entered the mines.\n"]
+        for i in range(1, 25):
+            texts.append(f"{texts[-1]}Day {i}: more tunnels.\n")
+            self._edit_entry(texts[-1])
+
+        snapshots = TextRevision.objects.filter(entry=self.entry, is_snapshot=True)
+        self.assertEqual(
+            sorted(snapshots.values_list("number", flat=True)),
+            [0, SNAPSHOT_INTERVAL, 2 * SNAPSHOT_INTERVAL],
+        )
+        for number, text in enumerate(texts):
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(get_revision_text(self.entry, "content", number), text)
+            self.assertEqual(len(queries), 1)
+
+    def test_out_of_band_changes_start_a_snapshot(self) -> None:
+        """
+        Text changed without ``save()`` is captured as a snapshot, so later
+        deltas apply to the right base.
+        """
+        self._edit_entry("First edit.\n")
+        JournalEntry.objects.filter(pk=self.entry.pk).update(content="Sneaky.\n")
+        self.entry.refresh_from_db()
+        self._edit_entry("Sneaky.\nAnd honest.\n")
+
+        self.assertEqual(get_revision_text(self.entry, "content", 2), "Sneaky.\n")
+        self.assertEqual(
+            get_revision_text(self.entry, "content", 3),
+            "Sneaky.\nAnd honest.\n",
+        )
+
+    def test_session_fields_have_separate_histories(self) -> None:
+        """
+        Notes and recap changes are recorded per field.
+        """
+        self.session.recap = "The party met."
+        self.session.notes = "Bring snacks."
+        self.session.save()
+        self.session.recap = "The party met a dragon."
+        self.session.save(update_fields=["recap"])
+
+        self.assertEqual(len(list_revisions(self.session, "recap")), 3)
+        self.assertEqual(len(list_revisions(self.session, "notes")), 2)
+        self.assertEqual(
+            get_revision_text(self.session, "recap", 2),
+            "The party met a dragon.",
+        )
+
+    def test_unknown_revision(self) -> None:
+        """
+        Asking for a revision that does not exist returns None.
+        """
+        self.assertIsNone(get_revision_text(self.entry, "content", 3))
+        self.assertIsNone(get_revision_diff(self.entry, "content", 3))
+
+    def test_session_history_page(self) -> None:
+        """
+        Members see the recap diff; outsiders are turned away.
+        """
+        self.session.recap = "The party met."
+        self.session.save()
+        url = reverse(
+            "session_history",
+            kwargs={
+                "campaign_slug": self.campaign.slug,
+                "session_number": self.session.session_number,
+            },
+        )
+
+        self.client.force_login(self.player)
+        response = self.client.get(url, {"field": "recap", "revision": "1"})
+        self.assertContains(response, "+The party met.")
+        self.assertEqual(self.client.get(url, {"field": "title"}).status_code, 404)
+
+        self.client.force_login(self.outsider)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_journal_history_respects_visibility(self) -> None:
+        """
+        Entries hidden from the party keep their history hidden too.
+        """
+        self._edit_entry("We fled the mines.\n")
+        url = reverse("journal_history", kwargs={"entry_id": self.entry.pk})
+        other, _ = UserFactory.create()
+        self.campaign.players.add(other)
+
+        self.client.force_login(other)
+        self.assertContains(self.client.get(url), "+We fled the mines.")
+
+        JournalEntry.objects.filter(pk=self.entry.pk).update(
+            visibility=JournalEntry.Visibility.DUNGEON_MASTER,
+        )
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.client.force_login(self.dm)
+        self.assertEqual(self.client.get(url).status_code, 200)
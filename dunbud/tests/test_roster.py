@@ -0,0 +1,202 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from config.tests.factories import (
+    CampaignFactory,
+    HelpfulLinkFactory,
+    PlayerCharacterFactory,
+    SessionFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from dunbud.models import Campaign, PartyFeedItem
+from dunbud.services import build_party_roster, get_party_roster
+from users.models import CustomUser
+
+
+# Cache hits are only query-free with an in-memory cache backend.
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class PartyRosterTests(TestCase):
+    """
+    Tests for the cached party roster read model.
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.dm, _ = UserFactory.create(username="dm")
+        self.alice, _ = UserFactory.create(username="alice")
+        self.bob, _ = UserFactory.create(username="bob")
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.alice, self.bob],
+        )
+        self.character = PlayerCharacterFactory.create(
+            user=self.alice,
+            campaign=self.campaign,
+            name="Aria",
+            character_sheet_link="https://example.com/aria",
+        )
+
+    def _reload(self) -> Campaign:
+        return Campaign.objects.get(pk=self.campaign.pk)
+
+    def test_roster_contents(self) -> None:
+        """
+        Players are listed by username with their campaign character.
+        """
+        roster = build_party_roster(self.campaign)
+
+        self.assertEqual([m.username for m in roster], ["alice", "bob"])
+        alice, bob = roster
+        self.assertEqual(alice.user_id, self.alice.pk)
+        self.assertIsNotNone(alice.campaign_character)
+        if alice.campaign_character:
+            self.assertEqual(alice.campaign_character.pk, self.character.pk)
+            self.assertEqual(alice.campaign_character.name, "Aria")
+            self.assertEqual(
+                alice.campaign_character.character_sheet_link,
+                "https://example.com/aria",
+            )
+        self.assertIsNone(bob.campaign_character)
+        self.assertEqual(bob.get_absolute_url(), self.bob.get_absolute_url())
+
+    def test_roster_ignores_characters_from_other_campaigns(self) -> None:
+        """
+        Only characters assigned to this campaign appear in its roster.
+        """
+        other = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+        )
+        PlayerCharacterFactory.create(user=self.bob, campaign=other)
+
+        roster = build_party_roster(self.campaign)
+
+        self.assertIsNone(roster[1].campaign_character)
+
+    def test_roster_built_in_one_query(self) -> None:
+        """
+        Building the roster costs a single query.
+        """
+        with self.assertNumQueries(1):
+            build_party_roster(self.campaign)
+
+    def test_cached_roster_costs_no_queries(self) -> None:
+        """
+        A cached roster is served without touching the database.
+        """
+        get_party_roster(self.campaign)
+
+        with self.assertNumQueries(0):
+            roster = get_party_roster(self.campaign)
+        self.assertEqual(len(roster), 2)
+
+    def test_player_change_invalidates_roster(self) -> None:
+        """
+        Joining or leaving the party bumps the campaign version.
+        """
+        get_party_roster(self.campaign)
+        self.campaign.players.remove(self.bob)
+
+        roster = get_party_roster(self._reload())
+
+        self.assertEqual([m.username for m in roster], ["alice"])
+
+    def test_character_change_invalidates_roster(self) -> None:
+        """
+        Renaming a character bumps the campaign version.
+        """
+        get_party_roster(self.campaign)
+        self.character.name = "Aria the Bold"
+        self.character.save()
+
+        roster = get_party_roster(self._reload())
+
+        character = roster[0].campaign_character
+        self.assertIsNotNone(character)
+        if character:
+            self.assertEqual(character.name, "Aria the Bold")
+
+    def test_character_moved_invalidates_old_campaign(self) -> None:
+        """
+        Moving a character out of a campaign removes it from that roster.
+        """
+        other = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+        )
+        get_party_roster(self.campaign)
+        self.character.campaign = other
+        self.character.save()
+
+        roster = get_party_roster(self._reload())
+
+        self.assertIsNone(roster[0].campaign_character)
+
+    def test_username_change_invalidates_roster(self) -> None:
+        """
+        Renaming a player bumps every campaign they play in.
+        """
+        get_party_roster(self.campaign)
+        self.bob.username = "robert"
+        self.bob.save()
+
+        roster = get_party_roster(self._reload())
+
+        self.assertIn("robert", [m.username for m in roster])
+
+    def test_page_activity_keeps_roster_cached(self) -> None:
+        """
+        Links, sessions, feed items and attendance leave the version alone.
+        """
+        version = self._reload().version
+
+        HelpfulLinkFactory.create(campaign=self.campaign)
+        session = SessionFactory.create(campaign=self.campaign)
+        session.attendees.add(self.alice)
+        PartyFeedItem.objects.create(campaign=self.campaign, message="News")
+        self._rename(self.dm, "overlord")
+
+        self.assertEqual(self._reload().version, version)
+
+    def _rename(self, user: CustomUser, username: str) -> None:
+        user.username = username
+        user.save()
+
+    def test_stale_instance_save_keeps_denormalized_fields(self) -> None:
+        """
+        Saving an old campaign instance leaves the version and the counters
+        maintained by conditional updates untouched.
+        """
+        stale = self._reload()
+        self.campaign.players.remove(self.bob)
+        for _ in range(3):
+            HelpfulLinkFactory.create(campaign=self.campaign)
+        fresh = self._reload()
+        self.assertNotEqual(stale.open_seats, fresh.open_seats)
+
+        stale.name = "Renamed"
+        stale.save()
+
+        saved = self._reload()
+        self.assertEqual(saved.name, "Renamed")
+        self.assertEqual(saved.version, fresh.version)
+        self.assertEqual(saved.open_seats, fresh.open_seats)
+        self.assertEqual(saved.helpful_link_count, 3)
+
+    def test_campaign_detail_renders_roster(self) -> None:
+        """
+        The campaign page lists the party from the roster.
+        """
+        self.client.force_login(self.alice)
+        response = self.client.get(
+            reverse("campaign_detail", kwargs={"slug": self.campaign.slug}),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Aria")
+        self.assertContains(response, "2 / 6")
@@ -80,10 +80,10 @@ class SessionChatTests(TestCase):
         self.client.login(username=self.uname, password=self.upass)
         response = self.client.get(self.url)
 
-        self.assertIn("players_with_data", response.context)
-        members = response.context["players_with_data"]
+        self.assertIn("roster", response.context)
+        members = response.context["roster"]
         self.assertEqual(len(members), 2)
-        self.assertIn(self.user, members)
+        self.assertIn(self.user.pk, [member.user_id for member in members])
 
     def test_post_chat_message(self) -> None:
         """
@@ -0,0 +1,112 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from config.tests.factories import (
+    CampaignFactory,
+    PlayerCharacterFactory,
+    SessionFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+
+
+def _count_lookups(context: CaptureQueriesContext, table: str) -> int:
+    """
+    Count the queries that load full rows from the given table.
+    """
+    return sum(
+        1
+        for query in context.captured_queries
+        if query["sql"].startswith(f'SELECT "{table}"."id", ')
+    )
+
+
+class MemoizedObjectMixinTests(TestCase):
+    """
+    Verifies that views resolve their URL object once per request.
+    """
+
+    def setUp(self) -> None:
+        self.dm, _ = UserFactory.create()
+        self.player, _ = UserFactory.create()
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.dm,
+            system=TabletopSystemFactory.create(),
+            players=[self.player],
+        )
+        self.character = PlayerCharacterFactory.create(
+            user=self.player,
+            campaign=self.campaign,
+        )
+        self.session = SessionFactory.create(campaign=self.campaign)
+
+    def test_campaign_detail_fetches_campaign_once(self) -> None:
+        """
+        The campaign is looked up once for test_func and the page render.
+        """
+        self.client.force_login(self.player)
+        url = reverse("campaign_detail", kwargs={"slug": self.campaign.slug})
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_count_lookups(context, "dunbud_campaign"), 1)
+
+    def test_campaign_update_fetches_campaign_once(self) -> None:
+        """
+        The campaign edit page looks up the campaign once.
+        """
+        self.client.force_login(self.dm)
+        url = reverse("campaign_edit", kwargs={"slug": self.campaign.slug})
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_count_lookups(context, "dunbud_campaign"), 1)
+
+    def test_session_detail_fetches_session_once(self) -> None:
+        """
+        The session detail page looks up the session once.
+        """
+        self.client.force_login(self.player)
+        url = reverse(
+            "session_detail",
+            kwargs={
+                "campaign_slug": self.campaign.slug,
+                "session_number": self.session.session_number,
+            },
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_count_lookups(context, "dunbud_session"), 1)
+
+    def test_character_detail_fetches_character_once(self) -> None:
+        """
+        The character detail page looks up the character once.
+        """
+        self.client.force_login(self.dm)
+        url = reverse("character_detail", kwargs={"pk": self.character.pk})
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_count_lookups(context, "dunbud_playercharacter"), 1)
+
+    def test_missing_object_still_returns_404(self) -> None:
+        """
+        A failed lookup is not memoized and still results in a 404.
+        """
+        self.client.force_login(self.dm)
+        url = reverse("campaign_detail", kwargs={"slug": "does-not-exist"})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
@@ -4,23 +4,41 @@ from .views import (
     CampaignAnnouncementCreateView,
     CampaignCreateView,
     CampaignDetailView,
+    CampaignDirectoryView,
+    CampaignHandoutsView,
     CampaignInvitationCreateView,
+    CampaignInvitationEmailStatusView,
+    CampaignInvitationEmailView,
     CampaignJoinView,
+    CampaignJournalView,
+    CampaignSnapshotView,
     CampaignUpdateView,
+    HandoutDownloadView,
     HelpfulLinkCreateView,
     HelpfulLinkDeleteView,
+    HelpfulLinkImportView,
     JoinedCampaignListView,
     JournalCreateView,
     JournalDeleteView,
+    JournalDraftView,
+    JournalExportView,
+    JournalHistoryView,
     JournalListView,
     JournalUpdateView,
     ManagedCampaignListView,
+    MyTableView,
     PlayerCharacterCreateView,
     PlayerCharacterDetailView,
     PlayerCharacterListView,
     PlayerCharacterUpdateView,
+    PortraitThumbnailView,
     SessionCreateView,
     SessionDetailView,
+    SessionHistoryView,
+    SessionRecordingCommitView,
+    SessionRecordingCreateView,
+    SessionRecordingDownloadView,
+    SessionRecordingUploadView,
     SessionToggleAttendanceView,
     SessionUpdateView,
     SplashView,
@@ -28,6 +46,12 @@ from .views import (
 
 urlpatterns = [
     path("", SplashView.as_view(), name="splash"),
+    path("table/", MyTableView.as_view(), name="my_table"),
+    path(
+        "directory/",
+        CampaignDirectoryView.as_view(),
+        name="campaign_directory",
+    ),
     path("campaigns/new/", CampaignCreateView.as_view(), name="campaign_create"),
     path(
         "campaigns/managed/",
@@ -44,6 +68,21 @@ urlpatterns = [
         CampaignDetailView.as_view(),
         name="campaign_detail",
     ),
+    path(
+        "campaigns/<slug:slug>/journal/",
+        CampaignJournalView.as_view(),
+        name="campaign_journal",
+    ),
+    path(
+        "campaigns/<slug:slug>/handouts/",
+        CampaignHandoutsView.as_view(),
+        name="campaign_handouts",
+    ),
+    path(
+        "handouts/<uuid:pk>/",
+        HandoutDownloadView.as_view(),
+        name="handout_download",
+    ),
     path(
         "campaigns/<slug:slug>/edit/",
         CampaignUpdateView.as_view(),
@@ -54,11 +93,27 @@ urlpatterns = [
         CampaignInvitationCreateView.as_view(),
         name="campaign_invite_create",
     ),
+    path(
+        "campaigns/<slug:slug>/invite/email/",
+        CampaignInvitationEmailView.as_view(),
+        name="campaign_invite_email",
+    ),
+    path(
+        "campaigns/<slug:slug>/invite/email/<uuid:batch>/",
+        CampaignInvitationEmailStatusView.as_view(),
+        name="campaign_invite_email_status",
+    ),
     path(
         "invites/<str:token>/",
         CampaignJoinView.as_view(),
         name="campaign_join",
     ),
+    # API URLs
+    path(
+        "api/campaigns/<uuid:pk>/",
+        CampaignSnapshotView.as_view(),
+        name="campaign_snapshot",
+    ),
     # Feed URLs
     path(
         "campaigns/<slug:slug>/announcement/create/",
@@ -71,6 +126,11 @@ urlpatterns = [
         HelpfulLinkCreateView.as_view(),
         name="helpful_link_add",
     ),
+    path(
+        "campaigns/<slug:slug>/links/import/",
+        HelpfulLinkImportView.as_view(),
+        name="helpful_link_import",
+    ),
     path(
         "links/<int:pk>/delete/",
         HelpfulLinkDeleteView.as_view(),
@@ -93,6 +153,11 @@ urlpatterns = [
         PlayerCharacterUpdateView.as_view(),
         name="character_edit",
     ),
+    path(
+        "portraits/<slug:digest>/<slug:size>.<slug:extension>",
+        PortraitThumbnailView.as_view(),
+        name="portrait_thumbnail",
+    ),
     # Session URLs
     path(
         "campaigns/<slug:campaign_slug>/sessions/propose/",
@@ -114,6 +179,31 @@ urlpatterns = [
         SessionUpdateView.as_view(),
         name="session_edit",
     ),
+    path(
+        "campaigns/<slug:campaign_slug>/sessions/<int:session_number>/history/",
+        SessionHistoryView.as_view(),
+        name="session_history",
+    ),
+    path(
+        "campaigns/<slug:campaign_slug>/sessions/<int:session_number>/recordings/",
+        SessionRecordingCreateView.as_view(),
+        name="session_recording_create",
+    ),
+    path(
+        "recordings/<uuid:pk>/",
+        SessionRecordingDownloadView.as_view(),
+        name="session_recording_download",
+    ),
+    path(
+        "recordings/<uuid:pk>/upload/",
+        SessionRecordingUploadView.as_view(),
+        name="session_recording_upload",
+    ),
+    path(
+        "recordings/<uuid:pk>/commit/",
+        SessionRecordingCommitView.as_view(),
+        name="session_recording_commit",
+    ),
     # Journal URLs
     path(
         "character/<uuid:character_id>/journal/",
@@ -125,11 +215,26 @@ urlpatterns = [
         JournalCreateView.as_view(),
         name="journal_create",
     ),
+    path(
+        "character/<uuid:character_id>/journal/draft/",
+        JournalDraftView.as_view(),
+        name="journal_draft",
+    ),
+    path(
+        "character/<uuid:character_id>/journal/export/",
+        JournalExportView.as_view(),
+        name="journal_export",
+    ),
     path(
         "journal/<uuid:entry_id>/edit/",
         JournalUpdateView.as_view(),
         name="journal_update",
     ),
+    path(
+        "journal/<uuid:entry_id>/history/",
+        JournalHistoryView.as_view(),
+        name="journal_history",
+    ),
     path(
         "journal/<uuid:entry_id>/delete/",
         JournalDeleteView.as_view(),
@@ -1,23 +1,41 @@
 from .campaign_announcement_create import CampaignAnnouncementCreateView
 from .campaign_create import CampaignCreateView
 from .campaign_detail import CampaignDetailView
+from .campaign_directory import CampaignDirectoryView
+from .campaign_handouts import CampaignHandoutsView
 from .campaign_invite_create import CampaignInvitationCreateView
+from .campaign_invite_email import CampaignInvitationEmailView
+from .campaign_invite_email_status import CampaignInvitationEmailStatusView
 from .campaign_join import CampaignJoinView
+from .campaign_journal import CampaignJournalView
 from .campaign_list_joined import JoinedCampaignListView
 from .campaign_list_managed import ManagedCampaignListView
+from .campaign_snapshot import CampaignSnapshotView
 from .campaign_update import CampaignUpdateView
 from .character_detail import PlayerCharacterDetailView
+from .handout_download import HandoutDownloadView
 from .helpful_link_create import HelpfulLinkCreateView
 from .helpful_link_delete import HelpfulLinkDeleteView
+from .helpful_link_import import HelpfulLinkImportView
 from .journal_create import JournalCreateView
 from .journal_delete import JournalDeleteView
+from .journal_draft import JournalDraftView
+from .journal_export import JournalExportView
+from .journal_history import JournalHistoryView
 from .journal_list import JournalListView
 from .journal_update import JournalUpdateView
+from .my_table import MyTableView
 from .player_character_create import PlayerCharacterCreateView
 from .player_character_list import PlayerCharacterListView
 from .player_character_update import PlayerCharacterUpdateView
+from .portrait_thumbnail import PortraitThumbnailView
 from .session_create import SessionCreateView
 from .session_detail import SessionDetailView
+from .session_history import SessionHistoryView
+from .session_recording_commit import SessionRecordingCommitView
+from .session_recording_create import SessionRecordingCreateView
+from .session_recording_download import SessionRecordingDownloadView
+from .session_recording_upload import SessionRecordingUploadView
 from .session_toggle_attendance import SessionToggleAttendanceView
 from .session_update import SessionUpdateView
 from .splash import SplashView
@@ -26,24 +44,42 @@ __all__ = [
     "CampaignAnnouncementCreateView",
     "CampaignCreateView",
     "CampaignDetailView",
+    "CampaignDirectoryView",
+    "CampaignHandoutsView",
     "CampaignInvitationCreateView",
+    "CampaignInvitationEmailStatusView",
+    "CampaignInvitationEmailView",
     "CampaignJoinView",
+    "CampaignJournalView",
+    "CampaignSnapshotView",
     "CampaignUpdateView",
     "JoinedCampaignListView",
     "ManagedCampaignListView",
+    "MyTableView",
     "PlayerCharacterCreateView",
     "PlayerCharacterDetailView",
     "PlayerCharacterListView",
     "PlayerCharacterUpdateView",
+    "PortraitThumbnailView",
     "SplashView",
+    "HandoutDownloadView",
     "HelpfulLinkCreateView",
     "HelpfulLinkDeleteView",
+    "HelpfulLinkImportView",
     "JournalCreateView",
     "JournalDeleteView",
+    "JournalDraftView",
+    "JournalExportView",
+    "JournalHistoryView",
     "JournalListView",
     "JournalUpdateView",
     "SessionCreateView",
     "SessionDetailView",
+    "SessionHistoryView",
+    "SessionRecordingCommitView",
+    "SessionRecordingCreateView",
+    "SessionRecordingDownloadView",
+    "SessionRecordingUploadView",
     "SessionToggleAttendanceView",
     "SessionUpdateView",
 ]
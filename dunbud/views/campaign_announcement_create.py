@@ -8,6 +8,7 @@ from django.views.generic import View
 
 from dunbud.forms import PartyFeedItemForm
 from dunbud.models import Campaign, PartyFeedItem
+from dunbud.services import is_dungeon_master
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +19,14 @@ class CampaignAnnouncementCreateView(LoginRequiredMixin, UserPassesTestMixin, Vi
     Restricted to the Dungeon Master.
     """
 
+    query_budget = 7
+
     def test_func(self) -> bool:
         """
         Only the Dungeon Master can post announcements.
         """
         self.campaign = get_object_or_404(Campaign, slug=self.kwargs["slug"])
-        return bool(self.campaign.dungeon_master == self.request.user)
+        return is_dungeon_master(self.request.user, self.campaign)
 
     def post(self, request: HttpRequest, slug: str) -> HttpResponse:
         """
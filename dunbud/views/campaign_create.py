@@ -25,10 +25,12 @@ class CampaignCreateView(LoginRequiredMixin, CreateView):
         "description",
         "system",
         "max_players",
+        "is_public",
         "vtt_link",
         "video_link",
     ]
     template_name = "campaign/campaign_form.html"
+    query_budget = 3
 
     def get_success_url(self) -> str:
         """
@@ -2,17 +2,30 @@ import logging
 from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import QuerySet
-from django.http import Http404
+from django.http import Http404, HttpRequest, HttpResponse
 from django.views.generic import DetailView
 
 from dunbud.forms import HelpfulLinkForm, PartyFeedItemForm
 from dunbud.models import Campaign
+from dunbud.models.links import MAX_LINKS_PER_CAMPAIGN
+from dunbud.services import (
+    get_link_health,
+    get_party_roster,
+    is_campaign_member,
+    mark_feed_read,
+)
+from dunbud.services.invitations import NEW_INVITE_SESSION_KEY
+from dunbud.views.mixins import MemoizedObjectMixin
 
 logger = logging.getLogger(__name__)
 
 
-class CampaignDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
+class CampaignDetailView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    DetailView,
+):
     """
     View to display the details of a specific campaign.
     Restricted to the Dungeon Master and joined players.
@@ -21,29 +34,29 @@ class CampaignDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
     model = Campaign
     template_name = "campaign/campaign_detail.html"
     context_object_name = "campaign"
-
-    def get_queryset(self) -> QuerySet[Campaign]:
+    query_budget = 17
+    select_related_fields = ("dungeon_master", "system")
+    prefetch_related_fields = (
+        "players",
+        "helpful_links",
+        "sessions__attendees",
+        "sessions__busy_users",
+        "feed_items",
+        "feed_items__session",
+    )
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         """
-        Optimize database queries by pre-fetching related objects.
+        Render the page and mark the campaign feed as read for the user.
         """
-        return (
-            super()
-            .get_queryset()
-            .select_related("dungeon_master", "system")
-            .prefetch_related(
-                "players",
-                "player_characters",
-                "helpful_links",
-                "sessions__attendees",
-                "sessions__busy_users",
-                "feed_items",
-                "feed_items__session",
-            )
-        )
+        response = super().get(request, *args, **kwargs)
+        mark_feed_read(request.user, self.object)
+        return response
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """
-        Add list of players with their active character for this campaign.
+        Add the party roster (players with their character in this campaign)
+        and the cached health of the page's external links.
         Also adds management forms for the Dungeon Master.
         """
         context = super().get_context_data(**kwargs)
@@ -51,26 +64,35 @@ class CampaignDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
 
         if self.request.user == self.object.dungeon_master:
             # Fetch the most recent active invitation if it exists
-            context["active_invite"] = self.object.invitations.filter(
-                is_active=True,
-            ).first()
+            context["active_invite"] = (
+                self.object.invitations.filter(is_active=True, email="")
+                .order_by("-created_at")
+                .first()
+            )
+            # A freshly generated link is shown once; only its hash is stored.
+            context["new_invite_url"] = self.request.session.pop(
+                NEW_INVITE_SESSION_KEY.format(campaign_id=campaign.pk),
+                None,
+            )
             if "link_form" not in kwargs:
                 context["link_form"] = HelpfulLinkForm()
             if "announcement_form" not in kwargs:
                 context["announcement_form"] = PartyFeedItemForm()
-
-        # Map user_id to their character in this campaign
-        character_map = {
-            char.user_id: char for char in campaign.player_characters.all()
-        }
-
-        # Annotate players with their character for this campaign
-        players_with_data = []
-        for player in campaign.players.all():
-            player.campaign_character = character_map.get(player.pk)
-            players_with_data.append(player)
-
-        context["players_with_data"] = players_with_data
+            context["max_helpful_links"] = MAX_LINKS_PER_CAMPAIGN
+
+        roster = get_party_roster(campaign)
+        context["roster"] = roster
+        context["link_health"] = get_link_health(
+            [
+                campaign.vtt_link,
+                *(link.url for link in campaign.helpful_links.all()),
+                *(
+                    member.campaign_character.character_sheet_link
+                    for member in roster
+                    if member.campaign_character
+                ),
+            ],
+        )
         return context
 
     def test_func(self) -> bool:
@@ -84,7 +106,7 @@ class CampaignDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
 
         user = self.request.user  # type: ignore[misc]
 
-        if campaign.dungeon_master == user or user in campaign.players.all():
+        if is_campaign_member(user, campaign):
             return True
 
         # Log unauthorized access attempts to existing campaigns.
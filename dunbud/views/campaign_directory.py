@@ -0,0 +1,52 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from django.views.generic import TemplateView
+
+from dunbud.services import get_directory_facets, get_directory_page
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignDirectoryView(TemplateView):
+    """
+    Public directory of campaigns that opted in to being listed.
+    Filterable by tabletop system and by minimum number of open seats.
+    """
+
+    template_name = "campaign/campaign_directory.html"
+    query_budget = 4
+
+    def get_filters(self) -> tuple[UUID | None, int]:
+        """
+        Parse the system and seat filters from the query string.
+        Invalid values fall back to the unfiltered defaults.
+        """
+        system = self.request.GET.get("system", "")
+        system_id = None
+        if system:
+            try:
+                system_id = UUID(system)
+            except ValueError:
+                system_id = None
+
+        try:
+            min_open_seats = max(int(self.request.GET.get("seats", 1)), 0)
+        except ValueError:
+            min_open_seats = 1
+        return system_id, min_open_seats
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        system_id, min_open_seats = self.get_filters()
+
+        context["page"] = get_directory_page(
+            system_id=system_id,
+            min_open_seats=min_open_seats,
+            cursor=self.request.GET.get("cursor"),
+        )
+        context["facets"] = get_directory_facets()
+        context["selected_system"] = str(system_id or "")
+        context["min_open_seats"] = min_open_seats
+        return context
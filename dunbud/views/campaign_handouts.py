@@ -0,0 +1,67 @@
+import logging
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import get_object_or_404, redirect
+from django.views.generic import TemplateView
+
+from dunbud.forms import HandoutForm
+from dunbud.models import Campaign, Handout
+from dunbud.services import is_campaign_member
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignHandoutsView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+    """
+    Lists a campaign's handouts for its members.
+    The Dungeon Master can upload new ones from the same page.
+    """
+
+    template_name = "handout/handout_list.html"
+    query_budget = 6
+
+    def test_func(self) -> bool:
+        self.campaign = get_object_or_404(
+            Campaign.objects.select_related("dungeon_master"),
+            slug=self.kwargs["slug"],
+        )
+        return is_campaign_member(self.request.user, self.campaign)
+
+    @property
+    def is_dungeon_master(self) -> bool:
+        return bool(self.campaign.dungeon_master_id == self.request.user.pk)
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["campaign"] = self.campaign
+        context["handouts"] = Handout.objects.filter(campaign=self.campaign).only(
+            "title",
+            "content_type",
+            "size",
+            "created_at",
+        )
+        if self.is_dungeon_master:
+            context.setdefault("form", HandoutForm())
+        return context
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if not self.is_dungeon_master:
+            raise PermissionDenied
+
+        form = HandoutForm(request.POST, request.FILES)
+        if not form.is_valid():
+            return self.render_to_response(self.get_context_data(form=form))
+
+        form.instance.campaign = self.campaign
+        form.instance.uploaded_by = request.user
+        handout = form.save()
+        logger.info(
+            "User %s uploaded handout %s to campaign %s",
+            request.user.pk,
+            handout.pk,
+            self.campaign.pk,
+        )
+        return redirect("campaign_handouts", slug=self.campaign.slug)
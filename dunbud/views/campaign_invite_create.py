@@ -7,7 +7,9 @@ from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.views.generic import View
 
-from dunbud.models import Campaign, CampaignInvitation
+from dunbud.models import Campaign
+from dunbud.services import create_invitation, is_dungeon_master
+from dunbud.services.invitations import NEW_INVITE_SESSION_KEY
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,8 @@ class CampaignInvitationCreateView(LoginRequiredMixin, View):
     Only accessible by the Dungeon Master of the campaign.
     """
 
+    query_budget = 12
+
     def post(self, request: HttpRequest, slug: str) -> HttpResponse:
         """
         Handle POST request to create a new invitation.
@@ -25,7 +29,7 @@ class CampaignInvitationCreateView(LoginRequiredMixin, View):
         campaign = get_object_or_404(Campaign, slug=slug)
 
         # Permission check: Only DM can create invites
-        if campaign.dungeon_master != request.user:
+        if not is_dungeon_master(request.user, campaign):
             logger.warning(
                 "Unauthorized invite creation attempt by user %s for campaign %s",
                 request.user.id,
@@ -37,33 +41,20 @@ class CampaignInvitationCreateView(LoginRequiredMixin, View):
             )
             return redirect("campaign_detail", slug=slug)
 
-        # Invalidate old invites (optional logic, keeping it clean for now by just creating a new one)
-        # or get existing active one to ensure idempotency if desired.
-        # Here we create a new one as requested by the 'Generate' action.
-
+        # Only the token hash is stored, so an existing link cannot be shown
+        # again; generating always rotates to a new invite.
         with transaction.atomic():
-            # Optional: Deactivate old invites to ensure only one valid link at a time
-            # campaign.invitations.update(is_active=False)
-
-            invite, created = CampaignInvitation.objects.get_or_create(
-                campaign=campaign,
-                is_active=True,
-            )
-
-            if created:
-                logger.info(
-                    "Created new invitation %s for campaign %s by %s",
-                    invite.id,
-                    campaign.slug,
-                    request.user,
-                )
-                messages.success(request, "Invitation link generated.")
-            else:
-                logger.info(
-                    "Retrieved existing invitation %s for campaign %s",
-                    invite.id,
-                    campaign.slug,
-                )
-                messages.info(request, "Existing active invitation retrieved.")
-
+            invite = create_invitation(campaign)
+
+        # Hand the raw link to the next page view, which shows it once.
+        request.session[NEW_INVITE_SESSION_KEY.format(campaign_id=campaign.pk)] = (
+            invite.get_absolute_url()
+        )
+        logger.info(
+            "Created new invitation %s for campaign %s by %s",
+            invite.id,
+            campaign.slug,
+            request.user,
+        )
+        messages.success(request, "Invitation link generated.")
         return redirect("campaign_detail", slug=slug)
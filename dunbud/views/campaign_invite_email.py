@@ -0,0 +1,62 @@
+import logging
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views.generic import View
+
+from dunbud.forms import InvitationEmailForm
+from dunbud.models import Campaign
+from dunbud.services import create_email_invitations, is_dungeon_master
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignInvitationEmailView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    View to email invitations to a list of addresses and users via AJAX.
+    The emails are queued in the outbox; the response points at a status URL
+    reporting per-recipient delivery.
+    """
+
+    form_class = InvitationEmailForm
+    query_budget = 9
+
+    def test_func(self) -> bool:
+        self.campaign = get_object_or_404(Campaign, slug=self.kwargs["slug"])
+        return is_dungeon_master(self.request.user, self.campaign)
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        form = self.form_class(request.POST)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        with transaction.atomic():
+            batch_id, emails = create_email_invitations(
+                self.campaign,
+                form.cleaned_data["emails"],
+                request.build_absolute_uri,
+                form.cleaned_data["invitees"],
+            )
+
+        logger.info(
+            "Queued %d invitation emails for campaign %s by %s",
+            len(emails),
+            self.campaign.slug,
+            request.user,
+        )
+        data = {
+            "batch": str(batch_id),
+            "status_url": reverse(
+                "campaign_invite_email_status",
+                kwargs={"slug": self.campaign.slug, "batch": batch_id},
+            ),
+            "recipients": [
+                {"recipient": email.recipient, "delivery_status": "pending"}
+                for email in emails
+            ],
+        }
+        return JsonResponse(data, status=202)
@@ -0,0 +1,32 @@
+import logging
+from uuid import UUID
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.generic import View
+
+from dunbud.models import Campaign, OutgoingEmail
+from dunbud.services import get_invitation_batch, is_dungeon_master
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignInvitationEmailStatusView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    JSON view reporting the delivery status of each recipient in a batch.
+    """
+
+    query_budget = 6
+
+    def test_func(self) -> bool:
+        self.campaign = get_object_or_404(Campaign, slug=self.kwargs["slug"])
+        return is_dungeon_master(self.request.user, self.campaign)
+
+    def get(self, request: HttpRequest, slug: str, batch: UUID) -> HttpResponse:
+        recipients = get_invitation_batch(self.campaign, batch)
+        pending = any(
+            recipient["delivery_status"] == OutgoingEmail.Status.PENDING
+            for recipient in recipients
+        )
+        return JsonResponse({"recipients": recipients, "done": not pending})
@@ -3,11 +3,19 @@ import logging
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import get_object_or_404, redirect
+from django.db import transaction
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import redirect
 from django.views.generic import View
 
-from dunbud.models import CampaignInvitation
+from dunbud.services import (
+    CampaignRole,
+    JoinOutcome,
+    find_invitation,
+    get_campaign_role,
+    join_campaign,
+    record_invitation_use,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +25,8 @@ class CampaignJoinView(LoginRequiredMixin, View):
     View to process a user clicking an invitation link.
     """
 
+    query_budget = 20
+
     def get(self, request: HttpRequest, token: str) -> HttpResponse:
         """
         Validate token and add user to campaign.
@@ -24,21 +34,34 @@ class CampaignJoinView(LoginRequiredMixin, View):
         if not request.user.is_authenticated:
             return redirect(settings.LOGIN_URL)
 
-        invite = get_object_or_404(CampaignInvitation, token=token, is_active=True)
+        invite = find_invitation(token)
+        if invite is None:
+            raise Http404("Invitation not found.")
         campaign = invite.campaign
+        role = get_campaign_role(request.user, campaign)
 
         # 1. Prevent DM from joining as a player
-        if request.user == campaign.dungeon_master:
+        if role is CampaignRole.DUNGEON_MASTER:
             messages.warning(request, "You are the Dungeon Master of this campaign.")
             return redirect("campaign_detail", slug=campaign.slug)
 
         # 2. Check if already a player
-        if request.user.pk and campaign.players.filter(pk=request.user.pk).exists():
+        if role is CampaignRole.PLAYER:
             messages.info(request, "You are already a player in this campaign.")
             return redirect("campaign_detail", slug=campaign.slug)
 
-        # 3. Check for player limit
-        if campaign.players.count() >= campaign.max_players:
+        # 3. Join in one conditional write; the database enforces capacity
+        with transaction.atomic():
+            outcome = join_campaign(campaign, request.user)
+            # 4. Use up one of the invite's seats
+            if outcome is JoinOutcome.JOINED and not record_invitation_use(invite):
+                transaction.set_rollback(True)
+                messages.error(request, "This invitation has expired.")
+                return redirect("campaign_joined")
+
+        if outcome is JoinOutcome.ALREADY_PLAYER:
+            messages.info(request, "You are already a player in this campaign.")
+        elif outcome is JoinOutcome.FULL:
             logger.warning(
                 "User %s attempted to join full campaign %s (Limit: %s)",
                 request.user.id,
@@ -48,10 +71,7 @@ class CampaignJoinView(LoginRequiredMixin, View):
             messages.error(request, "This campaign has reached its player limit.")
             # Redirect to 'joined' list (safe for non-members) instead of detail view (403 forbidden)
             return redirect("campaign_joined")
-
-        # 4. Add to players
-        try:
-            campaign.players.add(request.user)
+        else:
             logger.info(
                 "User %s joined campaign %s via invite %s",
                 request.user.id,
@@ -59,14 +79,6 @@ class CampaignJoinView(LoginRequiredMixin, View):
                 invite.id,
             )
             messages.success(request, f"You have successfully joined {campaign.name}!")
-        except Exception as e:
-            logger.error(
-                "Error adding user %s to campaign %s: %s",
-                request.user.id,
-                campaign.slug,
-                e,
-            )
-            messages.error(request, "An error occurred while joining the campaign.")
 
         return redirect("campaign_detail", slug=campaign.slug)
         return redirect("campaign_detail", slug=campaign.slug)
@@ -0,0 +1,35 @@
+import logging
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.shortcuts import get_object_or_404
+from django.views.generic import TemplateView
+
+from dunbud.models import Campaign
+from dunbud.services import get_campaign_timeline, is_campaign_member
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignJournalView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+    """
+    Timeline of every character's journal entries in a campaign, newest
+    first and grouped by session. Only campaign members can read it.
+    """
+
+    template_name = "journal/campaign_journal.html"
+    query_budget = 6
+
+    def test_func(self) -> bool:
+        self.campaign = get_object_or_404(Campaign, slug=self.kwargs["slug"])
+        return is_campaign_member(self.request.user, self.campaign)
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["campaign"] = self.campaign
+        context["page"] = get_campaign_timeline(
+            self.campaign,
+            self.request.user,
+            cursor=self.request.GET.get("cursor"),
+        )
+        return context
@@ -1,17 +1,18 @@
 import logging
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count, QuerySet
+from django.db.models import QuerySet
 from django.views.generic import (
     ListView,
 )
 
 from dunbud.models import Campaign
+from dunbud.views.mixins import CampaignListMixin
 
 logger = logging.getLogger(__name__)
 
 
-class ManagedCampaignListView(LoginRequiredMixin, ListView):
+class ManagedCampaignListView(LoginRequiredMixin, CampaignListMixin, ListView):
     """
     View to list campaigns managed by the current user.
     """
@@ -19,6 +20,7 @@ class ManagedCampaignListView(LoginRequiredMixin, ListView):
     model = Campaign
     template_name = "campaign/managed_campaign_list.html"
     context_object_name = "campaigns"
+    query_budget = 4
 
     def get_queryset(self) -> QuerySet[Campaign]:
         """
@@ -27,9 +29,6 @@ class ManagedCampaignListView(LoginRequiredMixin, ListView):
         if not self.request.user.is_authenticated:
             return Campaign.objects.none()
 
-        return (
-            Campaign.objects.filter(dungeon_master=self.request.user)
-            .select_related("dungeon_master", "system")
-            .annotate(player_count=Count("players"))
-            .prefetch_related("feed_items")
+        return self.annotate_campaigns(
+            Campaign.objects.filter(dungeon_master=self.request.user),
         )
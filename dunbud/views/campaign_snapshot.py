@@ -0,0 +1,38 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, JsonResponse
+from django.views.generic import View
+
+from dunbud.services import get_campaign_snapshot, is_campaign_member
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignSnapshotView(LoginRequiredMixin, View):
+    """
+    Read-only JSON API serving the materialized campaign document.
+    Restricted to the Dungeon Master and joined players.
+    """
+
+    query_budget = 5
+
+    def get(self, request: HttpRequest, pk: UUID, **kwargs: Any) -> JsonResponse:
+        """
+        Return the stored snapshot, rebuilding it first if it is stale.
+        """
+        if not is_campaign_member(request.user, pk):
+            logger.warning(
+                "Unauthorized snapshot access attempt to campaign %s by user %s",
+                pk,
+                request.user,
+            )
+            raise PermissionDenied
+
+        document = get_campaign_snapshot(pk)
+        if document is None:
+            raise Http404("Campaign not found.")
+        return JsonResponse(document)
@@ -5,11 +5,18 @@ from django.urls import reverse
 from django.views.generic import UpdateView
 
 from dunbud.models import Campaign
+from dunbud.services import is_dungeon_master
+from dunbud.views.mixins import MemoizedObjectMixin
 
 logger = logging.getLogger(__name__)
 
 
-class CampaignUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class CampaignUpdateView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    UpdateView,
+):
     """
     View to edit an existing campaign.
     Restricted to the Dungeon Master.
@@ -21,18 +28,20 @@ class CampaignUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         "description",
         "system",
         "max_players",
+        "is_public",
         "vtt_link",
         "video_link",
     ]
     template_name = "campaign/campaign_form.html"
     context_object_name = "campaign"
+    query_budget = 6
 
     def test_func(self) -> bool:
         """
         Only the Dungeon Master can edit the campaign.
         """
         campaign = self.get_object()
-        return bool(campaign.dungeon_master == self.request.user)
+        return is_dungeon_master(self.request.user, campaign)
 
     def get_success_url(self) -> str:
         return reverse("campaign_detail", kwargs={"slug": self.object.slug})
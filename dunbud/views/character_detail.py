@@ -4,11 +4,18 @@ from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.views.generic import DetailView
 
 from dunbud.models import PlayerCharacter
+from dunbud.services import is_campaign_member
+from dunbud.views.mixins import MemoizedObjectMixin
 
 logger = logging.getLogger(__name__)
 
 
-class PlayerCharacterDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
+class PlayerCharacterDetailView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    DetailView,
+):
     """
     View to display character details.
     Visible to the owner and members (DM/Players) of the assigned campaign.
@@ -17,6 +24,8 @@ class PlayerCharacterDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailV
     model = PlayerCharacter
     template_name = "character/character_detail.html"
     context_object_name = "character"
+    select_related_fields = ("user", "campaign", "portrait")
+    query_budget = 5
 
     def test_func(self) -> bool:
         """
@@ -26,14 +35,11 @@ class PlayerCharacterDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailV
         user = self.request.user
 
         # Owner access
-        if character.user == user:
+        if character.user_id == user.pk:
             return True
 
         # Campaign members access
-        if character.campaign:
-            if character.campaign.dungeon_master == user:
-                return True
-            if user in character.campaign.players.all():
-                return True
+        if character.campaign_id:
+            return is_campaign_member(user, character.campaign_id)
 
         return False
@@ -0,0 +1,46 @@
+import logging
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, HttpResponseBase
+from django.shortcuts import get_object_or_404
+from django.views.generic import View
+
+from dunbud.models import Handout
+from dunbud.services import is_campaign_member, serve_file
+
+logger = logging.getLogger(__name__)
+
+
+class HandoutDownloadView(LoginRequiredMixin, View):
+    """
+    Streams a handout to a campaign member, with support for resumable
+    downloads through ``Range`` and ``If-Range``.
+    """
+
+    query_budget = 5
+
+    def get(self, request: HttpRequest, pk: UUID, **kwargs: Any) -> HttpResponseBase:
+        handout = get_object_or_404(Handout, pk=pk)
+        if not is_campaign_member(request.user, handout.campaign_id):
+            raise PermissionDenied
+
+        try:
+            file = handout.file.open("rb")
+        except FileNotFoundError:
+            logger.error("Handout %s is missing its file", handout.pk)
+            raise Http404("Handout file is missing.") from None
+
+        return serve_file(
+            request,
+            file,
+            size=handout.size,
+            etag=handout.etag,
+            last_modified=handout.updated_at,
+            content_type=handout.content_type,
+            filename=Path(handout.file.name or "").name,
+            as_attachment=not handout.is_inline,
+        )
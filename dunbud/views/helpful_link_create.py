@@ -2,6 +2,7 @@ import logging
 from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.core.exceptions import ValidationError
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
@@ -9,6 +10,7 @@ from django.views.generic import View
 
 from dunbud.forms import HelpfulLinkForm
 from dunbud.models import Campaign, HelpfulLink
+from dunbud.services import is_dungeon_master
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +22,22 @@ class HelpfulLinkCreateView(LoginRequiredMixin, UserPassesTestMixin, View):
 
     model = HelpfulLink
     form_class = HelpfulLinkForm
+    query_budget = 11
 
     def test_func(self) -> bool:
         self.campaign = get_object_or_404(Campaign, slug=self.kwargs["slug"])
-        return bool(self.campaign.dungeon_master == self.request.user)
+        return is_dungeon_master(self.request.user, self.campaign)
 
     def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         form = self.form_class(request.POST)
         form.instance.campaign = self.campaign
 
         if form.is_valid():
-            link = form.save()
+            try:
+                link = form.save()
+            except ValidationError as e:
+                # Another request took the last slot after the form was validated.
+                return JsonResponse({"errors": {"__all__": e.messages}}, status=400)
             data = {
                 "pk": link.pk,
                 "name": link.name,
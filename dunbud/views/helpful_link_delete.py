@@ -18,6 +18,7 @@ class HelpfulLinkDeleteView(LoginRequiredMixin, DeleteView):
     """
 
     model = HelpfulLink
+    query_budget = 6
 
     def get_queryset(self) -> QuerySet:
         """
@@ -0,0 +1,55 @@
+import logging
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.core.exceptions import ValidationError
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views.generic import View
+
+from dunbud.forms import HelpfulLinkImportForm
+from dunbud.models import Campaign
+from dunbud.services import import_helpful_links, is_dungeon_master
+
+logger = logging.getLogger(__name__)
+
+
+class HelpfulLinkImportView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    View to import several helpful links at once via AJAX.
+    The whole batch is added in one transaction or rejected.
+    """
+
+    form_class = HelpfulLinkImportForm
+    query_budget = 10
+
+    def test_func(self) -> bool:
+        self.campaign = get_object_or_404(Campaign, slug=self.kwargs["slug"])
+        return is_dungeon_master(self.request.user, self.campaign)
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        form = self.form_class(request.POST)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        try:
+            links = import_helpful_links(self.campaign, form.cleaned_data["links"])
+        except ValidationError as e:
+            return JsonResponse({"errors": {"__all__": e.messages}}, status=400)
+
+        data = {
+            "links": [
+                {
+                    "pk": link.pk,
+                    "name": link.name,
+                    "url": link.url,
+                    "delete_url": reverse(
+                        "helpful_link_delete",
+                        kwargs={"pk": link.pk},
+                    ),
+                }
+                for link in links
+            ],
+        }
+        return JsonResponse(data, status=201)
@@ -1,6 +1,7 @@
 from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils.functional import cached_property
@@ -8,7 +9,9 @@ from django.views.generic import CreateView
 
 from dunbud.forms.journal import JournalEntryForm
 from dunbud.models.journal import JournalEntry
+from dunbud.models.journal_draft import JournalDraft
 from dunbud.models.player_character import PlayerCharacter
+from dunbud.services import discard_journal_draft, get_journal_draft
 
 
 class JournalCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
@@ -19,11 +22,25 @@ class JournalCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
     model = JournalEntry
     form_class = JournalEntryForm
     template_name = "journal/journal_form.html"
+    query_budget = 7
 
     @cached_property
     def character(self) -> PlayerCharacter:
         return get_object_or_404(PlayerCharacter, pk=self.kwargs["character_id"])
 
+    @cached_property
+    def draft(self) -> JournalDraft | None:
+        # Only restored when the form is first shown
+        if self.request.method != "GET":
+            return None
+        return get_journal_draft(self.character.pk)
+
+    def get_initial(self) -> dict[str, Any]:
+        initial = super().get_initial()
+        if self.draft:
+            initial.update(title=self.draft.title, content=self.draft.content)
+        return initial
+
     def get_form_kwargs(self) -> dict[str, Any]:
         kwargs = super().get_form_kwargs()
         kwargs["character"] = self.character
@@ -32,12 +49,18 @@ class JournalCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["character"] = self.character
+        context["draft"] = self.draft
         return context
 
     def test_func(self) -> bool:
         # Only the character's owner can write a journal
         return self.character.user == self.request.user
 
+    def form_valid(self, form: Any) -> HttpResponse:
+        response = super().form_valid(form)
+        discard_journal_draft(self.character.pk)
+        return response
+
     def get_success_url(self) -> str:
         return reverse(
             "journal_list",
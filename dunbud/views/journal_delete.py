@@ -3,9 +3,15 @@ from django.urls import reverse
 from django.views.generic import DeleteView
 
 from dunbud.models.journal import JournalEntry
+from dunbud.views.mixins import MemoizedObjectMixin
 
 
-class JournalDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class JournalDeleteView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    DeleteView,
+):
     """
     Allows a user to delete a journal entry.
     """
@@ -13,10 +19,12 @@ class JournalDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     model = JournalEntry
     template_name = "journal/journal_confirm_delete.html"
     pk_url_kwarg = "entry_id"
+    select_related_fields = ("character",)
+    query_budget = 3
 
     def test_func(self) -> bool:
         entry = self.get_object()
-        return bool(entry.character.user == self.request.user)
+        return bool(entry.character.user_id == self.request.user.pk)
 
     def get_success_url(self) -> str:
         return reverse(
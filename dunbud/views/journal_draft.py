@@ -0,0 +1,46 @@
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.views.generic import View
+
+from dunbud.forms import JournalDraftForm
+from dunbud.models.journal import JournalEntry
+from dunbud.models.player_character import PlayerCharacter
+from dunbud.services import save_journal_draft
+
+
+class JournalDraftView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    Autosave endpoint for the journal form. Stores a patch of the changed
+    fields in the character's draft without touching the entry itself.
+    """
+
+    form_class = JournalDraftForm
+    query_budget = 5
+
+    @cached_property
+    def character(self) -> PlayerCharacter:
+        return get_object_or_404(PlayerCharacter, pk=self.kwargs["character_id"])
+
+    def test_func(self) -> bool:
+        # Only the character's owner can write a journal
+        return self.character.user_id == self.request.user.pk
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        form = self.form_class(request.POST)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        entry = None
+        if form.cleaned_data["entry"]:
+            entry = get_object_or_404(
+                JournalEntry.objects.only("pk", "title", "content"),
+                pk=form.cleaned_data["entry"],
+                character=self.character,
+            )
+        save_journal_draft(self.character, entry, form.get_changes())
+        return JsonResponse({"saved_at": timezone.now().isoformat()})
@@ -0,0 +1,41 @@
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import HttpRequest, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
+from django.utils.text import slugify
+from django.views.generic import View
+
+from dunbud.models.player_character import PlayerCharacter
+from dunbud.services import stream_journal_export
+
+
+class JournalExportView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    Downloads a character's whole journal as a ZIP of Markdown files.
+    The archive is streamed as it is built.
+    """
+
+    query_budget = 4
+
+    @cached_property
+    def character(self) -> PlayerCharacter:
+        return get_object_or_404(PlayerCharacter, pk=self.kwargs["character_id"])
+
+    def test_func(self) -> bool:
+        # Only the character's owner can export the journal
+        return self.character.user_id == self.request.user.pk
+
+    def get(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> StreamingHttpResponse:
+        filename = f"{slugify(self.character.name) or 'character'}-journal.zip"
+        return StreamingHttpResponse(
+            stream_journal_export(self.character),
+            content_type="application/zip",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
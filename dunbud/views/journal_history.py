@@ -0,0 +1,50 @@
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views.generic import TemplateView
+
+from dunbud.models import JournalEntry, TextRevision
+from dunbud.services import is_campaign_member, visible_journal_entries
+from dunbud.views.mixins import RevisionHistoryMixin
+
+
+class JournalHistoryView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    RevisionHistoryMixin,
+    TemplateView,
+):
+    """
+    Revision history of a journal entry's content, for campaign members who
+    can read the entry.
+    """
+
+    template_name = "revisions/history.html"
+    query_budget = 7
+
+    def test_func(self) -> bool:
+        # Entries the user may not read look the same as missing ones
+        self.entry = get_object_or_404(
+            JournalEntry.objects.filter(
+                visible_journal_entries(self.request.user),
+            ).only("title", "character_id", "campaign_id"),
+            pk=self.kwargs["entry_id"],
+        )
+        return self.entry.campaign_id is not None and is_campaign_member(
+            self.request.user,
+            self.entry.campaign_id,
+        )
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["title"] = self.entry.title
+        context["back_url"] = reverse(
+            "journal_list",
+            kwargs={"character_id": self.entry.character_id},
+        )
+        context.update(
+            self.get_revision_context(self.entry, TextRevision.Field.CONTENT),
+        )
+        return context
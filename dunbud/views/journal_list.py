@@ -1,34 +1,34 @@
 from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import QuerySet
 from django.shortcuts import get_object_or_404
-from django.views.generic import ListView
+from django.views.generic import TemplateView
 
-from dunbud.models.journal import JournalEntry
 from dunbud.models.player_character import PlayerCharacter
+from dunbud.services import get_journal_page
 
 
-class JournalListView(LoginRequiredMixin, ListView):
+class JournalListView(LoginRequiredMixin, TemplateView):
     """
     Displays a list of journal entries for a specific character.
+    Entries are paginated with a keyset cursor, newest first.
     """
 
-    model = JournalEntry
     template_name = "journal/journal_list.html"
-    context_object_name = "entries"
-    paginate_by = 10
-
-    def get_queryset(self) -> QuerySet[JournalEntry]:
-        self.character = get_object_or_404(
-            PlayerCharacter,
-            pk=self.kwargs["character_id"],
-        )
-        return JournalEntry.objects.filter(character=self.character)
+    query_budget = 6
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        context["character"] = self.character
+        character = get_object_or_404(PlayerCharacter, pk=self.kwargs["character_id"])
+        page = get_journal_page(
+            character,
+            self.request.user,
+            cursor=self.request.GET.get("cursor"),
+        )
+
+        context["character"] = character
+        context["page"] = page
+        context["entries"] = page.entries
         # Check if current user is the owner to show add/edit buttons
-        context["is_owner"] = self.character.user == self.request.user
+        context["is_owner"] = character.user == self.request.user
         return context
@@ -1,14 +1,24 @@
 from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import HttpResponse
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.views.generic import UpdateView
 
 from dunbud.forms.journal import JournalEntryForm
 from dunbud.models.journal import JournalEntry
+from dunbud.models.journal_draft import JournalDraft
+from dunbud.services import discard_journal_draft, get_journal_draft
+from dunbud.views.mixins import MemoizedObjectMixin
 
 
-class JournalUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class JournalUpdateView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    UpdateView,
+):
     """
     Allows a user to edit an existing journal entry.
     """
@@ -17,6 +27,21 @@ class JournalUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     form_class = JournalEntryForm
     template_name = "journal/journal_form.html"
     pk_url_kwarg = "entry_id"
+    select_related_fields = ("character", "character__campaign")
+    query_budget = 5
+
+    @cached_property
+    def draft(self) -> JournalDraft | None:
+        # Only restored when the form is first shown
+        if self.request.method != "GET":
+            return None
+        return get_journal_draft(self.object.character_id, self.object.pk)
+
+    def get_initial(self) -> dict[str, Any]:
+        initial = super().get_initial()
+        if self.draft:
+            initial.update(title=self.draft.title, content=self.draft.content)
+        return initial
 
     def get_form_kwargs(self) -> dict[str, Any]:
         kwargs = super().get_form_kwargs()
@@ -26,11 +51,17 @@ class JournalUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["character"] = self.object.character
+        context["draft"] = self.draft
         return context
 
     def test_func(self) -> bool:
         entry = self.get_object()
-        return bool(entry.character.user == self.request.user)
+        return bool(entry.character.user_id == self.request.user.pk)
+
+    def form_valid(self, form: Any) -> HttpResponse:
+        response = super().form_valid(form)
+        discard_journal_draft(self.object.character_id, self.object.pk)
+        return response
 
     def get_success_url(self) -> str:
         return reverse(
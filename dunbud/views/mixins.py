@@ -0,0 +1,137 @@
+import logging
+from typing import Any
+
+from django.db.models import Count, Model, OuterRef, QuerySet, Subquery
+from django.shortcuts import get_object_or_404
+from django.views.generic.detail import SingleObjectMixin
+
+from dunbud.models import Campaign, JournalEntry, PartyFeedItem, Session
+from dunbud.services.revisions import get_revision_diff, list_revisions
+
+logger = logging.getLogger(__name__)
+
+CAMPAIGNS_PER_PAGE = 10
+
+
+class MemoizedObjectMixin(SingleObjectMixin):
+    """
+    Resolves the object referenced by the URL once per request.
+
+    Permission checks (``test_func``), ``get``/``post`` and
+    ``get_context_data`` all call ``get_object()``; without memoization each
+    call re-runs the lookup and every related prefetch. Views declare the
+    relations they need via ``select_related_fields`` and
+    ``prefetch_related_fields`` and they are applied to the default queryset.
+    """
+
+    select_related_fields: tuple[str, ...] = ()
+    prefetch_related_fields: tuple[str, ...] = ()
+
+    def get_queryset(self) -> QuerySet[Any]:
+        """
+        Apply the declared select_related/prefetch_related relations.
+        """
+        queryset = super().get_queryset()
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
+        return queryset
+
+    def get_object(self, queryset: QuerySet[Any] | None = None) -> Any:
+        """
+        Return the memoized object for the default queryset.
+        Lookups against an explicit queryset are never cached.
+        """
+        if queryset is not None:
+            return super().get_object(queryset)
+
+        obj: Model | None = getattr(self, "_memoized_object", None)
+        if obj is None:
+            obj = super().get_object()
+            self._memoized_object = obj
+        return obj
+
+
+class SessionLookupMixin(SingleObjectMixin):
+    """
+    Looks up a Session by the ``campaign_slug`` and ``session_number``
+    URL keyword arguments instead of a primary key.
+    """
+
+    kwargs: dict[str, Any]
+
+    def get_object(self, queryset: QuerySet[Any] | None = None) -> Any:
+        """
+        Retrieve the Session object based on campaign_slug and session_number
+        from the URL.
+        """
+        if queryset is None:
+            queryset = self.get_queryset()
+
+        return get_object_or_404(
+            queryset,
+            campaign__slug=self.kwargs.get("campaign_slug"),
+            session_number=self.kwargs.get("session_number"),
+        )
+
+
+class RevisionHistoryMixin:
+    """
+    Builds the context for a revision history page: the field's revisions
+    and the diff of the one picked with ``?revision=``, the latest by default.
+    """
+
+    request: Any
+
+    def get_revision_context(
+        self,
+        instance: JournalEntry | Session,
+        field: str,
+    ) -> dict[str, Any]:
+        revisions = list_revisions(instance, field)
+        selected = revisions[0].number if revisions else None
+        requested = self.request.GET.get("revision", "")
+        if requested.isdigit() and any(
+            revision.number == int(requested) for revision in revisions
+        ):
+            selected = int(requested)
+        return {
+            "field": field,
+            "revisions": revisions,
+            "selected": selected,
+            "diff": (
+                get_revision_diff(instance, field, selected)
+                if selected is not None
+                else None
+            ),
+        }
+
+
+class CampaignListMixin:
+    """
+    Shared queryset shaping and pagination for the campaign list pages.
+
+    The latest feed activity is computed with a correlated subquery, so a page
+    costs the same no matter how many feed items the campaigns have.
+    """
+
+    paginate_by: int | None = CAMPAIGNS_PER_PAGE
+
+    def annotate_campaigns(self, queryset: QuerySet[Campaign]) -> QuerySet[Campaign]:
+        """
+        Add the player count and latest activity timestamp to each campaign.
+        """
+        latest_activity = (
+            PartyFeedItem.objects.filter(campaign=OuterRef("pk"))
+            .order_by("-created_at")
+            .values("created_at")[:1]
+        )
+        return (
+            queryset.select_related("dungeon_master", "system")
+            .annotate(
+                player_count=Count("players"),
+                latest_activity=Subquery(latest_activity),
+            )
+            .order_by("-created_at", "pk")
+        )
@@ -0,0 +1,24 @@
+import logging
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.views.generic import TemplateView
+
+from dunbud.services import build_my_table
+
+logger = logging.getLogger(__name__)
+
+
+class MyTableView(LoginRequiredMixin, TemplateView):
+    """
+    Dashboard listing every campaign the user runs or plays in, with the next
+    session, unread feed items and the user's character for each.
+    """
+
+    template_name = "campaign/my_table.html"
+    query_budget = 4
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["entries"] = build_my_table(self.request.user)
+        return context
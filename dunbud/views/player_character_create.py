@@ -6,6 +6,7 @@ from django.http import HttpResponse
 from django.urls import reverse
 from django.views.generic import CreateView
 
+from dunbud.forms import PlayerCharacterForm
 from dunbud.models import PlayerCharacter
 
 logger = logging.getLogger(__name__)
@@ -17,8 +18,9 @@ class PlayerCharacterCreateView(LoginRequiredMixin, CreateView):
     """
 
     model = PlayerCharacter
-    fields = ["name", "race", "character_class", "level", "bio", "campaign"]
+    form_class = PlayerCharacterForm
     template_name = "character/character_form.html"
+    query_budget = 3
 
     def form_valid(self, form: BaseModelForm) -> HttpResponse:
         """
@@ -1,10 +1,12 @@
 import logging
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import QuerySet
+from django.db.models import Count, F, IntegerField, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.views.generic import ListView
 
-from dunbud.models import PlayerCharacter
+from dunbud.models import JournalEntry, PlayerCharacter, Portrait, Session
 
 logger = logging.getLogger(__name__)
 
@@ -12,16 +14,47 @@ logger = logging.getLogger(__name__)
 class PlayerCharacterListView(LoginRequiredMixin, ListView):
     """
     View to list characters belonging to the current user.
+
+    Each character carries its journal activity, campaign name, next session
+    date and whether its portrait thumbnails are ready as annotations, so the
+    page is one query however many characters the user has.
     """
 
     model = PlayerCharacter
     template_name = "character/character_list.html"
     context_object_name = "characters"
+    query_budget = 3
 
     def get_queryset(self) -> QuerySet[PlayerCharacter]:
         """
-        Returns characters owned by the logged-in user.
+        Returns characters owned by the logged-in user, annotated with
+        ``journal_count``, ``last_entry_at``, ``campaign_name``,
+        ``portrait_ready`` and ``next_session_date``.
         """
         if not self.request.user.is_authenticated:
             return PlayerCharacter.objects.none()
-        return PlayerCharacter.objects.filter(user=self.request.user)
+
+        entries = JournalEntry.objects.filter(character=OuterRef("pk"))
+        entry_count = (
+            entries.order_by()
+            .values("character")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        upcoming = Session.objects.filter(
+            campaign=OuterRef("campaign_id"),
+            proposed_date__gte=timezone.now(),
+        ).order_by("proposed_date")
+
+        return PlayerCharacter.objects.filter(user=self.request.user).annotate(
+            journal_count=Coalesce(
+                Subquery(entry_count, output_field=IntegerField()),
+                0,
+            ),
+            last_entry_at=Subquery(
+                entries.order_by("-created_at").values("created_at")[:1],
+            ),
+            campaign_name=F("campaign__name"),
+            portrait_ready=Q(portrait__status=Portrait.Status.READY),
+            next_session_date=Subquery(upcoming.values("proposed_date")[:1]),
+        )
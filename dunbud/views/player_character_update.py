@@ -4,34 +4,34 @@ from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.urls import reverse
 from django.views.generic import UpdateView
 
+from dunbud.forms import PlayerCharacterForm
 from dunbud.models import PlayerCharacter
+from dunbud.views.mixins import MemoizedObjectMixin
 
 logger = logging.getLogger(__name__)
 
 
-class PlayerCharacterUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class PlayerCharacterUpdateView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    UpdateView,
+):
     """
     View to update an existing character.
     """
 
     model = PlayerCharacter
-    fields = [
-        "name",
-        "race",
-        "character_class",
-        "level",
-        "bio",
-        "campaign",
-        "character_sheet_link",
-    ]
+    form_class = PlayerCharacterForm
     template_name = "character/character_form.html"
+    query_budget = 4
 
     def test_func(self) -> bool:
         """
         Only the owner can edit the character.
         """
         character = self.get_object()
-        return bool(character.user == self.request.user)
+        return bool(character.user_id == self.request.user.pk)
 
     def get_success_url(self) -> str:
         return reverse("character_detail", kwargs={"pk": self.object.pk})
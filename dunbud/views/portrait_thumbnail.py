@@ -0,0 +1,56 @@
+import logging
+import re
+from typing import Any
+
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpRequest
+from django.utils.cache import patch_cache_control
+from django.views.generic import View
+
+from dunbud.imaging import THUMBNAIL_FORMATS, THUMBNAIL_SIZES, thumbnail_filename
+
+logger = logging.getLogger(__name__)
+
+DIGEST_RE = re.compile(r"[0-9a-f]{64}")
+CONTENT_TYPES = {"webp": "image/webp", "jpg": "image/jpeg"}
+# Thumbnail URLs are content-addressed, so a response never goes stale.
+THUMBNAIL_MAX_AGE = 60 * 60 * 24 * 365
+
+
+class PortraitThumbnailView(View):
+    """
+    Serves portrait thumbnails straight from storage, without touching the
+    database. Portraits are addressed by digest and are not private.
+    """
+
+    query_budget = 0
+
+    def get(
+        self,
+        request: HttpRequest,
+        digest: str,
+        size: str,
+        extension: str,
+        **kwargs: Any,
+    ) -> FileResponse:
+        if (
+            not DIGEST_RE.fullmatch(digest)
+            or size not in THUMBNAIL_SIZES
+            or extension not in THUMBNAIL_FORMATS
+        ):
+            raise Http404("Unknown thumbnail.")
+
+        name = f"portraits/{digest[:2]}/{thumbnail_filename(digest, size, extension)}"
+        try:
+            file = default_storage.open(name)
+        except FileNotFoundError:
+            raise Http404("Thumbnail not rendered yet.") from None
+
+        response = FileResponse(file, content_type=CONTENT_TYPES[extension])
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=THUMBNAIL_MAX_AGE,
+            immutable=True,
+        )
+        return response
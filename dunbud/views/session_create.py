@@ -8,6 +8,7 @@ from django.views.generic import CreateView
 
 from dunbud.forms import SessionCreateForm
 from dunbud.models import Campaign, Session
+from dunbud.services import is_campaign_member
 
 
 class SessionCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
@@ -16,6 +17,7 @@ class SessionCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
     model = Session
     form_class = SessionCreateForm
     template_name = "session/session_form.html"
+    query_budget = 5
 
     def dispatch(self, request: Any, *args: Any, **kwargs: Any) -> HttpResponseBase:
         """Fetch the campaign and store it as an instance attribute."""
@@ -52,9 +54,4 @@ class SessionCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         return context
 
     def test_func(self) -> bool:
-        user = self.request.user
-        if not user.is_authenticated:
-            return False
-        return (
-            self.campaign.dungeon_master == user or user in self.campaign.players.all()
-        )
+        return is_campaign_member(self.request.user, self.campaign)
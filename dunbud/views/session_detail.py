@@ -2,20 +2,27 @@ import logging
 from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse
-from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.views.generic import DetailView
 from django.views.generic.edit import FormMixin
 
 from dunbud.forms import ChatMessageForm
-from dunbud.models import Session
+from dunbud.models import Session, SessionRecording
+from dunbud.services import get_party_roster, is_campaign_member
+from dunbud.views.mixins import MemoizedObjectMixin, SessionLookupMixin
 
 logger = logging.getLogger(__name__)
 
 
-class SessionDetailView(LoginRequiredMixin, UserPassesTestMixin, FormMixin, DetailView):
+class SessionDetailView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    SessionLookupMixin,
+    FormMixin,
+    DetailView,
+):
     """
     View to display session details using Campaign ID and Session Number lookup.
     """
@@ -24,35 +31,15 @@ class SessionDetailView(LoginRequiredMixin, UserPassesTestMixin, FormMixin, Deta
     template_name = "session/session_detail.html"
     context_object_name = "session_obj"
     form_class = ChatMessageForm
+    select_related_fields = ("campaign", "campaign__dungeon_master")
+    query_budget = 8
 
     def test_func(self) -> bool:
         """
         Ensure only the DM or campaign players can view the session.
         """
         session = self.get_object()
-        user = self.request.user
-        if session.campaign.dungeon_master == user:
-            return True
-        if user.pk is None:  # pragma: no cover - redundant for type checking
-            return False
-        return session.campaign.players.filter(pk=user.pk).exists()
-
-    def get_object(self, queryset: Any = None) -> Session | Any:
-        """
-        Retrieve the Session object based on campaign_slug and session_number
-        from the URL.
-        """
-        if queryset is None:
-            queryset = self.get_queryset()
-
-        campaign_slug = self.kwargs.get("campaign_slug")
-        session_number = self.kwargs.get("session_number")
-
-        return get_object_or_404(
-            queryset,
-            campaign__slug=campaign_slug,
-            session_number=session_number,
-        )
+        return is_campaign_member(self.request.user, session.campaign_id)
 
     def get_success_url(self) -> str:
         """
@@ -78,18 +65,11 @@ class SessionDetailView(LoginRequiredMixin, UserPassesTestMixin, FormMixin, Deta
         # Add campaign to context for shared templates
         context["campaign"] = session.campaign
 
-        # Map user_id to their character in this campaign
-        character_map = {
-            char.user_id: char for char in session.campaign.player_characters.all()
-        }
+        context["roster"] = get_party_roster(session.campaign)
 
-        # Annotate players with their character for this campaign
-        players_with_data = []
-        for player in session.campaign.players.all():
-            player.campaign_character = character_map.get(player.pk)  # type: ignore[attr-defined]
-            players_with_data.append(player)
-
-        context["players_with_data"] = players_with_data
+        context["recordings"] = session.recordings.filter(
+            status=SessionRecording.Status.READY,
+        ).only("session", "filename", "content_type", "size")
 
         # Add chat history
         context["chat_messages"] = session.chat_messages.select_related("user").all()
@@ -130,17 +110,3 @@ class SessionDetailView(LoginRequiredMixin, UserPassesTestMixin, FormMixin, Deta
             self.object.id,
         )
         return super().form_valid(form)
-
-    def get_queryset(self) -> QuerySet[Session]:
-        """
-        Optimize database queries by pre-fetching related objects.
-        """
-        return (
-            super()
-            .get_queryset()
-            .select_related("campaign")
-            .prefetch_related(
-                "campaign__players",
-                "campaign__player_characters",
-            )
-        )
@@ -0,0 +1,60 @@
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import Http404
+from django.urls import reverse
+from django.views.generic import DetailView
+
+from dunbud.models import Session, TextRevision
+from dunbud.services import is_campaign_member
+from dunbud.views.mixins import (
+    MemoizedObjectMixin,
+    RevisionHistoryMixin,
+    SessionLookupMixin,
+)
+
+
+class SessionHistoryView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    SessionLookupMixin,
+    RevisionHistoryMixin,
+    DetailView,
+):
+    """
+    Revision history of a session's notes or recap, picked with ``?field=``.
+    Any campaign member can read it.
+    """
+
+    model = Session
+    template_name = "revisions/history.html"
+    context_object_name = "session_obj"
+    select_related_fields = ("campaign",)
+    query_budget = 7
+
+    def test_func(self) -> bool:
+        session = self.get_object()
+        return is_campaign_member(self.request.user, session.campaign_id)
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        field = self.request.GET.get("field", TextRevision.Field.RECAP)
+        if field not in (TextRevision.Field.NOTES, TextRevision.Field.RECAP):
+            raise Http404("Unknown field")
+
+        session: Session = self.object
+        context["title"] = f"Session {session.session_number}"
+        context["back_url"] = reverse(
+            "session_detail",
+            kwargs={
+                "campaign_slug": session.campaign.slug,
+                "session_number": session.session_number,
+            },
+        )
+        context["field_choices"] = [
+            TextRevision.Field.NOTES,
+            TextRevision.Field.RECAP,
+        ]
+        context.update(self.get_revision_context(session, field))
+        return context
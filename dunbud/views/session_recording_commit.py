@@ -0,0 +1,35 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.generic import View
+
+from dunbud.models import SessionRecording
+from dunbud.services import RecordingOffsetError, commit_recording_upload
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRecordingCommitView(LoginRequiredMixin, View):
+    """
+    Finishes a recording upload once every part has been acknowledged.
+    """
+
+    query_budget = 7
+
+    def post(self, request: HttpRequest, pk: UUID, **kwargs: Any) -> HttpResponse:
+        recording = get_object_or_404(
+            SessionRecording,
+            pk=pk,
+            session__campaign__dungeon_master=request.user.pk,
+        )
+        try:
+            recording = commit_recording_upload(recording.pk)
+        except RecordingOffsetError as e:
+            return JsonResponse({"error": str(e), "offset": e.offset}, status=409)
+
+        logger.info("User %s committed recording %s", request.user.pk, pk)
+        return JsonResponse({"url": recording.get_absolute_url()})
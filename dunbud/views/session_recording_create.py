@@ -0,0 +1,69 @@
+import logging
+from typing import Any
+
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.functional import cached_property
+from django.views.generic import View
+
+from dunbud.forms import SessionRecordingForm
+from dunbud.models import Session
+from dunbud.services import start_recording_upload
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRecordingCreateView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    Starts a resumable recording upload for a session. Responds with the URLs
+    the parts and the final commit are sent to.
+    """
+
+    query_budget = 4
+
+    @cached_property
+    def session(self) -> Session:
+        return get_object_or_404(
+            Session.objects.select_related("campaign"),
+            campaign__slug=self.kwargs["campaign_slug"],
+            session_number=self.kwargs["session_number"],
+        )
+
+    def test_func(self) -> bool:
+        # Only the Dungeon Master uploads recordings
+        return bool(self.session.campaign.dungeon_master_id == self.request.user.pk)
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        form = SessionRecordingForm(request.POST)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        recording = start_recording_upload(
+            self.session,
+            request.user,
+            **form.cleaned_data,
+        )
+        logger.info(
+            "User %s started recording upload %s for Session %s",
+            request.user.pk,
+            recording.pk,
+            self.session.pk,
+        )
+        return JsonResponse(
+            {
+                "id": str(recording.pk),
+                "chunk_size": recording.chunk_size,
+                "offset": recording.received,
+                "upload_url": reverse(
+                    "session_recording_upload",
+                    kwargs={"pk": recording.pk},
+                ),
+                "commit_url": reverse(
+                    "session_recording_commit",
+                    kwargs={"pk": recording.pk},
+                ),
+            },
+            status=201,
+        )
@@ -0,0 +1,49 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, HttpResponseBase
+from django.shortcuts import get_object_or_404
+from django.views.generic import View
+
+from dunbud.models import SessionRecording
+from dunbud.services import is_campaign_member, serve_file
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRecordingDownloadView(LoginRequiredMixin, View):
+    """
+    Streams a session recording to a campaign member. ``Range`` support lets
+    players seek in the audio and video players and resume downloads.
+    """
+
+    query_budget = 5
+
+    def get(self, request: HttpRequest, pk: UUID, **kwargs: Any) -> HttpResponseBase:
+        recording = get_object_or_404(
+            SessionRecording.objects.select_related("session"),
+            pk=pk,
+            status=SessionRecording.Status.READY,
+        )
+        if not is_campaign_member(request.user, recording.session.campaign_id):
+            raise PermissionDenied
+
+        try:
+            file = recording.file.open("rb")
+        except FileNotFoundError:
+            logger.error("Recording %s is missing its file", recording.pk)
+            raise Http404("Recording file is missing.") from None
+
+        return serve_file(
+            request,
+            file,
+            size=recording.size,
+            etag=recording.etag,
+            last_modified=recording.updated_at,
+            content_type=recording.content_type,
+            filename=recording.filename,
+            as_attachment=False,
+        )
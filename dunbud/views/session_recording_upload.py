@@ -0,0 +1,82 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.generic import View
+
+from dunbud.models import SessionRecording
+from dunbud.services import (
+    RecordingOffsetError,
+    RecordingUploadError,
+    abort_recording_upload,
+    append_recording_chunk,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRecordingUploadView(LoginRequiredMixin, View):
+    """
+    The parts of a resumable recording upload.
+
+    ``GET`` reports the acknowledged offset, ``PUT`` appends the part in the
+    request body at the ``Upload-Offset`` header, checked against the SHA-256
+    hex digest in ``Upload-Checksum``, and ``DELETE`` abandons the upload.
+    A part for any other offset is answered with 409 and the offset to
+    resume from.
+    """
+
+    query_budget = 5
+
+    def get_recording(self, pk: UUID) -> SessionRecording:
+        # Only the Dungeon Master who can see the upload may continue it
+        return get_object_or_404(
+            SessionRecording,
+            pk=pk,
+            status=SessionRecording.Status.UPLOADING,
+            session__campaign__dungeon_master=self.request.user.pk,
+        )
+
+    def get(self, request: HttpRequest, pk: UUID, **kwargs: Any) -> HttpResponse:
+        recording = self.get_recording(pk)
+        return JsonResponse(
+            {
+                "offset": recording.received,
+                "size": recording.size,
+                "chunk_size": recording.chunk_size,
+            },
+        )
+
+    def put(self, request: HttpRequest, pk: UUID, **kwargs: Any) -> HttpResponse:
+        recording = self.get_recording(pk)
+        try:
+            offset = int(request.headers.get("Upload-Offset", ""))
+            length = int(request.headers.get("Content-Length", ""))
+        except ValueError:
+            return JsonResponse(
+                {"error": "Upload-Offset and Content-Length are required."},
+                status=400,
+            )
+
+        try:
+            received = append_recording_chunk(
+                recording.pk,
+                offset,
+                request,
+                length,
+                request.headers.get("Upload-Checksum", ""),
+            )
+        except RecordingOffsetError as e:
+            return JsonResponse({"error": str(e), "offset": e.offset}, status=409)
+        except RecordingUploadError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        return JsonResponse({"offset": received})
+
+    def delete(self, request: HttpRequest, pk: UUID, **kwargs: Any) -> HttpResponse:
+        recording = self.get_recording(pk)
+        abort_recording_upload(recording)
+        logger.info("User %s aborted recording upload %s", request.user.pk, pk)
+        return HttpResponse(status=204)
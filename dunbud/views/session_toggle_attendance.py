@@ -11,6 +11,8 @@ from dunbud.models import Session
 class SessionToggleAttendanceView(LoginRequiredMixin, View):
     """View for toggling a user's attendance for a session."""
 
+    query_budget = 9
+
     def post(
         self,
         request: HttpRequest,
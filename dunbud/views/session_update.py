@@ -1,19 +1,25 @@
 import logging
-from typing import Any
 
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.http import HttpResponse
-from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.views.generic import UpdateView
 
 from dunbud.forms import SessionUpdateForm
 from dunbud.models import Session
+from dunbud.services import is_dungeon_master
+from dunbud.views.mixins import MemoizedObjectMixin, SessionLookupMixin
 
 logger = logging.getLogger(__name__)
 
 
-class SessionUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class SessionUpdateView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    MemoizedObjectMixin,
+    SessionLookupMixin,
+    UpdateView,
+):
     """
     View for DMs to update session details, including notes.
     """
@@ -22,31 +28,15 @@ class SessionUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     form_class = SessionUpdateForm
     template_name = "session/session_update.html"
     context_object_name = "session_obj"
-
-    def get_object(self, queryset: Any = None) -> Session | Any:
-        """
-        Retrieve the Session object based on campaign_slug and session_number
-        from the URL.
-        """
-        if queryset is None:
-            queryset = self.get_queryset()
-
-        campaign_slug = self.kwargs.get("campaign_slug")
-        session_number = self.kwargs.get("session_number")
-
-        return get_object_or_404(
-            queryset,
-            campaign__slug=campaign_slug,
-            session_number=session_number,
-        )
+    select_related_fields = ("campaign",)
+    query_budget = 5
 
     def test_func(self) -> bool:
         """
         Ensure only the DM can update the session.
         """
         session = self.get_object()
-        user = self.request.user
-        return session.campaign.dungeon_master == user
+        return is_dungeon_master(self.request.user, session.campaign_id)
 
     def get_success_url(self) -> str:
         """
@@ -3,3 +3,4 @@ from django.views.generic import TemplateView
 
 class SplashView(TemplateView):
     template_name = "splash.html"
+    query_budget = 2
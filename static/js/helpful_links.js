@@ -85,3 +85,54 @@ document.addEventListener('DOMContentLoaded', function() {
       }
     });
   });
+
+document.addEventListener('DOMContentLoaded', function() {
+    // Import Links
+    const importForm = document.getElementById('import-links-form');
+    if (importForm) {
+      importForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        const formData = new FormData(importForm);
+        const errorDiv = document.getElementById('import-links-errors');
+
+        fetch(importForm.action, {
+            method: 'POST',
+            body: new URLSearchParams(formData),
+            headers: {
+              'X-CSRFToken': formData.get('csrfmiddlewaretoken'),
+              'Content-Type': 'application/x-www-form-urlencoded',
+              'X-Requested-With': 'XMLHttpRequest'
+            },
+          })
+          .then(response => response.json())
+          .then(data => {
+            if (data.links) {
+              const list = document.getElementById('helpful-links-list');
+              for (const link of data.links) {
+                list.insertAdjacentHTML('beforeend', `
+                        <li id="link-${link.pk}" class="list-group-item d-flex justify-content-between align-items-center">
+                            <a href="${link.url}" target="_blank">${link.name}</a>
+                            <button class="btn btn-sm btn-outline-danger delete-link-btn" data-link-pk="${link.pk}">
+                                <i class="fas fa-trash"></i>
+                            </button>
+                        </li>`);
+              }
+              importForm.reset();
+              errorDiv.classList.add('hidden');
+              const noLinksMessage = document.getElementById('no-links-message');
+              if (noLinksMessage) {
+                noLinksMessage.classList.add('hidden');
+              }
+            } else if (data.errors) {
+              let errorMessages = '';
+              for (const field in data.errors) {
+                errorMessages += `<p>${data.errors[field].join('<br>')}</p>`;
+              }
+              errorDiv.innerHTML = errorMessages;
+              errorDiv.classList.remove('hidden');
+            }
+          })
+          .catch(error => console.error('Error importing links:', error));
+      });
+    }
+  });
@@ -0,0 +1,65 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const form = document.getElementById('invite-email-form');
+    if (!form) {
+      return;
+    }
+    const errorDiv = document.getElementById('invite-email-errors');
+    const statusList = document.getElementById('invite-email-status');
+
+    function renderRecipients(recipients) {
+      statusList.innerHTML = '';
+      for (const recipient of recipients) {
+        const item = document.createElement('li');
+        item.className = 'list-group-item d-flex justify-content-between px-0';
+        const email = document.createElement('span');
+        email.textContent = recipient.recipient;
+        const status = document.createElement('span');
+        status.textContent = recipient.delivery_status;
+        if (recipient.delivery_error) {
+          status.title = recipient.delivery_error;
+        }
+        item.append(email, status);
+        statusList.appendChild(item);
+      }
+    }
+
+    function pollStatus(url) {
+      fetch(url, { headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+        .then(response => response.json())
+        .then(data => {
+          renderRecipients(data.recipients);
+          if (!data.done) {
+            setTimeout(() => pollStatus(url), 2000);
+          }
+        })
+        .catch(error => console.error('Error checking invitations:', error));
+    }
+
+    form.addEventListener('submit', function(e) {
+      e.preventDefault();
+      const formData = new FormData(form);
+
+      fetch(form.action, {
+          method: 'POST',
+          body: new URLSearchParams(formData),
+          headers: {
+            'X-CSRFToken': formData.get('csrfmiddlewaretoken'),
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'X-Requested-With': 'XMLHttpRequest'
+          },
+        })
+        .then(response => response.json())
+        .then(data => {
+          if (data.status_url) {
+            errorDiv.classList.add('hidden');
+            form.reset();
+            renderRecipients(data.recipients);
+            pollStatus(data.status_url);
+          } else if (data.errors) {
+            errorDiv.textContent = Object.values(data.errors).flat().join(' ');
+            errorDiv.classList.remove('hidden');
+          }
+        })
+        .catch(error => console.error('Error sending invitations:', error));
+    });
+  });
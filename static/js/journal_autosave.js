@@ -0,0 +1,73 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const DEBOUNCE_MS = 1500;
+    const form = document.getElementById('journal-form');
+    if (!form) {
+      return;
+    }
+    const status = document.getElementById('journal-draft-status');
+    const fields = ['title', 'content']
+      .map(name => form.elements.namedItem(name))
+      .filter(Boolean);
+    // Only fields edited since the last autosave are sent.
+    const dirty = new Set();
+    let timer = null;
+    let submitting = false;
+
+    function buildPatch() {
+      const patch = new FormData();
+      patch.append('csrfmiddlewaretoken', form.elements.namedItem('csrfmiddlewaretoken').value);
+      if (form.dataset.entry) {
+        patch.append('entry', form.dataset.entry);
+      }
+      for (const field of fields) {
+        if (dirty.has(field.name)) {
+          patch.append(field.name, field.value);
+        }
+      }
+      dirty.clear();
+      return patch;
+    }
+
+    function saveDraft() {
+      clearTimeout(timer);
+      if (!dirty.size || submitting) {
+        return;
+      }
+      fetch(form.dataset.draftUrl, {
+          method: 'POST',
+          body: buildPatch(),
+          headers: { 'X-Requested-With': 'XMLHttpRequest' },
+        })
+        .then(response => {
+          if (!response.ok) {
+            throw new Error(`Autosave failed with ${response.status}`);
+          }
+          status.textContent = `Draft saved at ${new Date().toLocaleTimeString()}`;
+        })
+        .catch(error => {
+          status.textContent = 'Draft not saved';
+          console.error('Error saving draft:', error);
+        });
+    }
+
+    for (const field of fields) {
+      field.addEventListener('input', function() {
+        dirty.add(field.name);
+        clearTimeout(timer);
+        timer = setTimeout(saveDraft, DEBOUNCE_MS);
+      });
+    }
+
+    form.addEventListener('submit', function() {
+      submitting = true;
+      clearTimeout(timer);
+    });
+
+    // Flush pending edits when the page is hidden or closed.
+    document.addEventListener('visibilitychange', function() {
+      if (document.visibilityState === 'hidden' && dirty.size && !submitting) {
+        clearTimeout(timer);
+        navigator.sendBeacon(form.dataset.draftUrl, buildPatch());
+      }
+    });
+  });
@@ -0,0 +1,108 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const form = document.getElementById('recording-upload-form');
+    if (!form) {
+      return;
+    }
+    const input = form.elements.namedItem('recording');
+    const progress = document.getElementById('recording-upload-progress');
+    const status = document.getElementById('recording-upload-status');
+    const csrfToken = form.elements.namedItem('csrfmiddlewaretoken').value;
+    const MAX_ATTEMPTS = 5;
+
+    // Uploads are remembered per file, so picking the same file again after
+    // an interruption resumes it.
+    function storageKey(file) {
+      return `dunbud:recording:${form.dataset.createUrl}:${file.name}:${file.size}:${file.lastModified}`;
+    }
+
+    async function request(url, options = {}) {
+      const response = await fetch(url, {
+        ...options,
+        headers: { 'X-CSRFToken': csrfToken, ...(options.headers || {}) },
+      });
+      const data = response.status === 204 ? {} : await response.json();
+      return { response, data };
+    }
+
+    async function startOrResume(file) {
+      const saved = JSON.parse(localStorage.getItem(storageKey(file)) || 'null');
+      if (saved) {
+        const { response, data } = await request(saved.upload_url);
+        if (response.ok) {
+          return { ...saved, offset: data.offset };
+        }
+        localStorage.removeItem(storageKey(file));
+      }
+      const body = new FormData();
+      body.append('filename', file.name);
+      body.append('content_type', file.type);
+      body.append('size', file.size);
+      const { response, data } = await request(form.dataset.createUrl, { method: 'POST', body });
+      if (!response.ok) {
+        throw new Error(Object.values(data.errors || {}).flat().join(' ') || 'Upload refused');
+      }
+      localStorage.setItem(storageKey(file), JSON.stringify(data));
+      return data;
+    }
+
+    async function sha256(buffer) {
+      const digest = await crypto.subtle.digest('SHA-256', buffer);
+      return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+    }
+
+    async function upload(file) {
+      const upload = await startOrResume(file);
+      let offset = upload.offset;
+      let attempts = 0;
+      while (offset < file.size) {
+        progress.value = (100 * offset) / file.size;
+        const part = await file.slice(offset, offset + upload.chunk_size).arrayBuffer();
+        try {
+          const { response, data } = await request(upload.upload_url, {
+            method: 'PUT',
+            body: part,
+            headers: {
+              'Content-Type': 'application/octet-stream',
+              'Upload-Offset': offset,
+              'Upload-Checksum': await sha256(part),
+            },
+          });
+          if (response.ok || response.status === 409) {
+            offset = data.offset;
+            attempts = 0;
+            continue;
+          }
+          throw new Error(data.error || `Upload failed with ${response.status}`);
+        } catch (error) {
+          attempts += 1;
+          if (attempts >= MAX_ATTEMPTS) {
+            throw error;
+          }
+          await new Promise(resolve => setTimeout(resolve, 1000 * 2 ** attempts));
+        }
+      }
+      const { response, data } = await request(upload.commit_url, { method: 'POST' });
+      if (!response.ok) {
+        throw new Error(data.error || 'Could not finish the upload');
+      }
+      localStorage.removeItem(storageKey(file));
+    }
+
+    form.addEventListener('submit', function(event) {
+      event.preventDefault();
+      const file = input.files[0];
+      if (!file) {
+        return;
+      }
+      form.querySelector('button').disabled = true;
+      progress.hidden = false;
+      status.textContent = 'Uploading…';
+      upload(file)
+        .then(() => window.location.reload())
+        .catch(error => {
+          status.textContent = `${error.message}. Choose the file again to resume.`;
+          form.querySelector('button').disabled = false;
+          console.error('Error uploading recording:', error);
+        });
+    });
+  });
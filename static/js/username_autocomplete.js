@@ -0,0 +1,73 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const DEBOUNCE_MS = 250;
+    const MIN_PREFIX_LENGTH = 3;
+
+    for (const input of document.querySelectorAll('input[data-autocomplete-url]')) {
+      const options = document.getElementById(input.getAttribute('list'));
+      const target = document.getElementById(input.dataset.target);
+      // Suggestions already fetched on this page, keyed by lowercased prefix.
+      const seen = new Map();
+      let timer = null;
+      let controller = null;
+
+      function render(results) {
+        options.innerHTML = '';
+        for (const result of results) {
+          const option = document.createElement('option');
+          option.value = result.username;
+          options.appendChild(option);
+        }
+      }
+
+      function fetchSuggestions(prefix) {
+        if (seen.has(prefix)) {
+          render(seen.get(prefix));
+          return;
+        }
+        if (controller) {
+          controller.abort();
+        }
+        controller = new AbortController();
+        const url = `${input.dataset.autocompleteUrl}?q=${encodeURIComponent(prefix)}`;
+        fetch(url, {
+            headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            signal: controller.signal,
+          })
+          .then(response => response.json())
+          .then(data => {
+            seen.set(prefix, data.results);
+            render(data.results);
+          })
+          .catch(error => {
+            if (error.name !== 'AbortError') {
+              console.error('Error fetching usernames:', error);
+            }
+          });
+      }
+
+      function addRecipient(username) {
+        const recipient = `@${username}`;
+        const current = target.value.trim();
+        if (!current.split(/[\s,;]+/).includes(recipient)) {
+          target.value = current ? `${current}\n${recipient}` : recipient;
+        }
+        input.value = '';
+        render([]);
+      }
+
+      input.addEventListener('input', function() {
+        const value = input.value.trim();
+        if (Array.from(options.options).some(option => option.value === value)) {
+          addRecipient(value);
+          return;
+        }
+        clearTimeout(timer);
+        const prefix = value.toLowerCase();
+        if (prefix.length < MIN_PREFIX_LENGTH) {
+          render([]);
+          return;
+        }
+        timer = setTimeout(() => fetchSuggestions(prefix), DEBOUNCE_MS);
+      });
+    }
+  });
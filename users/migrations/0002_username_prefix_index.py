@@ -0,0 +1,42 @@
+# Generated by Django 6.0.2 on 2026-10-19 12:00
+
+from django.db import migrations
+
+INDEX_NAME = 'users_username_prefix_idx'
+
+# Indexes that let a case-insensitive ``username__istartswith`` lookup run as
+# an index range scan. Django emits ``UPPER(username) LIKE UPPER(...)`` on
+# PostgreSQL and ``username LIKE ...`` on SQLite, whose LIKE is already
+# case-insensitive but only uses an index built with NOCASE collation.
+CREATE_INDEX_SQL = {
+    'postgresql': (
+        f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} '
+        'ON users_customuser (UPPER(username) text_pattern_ops)'
+    ),
+    'sqlite': (
+        f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} '
+        'ON users_customuser (username COLLATE NOCASE)'
+    ),
+}
+
+
+def create_prefix_index(apps, schema_editor):
+    sql = CREATE_INDEX_SQL.get(schema_editor.connection.vendor)
+    if sql:
+        schema_editor.execute(sql)
+
+
+def drop_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor in CREATE_INDEX_SQL:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_index, drop_prefix_index),
+    ]
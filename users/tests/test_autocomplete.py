@@ -0,0 +1,116 @@
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from config.tests.factories import (
+    CampaignFactory,
+    TabletopSystemFactory,
+    UserFactory,
+)
+from users.models import CustomUser
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class UsernameAutocompleteTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user, _ = UserFactory.create(username="dungeonmaster")
+        self.player, _ = UserFactory.create(username="player")
+        for name in ("Gandalf", "ganondorf", "gimli", "legolas"):
+            UserFactory.create(username=name)
+        UserFactory.create(username="gantz", is_active=False)
+        self.campaign = CampaignFactory.create(
+            dungeon_master=self.user,
+            system=TabletopSystemFactory.create(),
+            players=[self.player],
+        )
+        self.url = reverse("username_autocomplete", args=[self.campaign.slug])
+        self.client.force_login(self.user)
+
+    def _search(self, prefix: str) -> list[str]:
+        response = self.client.get(self.url, {"q": prefix})
+        self.assertEqual(response.status_code, 200)
+        return [result["username"] for result in response.json()["results"]]
+
+    def _searches_users(self, queries: CaptureQueriesContext) -> bool:
+        return any(
+            "users_customuser" in q["sql"] and "LIKE" in q["sql"]
+            for q in queries.captured_queries
+        )
+
+    def test_requires_login(self) -> None:
+        """Test that anonymous users are redirected to the login page."""
+        self.client.logout()
+        response = self.client.get(self.url, {"q": "gan"})
+        self.assertEqual(response.status_code, 302)
+
+    def test_only_the_campaign_dm_may_search(self) -> None:
+        """Test that players, outsiders and unknown campaigns get no suggestions."""
+        outsider, _ = UserFactory.create()
+        for user in (self.player, outsider):
+            with self.subTest(user=user.username):
+                self.client.force_login(user)
+                with CaptureQueriesContext(connection) as ctx:
+                    response = self.client.get(self.url, {"q": "gan"})
+                self.assertEqual(response.status_code, 403)
+                self.assertFalse(self._searches_users(ctx))
+
+        self.client.force_login(self.user)
+        response = self.client.get(
+            reverse("username_autocomplete", args=["no-such-campaign"]),
+            {"q": "gan"},
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_prefix_match_ignores_case(self) -> None:
+        """Test that active users are matched by prefix regardless of case."""
+        self.assertCountEqual(self._search("GAN"), ["ganondorf", "Gandalf"])
+        self.assertEqual(self._search("gim"), ["gimli"])
+
+    def test_short_or_invalid_prefixes_return_nothing(self) -> None:
+        """Test that prefixes which cannot match skip the database."""
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self._search("ga"), [])
+            self.assertEqual(self._search("g a"), [])
+            self.assertEqual(self._search("ga%"), [])
+        self.assertFalse(self._searches_users(ctx))
+
+    def test_results_are_limited(self) -> None:
+        """Test that at most ten suggestions are returned."""
+        for i in range(12):
+            UserFactory.create(username=f"orc{i:02d}")
+        self.assertEqual(len(self._search("orc")), 10)
+
+    def test_results_are_cached_per_prefix(self) -> None:
+        """Test that a repeated prefix is served from the cache."""
+        self._search("gan")
+        CustomUser.objects.create_user(username="gangly")
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertCountEqual(self._search("Gan"), ["ganondorf", "Gandalf"])
+        self.assertFalse(self._searches_users(ctx))
+        self.assertIn("gangly", self._search("gang"))
+
+    def test_response_is_privately_cacheable(self) -> None:
+        """Test that browsers may briefly reuse suggestions."""
+        response = self.client.get(self.url, {"q": "gan"})
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("max-age=60", response["Cache-Control"])
+
+    @skipUnless(connection.vendor == "sqlite", "Checks the SQLite query plan.")
+    def test_lookup_uses_prefix_index(self) -> None:
+        """Test that the prefix lookup is an index range scan."""
+        queryset = CustomUser.objects.filter(username__istartswith="gan")
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn("users_username_prefix_idx", plan)
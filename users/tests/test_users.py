@@ -6,6 +6,7 @@ from django.test import TestCase
 from django.urls import reverse
 
 from config.tests.factories import UserFactory
+from dunbud.services import send_outbox
 
 
 class CustomUserModelTests(TestCase):
@@ -104,7 +105,7 @@ class SignUpViewTests(TestCase):
         self.assertTrue(User.objects.filter(username="new_signup_user").exists())
 
     def test_signup_sends_email(self) -> None:
-        """Test that a confirmation email is sent upon successful signup."""
+        """Test that a confirmation email is queued and sent by the worker."""
         url = reverse("signup")
         data = {
             "username": "email_user",
@@ -116,6 +117,8 @@ class SignUpViewTests(TestCase):
         response = self.client.post(url, data)
 
         self.assertRedirects(response, reverse("login"))
+        self.assertEqual(mail.outbox, [])
+        send_outbox()
 
         # Verify email
         self.assertEqual(len(mail.outbox), 1)
@@ -1,11 +1,16 @@
 from django.contrib.auth import urls as auth_urls
 from django.urls import include, path
 
-from users.views import SignUpView
+from users.views import SignUpView, UsernameAutocompleteView
 from users.views.profiles import UserDetailView, UserUpdateView
 
 urlpatterns = [
     path("signup/", SignUpView.as_view(), name="signup"),
+    path(
+        "autocomplete/<slug:slug>/",
+        UsernameAutocompleteView.as_view(),
+        name="username_autocomplete",
+    ),
     path("profile/edit/", UserUpdateView.as_view(), name="profile_edit"),
     path("", include(auth_urls)),
     path("<str:username>/", UserDetailView.as_view(), name="user_detail"),
@@ -1,4 +1,10 @@
+from .autocomplete import UsernameAutocompleteView
 from .profiles import UserDetailView, UserUpdateView
 from .signup import SignUpView
 
-__all__ = ["SignUpView", "UserDetailView", "UserUpdateView"]
+__all__ = [
+    "SignUpView",
+    "UserDetailView",
+    "UserUpdateView",
+    "UsernameAutocompleteView",
+]
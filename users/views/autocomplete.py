@@ -0,0 +1,71 @@
+import hashlib
+import re
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.core.cache import cache
+from django.http import HttpRequest, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control
+from django.views.generic import View
+
+from dunbud.models import Campaign
+from dunbud.services import is_dungeon_master
+
+User = get_user_model()
+
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_TIMEOUT = 60
+MIN_PREFIX_LENGTH = 3
+MAX_PREFIX_LENGTH = 150
+# Characters allowed in usernames; other prefixes cannot match anyone.
+USERNAME_PREFIX_RE = re.compile(r"^[\w.@+-]+\Z")
+
+
+def search_usernames(prefix: str) -> list[str]:
+    """
+    Return up to ``AUTOCOMPLETE_LIMIT`` active usernames starting with
+    ``prefix``, ignoring case.
+
+    The lookup is served by the ``users_username_prefix_idx`` index, and
+    results are cached per prefix for ``AUTOCOMPLETE_TIMEOUT`` seconds.
+    """
+    prefix = prefix.strip().lower()
+    if len(prefix) < MIN_PREFIX_LENGTH or len(prefix) > MAX_PREFIX_LENGTH:
+        return []
+    if not USERNAME_PREFIX_RE.match(prefix):
+        return []
+
+    digest = hashlib.md5(prefix.encode(), usedforsecurity=False).hexdigest()
+    key = f"users:autocomplete:{digest}"
+    usernames: list[str] | None = cache.get(key)
+    if usernames is None:
+        usernames = list(
+            User.objects.filter(username__istartswith=prefix, is_active=True)
+            .order_by("username")
+            .values_list("username", flat=True)[:AUTOCOMPLETE_LIMIT],
+        )
+        cache.set(key, usernames, AUTOCOMPLETE_TIMEOUT)
+    return usernames
+
+
+class UsernameAutocompleteView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    JSON view suggesting usernames for the ``q`` prefix, used when a Dungeon
+    Master invites existing users by name. Only the Dungeon Master of the
+    campaign in the URL may use it, so the user list cannot be walked by
+    anyone who is logged in.
+    """
+
+    query_budget = 6
+
+    def test_func(self) -> bool:
+        campaign = get_object_or_404(Campaign, slug=self.kwargs["slug"])
+        return is_dungeon_master(self.request.user, campaign)
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+        usernames = search_usernames(request.GET.get("q", ""))
+        response = JsonResponse({"results": [{"username": u} for u in usernames]})
+        patch_cache_control(response, private=True, max_age=AUTOCOMPLETE_TIMEOUT)
+        return response
@@ -7,6 +7,7 @@ from django.http import HttpResponse
 from django.urls import reverse_lazy
 from django.views.generic import DetailView, UpdateView
 
+from dunbud.services import get_player_stats
 from users.forms import CustomUserChangeForm
 
 User = get_user_model()
@@ -34,3 +35,8 @@ class UserDetailView(LoginRequiredMixin, DetailView):
     slug_field = "username"
     slug_url_kwarg = "username"
     template_name = "users/user_detail.html"
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["stats"] = get_player_stats(self.object)
+        return context
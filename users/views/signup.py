@@ -1,12 +1,11 @@
 import logging
 
-from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
 from django.http import HttpResponse
 from django.urls import reverse_lazy
 from django.views.generic import CreateView
 
+from dunbud.services import queue_email
 from users.forms import CustomUserCreationForm
 
 User = get_user_model()
@@ -22,32 +21,23 @@ class SignUpView(CreateView):
         response = super().form_valid(form)
         user = self.object
 
+        # The email goes through the outbox, so signing up never waits on
+        # the mail provider.
         if user and user.email:
-            try:
-                send_mail(
-                    subject="Welcome to Dungeon Buddy!",
-                    message=(
-                        f"Hi {user.username},\n\n"
-                        "Thanks for signing up for Dungeon Buddy! "
-                        "We are excited to help you manage your campaigns."
-                    ),
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[user.email],
-                    fail_silently=False,
-                )
-
-                masked_email = self._mask_email(user.email)
-
-                logger.info(
-                    "Signup confirmation email sent to user: %s (%s)",
-                    user.username,
-                    masked_email,
-                )
-            except Exception:
-                logger.exception(
-                    "Failed to send signup confirmation email to user: %s",
-                    user.username,
-                )
+            queue_email(
+                subject="Welcome to Dungeon Buddy!",
+                body=(
+                    f"Hi {user.username},\n\n"
+                    "Thanks for signing up for Dungeon Buddy! "
+                    "We are excited to help you manage your campaigns."
+                ),
+                recipients=[user.email],
+            )
+            logger.info(
+                "Signup confirmation email queued for user: %s (%s)",
+                user.username,
+                self._mask_email(user.email),
+            )
 
         return response
 